@@ -0,0 +1,343 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Benchmarks of the runtime and memory of MCT quantization pipelines (PTQ, mixed-precision PTQ and GPTQ) on
+synthetic Keras and Pytorch models (MobileNet-like, ResNet-like and a small transformer) with random
+representative data. The benchmarks run offline on CPU, and each benchmark runs in a separate process, so its
+memory measurements are not affected by the benchmarks that ran before it.
+
+The time and memory of every stage of the pipeline are recorded using the pipeline profiler, and the results
+are written to a JSON file. Results can be compared to a baseline results file, and the runner exits with an
+error if a benchmark regressed by more than the tolerance.
+
+Usage examples:
+    python -m benchmarks.benchmark_runner --frameworks keras --pipelines ptq mp --output results.json
+    python -m benchmarks.benchmark_runner --update-baseline
+    python -m benchmarks.benchmark_runner --baseline benchmarks/baseline.json --tolerance 0.2
+"""
+import argparse
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+FRAMEWORK_MODULES = {'keras': 'benchmarks.keras_benchmarks',
+                     'pytorch': 'benchmarks.pytorch_benchmarks'}
+PIPELINES = ['ptq', 'mp', 'gptq']
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Measurements below these thresholds are not compared to the baseline, as they are dominated by noise.
+MIN_COMPARED_TIME = 0.1
+MIN_COMPARED_MEMORY_MB = 20.
+
+
+def get_benchmark_names(frameworks: List[str], models: List[str] = None, pipelines: List[str] = None) -> List[str]:
+    """
+    Get the names of the benchmarks to run. A benchmark name is '<framework>/<model>/<pipeline>'.
+    Unsupported benchmarks are skipped.
+
+    Args:
+        frameworks: Frameworks to benchmark.
+        models: Models to benchmark (all models if None).
+        pipelines: Pipelines to benchmark (all pipelines if None).
+
+    Returns:
+        List of benchmark names.
+    """
+    names = []
+    for framework in frameworks:
+        framework_module = importlib.import_module(FRAMEWORK_MODULES[framework])
+        for model_name in (framework_module.MODELS.keys() if models is None else models):
+            if model_name not in framework_module.MODELS:
+                raise Exception(f'Unknown {framework} benchmark model: {model_name}')
+            for pipeline in (PIPELINES if pipelines is None else pipelines):
+                unsupported_reason = framework_module.UNSUPPORTED_BENCHMARKS.get((model_name, pipeline))
+                if unsupported_reason is not None:
+                    print(f'Skipping benchmark {framework}/{model_name}/{pipeline}: {unsupported_reason}')
+                else:
+                    names.append(f'{framework}/{model_name}/{pipeline}')
+    return names
+
+
+def _get_core_config(pipeline: str, args: argparse.Namespace, report_path: str):
+    """
+    Get the CoreConfig of a benchmark run, with pipeline profiling enabled.
+
+    Args:
+        pipeline: Pipeline of the benchmark.
+        args: Benchmark arguments.
+        report_path: Path to write the pipeline profile to.
+
+    Returns:
+        A CoreConfig object.
+    """
+    import model_compression_toolkit as mct
+    mixed_precision_config = mct.MixedPrecisionQuantizationConfigV2(num_of_images=args.batch_size,
+                                                                    use_grad_based_weights=False) \
+        if pipeline == 'mp' else None
+    return mct.CoreConfig(n_iter=args.n_iter,
+                          mixed_precision_config=mixed_precision_config,
+                          debug_config=mct.DebugConfig(profile_pipeline=True, profile_report_path=report_path))
+
+
+def _median_by_key(runs: List[Dict[str, Any]], key: str) -> float:
+    return float(np.median([r[key] for r in runs]))
+
+
+def _aggregate_runs(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate the measurements of the repeated runs of a benchmark: the median of the time measurements,
+    and the maximum of the memory measurements.
+
+    Args:
+        runs: Measurements of the runs.
+
+    Returns:
+        Aggregated measurements.
+    """
+    stages = {}
+    for stage_name in runs[0]['stages'].keys():
+        stage_runs = [r['stages'][stage_name] for r in runs if stage_name in r['stages']]
+        stages[stage_name] = {'wall_time': _median_by_key(stage_runs, 'wall_time'),
+                              'cpu_time': _median_by_key(stage_runs, 'cpu_time'),
+                              'peak_rss_increase_mb': max([s['peak_rss_increase_mb'] for s in stage_runs]),
+                              'num_nodes': stage_runs[0]['num_nodes']}
+    return {'wall_time': _median_by_key(runs, 'wall_time'),
+            'cpu_time': _median_by_key(runs, 'cpu_time'),
+            'peak_rss_mb': max([r['peak_rss_mb'] for r in runs]),
+            'runs_wall_time': [r['wall_time'] for r in runs],
+            'stages': stages}
+
+
+def run_benchmark(name: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Run a benchmark in the current process.
+
+    Args:
+        name: Benchmark name.
+        args: Benchmark arguments.
+
+    Returns:
+        Aggregated measurements of the benchmark runs.
+    """
+    from model_compression_toolkit.core.common.pipeline_profiler import get_peak_rss_mb, set_pipeline_profiler
+
+    framework, model_name, pipeline = name.split('/')
+    framework_module = importlib.import_module(FRAMEWORK_MODULES[framework])
+    model_builder, input_shapes = framework_module.MODELS[model_name]
+
+    np.random.seed(args.seed)
+    representative_data = [np.random.randn(args.batch_size, *input_shape).astype(np.float32)
+                           for input_shape in input_shapes]
+
+    def representative_data_gen() -> list:
+        return representative_data
+
+    runs = []
+    with tempfile.TemporaryDirectory() as report_dir:
+        report_path = os.path.join(report_dir, 'profile.json')
+        for _ in range(args.repeats):
+            framework_module.set_seed(args.seed)
+            model = model_builder()
+            core_config = _get_core_config(pipeline, args, report_path)
+            # Stages that run before the pipeline sets its profiler (e.g. KPI data computation) are not profiled
+            set_pipeline_profiler(None)
+
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            framework_module.run_pipeline(pipeline, model, representative_data_gen, core_config,
+                                          target_kpi_ratio=args.target_kpi_ratio,
+                                          gptq_n_iter=args.gptq_n_iter)
+            wall_time, cpu_time = time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+            with open(report_path) as f:
+                profile = json.load(f)
+            runs.append({'wall_time': wall_time,
+                         'cpu_time': cpu_time,
+                         'peak_rss_mb': get_peak_rss_mb(),
+                         'stages': {s['name']: s for s in profile['stages']}})
+    return _aggregate_runs(runs)
+
+
+def run_isolated_benchmark(name: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Run a benchmark in a new process.
+
+    Args:
+        name: Benchmark name.
+        args: Benchmark arguments.
+
+    Returns:
+        Aggregated measurements of the benchmark runs.
+    """
+    repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([repo_dir] + ([env['PYTHONPATH']] if 'PYTHONPATH' in env else []))
+    with tempfile.TemporaryDirectory() as output_dir:
+        output_path = os.path.join(output_dir, 'result.json')
+        subprocess.run([sys.executable, '-m', 'benchmarks.benchmark_runner',
+                        '--worker', name,
+                        '--output', output_path,
+                        '--repeats', str(args.repeats),
+                        '--seed', str(args.seed),
+                        '--batch-size', str(args.batch_size),
+                        '--n-iter', str(args.n_iter),
+                        '--gptq-n-iter', str(args.gptq_n_iter),
+                        '--target-kpi-ratio', str(args.target_kpi_ratio)],
+                       env=env, check=True)
+        with open(output_path) as f:
+            return json.load(f)
+
+
+def compare_to_baseline(results: Dict[str, Any],
+                        baseline: Dict[str, Any],
+                        tolerance: float) -> Tuple[List[str], List[str]]:
+    """
+    Compare benchmark results to baseline results. The total wall time, the peak RSS and the wall time of each stage
+    of the benchmarks that appear in both results are compared.
+
+    Args:
+        results: Benchmark results.
+        baseline: Baseline benchmark results.
+        tolerance: Relative change from the baseline that is considered as a regression (or an improvement).
+
+    Returns:
+        Lists of descriptions of the regressions and of the improvements.
+    """
+    regressions, improvements = [], []
+
+    def _compare(description: str, value: float, baseline_value: float, min_compared_value: float):
+        if max(value, baseline_value) < min_compared_value:
+            return
+        change = f'{description}: {baseline_value:.3f} -> {value:.3f}'
+        if value > baseline_value * (1 + tolerance):
+            regressions.append(change)
+        elif value < baseline_value * (1 - tolerance):
+            improvements.append(change)
+
+    for name, benchmark in results['benchmarks'].items():
+        baseline_benchmark = baseline['benchmarks'].get(name)
+        if baseline_benchmark is None:
+            continue
+        _compare(f'{name} wall time', benchmark['wall_time'], baseline_benchmark['wall_time'], MIN_COMPARED_TIME)
+        _compare(f'{name} peak RSS (MB)', benchmark['peak_rss_mb'], baseline_benchmark['peak_rss_mb'],
+                 MIN_COMPARED_MEMORY_MB)
+        for stage_name, stage in benchmark['stages'].items():
+            baseline_stage = baseline_benchmark['stages'].get(stage_name)
+            if baseline_stage is not None:
+                _compare(f'{name} {stage_name} wall time', stage['wall_time'], baseline_stage['wall_time'],
+                         MIN_COMPARED_TIME)
+    return regressions, improvements
+
+
+def get_environment() -> Dict[str, str]:
+    """
+    Returns: Description of the environment the benchmarks run in.
+    """
+    import model_compression_toolkit as mct
+    environment = {'python': platform.python_version(),
+                   'platform': platform.platform(),
+                   'processor': platform.processor(),
+                   'cpu_count': os.cpu_count(),
+                   'mct': mct.__version__}
+    for package in ['tensorflow', 'torch']:
+        if importlib.util.find_spec(package) is not None:
+            environment[package] = importlib.import_module(package).__version__
+    return environment
+
+
+def argument_handler():
+    parser = argparse.ArgumentParser(description='Benchmarks of MCT quantization pipelines.')
+    parser.add_argument('--frameworks', nargs='+', choices=list(FRAMEWORK_MODULES.keys()),
+                        default=list(FRAMEWORK_MODULES.keys()), help='frameworks to benchmark.')
+    parser.add_argument('--models', nargs='+', default=None, help='models to benchmark (default: all models).')
+    parser.add_argument('--pipelines', nargs='+', choices=PIPELINES, default=PIPELINES,
+                        help='quantization pipelines to benchmark.')
+    parser.add_argument('--repeats', type=int, default=3, help='number of runs of each benchmark.')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the models and the representative data.')
+    parser.add_argument('--batch-size', type=int, default=8, help='batch size of the representative data.')
+    parser.add_argument('--n-iter', type=int, default=10, help='number of calibration iterations.')
+    parser.add_argument('--gptq-n-iter', type=int, default=20, help='number of GPTQ training iterations.')
+    parser.add_argument('--target-kpi-ratio', type=float, default=0.75,
+                        help='ratio of the 8-bit weights memory to use as the mixed-precision target KPI.')
+    parser.add_argument('--output', type=str, default='benchmark_results.json', help='path of the results file.')
+    parser.add_argument('--baseline', type=str, default=None,
+                        help=f'path of a baseline results file to compare to (default: {BASELINE_PATH}, '
+                             f'if it exists).')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='relative change from the baseline that is considered as a regression.')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='write the results to the baseline file (instead of comparing to it).')
+    parser.add_argument('--no-isolation', action='store_true',
+                        help='run all benchmarks in the current process.')
+    parser.add_argument('--worker', type=str, default=None, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = argument_handler()
+
+    # Benchmarks run on CPU only, so results are comparable between machines with and without a GPU
+    # (the frameworks are imported only after it is set).
+    os.environ['CUDA_VISIBLE_DEVICES'] = '-1'
+
+    if args.worker is not None:
+        # Run a single benchmark (in a process that was created by the runner)
+        with open(args.output, 'w') as f:
+            json.dump(run_benchmark(args.worker, args), f)
+        return 0
+
+    results = {'environment': get_environment(),
+               'config': {k: getattr(args, k) for k in ['repeats', 'seed', 'batch_size', 'n_iter', 'gptq_n_iter',
+                                                         'target_kpi_ratio']},
+               'benchmarks': {}}
+    for name in get_benchmark_names(args.frameworks, args.models, args.pipelines):
+        print(f'Running benchmark {name}')
+        results['benchmarks'][name] = run_benchmark(name, args) if args.no_isolation else \
+            run_isolated_benchmark(name, args)
+        print(f'{name}: wall time {results["benchmarks"][name]["wall_time"]:.3f}s, '
+              f'peak RSS {results["benchmarks"][name]["peak_rss_mb"]:.1f}MB')
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f'Benchmark results were written to {args.output}')
+
+    baseline_path = BASELINE_PATH if args.baseline is None else args.baseline
+    if args.update_baseline:
+        with open(baseline_path, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f'Baseline was written to {baseline_path}')
+        return 0
+
+    if not os.path.exists(baseline_path):
+        return 0
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    regressions, improvements = compare_to_baseline(results, baseline, args.tolerance)
+    for improvement in improvements:
+        print(f'Improvement: {improvement}')
+    for regression in regressions:
+        print(f'Regression: {regression}')
+    return 1 if len(regressions) > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
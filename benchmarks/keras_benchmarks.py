@@ -0,0 +1,148 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Callable, Dict, List, Tuple
+
+import tensorflow as tf
+
+import model_compression_toolkit as mct
+
+layers = tf.keras.layers
+
+
+def mobilenet_like(input_shape: Tuple[int] = (96, 96, 3), num_classes: int = 10) -> tf.keras.Model:
+    """
+    Build a MobileNetV2-like model (inverted residual blocks with depthwise convolutions).
+    """
+    inputs = layers.Input(shape=input_shape)
+    x = layers.Conv2D(16, 3, strides=2, padding='same', use_bias=False)(inputs)
+    x = layers.BatchNormalization()(x)
+    x = layers.ReLU(6.)(x)
+    for filters, strides, expansion in [(16, 1, 1), (24, 2, 6), (24, 1, 6), (32, 2, 6), (32, 1, 6), (64, 2, 6)]:
+        block_input = x
+        x = layers.Conv2D(block_input.shape[-1] * expansion, 1, use_bias=False)(x)
+        x = layers.BatchNormalization()(x)
+        x = layers.ReLU(6.)(x)
+        x = layers.DepthwiseConv2D(3, strides=strides, padding='same', use_bias=False)(x)
+        x = layers.BatchNormalization()(x)
+        x = layers.ReLU(6.)(x)
+        x = layers.Conv2D(filters, 1, use_bias=False)(x)
+        x = layers.BatchNormalization()(x)
+        if strides == 1 and block_input.shape[-1] == filters:
+            x = layers.Add()([block_input, x])
+    x = layers.GlobalAveragePooling2D()(x)
+    outputs = layers.Dense(num_classes)(x)
+    return tf.keras.Model(inputs=inputs, outputs=outputs)
+
+
+def resnet_like(input_shape: Tuple[int] = (64, 64, 3), num_classes: int = 10) -> tf.keras.Model:
+    """
+    Build a ResNet-like model (residual blocks of two convolutions).
+    """
+    inputs = layers.Input(shape=input_shape)
+    x = layers.Conv2D(32, 7, strides=2, padding='same')(inputs)
+    x = layers.BatchNormalization()(x)
+    x = layers.ReLU()(x)
+    x = layers.MaxPooling2D(3, strides=2, padding='same')(x)
+    for filters, strides in [(32, 1), (32, 1), (64, 2), (64, 1), (128, 2), (128, 1)]:
+        shortcut = x
+        x = layers.Conv2D(filters, 3, strides=strides, padding='same')(x)
+        x = layers.BatchNormalization()(x)
+        x = layers.ReLU()(x)
+        x = layers.Conv2D(filters, 3, padding='same')(x)
+        x = layers.BatchNormalization()(x)
+        if strides != 1 or shortcut.shape[-1] != filters:
+            shortcut = layers.Conv2D(filters, 1, strides=strides)(shortcut)
+        x = layers.Add()([shortcut, x])
+        x = layers.ReLU()(x)
+    x = layers.GlobalAveragePooling2D()(x)
+    outputs = layers.Dense(num_classes)(x)
+    return tf.keras.Model(inputs=inputs, outputs=outputs)
+
+
+def small_transformer(input_shape: Tuple[int] = (32, 64), num_classes: int = 10, num_heads: int = 4,
+                      num_blocks: int = 2) -> tf.keras.Model:
+    """
+    Build a small transformer encoder (multi-head self-attention and MLP blocks) over a sequence of tokens.
+    """
+    inputs = layers.Input(shape=input_shape)
+    x = layers.Dense(input_shape[-1])(inputs)
+    for _ in range(num_blocks):
+        attention = layers.MultiHeadAttention(num_heads, input_shape[-1] // num_heads)(x, x)
+        x = layers.LayerNormalization()(layers.Add()([x, attention]))
+        mlp = layers.Dense(2 * input_shape[-1], activation='relu')(x)
+        mlp = layers.Dense(input_shape[-1])(mlp)
+        x = layers.LayerNormalization()(layers.Add()([x, mlp]))
+    x = layers.GlobalAveragePooling1D()(x)
+    outputs = layers.Dense(num_classes)(x)
+    return tf.keras.Model(inputs=inputs, outputs=outputs)
+
+
+# Benchmark models: name --> (model builder, input shapes of the model (without the batch dimension))
+MODELS: Dict[str, Tuple[Callable, List[Tuple[int]]]] = {
+    'mobilenet_like': (mobilenet_like, [(96, 96, 3)]),
+    'resnet_like': (resnet_like, [(64, 64, 3)]),
+    'small_transformer': (small_transformer, [(32, 64)])}
+
+# Benchmarks that are not supported: (model name, pipeline) --> reason
+UNSUPPORTED_BENCHMARKS: Dict[Tuple[str, str], str] = {}
+
+
+def set_seed(seed: int):
+    """
+    Set the seed of Tensorflow's random generators (so models are initialized reproducibly).
+    """
+    tf.random.set_seed(seed)
+
+
+def run_pipeline(pipeline: str,
+                 model: tf.keras.Model,
+                 representative_data_gen: Callable,
+                 core_config: mct.CoreConfig,
+                 target_kpi_ratio: float,
+                 gptq_n_iter: int):
+    """
+    Run a quantization pipeline on a Keras model.
+
+    Args:
+        pipeline: Pipeline to run: 'ptq', 'mp' (mixed-precision PTQ) or 'gptq'.
+        model: Model to quantize.
+        representative_data_gen: Dataset used for calibration.
+        core_config: CoreConfig to quantize the model with.
+        target_kpi_ratio: Ratio of the 8-bit weights memory to use as the target KPI of the mixed-precision search.
+        gptq_n_iter: Number of GPTQ training iterations.
+
+    Returns:
+        The quantized model.
+    """
+    if pipeline == 'ptq':
+        quantized_model, _ = mct.keras_post_training_quantization_experimental(model,
+                                                                               representative_data_gen,
+                                                                               core_config=core_config)
+    elif pipeline == 'mp':
+        kpi_data = mct.keras_kpi_data_experimental(model, representative_data_gen, core_config)
+        quantized_model, _ = mct.keras_post_training_quantization_experimental(
+            model,
+            representative_data_gen,
+            target_kpi=mct.KPI(kpi_data.weights_memory * target_kpi_ratio),
+            core_config=core_config)
+    elif pipeline == 'gptq':
+        quantized_model, _ = mct.keras_gradient_post_training_quantization_experimental(
+            model,
+            representative_data_gen,
+            mct.get_keras_gptq_config(n_iter=gptq_n_iter),
+            core_config=core_config)
+    else:
+        raise Exception(f'Unknown benchmark pipeline: {pipeline}')
+    return quantized_model
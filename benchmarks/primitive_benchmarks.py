@@ -0,0 +1,401 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Micro-benchmarks of the numerical primitives of MCT (quantizers, threshold search, error functions, histogram
+collection and similarity distances), independent of any framework inference. Each primitive is timed over a sweep
+of tensor sizes, channel counts, bit-widths, candidate counts and histogram sample sizes, and its throughput
+(elements/s) and peak memory allocation are recorded for each point of the sweep, so the scaling curves of the
+primitive can be compared before and after an optimization. Primitives that approximate an exact computation
+(e.g. sampled histograms) record their approximation error as well.
+
+Usage examples:
+    python -m benchmarks.primitive_benchmarks --output primitives.json --plot-dir primitive_plots
+    python -m benchmarks.primitive_benchmarks --primitives quantize_tensor kmeans_assign_clusters --sizes 10000 1000000
+    python -m benchmarks.primitive_benchmarks --baseline primitives_baseline.json --tolerance 0.2
+    python -m benchmarks.primitive_benchmarks --primitives sampled_histogram_collector_update --sample-sizes 1000 10000
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from functools import partial
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector
+from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationErrorMethod, \
+    HistogramSamplingMethod
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
+    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.power_of_two_selection import \
+    power_of_two_selection_histogram
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
+    qparams_selection_tensor_search
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import quantize_tensor, \
+    uniform_quantize_tensor, kmeans_assign_clusters
+from model_compression_toolkit.core.common.similarity_analyzer import compute_mse, compute_mae, compute_cs, \
+    compute_lp_norm, compute_kl_divergence
+from model_compression_toolkit.core.common.target_platform import QuantizationMethod
+
+# Default sweep of the primitives parameters
+DEFAULT_SIZES = [10 ** 4, 10 ** 5, 10 ** 6]
+DEFAULT_CHANNELS = [1, 64]
+DEFAULT_N_BITS = [2, 4, 8]
+DEFAULT_CANDIDATES = [4, 16, 64]
+DEFAULT_SAMPLE_SIZES = [10 ** 3, 10 ** 4]
+
+# Number of samples in the batch of the similarity distances (the size is split between the samples)
+SIMILARITY_BATCH_SIZE = 32
+
+# Number of bins of the histograms the histogram error functions are computed on
+HISTOGRAM_N_BINS = 2048
+
+
+def _get_channels_tensor(size: int, channels: int) -> np.ndarray:
+    return np.random.randn(channels, max(size // channels, 1)).astype(np.float32)
+
+
+def _quantize_tensor_benchmark(size: int, channels: int, n_bits: int) -> Tuple[Callable, int]:
+    x = _get_channels_tensor(size, channels)
+    threshold = 2 ** np.ceil(np.log2(np.max(np.abs(x), axis=1, keepdims=True)))
+    return lambda: quantize_tensor(x, threshold, n_bits, True), x.size
+
+
+def _uniform_quantize_tensor_benchmark(size: int, channels: int, n_bits: int) -> Tuple[Callable, int]:
+    x = _get_channels_tensor(size, channels)
+    range_min, range_max = np.min(x, axis=1, keepdims=True), np.max(x, axis=1, keepdims=True)
+    return lambda: uniform_quantize_tensor(x, range_min, range_max, n_bits), x.size
+
+
+def _kmeans_assign_clusters_benchmark(size: int, n_bits: int) -> Tuple[Callable, int]:
+    x = np.random.randn(size).astype(np.float32)
+    cluster_centers = np.sort(np.random.randn(2 ** n_bits).astype(np.float32))
+    return lambda: kmeans_assign_clusters(cluster_centers, x), x.size
+
+
+def _threshold_search_benchmark(size: int, channels: int, n_bits: int, candidates: int) -> Tuple[Callable, int]:
+    x = _get_channels_tensor(size, channels)
+    error_function = get_threshold_selection_tensor_error_function(QuantizationMethod.POWER_OF_TWO,
+                                                                   QuantizationErrorMethod.MSE, p=2, n_bits=n_bits)
+    return lambda: qparams_selection_tensor_search(error_function, x, n_bits, per_channel=channels > 1,
+                                                   channel_axis=0, n_iter=candidates), x.size
+
+
+def _get_tensor_error_function_benchmark(quant_error_method: QuantizationErrorMethod) -> Callable:
+    def _tensor_error_function_benchmark(size: int, n_bits: int) -> Tuple[Callable, int]:
+        x = np.random.randn(size).astype(np.float32)
+        threshold = 2 ** np.ceil(np.log2(np.max(np.abs(x))))
+        qx = quantize_tensor(x, threshold, n_bits, True)
+        error_function = get_threshold_selection_tensor_error_function(QuantizationMethod.POWER_OF_TWO,
+                                                                       quant_error_method, p=3, n_bits=n_bits)
+        return lambda: error_function(x, qx, threshold), x.size
+    return _tensor_error_function_benchmark
+
+
+def _get_histogram_error_function_benchmark(quant_error_method: QuantizationErrorMethod) -> Callable:
+    def _histogram_error_function_benchmark(n_bits: int, candidates: int) -> Tuple[Callable, int]:
+        counts, bins = np.histogram(np.random.randn(10 ** 5), bins=HISTOGRAM_N_BINS)
+        thresholds = np.max(np.abs(bins)) / np.power(2, np.arange(candidates))
+        error_function = get_threshold_selection_histogram_error_function(QuantizationMethod.POWER_OF_TWO,
+                                                                          quant_error_method, p=3)
+
+        def _run():
+            # Error of each candidate threshold (as in the histogram threshold search)
+            for threshold in thresholds:
+                q_bins = quantize_tensor(bins, threshold, n_bits, True)
+                error_function(q_bins, counts, bins, counts, threshold, (-threshold, threshold))
+        return _run, HISTOGRAM_N_BINS * candidates
+    return _histogram_error_function_benchmark
+
+
+def _histogram_collector_update_benchmark(size: int) -> Tuple[Callable, int]:
+    x = np.random.randn(size).astype(np.float32)
+    return lambda: HistogramCollector().update(x), x.size
+
+
+def _get_sampled_histogram_collector_update_benchmark(sampling_method: HistogramSamplingMethod) -> Callable:
+    def _sampled_histogram_collector_update_benchmark(size: int, sample_size: int) -> Tuple[Callable, int, Dict]:
+        # A heavy-tailed tensor, so the threshold depends on the tail of the histogram
+        x = np.random.standard_t(4, size).astype(np.float32)
+
+        def _get_threshold(hc: HistogramCollector) -> float:
+            bins, counts = hc.get_histogram()
+            return power_of_two_selection_histogram(bins, counts, p=2, n_bits=8, min_value=hc.min(),
+                                                    max_value=hc.max())['threshold']
+
+        exact_hc, sampled_hc = HistogramCollector(), HistogramCollector(sample_size=sample_size,
+                                                                        sampling_method=sampling_method)
+        exact_hc.update(x)
+        sampled_hc.update(x)
+        exact_threshold, sampled_threshold = _get_threshold(exact_hc), _get_threshold(sampled_hc)
+        # Power-of-two thresholds are discrete, so the quality of the sampled threshold is measured by the increase
+        # of the quantization error of the tensor as well
+        exact_error = compute_mse(x, quantize_tensor(x, exact_threshold, 8, True))
+        sampled_error = compute_mse(x, quantize_tensor(x, sampled_threshold, 8, True))
+
+        def _run():
+            HistogramCollector(sample_size=sample_size, sampling_method=sampling_method).update(x)
+        return _run, x.size, {'threshold_relative_error': abs(sampled_threshold - exact_threshold) / exact_threshold,
+                              'quantization_error_increase': sampled_error / exact_error - 1}
+    return _sampled_histogram_collector_update_benchmark
+
+
+def _get_similarity_benchmark(distance_function: Callable) -> Callable:
+    def _similarity_benchmark(size: int) -> Tuple[Callable, int]:
+        x = np.random.randn(SIMILARITY_BATCH_SIZE, max(size // SIMILARITY_BATCH_SIZE, 1)).astype(np.float32)
+        y = x + 0.01 * np.random.randn(*x.shape).astype(np.float32)
+        if distance_function == compute_kl_divergence:
+            x, y = np.abs(x), np.abs(y)
+        return lambda: distance_function(x, y, batch=True), x.size
+    return _similarity_benchmark
+
+
+# Primitives micro-benchmarks: name --> (benchmark builder, swept parameters).
+# A benchmark builder gets a point of the sweep, and returns a function that runs the primitive once
+# and the number of elements the primitive processes (and optionally, a dictionary of quality metrics of the point).
+PRIMITIVES: Dict[str, Tuple[Callable, Tuple[str]]] = {
+    'quantize_tensor': (_quantize_tensor_benchmark, ('size', 'channels', 'n_bits')),
+    'uniform_quantize_tensor': (_uniform_quantize_tensor_benchmark, ('size', 'channels', 'n_bits')),
+    'kmeans_assign_clusters': (_kmeans_assign_clusters_benchmark, ('size', 'n_bits')),
+    'threshold_search': (_threshold_search_benchmark, ('size', 'channels', 'n_bits', 'candidates')),
+    'mse_tensor_error': (_get_tensor_error_function_benchmark(QuantizationErrorMethod.MSE), ('size', 'n_bits')),
+    'mae_tensor_error': (_get_tensor_error_function_benchmark(QuantizationErrorMethod.MAE), ('size', 'n_bits')),
+    'lp_tensor_error': (_get_tensor_error_function_benchmark(QuantizationErrorMethod.LP), ('size', 'n_bits')),
+    'kl_tensor_error': (_get_tensor_error_function_benchmark(QuantizationErrorMethod.KL), ('size', 'n_bits')),
+    'mse_histogram_error': (_get_histogram_error_function_benchmark(QuantizationErrorMethod.MSE),
+                            ('n_bits', 'candidates')),
+    'kl_histogram_error': (_get_histogram_error_function_benchmark(QuantizationErrorMethod.KL),
+                           ('n_bits', 'candidates')),
+    'histogram_collector_update': (_histogram_collector_update_benchmark, ('size',)),
+    'strided_histogram_collector_update': (
+        _get_sampled_histogram_collector_update_benchmark(HistogramSamplingMethod.STRIDED), ('size', 'sample_size')),
+    'random_histogram_collector_update': (
+        _get_sampled_histogram_collector_update_benchmark(HistogramSamplingMethod.RANDOM), ('size', 'sample_size')),
+    'similarity_mse': (_get_similarity_benchmark(compute_mse), ('size',)),
+    'similarity_mae': (_get_similarity_benchmark(compute_mae), ('size',)),
+    'similarity_cs': (_get_similarity_benchmark(compute_cs), ('size',)),
+    'similarity_lp_norm': (_get_similarity_benchmark(partial(compute_lp_norm, p=3)), ('size',)),
+    'similarity_kl_divergence': (_get_similarity_benchmark(compute_kl_divergence), ('size',))}
+
+
+def measure(fn: Callable, min_time: float, min_repeats: int = 3) -> Tuple[float, float]:
+    """
+    Measure the run time and the peak memory allocation of a function.
+
+    Args:
+        fn: Function to measure.
+        min_time: Minimal total time (in seconds) to repeat the function for.
+        min_repeats: Minimal number of repeats of the function.
+
+    Returns:
+        The median run time of the function (in seconds), and its peak memory allocation (in MB).
+    """
+    # The peak memory is measured in a separate run, since tracing the allocations slows the function down
+    tracemalloc.start()
+    fn()
+    peak_memory = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+
+    run_times = []
+    while len(run_times) < min_repeats or sum(run_times) < min_time:
+        start = time.perf_counter()
+        fn()
+        run_times.append(time.perf_counter() - start)
+    return float(np.median(run_times)), peak_memory
+
+
+def get_sweep_points(params: Tuple[str], sweep: Dict[str, List[int]]) -> List[Dict[str, int]]:
+    """
+    Get the points of the sweep of a primitive.
+
+    Args:
+        params: Parameters the primitive is swept over.
+        sweep: Values of each parameter.
+
+    Returns:
+        List of sweep points (mapping from a parameter to its value).
+    """
+    return [dict(zip(params, values)) for values in itertools.product(*[sweep[p] for p in params])]
+
+
+def get_point_key(point: Dict[str, int]) -> str:
+    return ','.join([f'{k}={v}' for k, v in point.items()])
+
+
+def run_primitive_benchmarks(primitives: List[str],
+                             sweep: Dict[str, List[int]],
+                             min_time: float,
+                             seed: int = 0) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Run the micro-benchmarks of primitives over a sweep of their parameters.
+
+    Args:
+        primitives: Names of the primitives to benchmark.
+        sweep: Values of each parameter to sweep.
+        min_time: Minimal total time (in seconds) to repeat each primitive run for.
+        seed: Seed of the random inputs of the primitives.
+
+    Returns:
+        A mapping from a primitive name to its measurements curve: a list of the sweep points, with their
+        number of elements, run time, throughput (elements/s), peak memory allocation (MB) and quality metrics.
+    """
+    results = {}
+    for name in primitives:
+        benchmark_builder, params = PRIMITIVES[name]
+        curve = []
+        for point in get_sweep_points(params, sweep):
+            np.random.seed(seed)
+            fn, n_elements, *metrics = benchmark_builder(**point)
+            metrics = metrics[0] if len(metrics) > 0 else {}
+            run_time, peak_memory = measure(fn, min_time)
+            curve.append({**point,
+                          **metrics,
+                          'key': get_point_key(point),
+                          'elements': n_elements,
+                          'time': run_time,
+                          'throughput': n_elements / run_time,
+                          'peak_memory_mb': peak_memory})
+            print(f'{name} {get_point_key(point)}: {n_elements / run_time:.3e} elements/s, '
+                  f'peak memory {peak_memory:.2f}MB' + ''.join([f', {k} {v:.3e}' for k, v in metrics.items()]))
+        results[name] = curve
+    return results
+
+
+def compare_to_baseline(results: Dict[str, List[Dict[str, Any]]],
+                        baseline: Dict[str, List[Dict[str, Any]]],
+                        tolerance: float) -> Tuple[List[str], List[str]]:
+    """
+    Compare the throughput of each sweep point of the primitives to baseline results.
+
+    Args:
+        results: Primitives benchmarks results.
+        baseline: Baseline primitives benchmarks results.
+        tolerance: Relative change from the baseline that is considered as a regression (or an improvement).
+
+    Returns:
+        Lists of descriptions of the regressions and of the improvements.
+    """
+    regressions, improvements = [], []
+    for name, curve in results.items():
+        baseline_points = {p['key']: p for p in baseline.get(name, [])}
+        for point in curve:
+            baseline_point = baseline_points.get(point['key'])
+            if baseline_point is None:
+                continue
+            change = f'{name} {point["key"]} throughput: {baseline_point["throughput"]:.3e} -> ' \
+                     f'{point["throughput"]:.3e} elements/s'
+            if point['throughput'] < baseline_point['throughput'] * (1 - tolerance):
+                regressions.append(change)
+            elif point['throughput'] > baseline_point['throughput'] * (1 + tolerance):
+                improvements.append(change)
+    return regressions, improvements
+
+
+def plot_curves(results: Dict[str, List[Dict[str, Any]]], plot_dir: str):
+    """
+    Plot the throughput and peak memory curves of each primitive (as a function of the number of elements),
+    with a curve for each combination of the other swept parameters.
+
+    Args:
+        results: Primitives benchmarks results.
+        plot_dir: Directory to save the plots to.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib import pyplot as plt
+
+    os.makedirs(plot_dir, exist_ok=True)
+    for name, curve in results.items():
+        fig, (throughput_ax, memory_ax) = plt.subplots(1, 2, figsize=(12, 4))
+        curves = {}
+        for point in curve:
+            # The number of elements is swept by the size, or by the candidates for primitives with a fixed size
+            x_param = 'size' if 'size' in point else 'candidates'
+            label = ','.join([f'{k}={v}' for k, v in point.items()
+                              if k in ('channels', 'n_bits', 'candidates', 'sample_size') and k != x_param])
+            curves.setdefault(label, []).append(point)
+        for label, points in curves.items():
+            points = sorted(points, key=lambda p: p['elements'])
+            elements = [p['elements'] for p in points]
+            throughput_ax.plot(elements, [p['throughput'] for p in points], marker='o', label=label)
+            memory_ax.plot(elements, [p['peak_memory_mb'] for p in points], marker='o', label=label)
+        for ax, y_label in [(throughput_ax, 'elements/s'), (memory_ax, 'peak memory (MB)')]:
+            ax.set_xscale('log')
+            ax.set_yscale('log')
+            ax.set_xlabel('elements')
+            ax.set_ylabel(y_label)
+            ax.grid(True)
+        if len(curves) > 1:
+            throughput_ax.legend(fontsize='small')
+        fig.suptitle(name)
+        fig.savefig(os.path.join(plot_dir, f'{name}.png'))
+        plt.close(fig)
+
+
+def argument_handler():
+    parser = argparse.ArgumentParser(description='Micro-benchmarks of MCT quantization primitives.')
+    parser.add_argument('--primitives', nargs='+', choices=list(PRIMITIVES.keys()), default=list(PRIMITIVES.keys()),
+                        help='primitives to benchmark.')
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES, help='tensor sizes to sweep.')
+    parser.add_argument('--channels', nargs='+', type=int, default=DEFAULT_CHANNELS, help='channel counts to sweep.')
+    parser.add_argument('--n-bits', nargs='+', type=int, default=DEFAULT_N_BITS, help='bit-widths to sweep.')
+    parser.add_argument('--candidates', nargs='+', type=int, default=DEFAULT_CANDIDATES,
+                        help='candidate (threshold search iterations) counts to sweep.')
+    parser.add_argument('--sample-sizes', nargs='+', type=int, default=DEFAULT_SAMPLE_SIZES,
+                        help='histogram sample sizes to sweep.')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='minimal total time (in seconds) to repeat each measurement for.')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random inputs.')
+    parser.add_argument('--output', type=str, default='primitive_benchmark_results.json',
+                        help='path of the results file.')
+    parser.add_argument('--plot-dir', type=str, default=None, help='directory to save the curves plots to.')
+    parser.add_argument('--baseline', type=str, default=None, help='path of a baseline results file to compare to.')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='relative change from the baseline that is considered as a regression.')
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = argument_handler()
+    sweep = {'size': args.sizes, 'channels': args.channels, 'n_bits': args.n_bits, 'candidates': args.candidates,
+             'sample_size': args.sample_sizes}
+    results = run_primitive_benchmarks(args.primitives, sweep, args.min_time, args.seed)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f'Primitives benchmark results were written to {args.output}')
+
+    if args.plot_dir is not None:
+        plot_curves(results, args.plot_dir)
+        print(f'Curves plots were saved to {args.plot_dir}')
+
+    if args.baseline is None:
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions, improvements = compare_to_baseline(results, baseline, args.tolerance)
+    for improvement in improvements:
+        print(f'Improvement: {improvement}')
+    for regression in regressions:
+        print(f'Regression: {regression}')
+    return 1 if len(regressions) > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,207 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Callable, Dict, List, Tuple
+
+import torch
+from torch import nn
+
+import model_compression_toolkit as mct
+
+
+class InvertedResidual(nn.Module):
+    """
+    MobileNetV2 inverted residual block.
+    """
+    def __init__(self, in_channels: int, out_channels: int, stride: int, expansion: int):
+        super().__init__()
+        hidden_channels = in_channels * expansion
+        self.use_residual = stride == 1 and in_channels == out_channels
+        self.block = nn.Sequential(
+            nn.Conv2d(in_channels, hidden_channels, 1, bias=False),
+            nn.BatchNorm2d(hidden_channels),
+            nn.ReLU6(),
+            nn.Conv2d(hidden_channels, hidden_channels, 3, stride=stride, padding=1, groups=hidden_channels,
+                      bias=False),
+            nn.BatchNorm2d(hidden_channels),
+            nn.ReLU6(),
+            nn.Conv2d(hidden_channels, out_channels, 1, bias=False),
+            nn.BatchNorm2d(out_channels))
+
+    def forward(self, x):
+        if self.use_residual:
+            return x + self.block(x)
+        return self.block(x)
+
+
+class MobileNetLike(nn.Module):
+    """
+    A MobileNetV2-like model (inverted residual blocks with depthwise convolutions).
+    """
+    def __init__(self, num_classes: int = 10):
+        super().__init__()
+        blocks = [nn.Conv2d(3, 16, 3, stride=2, padding=1, bias=False), nn.BatchNorm2d(16), nn.ReLU6()]
+        in_channels = 16
+        for out_channels, stride, expansion in [(16, 1, 1), (24, 2, 6), (24, 1, 6), (32, 2, 6), (32, 1, 6),
+                                                (64, 2, 6)]:
+            blocks.append(InvertedResidual(in_channels, out_channels, stride, expansion))
+            in_channels = out_channels
+        self.features = nn.Sequential(*blocks)
+        self.pool = nn.AdaptiveAvgPool2d(1)
+        self.classifier = nn.Linear(in_channels, num_classes)
+
+    def forward(self, x):
+        x = self.pool(self.features(x))
+        return self.classifier(torch.flatten(x, 1))
+
+
+class BasicBlock(nn.Module):
+    """
+    ResNet residual block of two convolutions.
+    """
+    def __init__(self, in_channels: int, out_channels: int, stride: int):
+        super().__init__()
+        self.conv1 = nn.Conv2d(in_channels, out_channels, 3, stride=stride, padding=1)
+        self.bn1 = nn.BatchNorm2d(out_channels)
+        self.relu1 = nn.ReLU()
+        self.conv2 = nn.Conv2d(out_channels, out_channels, 3, padding=1)
+        self.bn2 = nn.BatchNorm2d(out_channels)
+        self.relu2 = nn.ReLU()
+        self.shortcut = nn.Identity() if stride == 1 and in_channels == out_channels else \
+            nn.Conv2d(in_channels, out_channels, 1, stride=stride)
+
+    def forward(self, x):
+        y = self.bn2(self.conv2(self.relu1(self.bn1(self.conv1(x)))))
+        return self.relu2(self.shortcut(x) + y)
+
+
+class ResNetLike(nn.Module):
+    """
+    A ResNet-like model (residual blocks of two convolutions).
+    """
+    def __init__(self, num_classes: int = 10):
+        super().__init__()
+        blocks = [nn.Conv2d(3, 32, 7, stride=2, padding=3), nn.BatchNorm2d(32), nn.ReLU(),
+                  nn.MaxPool2d(3, stride=2, padding=1)]
+        in_channels = 32
+        for out_channels, stride in [(32, 1), (32, 1), (64, 2), (64, 1), (128, 2), (128, 1)]:
+            blocks.append(BasicBlock(in_channels, out_channels, stride))
+            in_channels = out_channels
+        self.features = nn.Sequential(*blocks)
+        self.pool = nn.AdaptiveAvgPool2d(1)
+        self.classifier = nn.Linear(in_channels, num_classes)
+
+    def forward(self, x):
+        x = self.pool(self.features(x))
+        return self.classifier(torch.flatten(x, 1))
+
+
+class TransformerBlock(nn.Module):
+    """
+    Transformer encoder block (multi-head self-attention and MLP). The query, key and value are projected by
+    separate layers before the attention, since the MultiheadAttention decomposition expects three different inputs.
+    """
+    def __init__(self, embed_dim: int, num_heads: int):
+        super().__init__()
+        self.q_proj = nn.Linear(embed_dim, embed_dim)
+        self.k_proj = nn.Linear(embed_dim, embed_dim)
+        self.v_proj = nn.Linear(embed_dim, embed_dim)
+        self.attention = nn.MultiheadAttention(embed_dim, num_heads, batch_first=True)
+        self.norm1 = nn.LayerNorm(embed_dim)
+        self.fc1 = nn.Linear(embed_dim, 2 * embed_dim)
+        self.relu = nn.ReLU()
+        self.fc2 = nn.Linear(2 * embed_dim, embed_dim)
+        self.norm2 = nn.LayerNorm(embed_dim)
+
+    def forward(self, x):
+        attention, _ = self.attention(self.q_proj(x), self.k_proj(x), self.v_proj(x))
+        x = self.norm1(x + attention)
+        return self.norm2(x + self.fc2(self.relu(self.fc1(x))))
+
+
+class SmallTransformer(nn.Module):
+    """
+    A small transformer encoder over a sequence of tokens.
+    """
+    def __init__(self, embed_dim: int = 64, num_classes: int = 10, num_heads: int = 4, num_blocks: int = 2):
+        super().__init__()
+        self.embedding = nn.Linear(embed_dim, embed_dim)
+        self.blocks = nn.Sequential(*[TransformerBlock(embed_dim, num_heads) for _ in range(num_blocks)])
+        self.classifier = nn.Linear(embed_dim, num_classes)
+
+    def forward(self, x):
+        x = self.blocks(self.embedding(x))
+        return self.classifier(torch.mean(x, dim=1))
+
+
+# Benchmark models: name --> (model builder, input shapes of the model (without the batch dimension))
+MODELS: Dict[str, Tuple[Callable, List[Tuple[int]]]] = {
+    'mobilenet_like': (MobileNetLike, [(3, 96, 96)]),
+    'resnet_like': (ResNetLike, [(3, 64, 64)]),
+    'small_transformer': (SmallTransformer, [(32, 64)])}
+
+# Benchmarks that are not supported: (model name, pipeline) --> reason
+UNSUPPORTED_BENCHMARKS: Dict[Tuple[str, str], str] = {
+    ('small_transformer', 'gptq'): 'the MultiheadAttention decomposition reshapes by the calibration batch size, '
+                                   'so the GPTQ Jacobian-based weights can not be computed for other batch sizes'}
+
+
+def set_seed(seed: int):
+    """
+    Set the seed of Pytorch's random generators (so models are initialized reproducibly).
+    """
+    torch.manual_seed(seed)
+
+
+def run_pipeline(pipeline: str,
+                 model: nn.Module,
+                 representative_data_gen: Callable,
+                 core_config: mct.CoreConfig,
+                 target_kpi_ratio: float,
+                 gptq_n_iter: int):
+    """
+    Run a quantization pipeline on a Pytorch model.
+
+    Args:
+        pipeline: Pipeline to run: 'ptq', 'mp' (mixed-precision PTQ) or 'gptq'.
+        model: Model to quantize.
+        representative_data_gen: Dataset used for calibration.
+        core_config: CoreConfig to quantize the model with.
+        target_kpi_ratio: Ratio of the 8-bit weights memory to use as the target KPI of the mixed-precision search.
+        gptq_n_iter: Number of GPTQ training iterations.
+
+    Returns:
+        The quantized model.
+    """
+    model.eval()
+    if pipeline == 'ptq':
+        quantized_model, _ = mct.pytorch_post_training_quantization_experimental(model,
+                                                                                 representative_data_gen,
+                                                                                 core_config=core_config)
+    elif pipeline == 'mp':
+        kpi_data = mct.pytorch_kpi_data_experimental(model, representative_data_gen, core_config)
+        quantized_model, _ = mct.pytorch_post_training_quantization_experimental(
+            model,
+            representative_data_gen,
+            target_kpi=mct.KPI(kpi_data.weights_memory * target_kpi_ratio),
+            core_config=core_config)
+    elif pipeline == 'gptq':
+        quantized_model, _ = mct.pytorch_gradient_post_training_quantization_experimental(
+            model,
+            representative_data_gen,
+            core_config=core_config,
+            gptq_config=mct.get_pytorch_gptq_config(n_iter=gptq_n_iter))
+    else:
+        raise Exception(f'Unknown benchmark pipeline: {pipeline}')
+    return quantized_model
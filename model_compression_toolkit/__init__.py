@@ -14,11 +14,12 @@
 # ==============================================================================
 
 from model_compression_toolkit.core.common.quantization.debug_config import DebugConfig
-from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig, RoundingType, GumbelConfig
+from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig, RoundingType, GumbelConfig, \
+    TeacherCacheConfig, AuxVarPrecision, CheckpointConfig
 from model_compression_toolkit.core.common.quantization import quantization_config
 from model_compression_toolkit.core.common.mixed_precision import mixed_precision_quantization_config
 from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig, \
-    QuantizationErrorMethod, DEFAULTCONFIG
+    QuantizationErrorMethod, HistogramSamplingMethod, DEFAULTCONFIG
 from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
 from model_compression_toolkit.core.common import target_platform
 from model_compression_toolkit.core.tpc_models.get_target_platform_capabilities import get_target_platform_capabilities
@@ -26,6 +27,7 @@ from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config import \
     MixedPrecisionQuantizationConfig, MixedPrecisionQuantizationConfigV2
 from model_compression_toolkit.core.common.logger import set_log_folder
+from model_compression_toolkit.core.common.graph.weights_store import set_weights_store_file
 from model_compression_toolkit.core.common.data_loader import FolderImageLoader
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo, ChannelAxis
 from model_compression_toolkit.core.common.defaultdict import DefaultDict
@@ -35,7 +37,7 @@ from model_compression_toolkit.core.keras.quantization_facade import keras_post_
     keras_post_training_quantization_mixed_precision
 from model_compression_toolkit.ptq.keras.quantization_facade import keras_post_training_quantization_experimental
 from model_compression_toolkit.gptq.keras.quantization_facade import \
-    keras_gradient_post_training_quantization_experimental
+    keras_gradient_post_training_quantization_experimental, keras_resume_gradient_post_training_quantization_experimental
 from model_compression_toolkit.gptq.keras.quantization_facade import get_keras_gptq_config
 from model_compression_toolkit.qat.keras.quantization_facade import keras_quantization_aware_training_init, \
     keras_quantization_aware_training_finalize
@@ -43,7 +45,8 @@ from model_compression_toolkit.core.pytorch.quantization_facade import pytorch_p
     pytorch_post_training_quantization_mixed_precision
 from model_compression_toolkit.ptq.pytorch.quantization_facade import pytorch_post_training_quantization_experimental
 from model_compression_toolkit.gptq.pytorch.quantization_facade import \
-    pytorch_gradient_post_training_quantization_experimental
+    pytorch_gradient_post_training_quantization_experimental, \
+    pytorch_resume_gradient_post_training_quantization_experimental
 from model_compression_toolkit.gptq.pytorch.quantization_facade import get_pytorch_gptq_config
 
 from model_compression_toolkit.core.keras.kpi_data_facade import keras_kpi_data, keras_kpi_data_experimental
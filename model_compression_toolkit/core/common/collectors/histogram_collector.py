@@ -13,9 +13,11 @@
 # limitations under the License.
 # ==============================================================================
 
+import math
 from typing import Tuple
 import numpy as np
 from model_compression_toolkit.core.common.collectors.base_collector import BaseCollector
+from model_compression_toolkit.core.common.quantization.quantization_config import HistogramSamplingMethod
 
 
 def interpolate_histogram(current_bins: np.ndarray,
@@ -46,14 +48,27 @@ class HistogramCollector(BaseCollector):
     Collector for holding histogram of tensors going through it.
     """
 
-    def __init__(self, n_bins: int = 2048):
+    def __init__(self,
+                 n_bins: int = 2048,
+                 sample_size: int = None,
+                 sampling_method: HistogramSamplingMethod = HistogramSamplingMethod.STRIDED,
+                 seed: int = 0):
         """
         Args:
             n_bins: Number of bins in the histogram.
+            sample_size: Maximal number of elements of a tensor to compute its histogram from. The histograms of
+            larger tensors are computed from a sample of their elements and their counts are scaled to the tensor's
+            size. The tensor's min and max elements are always counted, so the histogram's tails are kept.
+            If None, all elements are used.
+            sampling_method: Method to sample the elements of tensors that are larger than sample_size.
+            seed: Seed for the random sampling method.
         """
 
         super().__init__()
         self.__n_bins = n_bins
+        self.__sample_size = sample_size
+        self.__sampling_method = sampling_method
+        self.__rng = np.random.default_rng(seed)
         self.__bins = None
         self.__counts = None
         self.__histogram_per_iteration = []
@@ -156,5 +171,38 @@ class HistogramCollector(BaseCollector):
         Args:
             x: Tensor going through the collector to update the histogram according to.
         """
-        count, bins = np.histogram(x, bins=self.__n_bins)
+        if self.__sample_size is None or x.size <= self.__sample_size:
+            count, bins = np.histogram(x, bins=self.__n_bins)
+        else:
+            # The min and max elements are counted exactly (in the histogram's first and last bins), so the
+            # threshold selection does not trim the tails that the sample misses. The sample stands for the rest.
+            flat_x = x.reshape(-1)
+            extremes = flat_x[[np.argmin(flat_x), np.argmax(flat_x)]]
+            x_sample = self.__sample(x)
+            count, bins = np.histogram(extremes, bins=self.__n_bins, range=(extremes[0], extremes[1]))
+            sample_count, _ = np.histogram(x_sample, bins=bins)
+            count = count + sample_count * ((x.size - len(extremes)) / x_sample.size)
         self.__histogram_per_iteration.append((count, bins))
+
+    def __sample(self, x: np.ndarray) -> np.ndarray:
+        """
+        Sample elements of a tensor according to the collector's sampling method.
+
+        Args:
+            x: Tensor to sample.
+
+        Returns:
+            A flat array of (at most) sample_size elements of the tensor.
+        """
+        flat_x = x.reshape(-1)
+        if self.__sampling_method == HistogramSamplingMethod.RANDOM:
+            return flat_x[self.__rng.integers(0, flat_x.size, self.__sample_size)]
+
+        # A stride that divides the size of the last axis would sample only some of its indices (e.g. only some of
+        # the channels of a channels-last tensor), so the stride is increased until it is co-prime with it.
+        stride = flat_x.size // self.__sample_size
+        last_axis_size = x.shape[-1] if x.ndim > 0 else 1
+        while math.gcd(stride, last_axis_size) != 1:
+            stride += 1
+        offset = int(self.__rng.integers(0, max(flat_x.size - stride * (self.__sample_size - 1), 1)))
+        return flat_x[offset::stride][:self.__sample_size]
@@ -24,6 +24,7 @@ from model_compression_toolkit.core.common.framework_info import FrameworkInfo,
 from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector
 from model_compression_toolkit.core.common.collectors.mean_collector import MeanCollector
 from model_compression_toolkit.core.common.collectors.min_max_per_channel_collector import MinMaxPerChannelCollector
+from model_compression_toolkit.core.common.quantization.quantization_config import HistogramSamplingMethod
 
 
 class BaseStatsCollector(object):
@@ -58,7 +59,9 @@ class StatsCollector(BaseStatsCollector):
     def __init__(self,
                  out_channel_axis: int,
                  init_min_value: float = None,
-                 init_max_value: float = None):
+                 init_max_value: float = None,
+                 histogram_sample_size: int = None,
+                 histogram_sampling_method: HistogramSamplingMethod = HistogramSamplingMethod.STRIDED):
         """
         Instantiate three statistics collectors: histogram, mean and min/max per channel.
         Set initial min/max values if are known.
@@ -67,10 +70,12 @@ class StatsCollector(BaseStatsCollector):
             out_channel_axis: Index of output channels.
             init_min_value: Initial min value for min/max stored values.
             init_max_value: Initial max value for min/max stored values.
+            histogram_sample_size: Maximal number of elements of a tensor to collect its histogram from (None for all).
+            histogram_sampling_method: Method to sample tensors that are larger than histogram_sample_size.
         """
 
         super().__init__()
-        self.hc = HistogramCollector()
+        self.hc = HistogramCollector(sample_size=histogram_sample_size, sampling_method=histogram_sampling_method)
         self.mc = MeanCollector(axis=out_channel_axis)
         self.mpcc = MinMaxPerChannelCollector(init_min_value=init_min_value,
                                               init_max_value=init_max_value,
@@ -17,9 +17,11 @@
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
+from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig, DEFAULTCONFIG
 
 def create_stats_collector_for_node(node: common.BaseNode,
-                                    fw_info: FrameworkInfo) -> BaseStatsCollector:
+                                    fw_info: FrameworkInfo,
+                                    quant_config: QuantizationConfig = DEFAULTCONFIG) -> BaseStatsCollector:
     """
     Gets a node and a groups list and create and return a statistics collector for a node
     according to whether its statistics should be collected and the prior information we
@@ -28,6 +30,7 @@ def create_stats_collector_for_node(node: common.BaseNode,
     Args:
         node: Node to create its statistics collector.
         fw_info: Information relevant to a specific framework about what is out channel axis (for statistics per-channel).
+        quant_config: Quantization configuration (determines how histograms are collected).
 
     Returns:
         Statistics collector for statistics collection for the node.
@@ -38,7 +41,9 @@ def create_stats_collector_for_node(node: common.BaseNode,
         max_output = getattr(node.prior_info, 'max_output', None)
         stats_collector = common.StatsCollector(out_channel_axis=fw_info.out_channel_axis_mapping.get(node.type),
                                                 init_min_value=min_output,
-                                                init_max_value=max_output)
+                                                init_max_value=max_output,
+                                                histogram_sample_size=quant_config.histogram_sample_size,
+                                                histogram_sampling_method=quant_config.histogram_sampling_method)
     else:
         stats_collector = common.NoStatsCollector()
 
@@ -46,6 +46,9 @@ FLOAT_32 = 'float32'
 # Version
 LATEST = 'latest'
 
+# Z-score of the confidence interval of the mixed-precision metric in adaptive evaluation (95% confidence):
+MP_EVALUATION_CONFIDENCE_Z = 1.96
+
 # Number of Tensorboard cosine-similarity plots to add:
 NUM_SAMPLES_DISTANCE_TENSORBOARD = 20
 
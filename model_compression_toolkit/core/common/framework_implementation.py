@@ -27,7 +27,7 @@ from model_compression_toolkit.core.common.mixed_precision.sensitivity_evaluatio
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
 from model_compression_toolkit.core.common.node_prior_info import NodePriorInfo
 from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
-from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig
+from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig, DEFAULTCONFIG
 from model_compression_toolkit.core.common.user_info import UserInformation
 
 
@@ -130,6 +130,23 @@ class FrameworkImplementation(ABC):
         raise NotImplemented(f'{self.__class__.__name__} have to implement the '
                              f'framework\'s run_model_inference method.')
 
+    def compile_model_inference(self,
+                                model: Any,
+                                jit_compile: bool = False) -> Callable:
+        """
+        Get a compiled inference function of a model that was built by model_builder.
+        Frameworks that do not support compiling the model's inference return the model itself
+        (so it runs eagerly).
+
+        Args:
+            model: Framework's model to compile.
+            jit_compile: Whether to jit-compile the model's inference (if the framework supports it).
+
+        Returns:
+            A callable that gets the model's inputs and returns the model's outputs.
+        """
+        return model
+
     @abstractmethod
     def shift_negative_correction(self,
                                   graph: Graph,
@@ -150,7 +167,10 @@ class FrameworkImplementation(ABC):
                              f'framework\'s apply_shift_negative_correction method.')
 
     @abstractmethod
-    def attach_sc_to_node(self, node: BaseNode, fw_info: FrameworkInfo) -> BaseStatsCollector:
+    def attach_sc_to_node(self,
+                          node: BaseNode,
+                          fw_info: FrameworkInfo,
+                          quant_config: QuantizationConfig = DEFAULTCONFIG) -> BaseStatsCollector:
         """
         Return a statistics collector that should be attached to a node's output
         during statistics collection.
@@ -158,6 +178,7 @@ class FrameworkImplementation(ABC):
         Args:
             node: Node to return its collector.
             fw_info: Information relevant to a specific framework about what is out channel axis (for statistics per-channel).
+            quant_config: Quantization configuration (determines how histograms are collected).
 
         Returns:
             Statistics collector for the node.
@@ -183,9 +204,13 @@ class FrameworkImplementation(ABC):
                              f'framework\'s get_substitutions_channel_equalization method.')
 
     @abstractmethod
-    def get_substitutions_prepare_graph(self) -> List[common.BaseSubstitution]:
+    def get_substitutions_prepare_graph(self, quant_config: QuantizationConfig = DEFAULTCONFIG) -> \
+            List[common.BaseSubstitution]:
         """
 
+        Args:
+            quant_config: Quantization configuration.
+
         Returns: A list of the framework substitutions used to prepare the graph.
 
         """
@@ -300,7 +325,9 @@ class FrameworkImplementation(ABC):
                                   quant_config: MixedPrecisionQuantizationConfigV2,
                                   representative_data_gen: Callable,
                                   fw_info: FrameworkInfo,
-                                  disable_activation_for_metric: bool = False) -> SensitivityEvaluation:
+                                  disable_activation_for_metric: bool = False,
+                                  compiled_inference: bool = False,
+                                  jit_compile_inference: bool = False) -> SensitivityEvaluation:
         """
         Creates and returns an object which handles the computation of a sensitivity metric for a mixed-precision
         configuration (comparing to the float model).
@@ -311,6 +338,8 @@ class FrameworkImplementation(ABC):
             representative_data_gen: Dataset to use for retrieving images for the models inputs.
             fw_info: FrameworkInfo object with information about the specific framework's model.
             disable_activation_for_metric: Whether to disable activation quantization when computing the MP metric.
+            compiled_inference: Whether to evaluate the models using a compiled inference function.
+            jit_compile_inference: Whether to jit-compile the compiled inference function.
 
         Returns:
             A function that computes the metric.
@@ -367,6 +396,40 @@ class FrameworkImplementation(ABC):
         raise NotImplemented(f'{self.__class__.__name__} have to implement the '
                              f'framework\'s get_node_distance_fn method.')
 
+    def get_framework_distance_fn(self, distance_fn: Callable) -> Callable:
+        """
+        Returns the framework's implementation of a Numpy distance function (that get_node_distance_fn returns),
+        for computing the distances between the models' output tensors without converting them to Numpy.
+        The returned function gets two batches of tensors and returns a tensor of the distance per sample.
+
+        Args:
+            distance_fn: A Numpy distance function.
+
+        Returns: The framework's implementation of the distance function, or None if the framework does not
+        implement the given function (e.g., a user-defined distance function).
+        """
+
+        return None
+
+    def compute_distance_matrix(self,
+                                baseline_tensors: List[Any],
+                                mp_tensors: List[Any],
+                                distance_fns: List[Callable]) -> np.ndarray:
+        """
+        Compute the distance matrix between the baseline model's outputs and the MP model's outputs
+        using the framework's distance functions (that get_framework_distance_fn returns).
+
+        Args:
+            baseline_tensors: Baseline model's output tensors.
+            mp_tensors: MP model's output tensors.
+            distance_fns: Framework's distance function of each output tensor.
+
+        Returns: A distance matrix of shape [outputs, samples].
+        """
+
+        raise NotImplemented(f'{self.__class__.__name__} have to implement the '
+                             f'framework\'s compute_distance_matrix method.')
+
     @abstractmethod
     def get_model_layers_names(self,
                                model: Any) -> List[str]:
@@ -435,6 +498,41 @@ class FrameworkImplementation(ABC):
         raise NotImplemented(f'{self.__class__.__name__} have to implement the '
                              f'framework\'s model_grad method.')
 
+    @abstractmethod
+    def batched_model_grad(self,
+                           graph_float: common.Graph,
+                           model_input_tensors: Dict[BaseNode, np.ndarray],
+                           interest_points: List[BaseNode],
+                           output_list: List[BaseNode],
+                           all_outputs_indices: List[int],
+                           alpha: float = 0.3,
+                           n_iter: int = 50,
+                           norm_weights: bool = True) -> np.ndarray:
+        """
+        Calls a framework specific model gradient calculation function, which computes the jacobian-based weights of
+        the model's outputs with respect to the feature maps of the set of given interest points, for each sample
+        of a batch (as model_grad computes for a single sample).
+
+        Args:
+            graph_float: Graph to build its corresponding framework model.
+            model_input_tensors: A mapping between model input nodes to an input batch.
+            interest_points: List of nodes which we want to get their feature map as output, to calculate distance metric.
+            output_list: List of nodes that considered as model's output for the purpose of gradients computation.
+            all_outputs_indices: Indices of the model outputs and outputs replacements (if exists),
+                in a topological sorted interest points list.
+            alpha: A tuning parameter to allow calibration between the contribution of the output feature maps returned
+                weights and the other feature maps weights (since the gradient of the output layers does not provide a
+                compatible weight for the distance metric computation).
+            n_iter: The number of random iterations to calculate the approximated jacobian-based weights for each interest point.
+            norm_weights: Whether to normalize the returned weights (to get values between 0 and 1).
+
+        Returns: An array of (possibly normalized) jacobian-based weights of each sample, with shape
+        (batch size, number of interest points).
+        """
+
+        raise NotImplemented(f'{self.__class__.__name__} have to implement the '
+                             f'framework\'s batched_model_grad method.')
+
     @abstractmethod
     def is_node_compatible_for_metric_outputs(self,
                                                  node: BaseNode) -> bool:
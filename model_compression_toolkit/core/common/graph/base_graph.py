@@ -15,7 +15,7 @@
 from collections import namedtuple
 
 from copy import copy, deepcopy
-from typing import List, Tuple, Any
+from typing import List, Tuple, Any, Callable, Dict
 
 import networkx as nx
 import numpy as np
@@ -59,6 +59,12 @@ class Graph(nx.MultiDiGraph, GraphSearches):
             **attr: Attributes to add to graph as key=value pairs.
         """
 
+        # The graph's version is increased on every change to its nodes, edges or nodes' candidates, and is used
+        # to invalidate cached information that is derived from the graph (e.g., its topological order).
+        self.version = 0
+        self._cache = dict()
+        self._cache_version = self.version
+
         super().__init__(**attr)
         self.name = name
         self.input_nodes = input_nodes
@@ -94,12 +100,137 @@ class Graph(nx.MultiDiGraph, GraphSearches):
         self.tpc = tpc
 
 
-    def get_topo_sorted_nodes(self):
+    def increase_version(self):
+        """
+        Increase the graph's version, which invalidates all cached information that was computed from
+        the graph (topological order, configurable nodes, etc.).
+        This is called automatically by the graph's methods that change its nodes, edges, inputs, outputs or
+        fusions, and should be called explicitly only after changing the nodes' quantization configuration
+        candidates.
+        """
+
+        self.version += 1
+
+    def __copy__(self):
+        """
+        Shallow copy of the graph. The copy gets its own (empty) cache, so changes to the copy do not
+        invalidate the original graph's cache and vice versa.
+        """
+
+        graph_copy = self.__class__.__new__(self.__class__)
+        graph_copy.__dict__.update(self.__dict__)
+        graph_copy._cache = dict()
+        return graph_copy
+
+    def __deepcopy__(self, memo: Dict[int, Any]):
+        """
+        Deep copy of the graph. The cache is not copied, and the copy gets its own (empty) cache.
+        """
+
+        graph_copy = self.__class__.__new__(self.__class__)
+        memo[id(self)] = graph_copy
+        for k, v in self.__dict__.items():
+            if k != '_cache':
+                graph_copy.__dict__[k] = deepcopy(v, memo)
+        graph_copy._cache = dict()
+        return graph_copy
+
+    def _get_cached(self, key: Any, compute_fn: Callable) -> Any:
+        """
+        Get a value that is derived from the graph from the graph's cache. If the graph was changed since the value
+        was cached (or the value was never cached), the value is computed and cached.
+
+        Args:
+            key: Key of the cached value.
+            compute_fn: Function with no arguments to compute the value with.
+
+        Returns:
+            The cached value.
+        """
+
+        if self._cache_version != self.version:
+            self._cache = dict()
+            self._cache_version = self.version
+        if key not in self._cache:
+            self._cache[key] = compute_fn()
+        return self._cache[key]
+
+    def add_node(self, node_for_adding: BaseNode, **attr):
+        super().add_node(node_for_adding, **attr)
+        self.increase_version()
+
+    def add_nodes_from(self, nodes_for_adding: List[BaseNode], **attr):
+        super().add_nodes_from(nodes_for_adding, **attr)
+        self.increase_version()
+
+    def remove_nodes_from(self, nodes: List[BaseNode]):
+        super().remove_nodes_from(nodes)
+        self.increase_version()
+
+    def add_edge(self, u_for_edge: BaseNode, v_for_edge: BaseNode, key: Any = None, **attr):
+        key = super().add_edge(u_for_edge, v_for_edge, key, **attr)
+        self.increase_version()
+        return key
+
+    def remove_edge(self, u: BaseNode, v: BaseNode, key: Any = None):
+        super().remove_edge(u, v, key)
+        self.increase_version()
+
+    def clear(self):
+        super().clear()
+        self.increase_version()
+
+    def clear_edges(self):
+        super().clear_edges()
+        self.increase_version()
+
+    def get_topo_sorted_nodes(self) -> List[BaseNode]:
         """
         Returns: a list of toposorted nodes.
         """
 
-        return list(nx.algorithms.dag.topological_sort(self))
+        return list(self._get_cached('topo_sorted_nodes', lambda: list(topological_sort(self))))
+
+    def get_topo_sorted_node_index(self, n: BaseNode) -> int:
+        """
+        Get the index of a node in the topological order of the graph.
+
+        Args:
+            n: Node to get its index.
+
+        Returns:
+            The index of the node in the list returned by get_topo_sorted_nodes.
+        """
+
+        return self._get_topo_sorted_nodes_index()[n]
+
+    def _get_topo_sorted_nodes_index(self) -> Dict[BaseNode, int]:
+        """
+        Returns: A dictionary from each node in the graph to its index in the topological order of the graph.
+        """
+
+        return self._get_cached('topo_sorted_nodes_index',
+                                lambda: {node: i for i, node in enumerate(self.get_topo_sorted_nodes())})
+
+    def get_activation_max_cut(self) -> Tuple[List[BaseNode], float, List[Any]]:
+        """
+        Get a memory-optimal schedule of the graph's nodes, according to the number of elements in the
+        activation tensors that are alive at the same time during the graph's execution (max-cut).
+        The schedule is computed once (using an AStar search over the graph's memory graph) and cached until
+        the graph is changed.
+
+        Returns: A tuple of the schedule (list of nodes), the max-cut size (number of elements) and the list of cuts
+        (the sets of activation tensors that are alive in each step of the schedule).
+        If a schedule could not be found, the tuple (None, 0, None) is returned.
+
+        """
+
+        # The memory graph package depends on the graph module, thus, it is imported here
+        from model_compression_toolkit.core.common.graph.memory_graph.memory_graph import MemoryGraph
+        from model_compression_toolkit.core.common.graph.memory_graph.compute_graph_max_cut import \
+            compute_graph_max_cut
+
+        return self._get_cached('activation_max_cut', lambda: compute_graph_max_cut(MemoryGraph(self)))
 
     def get_op_list(self) -> np.ndarray:
         """
@@ -131,6 +262,7 @@ class Graph(nx.MultiDiGraph, GraphSearches):
         """
 
         self.input_nodes = input_nodes
+        self.increase_version()
 
     def set_outputs(self,
                     output_nodes: List[OutTensor]):
@@ -141,6 +273,7 @@ class Graph(nx.MultiDiGraph, GraphSearches):
         """
 
         self.output_nodes = output_nodes
+        self.increase_version()
 
     def set_out_stats_collector_to_node(self,
                                         n: BaseNode,
@@ -441,6 +574,7 @@ class Graph(nx.MultiDiGraph, GraphSearches):
                                                          f'before deleting the node from the graph.'
         #  Remove node
         super().remove_node(node_to_remove)
+        self.increase_version()
 
     def incoming_edges(self,
                        n: BaseNode,
@@ -519,8 +653,29 @@ class Graph(nx.MultiDiGraph, GraphSearches):
         more weight qc candidate) sorted topology.
 
         """
-        sorted_names = [n.name for n in self.get_configurable_sorted_nodes(include_reused_nodes=include_reused_nodes)]
-        return sorted_names
+        return list(self._get_cached(('configurable_sorted_nodes_names', include_reused_nodes),
+                                     lambda: [n.name for n in
+                                              self.get_configurable_sorted_nodes(include_reused_nodes)]))
+
+    def get_configurable_node_index(self,
+                                    node_name: str,
+                                    include_reused_nodes: bool = False) -> int:
+        """
+        Get the index of a configurable node in the list of configurable nodes sorted according to the
+        topological order of the graph (which is the index of the node in a mixed-precision configuration).
+
+        Args:
+            node_name: Name of the node to get its index.
+            include_reused_nodes: Whether or not to include reused nodes (False by default).
+
+        Returns: The index of the node in the sorted list of configurable nodes, or None if the node is not
+        configurable.
+
+        """
+        names_to_index = self._get_cached(('configurable_sorted_nodes_index', include_reused_nodes),
+                                          lambda: {name: i for i, name in enumerate(
+                                              self.get_configurable_sorted_nodes_names(include_reused_nodes))})
+        return names_to_index.get(node_name)
 
     def get_weights_configurable_nodes(self,
                                        include_reused_nodes: bool = False) -> List[BaseNode]:
@@ -551,7 +706,9 @@ class Graph(nx.MultiDiGraph, GraphSearches):
             A list of nodes that their weights can be configured (namely, has one or more weight qc candidate)
             sorted topologically.
         """
-        return self._sort_nodes_in_list(self.get_weights_configurable_nodes(include_reused_nodes))
+        return list(self._get_cached(('sorted_weights_configurable_nodes', include_reused_nodes),
+                                     lambda: self._sort_nodes_in_list(
+                                         self.get_weights_configurable_nodes(include_reused_nodes))))
 
     def get_activation_configurable_nodes(self,
                                           include_reused_nodes: bool = False) -> List[BaseNode]:
@@ -575,7 +732,8 @@ class Graph(nx.MultiDiGraph, GraphSearches):
             A list of nodes that their activation can be configured (namely, has one or more activation qc candidate)
             sorted topologically.
         """
-        return self._sort_nodes_in_list(self.get_activation_configurable_nodes())
+        return list(self._get_cached('sorted_activation_configurable_nodes',
+                                     lambda: self._sort_nodes_in_list(self.get_activation_configurable_nodes())))
 
     def get_configurable_sorted_nodes(self,
                                       include_reused_nodes: bool = False) -> List[BaseNode]:
@@ -591,13 +749,17 @@ class Graph(nx.MultiDiGraph, GraphSearches):
              A list of nodes that can be configured (namely, has one or more qc candidate) sorted topology.
 
         """
-        weights_configurable_nodes = self.get_weights_configurable_nodes(include_reused_nodes)
-        activation_configurable_nodes = self.get_activation_configurable_nodes()
+        def _compute_configurable_sorted_nodes():
+            weights_configurable_nodes = self.get_weights_configurable_nodes(include_reused_nodes)
+            activation_configurable_nodes = self.get_activation_configurable_nodes()
+
+            # combine and remove duplications
+            configurable_nodes = list(set(weights_configurable_nodes + activation_configurable_nodes))
 
-        # combine and remove duplications
-        configurable_nodes = list(set(weights_configurable_nodes + activation_configurable_nodes))
+            return self._sort_nodes_in_list(configurable_nodes)
 
-        return self._sort_nodes_in_list(configurable_nodes)
+        return list(self._get_cached(('configurable_sorted_nodes', include_reused_nodes),
+                                     _compute_configurable_sorted_nodes))
 
     def _sort_nodes_in_list(self, nodes_list: List[BaseNode]) -> List[BaseNode]:
         """
@@ -609,12 +771,9 @@ class Graph(nx.MultiDiGraph, GraphSearches):
         Returns: nodes_list sorted topologically.
 
         """
-        sorted_configurable_nodes = []
-        sorted_nodes = list(topological_sort(self))
-        for n in sorted_nodes:
-            if n in nodes_list:
-                sorted_configurable_nodes.append(n)
-        return sorted_configurable_nodes
+        nodes_index = self._get_topo_sorted_nodes_index()
+        # Nodes that are not in the graph are filtered out
+        return sorted([n for n in set(nodes_list) if n in nodes_index], key=nodes_index.get)
 
     def get_min_candidates_config(self) -> List[int]:
         """
@@ -681,6 +840,7 @@ class Graph(nx.MultiDiGraph, GraphSearches):
 
         """
         self.fused_nodes.append(fusion)
+        self.increase_version()
 
     def is_single_activation_cfg(self):
         """
@@ -20,6 +20,7 @@ import numpy as np
 
 from model_compression_toolkit.core.common.constants import WEIGHTS_NBITS_ATTRIBUTE, CORRECTED_BIAS_ATTRIBUTE, \
     ACTIVATION_NBITS_ATTRIBUTE
+from model_compression_toolkit.core.common.graph.weights_store import NodeWeights
 
 
 class BaseNode:
@@ -77,6 +78,26 @@ class BaseNode:
         """
         return self.layer_class
 
+    @property
+    def weights(self) -> NodeWeights:
+        """
+        The node's weights are held as handles in the weights store, so copying a node does not copy its weights.
+        Getting a weight returns a read-only array. To modify a weight, a new array should be set instead.
+
+        Returns: Dictionary from a variable name to the weights with that name in the layer the node represents.
+        """
+        return self._weights
+
+    @weights.setter
+    def weights(self, weights: Dict[str, np.ndarray]):
+        """
+        Set the node's weights.
+
+        Args:
+            weights: Dictionary from a variable name to the weights with that name in the layer the node represents.
+        """
+        self._weights = weights if isinstance(weights, NodeWeights) else NodeWeights(weights)
+
     def get_has_activation(self):
         """
         Returns has_activation attribute.
@@ -27,6 +27,8 @@ def compute_graph_max_cut(memory_graph: MemoryGraph,
     """
     A wrapper function to compute max cut and schedule for a given model.
     It runs iterations of AStar search on the given memory graph with a dynamically updating estimation bound.
+    The same MaxCutAstar object is used in all iterations, so cuts expansions computed in previous iterations
+    are reused.
 
     Args:
         memory_graph: A MemoryGraph object to run the search on.
@@ -44,15 +46,18 @@ def compute_graph_max_cut(memory_graph: MemoryGraph,
     it = 0
     while it < n_iter:
         estimate = (u_bound + l_bound) / 2
-        schedule, max_cut_size, cuts = max_cut_astar.solve(estimate_factor=estimate, iter_limit=astar_n_iter)
+        schedule, max_cut_size, cuts = max_cut_astar.solve(estimate=estimate, iter_limit=astar_n_iter)
         if schedule is None:
-            return last_result
+            # No solution was found within the search limit with the current estimation, so increase it
+            l_bound = estimate
+        else:
+            u_bound = min(estimate, max_cut_size)
+            # A search may find a solution with a max cut above the estimate, so keep the best solution found
+            if last_result[0] is None or max_cut_size < last_result[1]:
+                last_result = (schedule, max_cut_size, cuts)
 
-        next_u_bound = min(estimate, max_cut_size)
-        last_result = (schedule, max_cut_size, cuts)
-
-        if l_bound * (1 + eps) >= next_u_bound:
-            return last_result
+            if l_bound * (1 + eps) >= u_bound:
+                return last_result
 
         it += 1
 
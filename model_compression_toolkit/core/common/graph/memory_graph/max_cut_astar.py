@@ -13,6 +13,8 @@
 # limitations under the License.
 # ==============================================================================
 import copy
+import heapq
+import itertools
 from typing import List, Tuple, Dict
 
 from model_compression_toolkit.core.common import BaseNode
@@ -72,11 +74,43 @@ class DummyActivationMemoryTensorGenerator:
             self.counter += 1
 
 
+class _RouteNode:
+    """
+    A node in the AStar search tree. Holds a cut, its cost and a pointer to the route node of the cut it was
+    expanded from, so the route to the cut doesn't need to be copied in each expansion.
+    """
+
+    def __init__(self, cut: Cut, cost: float, parent: '_RouteNode' = None):
+        """
+        Args:
+            cut: The cut the node represents.
+            cost: The cost of the route to the cut.
+            parent: The route node of the cut that this cut was expanded from (None for the source cut).
+        """
+
+        self.cut = cut
+        self.cost = cost
+        self.parent = parent
+        self.length = 1 if parent is None else parent.length + 1
+
+    def get_route(self) -> List[Cut]:
+        """
+        Returns: The route to the node's cut (ordered from the node's cut back to the source cut).
+        """
+
+        route = []
+        route_node = self
+        while route_node is not None:
+            route.append(route_node.cut)
+            route_node = route_node.parent
+        return route
+
+
 class MaxCutAstar:
     """
     Implements the AStar solver and all the relevant utility methods to run a search for schedule and max cut
     on a model memory graph.
-    The solver returns a schedule, the max cut of the schedule and a set of all the cuts that are developed during
+    The solver returns a schedule, the max cut of the schedule and a list of all the cuts that are developed during
     the computation of the model according to the returned schedule.
     """
 
@@ -122,112 +156,110 @@ class MaxCutAstar:
         self.target_cut = Cut([], set(), MemoryElements(elements={target_dummy_b, target_dummy_b2},
                                                         total_size=0))
 
-    def solve(self, estimate_factor: float, iter_limit: int = 500) -> Tuple[List[BaseNode], float, List[Cut]]:
+        # Expansions are kept between searches, so repeated searches with different estimation factors
+        # don't need to re-compute them.
+        self._expansions_cache = {}
+
+    def solve(self, estimate: float, iter_limit: int = 500) -> Tuple[List[BaseNode], float, List[Cut]]:
         """
         The AStar solver function. This method runs an AStar-like search on the memory graph,
-        using the given estimate_factor as a heuristic gap for solutions to consider.
+        using the given estimate as a heuristic gap for solutions to consider.
+        The open set is kept in a priority queue with lazy deletion (outdated entries are skipped when popped),
+        the closed set is a hash set of the visited cuts' memory elements and the routes are kept as parent pointers.
 
         Args:
-            estimate_factor: A multiplication factor which allows the search to consider larger size of nodes in each
-                expansion step, in order to fasten the algorithm divergence towards a solution.
+            estimate: An estimation of the max cut size, which allows the search to consider larger size of nodes
+                in each expansion step, in order to fasten the algorithm divergence towards a solution.
             iter_limit: An upper limit for the number of expansion steps that the algorithm preforms.
 
         Returns: A solution (if found within the steps limit) which contains:
         - A schedule for computation of the model (List of nodes).
         - The cost of a max cut of the found schedule.
-        - All the cuts that are developed during the computation on the model according to the found schedule (List of Cuts).
+        - All the cuts that are developed during the computation on the model according to the found schedule,
+          ordered by the schedule (List of Cuts).
 
         """
 
-        open_list = [self.src_cut]
-        closed_list = []
-        costs = {self.src_cut: self.src_cut.memory_size()}
-        routes = {self.src_cut: [self.src_cut]}
+        # Open set: a heap of (priority, negative route length, insertion counter, route node) entries, and a mapping
+        # from a cut's memory elements (which identify a cut) to its currently valid route node in the heap.
+        # Among cuts with the same priority, longer routes are expanded first, to advance towards the target cut.
+        open_heap = []
+        open_routes = {}
+        closed_set = set()
+        push_counter = itertools.count()
+
+        def _push(route_node: _RouteNode):
+            open_routes[route_node.cut.mem_elements] = route_node
+            priority = self.accumulate(route_node.cost, self.estimate(route_node.cut, estimate))
+            heapq.heappush(open_heap, (priority, -route_node.length, next(push_counter), route_node))
+
+        _push(_RouteNode(self.src_cut, self.src_cut.memory_size(), None))
 
         expansion_count = 0
 
-        while expansion_count < iter_limit and len(open_list) > 0:
+        while expansion_count < iter_limit and len(open_routes) > 0:
             # Choose next node to expand
-            next_cut = self._get_cut_to_expand(open_list, costs, routes, estimate_factor)
-
-            cut_cost = costs[next_cut]
-            cut_route = routes[next_cut]
+            next_route = self._get_cut_to_expand(open_heap, open_routes)
+            next_cut = next_route.cut
+            cut_cost = next_route.cost
 
             if next_cut == self.target_cut:
-                return self._remove_dummys_from_path(cut_route[0].op_order), cut_cost,\
-                       list(set([self._remove_dummys_from_cut(self.clean_memory_for_next_step(c)) for c in cut_route]))
+                cut_route = next_route.get_route()
+                # A cut is returned for each operation in the schedule (in the order of the schedule), which holds
+                # the memory elements that are alive while computing the operation (its inputs and outputs, and any
+                # other tensor that is still required by an operation that wasn't computed yet).
+                return self._remove_dummys_from_path(cut_route[0].op_order), cut_cost, \
+                       [self._remove_dummys_from_cut(c) for c in reversed(cut_route)
+                        if DUMMY_NODE not in c.op_order[-1].name]
 
             if self.is_pivot(next_cut):
                 # Can clear all search history
-                open_list = []
-                closed_list = []
-                routes = {}
+                open_heap = []
+                open_routes.clear()
+                closed_set.clear()
             else:
-                # Can remove only next_cut and put it in closed_list
-                open_list.remove(next_cut)
-                del routes[next_cut]
-                closed_list.append(next_cut)
+                # Can remove only next_cut and put it in closed set
+                del open_routes[next_cut.mem_elements]
+                closed_set.add(next_cut.mem_elements)
 
             # Expand the chosen cut
             expanded_cuts = self.expand(next_cut)
             expansion_count += 1
 
-            # Only consider nodes that where not already visited
-            expanded_cuts = list(filter(lambda _c: _c not in closed_list, expanded_cuts))
             for c in expanded_cuts:
+                # Only consider nodes that where not already visited
+                if c.mem_elements in closed_set:
+                    continue
                 cost = self.accumulate(cut_cost, c.memory_size())
-                if c not in open_list:
-                    self._update_expanded_node(c, cost, cut_route, open_list, costs, routes)
-                elif self.ordering(cost, costs[c]):
+                open_route = open_routes.get(c.mem_elements)
+                if open_route is None or self.ordering(cost, open_route.cost):
                     # If we already saw this cut during the search with a larger cost, then we want to update the order
-                    # of the schedule in the cut
-                    # Remove call - removes the cut with the same memory elements but different ordering from open
-                    # Then - adds the cut with the improved ordering from open
-                    open_list.remove(c)
-                    self._update_expanded_node(c, cost, cut_route, open_list, costs, routes)
+                    # of the schedule in the cut. The previous entry of the cut in the heap becomes outdated and is
+                    # skipped when it is popped.
+                    _push(_RouteNode(c, cost, next_route))
 
         # Halt or No Solution
         return None, 0, None
 
     @staticmethod
-    def _update_expanded_node(cut: Cut, cost: float, route: List[Cut], open_list: List[Cut],
-                              costs: Dict[Cut, float], routes: Dict[Cut, List[Cut]]):
-        """
-        An auxiliary method for updating search data structures according to an expanded node.
-
-        Args:
-            cut: A cut to expand the search to.
-            cost: The cost of the cut.
-            route: The rout to the cut.
-            open_list: The search open list.
-            costs: The search utility mapping between cuts and their cost.
-            routes: The search utility mapping between cuts and their routes.
-
-        """
-        open_list.append(cut)
-        costs.update({cut: cost})
-        routes.update({cut: [cut] + route})
-
-    def _get_cut_to_expand(self, open_list: List[Cut], costs: Dict[Cut, float], routes: Dict[Cut, List[Cut]],
-                           estimate_factor: float) -> Cut:
+    def _get_cut_to_expand(open_heap: List[Tuple], open_routes: Dict[MemoryElements, '_RouteNode']) -> '_RouteNode':
         """
         An auxiliary method for finding a cut for expanding the search out of a set of potential cuts for expansion.
+        Pops entries from the open heap until a valid (not outdated) entry is found.
 
         Args:
-            open_list: The search open list.
-            costs: The search utility mapping between cuts and their cost.
-            routes: The search utility mapping between cuts and their routes.
-            estimate_factor: A multiplication factor to set extended boundaries on the potential cuts to exapand.
+            open_heap: The search open heap.
+            open_routes: A mapping from the open cuts' memory elements to their valid route node.
 
-        Returns: A sorted list of potential cuts for expansion (ordered by lowest cost first).
+        Returns: The route node of the cut with the lowest cost (the longest route is used to break ties).
 
         """
-        ordered_cuts_list = sorted(open_list,
-                                   key=lambda c: (self.accumulate(costs[c], self.estimate(c, estimate_factor)), len(routes[c])),
-                                   reverse=False)
-
-        assert len(ordered_cuts_list) > 0
-        return ordered_cuts_list[0]
+        assert len(open_heap) > 0
+        route_node = heapq.heappop(open_heap)[-1]
+        while open_routes.get(route_node.cut.mem_elements) is not route_node:
+            # Outdated entry of a cut that was closed or that was reached later with a lower cost
+            route_node = heapq.heappop(open_heap)[-1]
+        return route_node
 
     def clean_memory_for_next_step(self, cut: Cut) -> Cut:
         """
@@ -269,6 +301,8 @@ class MaxCutAstar:
     def expand(self, cut: Cut) -> List[Cut]:
         """
         Expends the search with the given cut.
+        The expansion candidates of a cut depend only on its executed operations and memory elements, so they are
+        cached and reused in subsequent searches (e.g., in the iterations of compute_graph_max_cut).
 
         Args:
             cut: A cut to expand the search to.
@@ -276,29 +310,41 @@ class MaxCutAstar:
         Returns: A list of successors of the expanded cut.
 
         """
-        clean_cut = self.clean_memory_for_next_step(cut)
+        expansion_key = (frozenset(cut.op_record), cut.mem_elements)
+        expansions = self._expansions_cache.get(expansion_key)
+        if expansions is None:
+            clean_cut = self.clean_memory_for_next_step(cut)
+            clean_elements = clean_cut.mem_elements.elements
+
+            # candidates for expansion are children of the memory elements from the cleaned cut that can be expanded
+            candidates = []
+            for mem_element in clean_elements:
+                for op in self.memory_graph.activation_tensor_children(mem_element):
+                    if op not in cut.op_record and op not in candidates and \
+                            all([parent_mem_element in clean_elements for parent_mem_element in
+                                 self.memory_graph.operation_node_parents(op)]):
+                        candidates.append(op)
 
-        # candidates for expansion are children of the memory elements from the cleaned cut that can be expanded
-        candidates = []
-        for mem_element in clean_cut.mem_elements.elements:
-            child_ops = self.memory_graph.activation_tensor_children(mem_element)
-            ops_to_expand = list(filter(lambda op: self.can_expand(op, clean_cut) and op not in candidates, child_ops))
-            candidates.extend(ops_to_expand)
+            # for each candidate we keep the resulting memory elements
+            # (resulting memory elements of the operation are added to the cleaned cut's memory elements)
+            expansions = []
+            for candidate in candidates:
+                mem_elements = copy.copy(clean_cut.mem_elements)
+                mem_elements.add_elements_set(set(self.memory_graph.operation_node_children(candidate)))
+                expansions.append((candidate, mem_elements))
+
+            self._expansions_cache[expansion_key] = expansions
 
         # for each candidate a cut is returned with the candidate expanded
         # (operation is added to record / order and resulting memory elements added to memory elements)
         next_cuts = []
-        for candidate in candidates:
-            op_order = clean_cut.op_order + [candidate]
+        for candidate, mem_elements in expansions:
+            op_order = cut.op_order + [candidate]
 
-            op_record = clean_cut.op_record.copy()
+            op_record = cut.op_record.copy()
             op_record.add(candidate)
 
-            mem_elements = copy.copy(clean_cut.mem_elements)
-            mem_elements.add_elements_set(set(self.memory_graph.operation_node_children(candidate)))
-
-            expanded_cut = Cut(op_order, op_record, mem_elements)
-            next_cuts.append(expanded_cut)
+            next_cuts.append(Cut(op_order, op_record, mem_elements))
 
         return next_cuts
 
@@ -351,7 +397,8 @@ class MaxCutAstar:
         """
         return cost_1 < cost_2
 
-    def estimate(self, cut: Cut, estimate_factor: float) -> float:
+    @staticmethod
+    def estimate(cut: Cut, estimate: float) -> float:
         """
         A function that defines the estimation gap for the Astar search.
         The estimation gap is used to sort the cuts that are considered for expanding the search in each iteration.
@@ -359,15 +406,15 @@ class MaxCutAstar:
         Args:
             cut: A cut (not used in the default implementation, but can be used if overriding the method to consider
                 the actual cut in the estimation computation).
-            estimate_factor: The given estimate factor to the search.
+            estimate: The given estimate to the search.
 
         Returns: An estimation value.
 
         """
-        return estimate_factor * self.memory_graph.memory_lbound_single_op
+        return estimate
 
     @staticmethod
-    def get_init_estimate_factor(memory_graph: MemoryGraph) -> float:
+    def get_init_estimate(memory_graph: MemoryGraph) -> float:
         """
         Returns an initial estimation value, which is based on the memory graph's upper and lower bounds.
 
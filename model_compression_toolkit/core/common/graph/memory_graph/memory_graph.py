@@ -48,8 +48,14 @@ class MemoryGraph(DirectedBipartiteGraph):
             n_outputs = [n.output_shape] if isinstance(n.output_shape, tuple) else n.output_shape
             out_edges = model_graph.out_edges(n, sort_by_attr=EDGE_SOURCE_INDEX)
 
+            # A node without output tensors (e.g., an operation with a non-tensor output) gets an empty
+            # memory tensor, so all operations have an activation tensor in the memory graph
+            init_size_to_zero = len(n_outputs) == 0
+            if init_size_to_zero:
+                n_outputs = [tuple()]
+
             for i, ot in enumerate(n_outputs):
-                memory_tensor = ActivationMemoryTensor(ot, n.name, i)
+                memory_tensor = ActivationMemoryTensor(ot, n.name, i, init_size_to_zero=init_size_to_zero)
                 memory_tensors.append(memory_tensor)
                 # Add memory tensor as current node's output
                 node_to_tensor.append((n, memory_tensor))
@@ -0,0 +1,92 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import List, Dict
+
+from model_compression_toolkit.core.common import Graph, BaseNode, Logger
+
+
+def set_memory_schedule(graph: Graph) -> bool:
+    """
+    Computes a memory-optimal execution schedule of the graph (using the graph's activation max-cut) and sets it
+    in the graph's UserInformation, together with the activation tensors that are alive in each step of the schedule.
+
+    Args:
+        graph: Graph to compute its memory schedule.
+
+    Returns: True if a schedule was found and set in the graph's UserInformation, False otherwise.
+
+    """
+
+    schedule, _, cuts = graph.get_activation_max_cut()
+    if schedule is None:
+        Logger.warning(f"Failed to compute a memory schedule for graph {graph.name}, "
+                       f"the memory schedule is not set.")
+        return False
+
+    graph.user_info.set_memory_schedule([n.name for n in schedule],
+                                        [sorted({t.node_name for t in c.mem_elements.elements}) for c in cuts])
+    return True
+
+
+def get_memory_schedule(graph: Graph) -> List[BaseNode]:
+    """
+    Get the graph's nodes ordered by the memory schedule in the graph's UserInformation.
+    If no schedule was set, or the schedule doesn't match the graph's nodes (e.g., the graph was changed after the
+    schedule was computed), the schedule is computed and set in the graph's UserInformation.
+
+    Args:
+        graph: Graph to get its memory schedule.
+
+    Returns: A list of the graph's nodes ordered by the schedule, or None if a schedule could not be found.
+
+    """
+
+    name_to_node = {n.name: n for n in graph.nodes}
+    schedule = graph.user_info.memory_schedule
+    if schedule is None or sorted(schedule) != sorted(name_to_node.keys()):
+        if not set_memory_schedule(graph):
+            return None
+        schedule = graph.user_info.memory_schedule
+
+    return [name_to_node[name] for name in schedule]
+
+
+def get_nodes_to_release(schedule: List[BaseNode],
+                         graph: Graph,
+                         nodes_to_keep: List[BaseNode]) -> Dict[BaseNode, List[BaseNode]]:
+    """
+    Build a mapping from each node in the schedule to the nodes that their output tensors can be released after
+    it is executed, i.e., the node is the last node in the schedule that uses the tensors.
+
+    Args:
+        schedule: The graph's nodes ordered by their execution order.
+        graph: Graph the nodes belong to.
+        nodes_to_keep: Nodes that their output tensors should never be released (e.g., the model's outputs).
+
+    Returns: A dictionary from a node to a list of nodes that their output tensors can be released after it runs.
+
+    """
+
+    last_use = {}
+    for n in schedule:
+        for ie in graph.incoming_edges(n):
+            last_use[ie.source_node] = n
+
+    nodes_to_release = {}
+    for source_node, last_node in last_use.items():
+        if source_node not in nodes_to_keep:
+            nodes_to_release.setdefault(last_node, []).append(source_node)
+
+    return nodes_to_release
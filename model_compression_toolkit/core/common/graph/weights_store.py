@@ -0,0 +1,208 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import hashlib
+import os
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator
+from weakref import WeakValueDictionary
+
+import numpy as np
+
+# Entries in a file-backed store are aligned to this number of bytes.
+WEIGHTS_STORE_ALIGNMENT = 64
+
+
+class WeightHandle:
+    """
+    An immutable handle of a weight array in a WeightsStore. Copying a handle returns the same handle,
+    so copying a graph copies only the handles of its nodes' weights (and not the weights themselves).
+    """
+    __slots__ = ('key', 'array')
+
+    def __init__(self, key: str, array: np.ndarray):
+        """
+        Args:
+            key: Content key of the weight in the store.
+            array: The read-only weight array.
+        """
+        self.key = key
+        self.array = array
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]):
+        return self
+
+
+class WeightsStore:
+    """
+    A content-addressed arena of read-only weight arrays. Arrays with identical content (dtype, shape and values)
+    share a single entry. Entries are never modified: setting a new weight adds a new entry.
+    The arena can be backed by a file, which is memory-mapped, so the weights are paged in from the file
+    (instead of being held in memory). A file-backed arena only grows, and its file is removed when the
+    store is closed.
+    """
+
+    def __init__(self, file_path: str = None):
+        """
+        Args:
+            file_path: Path of a file to back the arena with (optional). If None, the arena is held in memory.
+        """
+        self.file_path = file_path
+        self._file = None if file_path is None else open(file_path, 'w+b')
+        # An entry is kept while there is a handle that refers to its array.
+        self._entries = WeakValueDictionary()
+
+    @staticmethod
+    def _get_key(array: np.ndarray) -> str:
+        """
+        Compute the content key of an array.
+
+        Args:
+            array: Array to compute its key.
+
+        Returns: The content key of the array.
+        """
+        key = hashlib.sha1(f'{array.dtype.str}{array.shape}'.encode())
+        key.update(np.ascontiguousarray(array).reshape(-1).view(np.uint8).data)
+        return key.hexdigest()
+
+    def _write_array(self, array: np.ndarray) -> np.ndarray:
+        """
+        Append an array to the arena's file, and map it back from the file.
+
+        Args:
+            array: Array to write.
+
+        Returns: A read-only array that is memory-mapped from the file.
+        """
+        offset = self._file.seek(0, os.SEEK_END)
+        padding = -offset % WEIGHTS_STORE_ALIGNMENT
+        self._file.write(b'\0' * padding)
+        self._file.write(np.ascontiguousarray(array).tobytes())
+        self._file.flush()
+        mapped_array = np.memmap(self.file_path, dtype=array.dtype, mode='r', offset=offset + padding,
+                                 shape=array.shape)
+        return mapped_array.view(np.ndarray)
+
+    def put(self, array: np.ndarray) -> WeightHandle:
+        """
+        Add an array to the store (if an array with the same content is not in the store already).
+
+        Args:
+            array: Array to add.
+
+        Returns: A handle of the array's entry.
+        """
+        key = self._get_key(array)
+        stored_array = self._entries.get(key)
+        if stored_array is None:
+            if self._file is not None and array.size > 0:
+                stored_array = self._write_array(array)
+            else:
+                stored_array = np.array(array)
+                stored_array.flags.writeable = False
+            self._entries[key] = stored_array
+        return WeightHandle(key, stored_array)
+
+    def close(self):
+        """
+        Close the store's file and remove it. Arrays that were mapped from the file remain valid.
+        """
+        if self._file is not None:
+            self._file.close()
+            os.remove(self.file_path)
+            self._file = None
+
+
+_weights_store = WeightsStore()
+
+
+def get_weights_store() -> WeightsStore:
+    """
+    Returns: The WeightsStore that nodes' weights are added to.
+    """
+    return _weights_store
+
+
+def set_weights_store_file(file_path: str = None):
+    """
+    Set a file to back the store of the nodes' weights. The weights that are added to the store are written to
+    the file and memory-mapped from it, so models with weights larger than the host's memory can be quantized.
+    The file is created (or overwritten), and removed when another file is set.
+
+    Args:
+        file_path: Path of the file to back the weights store. If None, the weights are held in memory.
+
+    """
+    global _weights_store
+    _weights_store.close()
+    _weights_store = WeightsStore(file_path)
+
+
+class NodeWeights(MutableMapping):
+    """
+    A dictionary from a variable name to a node's weight, that holds the weights as handles in a WeightsStore.
+    Getting a weight returns a read-only array, and setting a weight adds a new entry to the store.
+    Copying a NodeWeights copies the handles only.
+    """
+
+    def __init__(self, weights: Dict[str, Any] = None):
+        """
+        Args:
+            weights: Dictionary from a variable name to a weight (optional).
+        """
+        self._handles = {}
+        if weights is not None:
+            self.update(weights)
+
+    def __getitem__(self, name: str) -> Any:
+        value = self._handles[name]
+        return value.array if isinstance(value, WeightHandle) else value
+
+    def __setitem__(self, name: str, value: Any):
+        # Values that are not numeric arrays (such as None for a missing bias) are held as is.
+        if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+            value = get_weights_store().put(value)
+        self._handles[name] = value
+
+    def __delitem__(self, name: str):
+        del self._handles[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._handles)
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __copy__(self):
+        weights = NodeWeights()
+        weights._handles = dict(self._handles)
+        return weights
+
+    def __deepcopy__(self, memo: Dict[int, Any]):
+        weights = NodeWeights()
+        weights._handles = {k: v if isinstance(v, WeightHandle) else copy.deepcopy(v, memo)
+                            for k, v in self._handles.items()}
+        return weights
+
+    def __reduce__(self):
+        # Pickle the weights' arrays, so they are added to the store of the unpickling process.
+        return NodeWeights, (dict(self.items()),)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
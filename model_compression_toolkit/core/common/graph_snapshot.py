@@ -0,0 +1,204 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import hashlib
+import os
+import pickle
+import re
+from typing import Any, List
+
+import numpy as np
+
+from model_compression_toolkit.core.common.graph.base_graph import Graph
+from model_compression_toolkit.core.common.logger import Logger
+from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig, DEFAULTCONFIG
+
+# Version of the snapshot file format. Snapshots of other versions are ignored.
+SNAPSHOT_VERSION = 1
+
+# Memory addresses in objects representations (e.g. '<function relu at 0x7f...>') differ between processes,
+# so they are removed before the representations are hashed.
+_ADDRESS_PATTERN = re.compile(r' at 0x[0-9a-fA-F]+')
+
+
+def _update_hash(h: Any, obj: Any):
+    """
+    Update a hash object with the (address-less) representation of an object.
+
+    Args:
+        h: Hash object to update.
+        obj: Object to hash.
+    """
+    h.update(_ADDRESS_PATTERN.sub('', repr(obj)).encode())
+
+
+def _update_hash_with_array(h: Any, array: Any):
+    """
+    Update a hash object with the shape, dtype and content of an array.
+
+    Args:
+        h: Hash object to update.
+        array: Array to hash.
+    """
+    array = np.ascontiguousarray(array)
+    _update_hash(h, (array.shape, array.dtype.str))
+    if array.dtype == object:
+        _update_hash(h, array.tolist())
+    else:
+        h.update(array.tobytes())
+
+
+def get_graph_fingerprint(graph: Graph) -> str:
+    """
+    Compute a fingerprint of a graph: its topology and, for each node, its type, attributes, shapes and weights.
+    Since the fingerprint is computed on the graph that the statistics are collected on, it reflects both the model
+    and the configuration the graph was prepared with (e.g. substitutions and channel equalization).
+
+    Args:
+        graph: Graph to compute its fingerprint.
+
+    Returns:
+        Hex digest of the graph fingerprint.
+    """
+    h = hashlib.sha256()
+    for n in graph.get_topo_sorted_nodes():
+        node_type = n.type
+        _update_hash(h, (n.name,
+                         getattr(node_type, '__module__', ''),
+                         getattr(node_type, '__qualname__', node_type),
+                         n.framework_attr,
+                         n.input_shape,
+                         n.output_shape,
+                         getattr(n, 'op_call_args', None),
+                         getattr(n, 'op_call_kwargs', None)))
+        for weight_name, weight in sorted(n.weights.items(), key=lambda w: str(w[0])):
+            _update_hash(h, weight_name)
+            _update_hash_with_array(h, weight)
+        for e in graph.out_edges(n):
+            _update_hash(h, (e.sink_node.name, e.source_index, e.sink_index))
+    return h.hexdigest()
+
+
+def get_data_fingerprint(inputs_list: List[Any]) -> str:
+    """
+    Compute a fingerprint of a batch of the representative dataset.
+
+    Args:
+        inputs_list: Inputs of the model (a list of arrays).
+
+    Returns:
+        Hex digest of the batch fingerprint.
+    """
+    h = hashlib.sha256()
+    for inputs in inputs_list:
+        _update_hash_with_array(h, inputs)
+    return h.hexdigest()
+
+
+def get_snapshot_path(snapshot_dir: str,
+                      graph: Graph,
+                      first_inputs: List[Any],
+                      n_iter: int,
+                      quant_config: QuantizationConfig = DEFAULTCONFIG) -> str:
+    """
+    Get the path of the statistics snapshot of a graph. The snapshot is keyed by a hash of the graph fingerprint,
+    a fingerprint of the first batch of the representative dataset, the number of calibration iterations and the
+    histogram sampling configuration.
+
+    Args:
+        snapshot_dir: Directory of the snapshots.
+        graph: Graph the statistics are collected on.
+        first_inputs: First batch of the representative dataset.
+        n_iter: Number of calibration iterations.
+        quant_config: Quantization configuration the statistics are collected with.
+
+    Returns:
+        Path of the snapshot file.
+    """
+    h = hashlib.sha256()
+    _update_hash(h, (SNAPSHOT_VERSION, get_graph_fingerprint(graph), get_data_fingerprint(first_inputs), n_iter,
+                     quant_config.histogram_sample_size, quant_config.histogram_sampling_method.name))
+    return os.path.join(snapshot_dir, f'statistics_{h.hexdigest()[:32]}.pkl')
+
+
+def save_statistics_snapshot(graph: Graph, path: str):
+    """
+    Save the output statistics collectors of the graph nodes to a snapshot file.
+
+    Args:
+        graph: Graph with collected statistics.
+        path: Path of the snapshot file.
+    """
+    statistics = {n.name: graph.get_out_stats_collector(n) for n in graph.nodes}
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # Write to a temporary file first, so concurrent runs never read a partially written snapshot
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump({'version': SNAPSHOT_VERSION, 'statistics': statistics}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    Logger.info(f'Saved statistics snapshot to {path}')
+
+
+def _is_matching_collector(sc: Any, loaded_sc: Any) -> bool:
+    if isinstance(sc, list):
+        return isinstance(loaded_sc, list) and len(sc) == len(loaded_sc) and \
+               all([_is_matching_collector(s, l) for s, l in zip(sc, loaded_sc)])
+    return type(sc) == type(loaded_sc)
+
+
+def _restore_collector(sc: Any, loaded_sc: Any):
+    # The collectors are restored in place, since the input statistics of the next nodes refer to them
+    if isinstance(sc, list):
+        for s, l in zip(sc, loaded_sc):
+            _restore_collector(s, l)
+    elif sc is not None:
+        sc.__dict__.update(loaded_sc.__dict__)
+
+
+def load_statistics_snapshot(graph: Graph, path: str) -> bool:
+    """
+    Restore the output statistics collectors of the graph nodes from a snapshot file. The statistics are restored
+    only if the snapshot has a collector of the same kind for every node of the graph (for example, a change in the
+    target platform capabilities can change the nodes that collect statistics).
+
+    Args:
+        graph: Graph with statistics collectors attached (and no statistics collected yet).
+        path: Path of the snapshot file.
+
+    Returns:
+        Whether the statistics were restored.
+    """
+    try:
+        with open(path, 'rb') as f:
+            snapshot = pickle.load(f)
+    except Exception as e:
+        Logger.warning(f'Failed to read statistics snapshot {path}: {e}')
+        return False
+
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        Logger.warning(f'Statistics snapshot {path} has an unsupported version, and is ignored')
+        return False
+
+    statistics = snapshot['statistics']
+    for n in graph.nodes:
+        if n.name not in statistics or \
+                not _is_matching_collector(graph.get_out_stats_collector(n), statistics[n.name]):
+            Logger.warning(f'Statistics snapshot {path} does not match the statistics collectors of node {n.name}, '
+                           f'and is ignored')
+            return False
+
+    for n in graph.nodes:
+        _restore_collector(graph.get_out_stats_collector(n), statistics[n.name])
+    Logger.info(f'Restored statistics from snapshot {path}')
+    return True
@@ -44,13 +44,12 @@ def set_bit_widths(mixed_precision_enable: bool,
             "All configurable nodes in graph should have at least one candidate configuration in mixed precision mode"
 
         Logger.info(f'Set bit widths from configuration: {bit_widths_config}')
-        # Get a list of nodes' names we need to finalize (that they have at least one weight qc candidate).
-        sorted_nodes_names = graph.get_configurable_sorted_nodes_names()
         for node in graph.nodes:  # set a specific node qc for each node final weights qc
             # If it's reused, take the configuration that the base node has
             node_name = node.name if not node.reuse else '_'.join(node.name.split('_')[:-2])
-            if node_name in sorted_nodes_names:  # only configurable nodes are in this list
-                node_index_in_graph = sorted_nodes_names.index(node_name)
+            # Get the node's index in the configuration (only configurable nodes have one)
+            node_index_in_graph = graph.get_configurable_node_index(node_name)
+            if node_index_in_graph is not None:
                 _set_node_final_qc(bit_widths_config,
                                    node,
                                    node_index_in_graph)
@@ -69,6 +68,9 @@ def set_bit_widths(mixed_precision_enable: bool,
                     "Node need to have at least one quantization configuration in order to quantize its activation"
                 node.final_weights_quantization_cfg = copy.deepcopy(node.candidates_quantization_cfg[0].weights_quantization_cfg)
 
+        # Setting the final configurations changes which nodes are configurable.
+        graph.increase_version()
+
     # When working in non-mixed-precision mode, there's only one bitwidth, and we simply set the
     # only candidate of the node as its final weight and activation quantization configuration.
     else:
@@ -76,6 +78,7 @@ def set_bit_widths(mixed_precision_enable: bool,
             assert len(n.candidates_quantization_cfg) == 1
             n.final_weights_quantization_cfg = copy.deepcopy(n.candidates_quantization_cfg[0].weights_quantization_cfg)
             n.final_activation_quantization_cfg = copy.deepcopy(n.candidates_quantization_cfg[0].activation_quantization_cfg)
+        graph.increase_version()
 
     return graph
 
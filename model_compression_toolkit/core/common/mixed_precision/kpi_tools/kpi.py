@@ -34,12 +34,15 @@ class KPITarget(Enum):
 
     BOPS - Total Bit-Operations KPI Metric.
 
+    ACTIVATION_MAX_CUT - Peak activation memory KPI metric (max-cut over a memory-optimal schedule of the model).
+
     """
 
     WEIGHTS = 'weights'
     ACTIVATION = 'activation'
     TOTAL = 'total'
     BOPS = 'bops'
+    ACTIVATION_MAX_CUT = 'activation_max_cut'
 
 
 class KPI:
@@ -51,7 +54,8 @@ class KPI:
                  weights_memory: float = np.inf,
                  activation_memory: float = np.inf,
                  total_memory: float = np.inf,
-                 bops: float = np.inf):
+                 bops: float = np.inf,
+                 activation_max_cut_memory: float = np.inf):
         """
 
         Args:
@@ -59,17 +63,20 @@ class KPI:
             activation_memory: Memory of a model's activation in bytes, according to the given activation kpi metric.
             total_memory: The sum of model's activation and weights memory in bytes, according to the given total kpi metric.
             bops: The total bit-operations in the model.
+            activation_max_cut_memory: Peak memory of a model's activation in bytes, i.e., the maximal memory of activation tensors that are alive at the same time during the model's inference.
         """
         self.weights_memory = weights_memory
         self.activation_memory = activation_memory
         self.total_memory = total_memory
         self.bops = bops
+        self.activation_max_cut_memory = activation_max_cut_memory
 
     def __repr__(self):
         return f"Weights_memory: {self.weights_memory}, " \
                f"Activation_memory: {self.activation_memory}, " \
                f"Total_memory: {self.total_memory}, " \
-               f"BOPS: {self.bops}"
+               f"BOPS: {self.bops}, " \
+               f"Activation_max_cut_memory: {self.activation_max_cut_memory}"
 
     def get_kpi_dict(self) -> Dict[KPITarget, float]:
         """
@@ -78,7 +85,8 @@ class KPI:
         return {KPITarget.WEIGHTS: self.weights_memory,
                 KPITarget.ACTIVATION: self.activation_memory,
                 KPITarget.TOTAL: self.total_memory,
-                KPITarget.BOPS: self.bops}
+                KPITarget.BOPS: self.bops,
+                KPITarget.ACTIVATION_MAX_CUT: self.activation_max_cut_memory}
 
     def set_kpi_by_target(self, kpis_mapping: Dict[KPITarget, float]):
         """
@@ -92,6 +100,7 @@ class KPI:
         self.activation_memory = kpis_mapping.get(KPITarget.ACTIVATION, np.inf)
         self.total_memory = kpis_mapping.get(KPITarget.TOTAL, np.inf)
         self.bops = kpis_mapping.get(KPITarget.BOPS, np.inf)
+        self.activation_max_cut_memory = kpis_mapping.get(KPITarget.ACTIVATION_MAX_CUT, np.inf)
 
     def holds_constraints(self, kpi: Any) -> bool:
         """
@@ -109,4 +118,5 @@ class KPI:
         return kpi.weights_memory <= self.weights_memory and \
                kpi.activation_memory <= self.activation_memory and \
                kpi.total_memory <= self.total_memory and \
-               kpi.bops <= self.bops
+               kpi.bops <= self.bops and \
+               kpi.activation_max_cut_memory <= self.activation_max_cut_memory
@@ -30,10 +30,13 @@ def compute_kpi_data(in_model: Any,
                      core_config: CoreConfig,
                      tpc: TargetPlatformCapabilities,
                      fw_info: FrameworkInfo,
-                     fw_impl: FrameworkImplementation) -> KPI:
+                     fw_impl: FrameworkImplementation,
+                     compute_activation_max_cut: bool = False) -> KPI:
     """
     Compute KPI information that can be relevant for defining target KPI for mixed precision search.
-    Calculates maximal activation tensor, sum of weights' parameters and total (sum of both).
+    Calculates maximal activation tensor, sum of weights' parameters, total (sum of both), BOPS and
+    (if requested) maximal activation cut (activation tensors that are alive at the same time in a
+    memory-optimal schedule).
 
     Args:
         in_model:  Model to build graph from (the model that intended to be quantized).
@@ -43,6 +46,8 @@ def compute_kpi_data(in_model: Any,
                                               the attached framework operator's information.
         fw_info: Information needed for quantization about the specific framework.
         fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+        compute_activation_max_cut: Whether to compute the maximal activation cut, which requires a memory
+            schedule search over the graph. If False, the activation max-cut KPI is set to infinity.
 
     Returns: A KPI object with the results.
 
@@ -77,10 +82,18 @@ def compute_kpi_data(in_model: Any,
     bops_count = compute_total_bops(graph=transformed_graph, fw_info=fw_info, fw_impl=fw_impl)
     bops_count = np.inf if len(bops_count) == 0 else sum(bops_count)
 
+    # Compute max activation cut - the maximal number of activation elements that are alive at the same time
+    max_activation_cut_size = np.inf
+    if compute_activation_max_cut:
+        activation_cuts_sizes = compute_activation_cuts_sizes(graph=transformed_graph)
+        if len(activation_cuts_sizes) > 0:
+            max_activation_cut_size = max(activation_cuts_sizes)
+
     return KPI(weights_memory=total_weights_params,
                activation_memory=max_activation_tensor_size,
                total_memory=total_size,
-               bops=bops_count)
+               bops=bops_count,
+               activation_max_cut_memory=max_activation_cut_size)
 
 
 def compute_nodes_weights_params(graph: Graph, fw_info: FrameworkInfo) -> np.ndarray:
@@ -130,6 +143,33 @@ def compute_activation_output_sizes(graph: Graph) -> np.ndarray:
     return np.array(activation_outputs)
 
 
+def compute_activation_cuts_sizes(graph: Graph) -> np.ndarray:
+    """
+    Computes a vector with the respective activation tensors size of each cut in a memory-optimal schedule of the
+    graph (only activation tensors of nodes with activation quantization are considered).
+
+    Args:
+        graph: Finalized Graph object.
+
+    Returns: A vector of the schedule's cuts activation size (empty if a schedule could not be found).
+
+    """
+
+    _, _, cuts = graph.get_activation_max_cut()
+    if cuts is None:
+        Logger.warning(f"Failed to compute a memory schedule for graph {graph.name}, "
+                       f"the activation max-cut KPI data is not computed.")
+        return np.array([])
+
+    nodes_by_name = {n.name: n for n in graph.nodes}
+    cuts_sizes = []
+    for cut in cuts:
+        cuts_sizes.append(sum([t.total_size for t in cut.mem_elements.elements
+                               if nodes_by_name[t.node_name].has_activation_quantization_enabled_candidate()]))
+
+    return np.array(cuts_sizes)
+
+
 def compute_total_bops(graph: Graph, fw_info: FrameworkInfo, fw_impl: FrameworkImplementation) -> np.ndarray:
     """
     Computes a vector with the respective Bit-operations count for each configurable node that includes MAC operations.
@@ -23,4 +23,5 @@ from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_methods
 kpi_functions_mapping = {KPITarget.WEIGHTS: (MpKpiMetric.WEIGHTS_SIZE, MpKpiAggregation.SUM),
                          KPITarget.ACTIVATION: (MpKpiMetric.ACTIVATION_OUTPUT_SIZE, MpKpiAggregation.MAX),
                          KPITarget.TOTAL: (MpKpiMetric.TOTAL_WEIGHTS_ACTIVATION_SIZE, MpKpiAggregation.TOTAL),
-                         KPITarget.BOPS: (MpKpiMetric.BOPS_COUNT, MpKpiAggregation.SUM)}
+                         KPITarget.BOPS: (MpKpiMetric.BOPS_COUNT, MpKpiAggregation.SUM),
+                         KPITarget.ACTIVATION_MAX_CUT: (MpKpiMetric.ACTIVATION_MAX_CUT_SIZE, MpKpiAggregation.MAX)}
@@ -48,12 +48,11 @@ def weights_size_kpi(mp_cfg: List[int],
 
     """
     weights_memory = []
-    mp_nodes = graph.get_configurable_sorted_nodes_names()
 
     if len(mp_cfg) == 0:
         # Computing non-configurable nodes KPI
         for n in graph.nodes:
-            if n.name not in mp_nodes and n.has_weights_quantization_enabled_candidate():
+            if graph.get_configurable_node_index(n.name) is None and n.has_weights_quantization_enabled_candidate():
                 if len(n.candidates_quantization_cfg) == 1:
                     node_nbits = n.candidates_quantization_cfg[0].weights_quantization_cfg.weights_n_bits
                     node_weights_memory_in_bytes = _compute_node_weights_memory(n, node_nbits, fw_info)
@@ -65,7 +64,7 @@ def weights_size_kpi(mp_cfg: List[int],
     else:
         # Go over configurable all nodes that should be taken into consideration when computing the weights KPI.
         for n in graph.get_sorted_weights_configurable_nodes():
-            node_idx = mp_nodes.index(n.name)
+            node_idx = graph.get_configurable_node_index(n.name)
             node_qc = n.candidates_quantization_cfg[mp_cfg[node_idx]]
             node_nbits = node_qc.weights_quantization_cfg.weights_n_bits
 
@@ -97,12 +96,11 @@ def activation_output_size_kpi(mp_cfg: List[int],
 
     """
     activation_memory = []
-    mp_nodes = graph.get_configurable_sorted_nodes_names()
 
     if len(mp_cfg) == 0:
         # Computing non-configurable nodes KPI
         for n in graph.nodes:
-            if n.name not in mp_nodes and n.has_activation_quantization_enabled_candidate():
+            if graph.get_configurable_node_index(n.name) is None and n.has_activation_quantization_enabled_candidate():
                 if len(n.candidates_quantization_cfg) == 1:
                     node_nbits = n.candidates_quantization_cfg[0].activation_quantization_cfg.activation_n_bits
                     node_activation_memory_in_bytes = _compute_node_activation_memory(n, node_nbits)
@@ -114,7 +112,7 @@ def activation_output_size_kpi(mp_cfg: List[int],
     else:
         # Go over all nodes that should be taken into consideration when computing the weights KPI.
         for n in graph.get_sorted_activation_configurable_nodes():
-            node_idx = mp_nodes.index(n.name)
+            node_idx = graph.get_configurable_node_index(n.name)
             node_qc = n.candidates_quantization_cfg[mp_cfg[node_idx]]
             node_nbits = node_qc.activation_quantization_cfg.activation_n_bits
 
@@ -146,12 +144,11 @@ def total_weights_activation_kpi(mp_cfg: List[int],
 
     """
     weights_activation_memory = []
-    mp_nodes = graph.get_configurable_sorted_nodes_names()
 
     if len(mp_cfg) == 0:
         # Computing non-configurable nodes KPI
         for n in graph.nodes:
-            if n.name not in mp_nodes:
+            if graph.get_configurable_node_index(n.name) is None:
                 if len(n.candidates_quantization_cfg) == 1:
                     node_weights_memory_in_bytes = 0
                     if n.has_weights_quantization_enabled_candidate():
@@ -192,6 +189,58 @@ def total_weights_activation_kpi(mp_cfg: List[int],
     return np.array(weights_activation_memory)
 
 
+def activation_max_cut_kpi(mp_cfg: List[int],
+                           graph: Graph,
+                           fw_info: FrameworkInfo,
+                           fw_impl: FrameworkImplementation) -> np.ndarray:
+    """
+    Computes a KPIs vector with the respective activation memory of each cut (set of activation tensors that are
+    alive at the same time) in a memory-optimal schedule of the graph, according to the given mixed-precision
+    configuration.
+    The schedule is computed once for the graph using the max-cut search over the activation tensors' number of
+    elements, and only the tensors' bit-widths depend on the configuration, so each entry in the vector is linear
+    in the nodes' candidates choice (which allows to use the entries as constraints in the LP problem).
+    Since each cut may contain both configurable and non-configurable nodes' tensors, non-configurable nodes are
+    considered in the configurable nodes KPI vector. Thus, if an empty configuration is given, an empty vector is
+    returned, unless the graph has no configurable nodes at all.
+
+    Args:
+        mp_cfg: A mixed-precision configuration (list of candidates index for each configurable node)
+        graph: Graph object.
+        fw_info: FrameworkInfo object about the specific framework (e.g., attributes of different layers' weights to quantize)
+            (not used in this method).
+        fw_impl: FrameworkImplementation object with specific framework methods implementation(not used in this method).
+
+    Returns: A vector of the schedule's cuts activation memory sizes.
+
+    """
+
+    if len(mp_cfg) == 0 and len(graph.get_configurable_sorted_nodes()) > 0:
+        # Non-configurable nodes KPI is computed as part of the configurable nodes KPI
+        return np.array([])
+
+    _, _, cuts = graph.get_activation_max_cut()
+    if cuts is None:
+        Logger.critical(f"Failed to compute a memory schedule for graph {graph.name}, "
+                        f"can't compute the activation max-cut KPI.")
+
+    nodes_by_name = {n.name: n for n in graph.nodes}
+    tensors_memory = {}
+    cuts_memory = []
+    for cut in cuts:
+        cut_memory = 0
+        for tensor in cut.mem_elements.elements:
+            if tensor not in tensors_memory:
+                tensors_memory[tensor] = _compute_tensor_activation_memory(nodes_by_name[tensor.node_name],
+                                                                           tensor.total_size,
+                                                                           mp_cfg,
+                                                                           graph)
+            cut_memory += tensors_memory[tensor]
+        cuts_memory.append(cut_memory)
+
+    return np.array(cuts_memory)
+
+
 def bops_kpi(mp_cfg: List[int],
              graph: Graph,
              fw_info: FrameworkInfo,
@@ -227,8 +276,7 @@ def bops_kpi(mp_cfg: List[int],
     else:
         virtual_bops_nodes = [n for n in graph.get_topo_sorted_nodes() if isinstance(n, VirtualActivationWeightsNode)]
 
-        mp_nodes = graph.get_configurable_sorted_nodes_names()
-        bops = [n.get_bops_count(fw_impl, fw_info, candidate_idx=_get_node_cfg_idx(n, mp_cfg, mp_nodes)) for n in virtual_bops_nodes]
+        bops = [n.get_bops_count(fw_impl, fw_info, candidate_idx=_get_node_cfg_idx(n, mp_cfg, graph)) for n in virtual_bops_nodes]
 
     return np.array(bops)
 
@@ -251,8 +299,6 @@ def _bops_kpi(mp_cfg: List[int],
 
     """
 
-    mp_nodes = graph.get_configurable_sorted_nodes_names()
-
     # Go over all nodes that should be taken into consideration when computing the BOPS KPI.
     bops = []
     for n in graph.get_topo_sorted_nodes():
@@ -268,11 +314,11 @@ def _bops_kpi(mp_cfg: List[int],
                 # we don't consider this edge in the BOPS KPI calculation
                 continue
 
-            input_activation_node_cfg = input_activation_node.candidates_quantization_cfg[_get_node_cfg_idx(input_activation_node, mp_cfg, mp_nodes)]
+            input_activation_node_cfg = input_activation_node.candidates_quantization_cfg[_get_node_cfg_idx(input_activation_node, mp_cfg, graph)]
 
             node_mac = fw_impl.get_node_mac_operations(n, fw_info)
 
-            node_qc = n.candidates_quantization_cfg[_get_node_cfg_idx(n, mp_cfg, mp_nodes)]
+            node_qc = n.candidates_quantization_cfg[_get_node_cfg_idx(n, mp_cfg, graph)]
             node_weights_nbits = node_qc.weights_quantization_cfg.weights_n_bits if \
                 node_qc.weights_quantization_cfg.enable_weights_quantization else FLOAT_BITWIDTH
             input_activation_nbits = input_activation_node_cfg.activation_quantization_cfg.activation_n_bits if \
@@ -284,7 +330,7 @@ def _bops_kpi(mp_cfg: List[int],
     return np.array(bops)
 
 
-def _get_node_cfg_idx(node: BaseNode, mp_cfg: List[int], sorted_configurable_nodes_names: List[str]) -> int:
+def _get_node_cfg_idx(node: BaseNode, mp_cfg: List[int], graph: Graph) -> int:
     """
     Returns the index of a node's quantization configuration candidate according to the given
     mixed-precision configuration. If the node is not configurable, then it must have a single configuration,
@@ -293,13 +339,13 @@ def _get_node_cfg_idx(node: BaseNode, mp_cfg: List[int], sorted_configurable_nod
     Args:
         node: A node to get its candidate configuration index.
         mp_cfg: A mixed-precision configuration (list of candidates index for each configurable node)
-        sorted_configurable_nodes_names: A list of configurable nodes names.
+        graph: Graph object the node belongs to (used to get the node's index in the configuration).
 
     Returns: An index (integer) of a node's quantization configuration candidate.
     """
 
-    if node.name in sorted_configurable_nodes_names:
-        node_idx = sorted_configurable_nodes_names.index(node.name)
+    node_idx = graph.get_configurable_node_index(node.name)
+    if node_idx is not None:
         return mp_cfg[node_idx]
     else:
         assert len(node.candidates_quantization_cfg) > 0, \
@@ -388,6 +434,30 @@ def _compute_node_activation_memory(n: BaseNode, node_nbits: int) -> float:
     return node_output_size * node_nbits / BITS_TO_BYTES
 
 
+def _compute_tensor_activation_memory(n: BaseNode, tensor_size: float, mp_cfg: List[int], graph: Graph) -> float:
+    """
+    Computes the memory of an activation tensor of the given node, according to the node's activation bit-width
+    in the given mixed-precision configuration. Similarly to the activation KPI, if the node's activation is not
+    quantized then the tensor is not considered in the memory computation.
+
+    Args:
+        n: The node that outputs the activation tensor.
+        tensor_size: The number of elements in the activation tensor.
+        mp_cfg: A mixed-precision configuration (list of candidates index for each configurable node)
+        graph: Graph object the node belongs to.
+
+    Returns: The memory of the activation tensor when quantized to the node's bit-width (0 if the node's activation
+    is not quantized).
+
+    """
+
+    node_qc = n.candidates_quantization_cfg[_get_node_cfg_idx(n, mp_cfg, graph)]
+    if not node_qc.activation_quantization_cfg.enable_activation_quantization:
+        return 0
+
+    return tensor_size * node_qc.activation_quantization_cfg.activation_n_bits / BITS_TO_BYTES
+
+
 class MpKpiMetric(Enum):
     """
     Defines kpi computation functions that can be used to compute KPI for a given target for a given mp config.
@@ -401,12 +471,15 @@ class MpKpiMetric(Enum):
 
      BOPS_COUNT - applies the bops_kpi function
 
+     ACTIVATION_MAX_CUT_SIZE - applies the activation_max_cut_kpi function
+
     """
 
     WEIGHTS_SIZE = partial(weights_size_kpi)
     ACTIVATION_OUTPUT_SIZE = partial(activation_output_size_kpi)
     TOTAL_WEIGHTS_ACTIVATION_SIZE = partial(total_weights_activation_kpi)
     BOPS_COUNT = partial(bops_kpi)
+    ACTIVATION_MAX_CUT_SIZE = partial(activation_max_cut_kpi)
 
     def __call__(self, *args):
         return self.value(*args)
@@ -33,7 +33,10 @@ class MixedPrecisionQuantizationConfigV2:
                  use_grad_based_weights: bool = True,
                  output_grad_factor: float = 0.1,
                  norm_weights: bool = True,
-                 refine_mp_solution: bool = True):
+                 refine_mp_solution: bool = True,
+                 adaptive_evaluation: bool = False,
+                 adaptive_evaluation_batch_size: int = 8,
+                 adaptive_evaluation_tolerance: float = 0.05):
         """
         Class with mixed precision parameters to quantize the input model.
         Unlike QuantizationConfig, number of bits for quantization is a list of possible bit widths to
@@ -49,6 +52,9 @@ class MixedPrecisionQuantizationConfigV2:
             output_grad_factor (float): A tuning parameter to be used for gradient-based weights.
             norm_weights (bool): Whether to normalize the returned weights (to get values between 0 and 1).
             refine_mp_solution (bool): Whether to try to improve the final mixed-precision configuration using a greedy algorithm that searches layers to increase their bit-width, or not.
+            adaptive_evaluation (bool): Whether to evaluate the sensitivity metric of a configuration progressively (in batches of images), and stop once the metric's confidence interval is tight enough, or once the configuration is provably worse than the configurations it is compared to.
+            adaptive_evaluation_batch_size (int): Number of images to evaluate in each step of the adaptive evaluation (at least 2).
+            adaptive_evaluation_tolerance (float): The adaptive evaluation stops when the half-width of the metric's confidence interval is smaller than this fraction of the metric.
 
         """
 
@@ -58,6 +64,12 @@ class MixedPrecisionQuantizationConfigV2:
         self.configuration_overwrite = configuration_overwrite
         self.refine_mp_solution = refine_mp_solution
 
+        assert adaptive_evaluation_batch_size >= 2, "adaptive_evaluation_batch_size should be at least 2 images, " \
+                                                    "to estimate the metric's confidence interval"
+        self.adaptive_evaluation = adaptive_evaluation
+        self.adaptive_evaluation_batch_size = adaptive_evaluation_batch_size
+        self.adaptive_evaluation_tolerance = adaptive_evaluation_tolerance
+
         assert 0.0 < num_interest_points_factor <= 1.0, "num_interest_points_factor should represent a percentage of " \
                                                         "the base set of interest points that are required to be " \
                                                         "used for mixed-precision metric evaluation, " \
@@ -25,7 +25,7 @@ from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_functio
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_manager import MixedPrecisionSearchManager
 from model_compression_toolkit.core.common.mixed_precision.search_methods.linear_programming import \
-    mp_integer_programming_search
+    mp_integer_programming_search, mp_integer_programming_sweep
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.mixed_precision.solution_refinement_procedure import \
     greedy_solution_refinement_procedure
@@ -41,6 +41,10 @@ class BitWidthSearchMethod(Enum):
 search_methods = {
     BitWidthSearchMethod.INTEGER_PROGRAMMING: mp_integer_programming_search}
 
+# Search methods that search configurations for a list of target KPIs, reusing the measurements of the search space.
+sweep_methods = {
+    BitWidthSearchMethod.INTEGER_PROGRAMMING: mp_integer_programming_sweep}
+
 
 def search_bit_width(graph_to_search_cfg: Graph,
                      fw_info: FrameworkInfo,
@@ -48,7 +52,9 @@ def search_bit_width(graph_to_search_cfg: Graph,
                      target_kpi: KPI,
                      mp_config: MixedPrecisionQuantizationConfigV2,
                      representative_data_gen: Callable,
-                     search_method: BitWidthSearchMethod = BitWidthSearchMethod.INTEGER_PROGRAMMING) -> List[int]:
+                     search_method: BitWidthSearchMethod = BitWidthSearchMethod.INTEGER_PROGRAMMING,
+                     compiled_inference: bool = False,
+                     jit_compile_inference: bool = False) -> List[int]:
     """
     Search for an MP configuration for a given graph. Given a search_method method (by default, it's linear
     programming), we use the sensitivity_evaluator object that provides a function to compute an
@@ -65,6 +71,8 @@ def search_bit_width(graph_to_search_cfg: Graph,
         mp_config: Mixed-precision quantization configuration.
         representative_data_gen: Dataset to use for retrieving images for the models inputs.
         search_method: BitWidthSearchMethod to define which searching method to use.
+        compiled_inference: Whether to evaluate the models for the sensitivity metric using a compiled inference function.
+        jit_compile_inference: Whether to jit-compile the compiled inference function.
 
     Returns:
         A MP configuration for the graph (list of integers, where the index in the list, is the node's
@@ -77,6 +85,63 @@ def search_bit_width(graph_to_search_cfg: Graph,
     if target_kpi is None:
         Logger.critical('Target KPI have to be passed for search_methods bit-width configuration')
 
+    return search_bit_width_sweep(graph_to_search_cfg,
+                                  fw_info,
+                                  fw_impl,
+                                  [target_kpi],
+                                  mp_config,
+                                  representative_data_gen,
+                                  search_method=search_method,
+                                  compiled_inference=compiled_inference,
+                                  jit_compile_inference=jit_compile_inference)[0]
+
+
+def search_bit_width_sweep(graph_to_search_cfg: Graph,
+                           fw_info: FrameworkInfo,
+                           fw_impl: FrameworkImplementation,
+                           target_kpis: List[KPI],
+                           mp_config: MixedPrecisionQuantizationConfigV2,
+                           representative_data_gen: Callable,
+                           search_method: BitWidthSearchMethod = BitWidthSearchMethod.INTEGER_PROGRAMMING,
+                           compiled_inference: bool = False,
+                           jit_compile_inference: bool = False) -> List[List[int]]:
+    """
+    Search for an MP configuration for a given graph for each target KPI in a list.
+    The sensitivity evaluator, the sensitivity of each layer's bit-width and the KPI of each node's bit-width
+    do not depend on the target KPI values, so they are computed once for the whole sweep, and only the search
+    problem is solved for each target KPI. Sweeping a list of increasing target KPIs traces the trade-off between
+    the model's KPI and its sensitivity.
+    All target KPIs have to constrain the same KPI targets (e.g. weights memory and BOPS), with different values.
+
+    Args:
+        graph_to_search_cfg: Graph to search a MP configuration for.
+        fw_info: FrameworkInfo object about the specific framework (e.g., attributes of different layers' weights to quantize).
+        fw_impl: FrameworkImplementation object with specific framework methods implementation.
+        target_kpis: List of target KPIs to search a configuration for.
+        mp_config: Mixed-precision quantization configuration.
+        representative_data_gen: Dataset to use for retrieving images for the models inputs.
+        search_method: BitWidthSearchMethod to define which searching method to use.
+        compiled_inference: Whether to evaluate the models for the sensitivity metric using a compiled inference function.
+        jit_compile_inference: Whether to jit-compile the compiled inference function.
+
+    Returns:
+        A list of MP configurations for the graph, one for each target KPI (each a list of integers, where the index
+        in the list, is the node's index in the graph, when the graph is topology sorted, and the value in this index
+        is the bit-width index on the node).
+
+    """
+
+    if target_kpis is None or len(target_kpis) == 0 or any([t is None for t in target_kpis]):
+        Logger.critical('Target KPIs have to be passed for search_methods bit-width configuration sweep')
+
+    # The search graph, the sensitivity evaluator and the KPI constraints depend on the KPI targets that are
+    # constrained, thus, they are shared only by target KPIs that constrain the same KPI targets.
+    constrained_targets = [{t for t, v in target_kpi.get_kpi_dict().items() if v < np.inf}
+                           for target_kpi in target_kpis]
+    if any([c != constrained_targets[0] for c in constrained_targets]):
+        Logger.critical('All target KPIs in a bit-width configuration sweep have to constrain the same KPI targets')
+    target_kpi = target_kpis[0]
+
     # Set graph for MP search
     graph = copy.deepcopy(graph_to_search_cfg)  # Copy graph before searching
     if target_kpi.bops < np.inf:
@@ -88,7 +153,9 @@ def search_bit_width(graph_to_search_cfg: Graph,
     disable_activation_for_metric = (target_kpi.weights_memory < np.inf and
                                     (target_kpi.activation_memory == np.inf and
                                      target_kpi.total_memory == np.inf and
-                                     target_kpi.bops == np.inf)) or graph_to_search_cfg.is_single_activation_cfg()
+                                     target_kpi.bops == np.inf and
+                                     target_kpi.activation_max_cut_memory == np.inf)) or \
+                                    graph_to_search_cfg.is_single_activation_cfg()
 
     # Set Sensitivity Evaluator for MP search. It should always work with the original MP graph,
     # even if a virtual graph was created (and is used only for BOPS KPI computation purposes)
@@ -97,10 +164,15 @@ def search_bit_width(graph_to_search_cfg: Graph,
         mp_config,
         representative_data_gen=representative_data_gen,
         fw_info=fw_info,
-        disable_activation_for_metric=disable_activation_for_metric)
+        disable_activation_for_metric=disable_activation_for_metric,
+        compiled_inference=compiled_inference,
+        jit_compile_inference=jit_compile_inference)
 
-    # Each pair of (KPI method, KPI aggregation) should match to a specific provided kpi target
-    kpi_functions = kpi_functions_mapping
+    # Each pair of (KPI method, KPI aggregation) should match to a specific provided kpi target.
+    # The activation max-cut KPI requires a schedule search over the graph, thus, it is considered only if
+    # it was set in the target KPI.
+    kpi_functions = {target: kpi_fns for target, kpi_fns in kpi_functions_mapping.items()
+                     if target != KPITarget.ACTIVATION_MAX_CUT or target_kpi.activation_max_cut_memory < np.inf}
 
     # Instantiate a manager object
     search_manager = MixedPrecisionSearchManager(graph,
@@ -111,16 +183,21 @@ def search_bit_width(graph_to_search_cfg: Graph,
                                                  target_kpi,
                                                  original_graph=graph_to_search_cfg)
 
-    if search_method in search_methods:  # Get a specific search function
-        search_method_fn = search_methods.get(search_method)
+    if search_method in sweep_methods:  # Get a specific search function
+        sweep_method_fn = sweep_methods.get(search_method)
     else:
         raise NotImplemented
 
-    # Search for the desired mixed-precision configuration
-    result_bit_cfg = search_method_fn(search_manager,
-                                      target_kpi)
+    # Search for the desired mixed-precision configuration of each target KPI
+    result_bit_cfgs = sweep_method_fn(search_manager,
+                                      target_kpis)
+
+    if mp_config.adaptive_evaluation and len(se.num_evaluated_images) > 0:
+        Logger.info(f'Adaptive sensitivity evaluation used {np.mean(se.num_evaluated_images):.1f} images per '
+                    f'evaluation on average (out of {mp_config.num_of_images} images)')
 
     if mp_config.refine_mp_solution:
-        result_bit_cfg = greedy_solution_refinement_procedure(result_bit_cfg, search_manager, target_kpi)
+        result_bit_cfgs = [greedy_solution_refinement_procedure(result_bit_cfg, search_manager, target_kpi)
+                           for result_bit_cfg, target_kpi in zip(result_bit_cfgs, target_kpis)]
 
-    return result_bit_cfg
+    return result_bit_cfgs
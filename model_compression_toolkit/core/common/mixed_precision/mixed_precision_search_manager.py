@@ -354,15 +354,15 @@ class ConfigReconstructionHelper:
                 Logger.critical("Must provide a base original config in order to run config reconstruction for partial"
                                 "set of nodes.")
 
-            updated_virtual_nodes = \
-                [(idx, self.virtual_graph.get_configurable_sorted_nodes()[idx]) for idx in changed_virtual_nodes_idx]
+            virtual_sorted_conf_nodes = self.virtual_graph.get_configurable_sorted_nodes()
+            updated_virtual_nodes = [(idx, virtual_sorted_conf_nodes[idx]) for idx in changed_virtual_nodes_idx]
             # Iterating only over the virtual nodes that have updated config
             for virtual_node_idx, n in updated_virtual_nodes:
                 self.reconstruct_node_config(n, virtual_mp_cfg, virtual_node_idx)
             # Updating reconstructed config for all other nodes based on provided base_config
             original_sorted_conf_nodes = self.original_graph.get_configurable_sorted_nodes()
             for i in range(len(original_base_config)):
-                if i not in list(self.origin_node_idx_to_cfg.keys()):
+                if i not in self.origin_node_idx_to_cfg:
                     self.update_config_at_original_idx(n=original_sorted_conf_nodes[i],
                                                        origin_cfg_idx=original_base_config[i])
         else:
@@ -400,7 +400,7 @@ class ConfigReconstructionHelper:
             if isinstance(activation_node, VirtualSplitActivationNode):
                 self.get_weights_for_split_activation(activation_node, n, virtual_cfg_idx, virtual_mp_cfg)
             else:
-                if activation_node.name in self.origin_sorted_conf_nodes_names:
+                if self.original_graph.get_configurable_node_index(activation_node.name) is not None:
                     # It is possible that the original activation node is not configurable,
                     # in this case we don't need to retrieve its bit-width config
                     self.retrieve_activation_only_config(activation_node, n, virtual_cfg_idx)
@@ -421,10 +421,10 @@ class ConfigReconstructionHelper:
             self.get_weights_for_split_activation(n, n, virtual_cfg_idx, virtual_mp_cfg)
         else:
             # Node didn't change in virtual graph - candidates list is similar to original
-            if n.name not in self.origin_sorted_conf_nodes_names:
+            origin_idx = self.original_graph.get_configurable_node_index(n.name)
+            if origin_idx is None:
                 Logger.error(f"Node {n.name} appears in virtual graph as configurable, "
                              f"but is not configurable in the original graph.")
-            origin_idx = self.origin_sorted_conf_nodes_names.index(n.name)
             self.origin_node_idx_to_cfg[origin_idx] = virtual_cfg_idx
 
     def retrieve_weights_only_config(self, weights_node: BaseNode, virtual_node: BaseNode, virtual_cfg_idx: int):
@@ -439,7 +439,7 @@ class ConfigReconstructionHelper:
             virtual_cfg_idx: The virtual node's chosen config index.
         """
 
-        if weights_node.name in self.origin_sorted_conf_nodes_names:
+        if self.original_graph.get_configurable_node_index(weights_node.name) is not None:
             # It is possible that the original weights node is not configurable,
             # in this case we don't need to retrieve its bit-width config
             weights_bitwidth = virtual_node.candidates_quantization_cfg[virtual_cfg_idx].weights_quantization_cfg.weights_n_bits
@@ -461,7 +461,7 @@ class ConfigReconstructionHelper:
             virtual_cfg_idx: The virtual node's chosen config index.
         """
 
-        if activation_node.name in self.origin_sorted_conf_nodes_names:
+        if self.original_graph.get_configurable_node_index(activation_node.name) is not None:
             # It is possible that the original activation node is not configurable,
             # in this case we don't need to retrieve its bit-width config
             activation_bitwidth = virtual_node.candidates_quantization_cfg[
@@ -492,7 +492,7 @@ class ConfigReconstructionHelper:
         """
 
         activation_bitwidth = activation_node.candidates_quantization_cfg[virtual_mp_cfg[
-            self.virtual_sorted_nodes_names.index(activation_node.name)]].activation_quantization_cfg.activation_n_bits
+            self.virtual_graph.get_configurable_node_index(activation_node.name)]].activation_quantization_cfg.activation_n_bits
 
         weights_bitwidth = virtual_node.candidates_quantization_cfg[virtual_cfg_idx].weights_quantization_cfg.weights_n_bits
 
@@ -523,7 +523,7 @@ class ConfigReconstructionHelper:
         """
 
         weights_bitwidth = weights_node.candidates_quantization_cfg[virtual_mp_cfg[
-            self.virtual_sorted_nodes_names.index(weights_node.name)]].weights_quantization_cfg.weights_n_bits
+            self.virtual_graph.get_configurable_node_index(weights_node.name)]].weights_quantization_cfg.weights_n_bits
 
         activation_bitwidth = virtual_node.candidates_quantization_cfg[
             virtual_cfg_idx].activation_quantization_cfg.activation_n_bits
@@ -560,7 +560,7 @@ class ConfigReconstructionHelper:
         if isinstance(activation_node, VirtualActivationWeightsNode):
             if activation_node.original_activation_node.is_activation_quantization_enabled() and not \
                     activation_node.original_activation_node.is_all_activation_candidates_equal():
-                assert activation_node.name in self.virtual_sorted_nodes_names  # Sanity check
+                assert self.virtual_graph.get_configurable_node_index(activation_node.name) is not None  # Sanity check
                 # The original node is both weights and activation configurable
                 self.retrieve_activation_weights_config(activation_node, weights_node, virtual_node, virtual_cfg_idx, virtual_mp_cfg)
             else:
@@ -568,7 +568,7 @@ class ConfigReconstructionHelper:
                 self.retrieve_weights_only_config(weights_node.origin_node, virtual_node, virtual_cfg_idx)
         else:
             assert isinstance(activation_node, VirtualSplitActivationNode)  # Sanity check
-            if activation_node.name in self.virtual_sorted_nodes_names:
+            if self.virtual_graph.get_configurable_node_index(activation_node.name) is not None:
                 self.retrieve_activation_weights_config(activation_node, weights_node, virtual_node, virtual_cfg_idx, virtual_mp_cfg)
             else:
                 # The original node is only weights configurable
@@ -601,7 +601,7 @@ class ConfigReconstructionHelper:
         if isinstance(weights_node, VirtualActivationWeightsNode):
             if weights_node.original_weights_node.is_weights_quantization_enabled() and not \
                     weights_node.original_weights_node.is_all_weights_candidates_equal():
-                assert weights_node.name in self.virtual_sorted_nodes_names  # Sanity check
+                assert self.virtual_graph.get_configurable_node_index(weights_node.name) is not None  # Sanity check
                 # The original node is both weights and activation configurable
                 self.retrieve_weights_activation_config(activation_node, weights_node, virtual_node, virtual_cfg_idx, virtual_mp_cfg)
             else:
@@ -633,5 +633,5 @@ class ConfigReconstructionHelper:
 
         """
 
-        origin_idx = self.origin_sorted_conf_nodes_names.index(n.name)
+        origin_idx = self.original_graph.get_configurable_node_index(n.name)
         self.origin_node_idx_to_cfg[origin_idx] = origin_cfg_idx
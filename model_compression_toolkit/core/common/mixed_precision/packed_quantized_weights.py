@@ -0,0 +1,245 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import List, Tuple
+
+import numpy as np
+
+from model_compression_toolkit.core.common.quantization.candidate_node_quantization_config import \
+    CandidateNodeQuantizationConfig
+from model_compression_toolkit.core.common.quantization.node_quantization_config import \
+    NodeWeightsQuantizationConfig
+
+# Maximal number of bits of a quantized weight that is stored using packed codes.
+MAX_PACKED_N_BITS = 8
+
+
+class PackedTensor:
+    """
+    A compact representation of a fake-quantized tensor.
+    Each output channel (or the entire tensor, if it is not quantized per-channel) of a fake-quantized tensor
+    holds at most 2^n_bits distinct values. The tensor is stored as n_bits codes per element, packed into a uint8
+    array, together with a codebook of the channel's values (which corresponds to the quantizer's scale and
+    zero-point for uniform quantizers, or to the cluster centers for LUT quantizers).
+    """
+
+    def __init__(self,
+                 codes: np.ndarray,
+                 codebook: np.ndarray,
+                 n_bits: int,
+                 shape: Tuple[int],
+                 channels_axis: int):
+        """
+        Args:
+            codes: Packed codes of the tensor's elements (uint8 array).
+            codebook: Values of each channel's codes, with shape (num_of_channels, num_of_codes).
+            n_bits: Number of bits of each code.
+            shape: Shape of the original tensor.
+            channels_axis: Axis of the channels in the original tensor (None if not quantized per-channel).
+        """
+        self.codes = codes
+        self.codebook = codebook
+        self.n_bits = n_bits
+        self.shape = shape
+        self.channels_axis = channels_axis
+
+    @property
+    def nbytes(self) -> int:
+        """
+
+        Returns: Number of bytes the packed tensor holds.
+
+        """
+        return self.codes.nbytes + self.codebook.nbytes
+
+    def unpack(self) -> np.ndarray:
+        """
+        Dequantize the packed tensor.
+
+        Returns: The fake-quantized tensor as a float32 array.
+
+        """
+        num_of_elements = int(np.prod(self.shape))
+        bits = np.unpackbits(self.codes)[:num_of_elements * self.n_bits].reshape(num_of_elements, self.n_bits)
+        codes = np.packbits(np.pad(bits, ((0, 0), (8 - self.n_bits, 0))), axis=1)
+        codes = codes.reshape(self.codebook.shape[0], -1).astype(np.int64)
+
+        values = np.take_along_axis(self.codebook, codes, axis=1)
+        if self.channels_axis is None:
+            return values.reshape(self.shape)
+        channels_first_shape = (self.shape[self.channels_axis],) + \
+                               tuple(np.delete(self.shape, self.channels_axis % len(self.shape)))
+        return np.moveaxis(values.reshape(channels_first_shape), 0, self.channels_axis)
+
+
+def _move_channels_first(tensor: np.ndarray, channels_axis: int) -> np.ndarray:
+    """
+    Move the channels axis of a tensor to be the first axis.
+
+    Args:
+        tensor: Tensor to move its channels axis.
+        channels_axis: Axis of the channels (None to treat the entire tensor as a single channel).
+
+    Returns: The tensor with its channels as the first axis.
+
+    """
+    if channels_axis is None:
+        return tensor.reshape((1,) + tensor.shape)
+    return np.moveaxis(tensor, channels_axis, 0)
+
+
+def pack_quantized_tensor(quantized_tensor: np.ndarray,
+                          n_bits: int,
+                          channels_axis: int = None) -> PackedTensor:
+    """
+    Pack a fake-quantized tensor into n_bits codes and a per-channel codebook.
+
+    Args:
+        quantized_tensor: Fake-quantized tensor to pack.
+        n_bits: Number of bits the tensor was quantized with.
+        channels_axis: Axis of the channels the tensor was quantized by (None if not quantized per-channel).
+
+    Returns: A PackedTensor, or None if the tensor can't be represented using n_bits codes (or if packing
+    it doesn't reduce its memory).
+
+    """
+    if n_bits > MAX_PACKED_N_BITS:
+        return None
+
+    quantized_tensor = np.asarray(quantized_tensor, dtype=np.float32)
+    per_channel_tensor = _move_channels_first(quantized_tensor, channels_axis)
+    per_channel_tensor = per_channel_tensor.reshape(per_channel_tensor.shape[0], -1)
+
+    channels_codebooks = []
+    codes = np.zeros(per_channel_tensor.shape, dtype=np.uint8)
+    for c, channel_values in enumerate(per_channel_tensor):
+        channel_codebook, channel_codes = np.unique(channel_values, return_inverse=True)
+        if len(channel_codebook) > 2 ** n_bits:
+            return None
+        channels_codebooks.append(channel_codebook)
+        codes[c] = channel_codes.reshape(-1)
+
+    codebook = np.zeros((len(channels_codebooks), max([len(cb) for cb in channels_codebooks])), dtype=np.float32)
+    for c, channel_codebook in enumerate(channels_codebooks):
+        codebook[c, :len(channel_codebook)] = channel_codebook
+
+    # Keep only the n_bits least significant bits of each code, and pack them into a bytes array
+    bits = np.unpackbits(codes.reshape(-1, 1), axis=1)[:, 8 - n_bits:]
+    packed_tensor = PackedTensor(codes=np.packbits(bits.reshape(-1)),
+                                 codebook=codebook,
+                                 n_bits=n_bits,
+                                 shape=quantized_tensor.shape,
+                                 channels_axis=channels_axis)
+
+    # For small tensors the codebook may take more memory than the float tensor itself
+    return packed_tensor if packed_tensor.nbytes < quantized_tensor.nbytes else None
+
+
+def _is_same_weights_cfg(cfg_a: NodeWeightsQuantizationConfig, cfg_b: NodeWeightsQuantizationConfig) -> bool:
+    """
+    Check whether two weights quantization configurations quantize a weight to the same tensor.
+
+    Args:
+        cfg_a: First weights quantization configuration.
+        cfg_b: Second weights quantization configuration.
+
+    Returns: Whether the configurations are identical (including their quantization parameters).
+
+    """
+    if cfg_a != cfg_b:
+        return False
+    params_a, params_b = cfg_a.weights_quantization_params, cfg_b.weights_quantization_params
+    return params_a.keys() == params_b.keys() and \
+           all([np.array_equal(params_a[k], params_b[k]) for k in params_a.keys()])
+
+
+class PackedQuantizedWeights:
+    """
+    Storage of the quantized versions of a float weight for each of a node's quantization candidates, to be used
+    during mixed precision search.
+    Candidates with identical weights quantization configurations (e.g., candidates that differ only in their
+    activation bit-width) share a single quantized weight, and each quantized weight is stored as a PackedTensor
+    (or as a float tensor, if it can't be packed), so it takes a fraction of the float weight's memory.
+    """
+
+    def __init__(self,
+                 node_q_cfg: List[CandidateNodeQuantizationConfig],
+                 float_weight: np.ndarray):
+        """
+        Args:
+            node_q_cfg: Quantization configuration candidates of the node the weight belongs to.
+            float_weight: Float weight to quantize.
+        """
+
+        # Index of the stored quantized weight of each candidate
+        self.candidate_to_weight_index = []
+        self.quantized_weights = []
+        weights_cfgs = []
+
+        for qc in node_q_cfg:
+            w_cfg = qc.weights_quantization_cfg
+            same_cfg_index = [i for i, cfg in enumerate(weights_cfgs) if _is_same_weights_cfg(cfg, w_cfg)]
+            if len(same_cfg_index) > 0:
+                self.candidate_to_weight_index.append(same_cfg_index[0])
+                continue
+
+            q_weight = w_cfg.weights_quantization_fn(float_weight,
+                                                     w_cfg.weights_n_bits,
+                                                     True,
+                                                     w_cfg.weights_quantization_params,
+                                                     w_cfg.weights_per_channel_threshold,
+                                                     w_cfg.weights_channels_axis)
+            channels_axis = w_cfg.weights_channels_axis if w_cfg.weights_per_channel_threshold else None
+            packed_weight = pack_quantized_tensor(q_weight, w_cfg.weights_n_bits, channels_axis)
+
+            self.candidate_to_weight_index.append(len(weights_cfgs))
+            self.quantized_weights.append(np.asarray(q_weight, dtype=np.float32) if packed_weight is None
+                                          else packed_weight)
+            weights_cfgs.append(w_cfg)
+
+    def __len__(self) -> int:
+        """
+
+        Returns: Number of candidates the quantized weights are stored for.
+
+        """
+        return len(self.candidate_to_weight_index)
+
+    def get_weight_index(self, candidate_index: int) -> int:
+        """
+        Get the index of the stored quantized weight of a candidate. Candidates with the same
+        index share the same quantized weight.
+
+        Args:
+            candidate_index: Index of a quantization configuration candidate.
+
+        Returns: Index of the candidate's stored quantized weight.
+
+        """
+        assert candidate_index < len(self), \
+            f"Index {candidate_index} does not exist in current quantization candidates list"
+        return self.candidate_to_weight_index[candidate_index]
+
+    def get_quantized_weight(self, candidate_index: int) -> np.ndarray:
+        """
+        Dequantize the quantized weight of a candidate.
+
+        Args:
+            candidate_index: Index of a quantization configuration candidate.
+
+        Returns: The candidate's fake-quantized weight as a float32 array.
+
+        """
+        q_weight = self.quantized_weights[self.get_weight_index(candidate_index)]
+        return q_weight.unpack() if isinstance(q_weight, PackedTensor) else q_weight
@@ -16,7 +16,7 @@
 import numpy as np
 from pulp import *
 from tqdm import tqdm
-from typing import Dict, List, Tuple, Callable
+from typing import Any, Dict, List, Tuple, Callable
 
 from model_compression_toolkit.core.common import Logger
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPI, KPITarget
@@ -45,39 +45,69 @@ def mp_integer_programming_search(search_manager: MixedPrecisionSearchManager,
     Returns:
         The mixed-precision configuration (list of indices. Each indicates the bitwidth index of a node).
 
+    """
+    return mp_integer_programming_sweep(search_manager, [target_kpi], non_conf_kpi_dict)[0]
+
+
+def mp_integer_programming_sweep(search_manager: MixedPrecisionSearchManager,
+                                 target_kpis: List[KPI],
+                                 non_conf_kpi_dict: Dict[KPITarget, np.ndarray] = None) -> List[List[int]]:
+    """
+    Searching and returning a mixed-precision configuration for each target KPI in a list, using an ILP optimization
+    solution. The sensitivity of the layers and the KPI constraints expressions do not depend on the target KPI
+    values, so they are computed once, and only the LP problem is solved for each target KPI.
+    All the target KPIs are expected to constrain the same KPI targets (e.g. weights memory), with different values.
+
+    Args:
+        search_manager: MixedPrecisionSearchManager object to be used for problem formalization.
+        target_kpis: List of KPIs to constrain our LP problem with.
+        non_conf_kpi_dict: A mapping between a KPITarget and its non-configurable nodes' KPI vector.
+
+    Returns:
+        A list of mixed-precision configurations (list of indices. Each indicates the bitwidth index of a node),
+        one for each target KPI.
+
     """
 
     # Build a mapping from each layer's index (in the model) to a dictionary that maps the
     # bitwidth index to the observed sensitivity of the model when using that bitwidth for that layer.
-    layer_to_metrics_mapping = _build_layer_to_metrics_mapping(search_manager, target_kpi)
+    layer_to_metrics_mapping = _build_layer_to_metrics_mapping(search_manager, target_kpis[0])
 
     # Init variables to find their values when solving the lp problem.
     layer_to_indicator_vars_mapping, layer_to_objective_vars_mapping = _init_problem_vars(layer_to_metrics_mapping)
 
-    # Add all equations and inequalities that define the problem.
-    lp_problem = _formalize_problem(layer_to_indicator_vars_mapping,
-                                    layer_to_metrics_mapping,
-                                    layer_to_objective_vars_mapping,
-                                    target_kpi,
-                                    search_manager,
-                                    non_conf_kpi_dict)
-
-    lp_problem.solve()  # Try to solve the problem.
-    assert lp_problem.status == LpStatusOptimal, Logger.critical(
-        "No solution was found during solving the LP problem")
-    Logger.info(LpStatus[lp_problem.status])
-
-    # Take the bitwidth index only if its corresponding indicator is one.
-    config = np.asarray(
-        [[nbits for nbits, indicator in nbits_to_indicator.items() if indicator.varValue == 1.0] for
-         nbits_to_indicator
-         in layer_to_indicator_vars_mapping.values()]
-    ).flatten()
-
-    if target_kpi.bops < np.inf:
-        return search_manager.config_reconstruction_helper.reconstruct_config_from_virtual_graph(config)
-    else:
-        return config
+    # Aggregated KPI expressions of each KPI target, shared by the problems of all target KPIs.
+    kpi_expressions = {}
+
+    configs = []
+    for target_kpi in target_kpis:
+        # Add all equations and inequalities that define the problem.
+        lp_problem = _formalize_problem(layer_to_indicator_vars_mapping,
+                                        layer_to_metrics_mapping,
+                                        layer_to_objective_vars_mapping,
+                                        target_kpi,
+                                        search_manager,
+                                        non_conf_kpi_dict,
+                                        kpi_expressions)
+
+        lp_problem.solve()  # Try to solve the problem.
+        assert lp_problem.status == LpStatusOptimal, Logger.critical(
+            "No solution was found during solving the LP problem")
+        Logger.info(LpStatus[lp_problem.status])
+
+        # Take the bitwidth index only if its corresponding indicator is one.
+        config = np.asarray(
+            [[nbits for nbits, indicator in nbits_to_indicator.items() if indicator.varValue == 1.0] for
+             nbits_to_indicator
+             in layer_to_indicator_vars_mapping.values()]
+        ).flatten()
+
+        if target_kpi.bops < np.inf:
+            configs.append(search_manager.config_reconstruction_helper.reconstruct_config_from_virtual_graph(config))
+        else:
+            configs.append(config)
+
+    return configs
 
 
 def _init_problem_vars(layer_to_metrics_mapping: Dict[int, Dict[int, float]]) -> Tuple[
@@ -117,7 +147,8 @@ def _formalize_problem(layer_to_indicator_vars_mapping: Dict[int, Dict[int, LpVa
                        layer_to_objective_vars_mapping: Dict[int, LpVariable],
                        target_kpi: KPI,
                        search_manager: MixedPrecisionSearchManager,
-                       non_conf_kpi_dict: Dict[KPITarget, np.ndarray]) -> LpProblem:
+                       non_conf_kpi_dict: Dict[KPITarget, np.ndarray],
+                       kpi_expressions: Dict[KPITarget, List[Any]] = None) -> LpProblem:
     """
     Formalize the LP problem by defining all inequalities that define the solution space.
 
@@ -131,10 +162,14 @@ def _formalize_problem(layer_to_indicator_vars_mapping: Dict[int, Dict[int, LpVa
         target_kpi: KPI to reduce our feasible solution space.
         search_manager: MixedPrecisionSearchManager object to be used for kpi constraints formalization.
         non_conf_kpi_dict: A mapping between a KPITarget and its non-configurable nodes' KPI vector.
+        kpi_expressions: A mapping between a KPITarget and its aggregated KPI expressions, that is used as a cache
+        when formalizing problems with several target KPIs. Missing expressions are computed and added to it.
 
     Returns:
         The formalized LP problem.
     """
+    if kpi_expressions is None:
+        kpi_expressions = {}
 
     lp_problem = LpProblem()  # minimization problem by default
     lp_problem += lpSum([layer_to_objective_vars_mapping[layer] for layer in
@@ -158,44 +193,42 @@ def _formalize_problem(layer_to_indicator_vars_mapping: Dict[int, Dict[int, LpVa
             for _, indicator in layer_to_indicator_vars_mapping[layer].items():
                 indicators.append(indicator)
 
-        indicators_arr = np.array(indicators)
-        indicators_matrix = np.diag(indicators_arr)
-
         for target, kpi_value in target_kpi.get_kpi_dict().items():
             if not np.isinf(kpi_value):
-                non_conf_kpi_vector = None if non_conf_kpi_dict is None else non_conf_kpi_dict.get(target)
-                _add_set_of_kpi_constraints(search_manager=search_manager,
-                                            target=target,
+                if target not in kpi_expressions:
+                    non_conf_kpi_vector = None if non_conf_kpi_dict is None else non_conf_kpi_dict.get(target)
+                    kpi_expressions[target] = _get_kpi_expressions(search_manager=search_manager,
+                                                                   target=target,
+                                                                   indicators=indicators,
+                                                                   non_conf_kpi_vector=non_conf_kpi_vector)
+                _add_set_of_kpi_constraints(target=target,
                                             target_kpi_value=kpi_value,
-                                            indicators_matrix=indicators_matrix,
-                                            lp_problem=lp_problem,
-                                            non_conf_kpi_vector=non_conf_kpi_vector)
+                                            kpi_expressions=kpi_expressions[target],
+                                            lp_problem=lp_problem)
     else:
         raise Exception("Can't run mixed-precision search with given target_kpi=None."
                         "Please provide a valid target_kpi.")
     return lp_problem
 
 
-def _add_set_of_kpi_constraints(search_manager: MixedPrecisionSearchManager,
-                                target: KPITarget,
-                                target_kpi_value: float,
-                                indicators_matrix: np.ndarray,
-                                lp_problem: LpProblem,
-                                non_conf_kpi_vector: np.ndarray):
+def _get_kpi_expressions(search_manager: MixedPrecisionSearchManager,
+                         target: KPITarget,
+                         indicators: List[LpVariable],
+                         non_conf_kpi_vector: np.ndarray) -> List[Any]:
     """
-    Adding a constraint for the Lp problem for the given KPI target.
-    The update to the Lp problem object is done inplace.
+    Computing the aggregated KPI of the given KPI target, as expressions of the Lp problem's indicators.
 
     Args:
         search_manager:  MixedPrecisionSearchManager object to be used for kpi constraints formalization.
         target: A KPITarget.
-        target_kpi_value: Target KPI value of the given KPI target for which the constraint is added.
-        indicators_matrix: A diagonal matrix of the Lp problem's indicators.
-        lp_problem: An Lp problem object to add constraint to.
+        indicators: The Lp problem's indicators.
         non_conf_kpi_vector: A non-configurable nodes' KPI vector.
 
-    """
+    Returns:
+        A list of the aggregated KPI values (Lp expressions, or floats if they do not depend on the indicators).
 
+    """
+    indicators_matrix = np.diag(np.array(indicators))
     kpi_matrix = search_manager.compute_kpi_matrix(target)
     indicated_kpi_matrix = np.matmul(kpi_matrix, indicators_matrix)
     # Need to re-organize the tensor such that the configurations' axis will be second,
@@ -217,7 +250,25 @@ def _add_set_of_kpi_constraints(search_manager: MixedPrecisionSearchManager,
     else:
         aggr_kpi = search_manager.compute_kpi_functions[target][1](np.concatenate([kpi_sum_vector, non_conf_kpi_vector]))
 
-    for v in aggr_kpi:
+    return aggr_kpi
+
+
+def _add_set_of_kpi_constraints(target: KPITarget,
+                                target_kpi_value: float,
+                                kpi_expressions: List[Any],
+                                lp_problem: LpProblem):
+    """
+    Adding a constraint for the Lp problem for the given KPI target.
+    The update to the Lp problem object is done inplace.
+
+    Args:
+        target: A KPITarget.
+        target_kpi_value: Target KPI value of the given KPI target for which the constraint is added.
+        kpi_expressions: The aggregated KPI expressions of the given KPI target.
+        lp_problem: An Lp problem object to add constraint to.
+
+    """
+    for v in kpi_expressions:
         if isinstance(v, float):
             if v > target_kpi_value:
                 Logger.critical(f"The model can't be quantized to satisfy target KPI {target.value} with value {target_kpi_value}")
@@ -234,6 +285,8 @@ def _build_layer_to_metrics_mapping(search_manager: MixedPrecisionSearchManager,
     the framework function compute_metric_fn in order to infer
     a batch of images, and compute (using the inference results) the sensitivity metric of
     the configured mixed-precision model.
+    In adaptive sensitivity evaluation, each measurement gets a dominance threshold (see _get_dominance_threshold),
+    so it can stop early once the bitwidth is provably dominated by another bitwidth of the node.
 
     Args:
         search_manager: MixedPrecisionSearchManager object to be used for problem formalization.
@@ -257,9 +310,17 @@ def _build_layer_to_metrics_mapping(search_manager: MixedPrecisionSearchManager,
     else:
         max_config_value = search_manager.compute_metric_fn(search_manager.max_kpi_config)
 
+    adaptive_evaluation = search_manager.sensitivity_evaluator.quant_config.adaptive_evaluation
+    constrained_targets = [t for t, v in target_kpi.get_kpi_dict().items()
+                           if v < np.inf and t in search_manager.compute_kpi_functions]
+
     for node_idx, layer_possible_bitwidths_indices in tqdm(search_manager.layer_to_bitwidth_mapping.items(),
                                                            total=len(search_manager.layer_to_bitwidth_mapping)):
         layer_to_metrics_mapping[node_idx] = {}
+        # The max configuration's bitwidth is measured first, since its metric is already computed
+        layer_possible_bitwidths_indices = sorted(layer_possible_bitwidths_indices,
+                                                  key=lambda b: b != search_manager.max_kpi_config[node_idx])
+        candidates_kpis = {}
 
         for bitwidth_idx in layer_possible_bitwidths_indices:
             if search_manager.max_kpi_config[node_idx] == bitwidth_idx:
@@ -267,6 +328,15 @@ def _build_layer_to_metrics_mapping(search_manager: MixedPrecisionSearchManager,
                 layer_to_metrics_mapping[node_idx][bitwidth_idx] = max_config_value
                 continue
 
+            dominance_threshold = None
+            if adaptive_evaluation:
+                dominance_threshold = _get_dominance_threshold(search_manager,
+                                                               node_idx,
+                                                               bitwidth_idx,
+                                                               layer_to_metrics_mapping[node_idx],
+                                                               constrained_targets,
+                                                               candidates_kpis)
+
             # Create a configuration that differs at one layer only from the baseline model
             mp_model_configuration = search_manager.max_kpi_config.copy()
             mp_model_configuration[node_idx] = bitwidth_idx
@@ -284,16 +354,57 @@ def _build_layer_to_metrics_mapping(search_manager: MixedPrecisionSearchManager,
                 layer_to_metrics_mapping[node_idx][bitwidth_idx] = search_manager.compute_metric_fn(
                     origin_mp_model_configuration,
                     origin_changed_nodes_indices,
-                    origin_max_config)
+                    origin_max_config,
+                    dominance_threshold=dominance_threshold)
             else:
                 layer_to_metrics_mapping[node_idx][bitwidth_idx] = search_manager.compute_metric_fn(
                     mp_model_configuration,
                     [node_idx],
-                    search_manager.max_kpi_config)
+                    search_manager.max_kpi_config,
+                    dominance_threshold=dominance_threshold)
 
     return layer_to_metrics_mapping
 
 
+def _get_dominance_threshold(search_manager: MixedPrecisionSearchManager,
+                             node_idx: int,
+                             bitwidth_idx: int,
+                             layer_metrics: Dict[int, float],
+                             constrained_targets: List[KPITarget],
+                             candidates_kpis: Dict[int, List[np.ndarray]]) -> float:
+    """
+    Get the dominance threshold of a node's bitwidth: the minimal metric of the node's bitwidths that were already
+    measured, and whose KPI is not greater than the bitwidth's KPI in any of the constrained KPI targets.
+    A bitwidth with a greater metric than the threshold is dominated (another bitwidth has a better metric without
+    a greater KPI), so the LP never selects it, and its metric does not need to be measured accurately.
+
+    Args:
+        search_manager: MixedPrecisionSearchManager object to be used for problem formalization.
+        node_idx: Index of the configurable node.
+        bitwidth_idx: Index of the bitwidth of the node to get the dominance threshold of.
+        layer_metrics: Mapping from the node's measured bitwidths indices to their metrics.
+        constrained_targets: KPI targets that the LP problem is constrained by.
+        candidates_kpis: Cache of the node's bitwidths KPIs (one per constrained target), updated in place.
+
+    Returns:
+        The dominance threshold, or None if none of the measured bitwidths can dominate the bitwidth.
+
+    """
+
+    def _get_candidate_kpis(candidate_idx: int) -> List[np.ndarray]:
+        if candidate_idx not in candidates_kpis:
+            candidates_kpis[candidate_idx] = [
+                np.asarray(search_manager.compute_node_kpi_for_candidate(node_idx, candidate_idx, target))
+                for target in constrained_targets]
+        return candidates_kpis[candidate_idx]
+
+    bitwidth_kpis = _get_candidate_kpis(bitwidth_idx)
+    dominating_metrics = [metric for candidate_idx, metric in layer_metrics.items()
+                          if all([np.all(candidate_kpi <= kpi) for candidate_kpi, kpi in
+                                  zip(_get_candidate_kpis(candidate_idx), bitwidth_kpis)])]
+    return min(dominating_metrics) if len(dominating_metrics) > 0 else None
+
+
 def _compute_kpis(node_to_bitwidth_indices: Dict[int, List[int]],
                   compute_kpi_fn: Callable,
                   min_weights_cfg: List[int],
@@ -15,12 +15,13 @@
 import copy
 
 import numpy as np
-from typing import Callable, Any, List
+from typing import Callable, Any, List, Tuple
 
 from model_compression_toolkit import FrameworkInfo, MixedPrecisionQuantizationConfigV2
 from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
 from model_compression_toolkit.core.common import Logger
+from model_compression_toolkit.core.common.constants import MP_EVALUATION_CONFIDENCE_Z
 
 
 class SensitivityEvaluation:
@@ -37,7 +38,9 @@ class SensitivityEvaluation:
                  fw_impl: Any,
                  set_layer_to_bitwidth: Callable,
                  get_quant_node_name: Callable,
-                 disable_activation_for_metric: bool = False):
+                 disable_activation_for_metric: bool = False,
+                 compiled_inference: bool = False,
+                 jit_compile_inference: bool = False):
         """
         Initiates all relevant objects to manage a sensitivity evaluation for MP search.
         Create an object that allows to compute the sensitivity metric of an MP model (the sensitivity
@@ -61,6 +64,10 @@ class SensitivityEvaluation:
             get_quant_node_name: A fw-dependent function that takes a node's name and outputs the node's name in a
                 quantized model (according to the fw conventions).
             disable_activation_for_metric: Whether to disable activation quantization when computing the MP metric.
+            compiled_inference: Whether to infer the models using compiled inference functions. The MP model's
+                bit-width configuration is changed between inferences, so it is supported only by frameworks that
+                select the active configuration at runtime (without recompiling).
+            jit_compile_inference: Whether to jit-compile the compiled inference functions.
         """
         self.graph = graph
         self.quant_config = quant_config
@@ -91,9 +98,35 @@ class SensitivityEvaluation:
         # Build a mixed-precision model which can be configured to use different bitwidth in different layers.
         # And a baseline model.
         self.baseline_model, self.model_mp = self._build_models()
+        self.baseline_inference_fn, self.model_mp_inference_fn = self.baseline_model, self.model_mp
+        if compiled_inference:
+            self.baseline_inference_fn = self.fw_impl.compile_model_inference(self.baseline_model,
+                                                                              jit_compile=jit_compile_inference)
+            self.model_mp_inference_fn = self.fw_impl.compile_model_inference(self.model_mp,
+                                                                              jit_compile=jit_compile_inference)
+
+        # Get the distance function of each interest point. If the framework implements all of them, the distances
+        # are computed on the framework's tensors, and only the distance matrix is converted to Numpy.
+        self.interest_points_distance_fns = [
+            self.fw_impl.get_node_distance_fn(layer_class=ip.layer_class,
+                                              framework_attrs=ip.framework_attr,
+                                              compute_distance_fn=self.quant_config.compute_distance_fn)
+            for ip in self.interest_points]
+        self.framework_distance_fns = [self.fw_impl.get_framework_distance_fn(distance_fn)
+                                       for distance_fn in self.interest_points_distance_fns]
+        if any([distance_fn is None for distance_fn in self.framework_distance_fns]):
+            self.framework_distance_fns = None
 
         # Build images batches for inference comparison
         self.images_batches = self._get_images_batches(quant_config.num_of_images)
+        if self.quant_config.adaptive_evaluation:
+            # Evaluate the images progressively in small batches, so the evaluation can stop early.
+            self.images_batches = self._split_images_batches(self.images_batches,
+                                                             self.quant_config.adaptive_evaluation_batch_size)
+
+        # Number of images that were used for each metric evaluation (fewer than num_of_images in case an
+        # adaptive evaluation stopped early).
+        self.num_evaluated_images = []
 
         # Get baseline model inference on all samples
         self.baseline_tensors_list = []  # setting from outside scope
@@ -118,7 +151,8 @@ class SensitivityEvaluation:
     def compute_metric(self,
                        mp_model_configuration: List[int],
                        node_idx: List[int] = None,
-                       baseline_mp_configuration: List[int] = None) -> float:
+                       baseline_mp_configuration: List[int] = None,
+                       dominance_threshold: float = None) -> float:
         """
         Compute the sensitivity metric of the MP model for a given configuration (the sensitivity
         is computed based on the similarity of the interest points' outputs between the MP model
@@ -129,6 +163,8 @@ class SensitivityEvaluation:
             node_idx: A list of nodes' indices to configure (instead of using the entire mp_model_configuration).
             baseline_mp_configuration: A mixed-precision configuration to set the model back to after modifying it to
                 compute the metric for the given configuration.
+            dominance_threshold: A metric value that the configuration is compared to. In adaptive evaluation, the
+                evaluation stops early once the configuration's metric is provably greater than this value.
 
         Returns:
             The sensitivity metric of the MP model for a given configuration.
@@ -141,7 +177,7 @@ class SensitivityEvaluation:
                                         node_idx)
 
         # Compute the distance matrix
-        distance_matrix = self._build_distance_metrix()
+        distance_matrix = self._build_distance_metrix(dominance_threshold)
 
         # Configure MP model back to the same configuration as the baseline model if baseline provided
         if baseline_mp_configuration is not None:
@@ -156,9 +192,14 @@ class SensitivityEvaluation:
         """
         Evaluates the baseline model on all images and saves the obtained lists of tensors in a list for later use.
         Initiates a class variable self.baseline_tensors_list
+        The tensors are kept as framework's tensors if the distances are computed by the framework,
+        and as Numpy arrays otherwise.
         """
-        self.baseline_tensors_list = [self._tensors_as_list(self.fw_impl.to_numpy(self.baseline_model(images)))
+        self.baseline_tensors_list = [self._tensors_as_list(self.fw_impl.to_numpy(self.baseline_inference_fn(images)))
                                       for images in self.images_batches]
+        if self.framework_distance_fns is not None:
+            self.baseline_tensors_list = [self.fw_impl.to_tensor(baseline_tensors)
+                                          for baseline_tensors in self.baseline_tensors_list]
 
     def _build_models(self) -> Any:
         """
@@ -175,6 +216,7 @@ class SensitivityEvaluation:
             for n in evaluation_graph.get_topo_sorted_nodes():
                 for c in n.candidates_quantization_cfg:
                     c.activation_quantization_cfg.enable_activation_quantization = False
+            evaluation_graph.increase_version()
 
         model_mp, _ = self.fw_impl.model_builder(evaluation_graph,
                                                  mode=ModelBuilderMode.MIXEDPRECISION,
@@ -274,18 +316,19 @@ class SensitivityEvaluation:
         distance_matrix = np.ndarray((num_interest_points, num_samples))
 
         for i in range(num_interest_points):
-            point_distance_fn = \
-                self.fw_impl.get_node_distance_fn(layer_class=self.interest_points[i].layer_class,
-                                                  framework_attrs=self.interest_points[i].framework_attr,
-                                                  compute_distance_fn=self.quant_config.compute_distance_fn)
-
-            distance_matrix[i] = point_distance_fn(baseline_tensors[i], mp_tensors[i], batch=True)
+            distance_matrix[i] = self.interest_points_distance_fns[i](baseline_tensors[i], mp_tensors[i], batch=True)
 
         return distance_matrix
 
-    def _build_distance_metrix(self):
+    def _build_distance_metrix(self, dominance_threshold: float = None):
         """
         Builds a matrix that contains the distances between the baseline and MP models for each interest point.
+        In adaptive evaluation, the images batches are evaluated until the evaluation can be stopped early
+        (see _stop_adaptive_evaluation), so the matrix may contain fewer than num_of_images images.
+
+        Args:
+            dominance_threshold: A metric value to stop the adaptive evaluation once the metric is provably greater.
+
         Returns: A distance matrix.
         """
         # List of distance matrices. We create a distance matrix for each sample from the representative_data_gen
@@ -295,20 +338,74 @@ class SensitivityEvaluation:
         # Compute the distance matrix for num_of_images images.
         for images, baseline_tensors in zip(self.images_batches, self.baseline_tensors_list):
             # when using model.predict(), it does not use the QuantizeWrapper functionality
-            mp_tensors = self.model_mp(images)
-            mp_tensors = self._tensors_as_list(self.fw_impl.to_numpy(mp_tensors))
+            mp_tensors = self._tensors_as_list(self.model_mp_inference_fn(images))
 
             # Build distance matrix: similarity between the baseline model to the float model
             # in every interest point for every image in the batch.
-            distance_matrices.append(self._compute_distance_matrix(baseline_tensors, mp_tensors))
+            if self.framework_distance_fns is not None:
+                distance_matrices.append(self.fw_impl.compute_distance_matrix(baseline_tensors,
+                                                                              mp_tensors,
+                                                                              self.framework_distance_fns))
+            else:
+                mp_tensors = self._tensors_as_list(self.fw_impl.to_numpy(mp_tensors))
+                distance_matrices.append(self._compute_distance_matrix(baseline_tensors, mp_tensors))
+
+            if self.quant_config.adaptive_evaluation and \
+                    self._stop_adaptive_evaluation(np.concatenate(distance_matrices, axis=1), dominance_threshold):
+                break
 
         # Merge all distance matrices into a single distance matrix.
         distance_matrix = np.concatenate(distance_matrices, axis=1)
+        self.num_evaluated_images.append(distance_matrix.shape[1])
 
         # Assert we used a correct number of images for computing the distance matrix
-        assert distance_matrix.shape[1] == self.quant_config.num_of_images
+        if self.quant_config.adaptive_evaluation:
+            assert distance_matrix.shape[1] <= self.quant_config.num_of_images
+        else:
+            assert distance_matrix.shape[1] == self.quant_config.num_of_images
         return distance_matrix
 
+    def _stop_adaptive_evaluation(self, distance_matrix: np.ndarray, dominance_threshold: float = None) -> bool:
+        """
+        Check whether an adaptive evaluation can stop, given the distance matrix of the images evaluated so far.
+        The evaluation stops once the half-width of the metric's confidence interval is smaller than
+        adaptive_evaluation_tolerance of the metric, or once the lower bound of the confidence interval is
+        greater than the dominance threshold (so the evaluated configuration is provably worse).
+
+        Args:
+            distance_matrix: A distance matrix of the images that were evaluated so far.
+            dominance_threshold: A metric value that the evaluated configuration is compared to (optional).
+
+        Returns: Whether to stop the evaluation.
+        """
+        if distance_matrix.shape[1] >= self.quant_config.num_of_images:
+            return False
+
+        metric, half_width = self._compute_mp_distance_confidence_interval(distance_matrix,
+                                                                           self.quant_config.distance_weighting_method)
+        if half_width <= self.quant_config.adaptive_evaluation_tolerance * np.abs(metric):
+            return True
+        return dominance_threshold is not None and metric - half_width > dominance_threshold
+
+    @staticmethod
+    def _compute_mp_distance_confidence_interval(distance_matrix: np.ndarray,
+                                                 metrics_weights_fn: Callable) -> Tuple[float, float]:
+        """
+        Computes the distance value out of a distance matrix (as in _compute_mp_distance_measure), and the
+        half-width of its confidence interval, based on the variance of the distance value between the images.
+
+        Args:
+            distance_matrix: A matrix that contains the distances between the baseline and MP models
+                for each interest point.
+            metrics_weights_fn: Function to compute the weights of the interest points.
+
+        Returns: The distance value and the half-width of its confidence interval.
+        """
+        # The weighted average of the interest points' distances of each image
+        image_distances = np.average(distance_matrix, axis=0, weights=metrics_weights_fn(distance_matrix))
+        half_width = MP_EVALUATION_CONFIDENCE_Z * np.std(image_distances, ddof=1) / np.sqrt(len(image_distances))
+        return np.mean(image_distances), half_width
+
     @staticmethod
     def _compute_mp_distance_measure(distance_matrix: np.ndarray, metrics_weights_fn: Callable) -> float:
         """
@@ -355,6 +452,23 @@ class SensitivityEvaluation:
             samples_count += batch_size
         return images_batches
 
+    @staticmethod
+    def _split_images_batches(images_batches: List[Any], batch_size: int) -> List[Any]:
+        """
+        Split images batches to batches of a given size (the last batch of each original batch may be smaller).
+
+        Args:
+            images_batches: A list of images batches (lists of images).
+            batch_size: Number of images in each batch.
+
+        Returns: A list of images batches (lists of images).
+        """
+        split_batches = []
+        for images in images_batches:
+            for i in range(0, images[0].shape[0], batch_size):
+                split_batches.append([x[i:i + batch_size] for x in images])
+        return split_batches
+
     def _update_ips_with_outputs_replacements(self):
         """
         Updates the list of interest points with the set of pre-calculated replacement outputs.
@@ -14,6 +14,7 @@
 # ==============================================================================
 
 
+import time
 import numpy as np
 from typing import List
 
@@ -23,6 +24,7 @@ from model_compression_toolkit.core.common.framework_implementation import Frame
 from model_compression_toolkit.core.common.graph.base_graph import Graph
 from model_compression_toolkit.core.common.logger import Logger
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.common.pipeline_profiler import get_pipeline_profiler
 
 
 class ModelCollector:
@@ -33,7 +35,12 @@ class ModelCollector:
     for thresholds calculations.
     """
 
-    def __init__(self, graph: Graph, fw_impl: FrameworkImplementation, fw_info: FrameworkInfo):
+    def __init__(self,
+                 graph: Graph,
+                 fw_impl: FrameworkImplementation,
+                 fw_info: FrameworkInfo,
+                 compiled_inference: bool = False,
+                 jit_compile_inference: bool = False):
         """
         Build a Keras model from the passed graph, and set the model's
         outputs to be all layers' outputs.
@@ -41,6 +48,9 @@ class ModelCollector:
         Args:
             graph: Graph to build a model from it.
             fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+            fw_info: FrameworkInfo object with information about the specific framework's model.
+            compiled_inference: Whether to infer the model using a compiled inference function.
+            jit_compile_inference: Whether to jit-compile the compiled inference function.
 
         """
 
@@ -51,6 +61,7 @@ class ModelCollector:
         node2fetch = []  # List of graph nodes, the model should output their outputs.
         stats_containers_list = []  # List of output statistics containers of nodes ordered
         # the same as node2fetch so statistics of outputs can be gathered for the correct statistics container.
+        stats_nodes_names = []  # Names of the nodes of the statistics containers (ordered the same).
 
         for n in self.graph.nodes():
             out_stats_container = self.graph.get_out_stats_collector(n)
@@ -65,13 +76,16 @@ class ModelCollector:
                             mark2fetch = False
                             node2fetch.append(n)  # Append node several times (as number of outputs it has)
                     stats_containers_list.append(out_stats_container)
+                    stats_nodes_names.append(n.name)
 
             else:  # A single output
                 if out_stats_container.require_collection():
                     node2fetch.append(n)
                     stats_containers_list.append(out_stats_container)
+                    stats_nodes_names.append(n.name)
 
         self.stats_containers_list = stats_containers_list
+        self.stats_nodes_names = stats_nodes_names
 
         # Build a float model and output all layers' outputs
         # (that should be collected) as the model's outputs
@@ -79,6 +93,9 @@ class ModelCollector:
                                                    mode=ModelBuilderMode.FLOAT,
                                                    append2output=node2fetch,
                                                    fw_info=self.fw_info)
+        self.inference_fn = self.model
+        if compiled_inference:
+            self.inference_fn = self.fw_impl.compile_model_inference(self.model, jit_compile=jit_compile_inference)
 
     def infer(self, inputs_list: List[np.ndarray]):
         """
@@ -92,8 +109,11 @@ class ModelCollector:
 
         # TODO: Thinking about delegating collections to framework
         # TODO: migrate datasets to framework datasets
-        tensor_data = self.fw_impl.run_model_inference(self.model, inputs_list)
-        for td, sc in zip(tensor_data, self.stats_containers_list):
+        tensor_data = self.fw_impl.run_model_inference(self.inference_fn, inputs_list)
+        # Time of statistics update of each node is reported to the pipeline profiler (if profiling is enabled)
+        profiler = get_pipeline_profiler()
+        for td, sc, node_name in zip(tensor_data, self.stats_containers_list, self.stats_nodes_names):
+            update_start_time = time.perf_counter()
             if isinstance(sc, (list, tuple)):
                 if not isinstance(td, (list, tuple)):
                     Logger.exception(
@@ -104,3 +124,5 @@ class ModelCollector:
                     sci.update_statistics(self.fw_impl.to_numpy(tdi))
             else:
                 sc.update_statistics(self.fw_impl.to_numpy(td))
+            if profiler is not None:
+                profiler.add_node_time(node_name, time.perf_counter() - update_start_time)
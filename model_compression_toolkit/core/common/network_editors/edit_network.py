@@ -41,4 +41,6 @@ def edit_network_graph(graph: Graph,
         filtered_nodes = graph.filter(edit_rule.filter)
         for node in filtered_nodes:
             edit_rule.action.apply(node, graph, fw_info)
+    # Edit actions may change the nodes' quantization configurations.
+    graph.increase_version()
     # return graph
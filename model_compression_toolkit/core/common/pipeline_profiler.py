@@ -0,0 +1,257 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+from model_compression_toolkit.core.common.logger import Logger
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    RESOURCE_AVAILABLE = False
+
+# Number of nodes to show in the per-node breakdown of a stage in the logged report.
+PROFILE_TOP_NODES = 5
+
+
+def get_peak_rss_mb() -> float:
+    """
+    Returns: The peak resident set size of the process (in MB), or 0 if it cannot be measured.
+    """
+    if not RESOURCE_AVAILABLE:
+        return 0.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak_rss / 2 ** 20 if sys.platform == 'darwin' else peak_rss / 2 ** 10
+
+
+class StageProfile:
+    """
+    Measurements of a single stage of the quantization pipeline.
+    """
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Name of the stage.
+        """
+        self.name = name
+        self.wall_time = 0.
+        self.cpu_time = 0.
+        self.peak_rss_mb = 0.
+        self.peak_rss_increase_mb = 0.
+        self.num_nodes = None
+        self.nodes_time = {}
+
+    def set_graph(self, graph: Any):
+        """
+        Record the number of nodes of the graph the stage outputs.
+
+        Args:
+            graph: Graph the stage outputs.
+        """
+        self.num_nodes = len(graph.nodes)
+
+    def add_node_time(self, node_name: str, node_time: float):
+        """
+        Accumulate time that was spent in the stage on a specific node.
+
+        Args:
+            node_name: Name of the node.
+            node_time: Time (in seconds) to add to the node.
+        """
+        self.nodes_time[node_name] = self.nodes_time.get(node_name, 0.) + node_time
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns: A dictionary with the stage measurements.
+        """
+        return {'name': self.name,
+                'wall_time': self.wall_time,
+                'cpu_time': self.cpu_time,
+                'peak_rss_mb': self.peak_rss_mb,
+                'peak_rss_increase_mb': self.peak_rss_increase_mb,
+                'num_nodes': self.num_nodes,
+                'nodes_time': self.nodes_time}
+
+
+class PipelineProfiler:
+    """
+    Profiler of the stages of the quantization pipeline. For each stage, it records the wall time, the CPU time,
+    the peak RSS of the process, the number of nodes in the graph the stage outputs and, for stages that report it,
+    the time spent on each node.
+    Every completed stage is logged, added to TensorBoard (if a TensorboardWriter is given) and written to a JSON
+    report file (if a path is given), so stages that run after the core runner (e.g. GPTQ) are reported as well.
+    """
+
+    def __init__(self, report_path: str = None, tb_w: Any = None):
+        """
+        Args:
+            report_path: Path of a JSON file to write the profile to.
+            tb_w: TensorboardWriter object to add the profile to.
+        """
+        self.report_path = report_path
+        self.tb_w = tb_w
+        self.stages: List[StageProfile] = []
+        self.current_stage = None
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Profile a stage of the pipeline.
+
+        Args:
+            name: Name of the stage.
+
+        Returns:
+            A context manager that yields the StageProfile of the stage.
+        """
+        stage_profile = StageProfile(name)
+        parent_stage = self.current_stage
+        self.current_stage = stage_profile
+        peak_rss_start = get_peak_rss_mb()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield stage_profile
+        finally:
+            stage_profile.wall_time = time.perf_counter() - wall_start
+            stage_profile.cpu_time = time.process_time() - cpu_start
+            stage_profile.peak_rss_mb = get_peak_rss_mb()
+            stage_profile.peak_rss_increase_mb = stage_profile.peak_rss_mb - peak_rss_start
+            self.current_stage = parent_stage
+            self.stages.append(stage_profile)
+            self._report_stage(stage_profile)
+
+    def add_node_time(self, node_name: str, node_time: float):
+        """
+        Accumulate time that was spent on a node in the currently profiled stage (if any).
+
+        Args:
+            node_name: Name of the node.
+            node_time: Time (in seconds) to add to the node.
+        """
+        if self.current_stage is not None:
+            self.current_stage.add_node_time(node_name, node_time)
+
+    def _report_stage(self, stage_profile: StageProfile):
+        """
+        Log a completed stage, add it to TensorBoard and update the JSON report.
+
+        Args:
+            stage_profile: Profile of the completed stage.
+        """
+        msg = f'Stage {stage_profile.name}: wall time {stage_profile.wall_time:.3f}s, ' \
+              f'CPU time {stage_profile.cpu_time:.3f}s, peak RSS {stage_profile.peak_rss_mb:.1f}MB ' \
+              f'(+{stage_profile.peak_rss_increase_mb:.1f}MB)'
+        if stage_profile.num_nodes is not None:
+            msg += f', {stage_profile.num_nodes} nodes'
+        if len(stage_profile.nodes_time) > 0:
+            top_nodes = sorted(stage_profile.nodes_time.items(), key=lambda x: -x[1])[:PROFILE_TOP_NODES]
+            msg += ', slowest nodes: ' + ', '.join([f'{n} {t:.3f}s' for n, t in top_nodes])
+        Logger.info(msg)
+
+        if self.tb_w is not None:
+            self.tb_w.add_stage_profile(stage_profile, step=len(self.stages) - 1)
+
+        if self.report_path is not None:
+            self.export_json(self.report_path)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns: A dictionary with the profiles of all completed stages.
+        """
+        return {'stages': [s.to_dict() for s in self.stages],
+                'total_wall_time': sum([s.wall_time for s in self.stages]),
+                'total_cpu_time': sum([s.cpu_time for s in self.stages]),
+                'peak_rss_mb': max([s.peak_rss_mb for s in self.stages], default=0.)}
+
+    def export_json(self, path: str):
+        """
+        Write the profiles of all completed stages to a JSON file.
+
+        Args:
+            path: Path of the JSON file.
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def log_summary(self):
+        """
+        Log the total time of the pipeline and the stages sorted by their wall time.
+        """
+        summary = self.to_dict()
+        Logger.info(f'Pipeline total wall time {summary["total_wall_time"]:.3f}s, '
+                    f'CPU time {summary["total_cpu_time"]:.3f}s, peak RSS {summary["peak_rss_mb"]:.1f}MB')
+        for s in sorted(self.stages, key=lambda x: -x.wall_time):
+            Logger.info(f'  {s.name}: {s.wall_time:.3f}s')
+
+
+class _NullStageProfile:
+    """
+    A StageProfile replacement that is used when no pipeline profiler is active.
+    """
+
+    def set_graph(self, graph: Any):
+        pass
+
+    def add_node_time(self, node_name: str, node_time: float):
+        pass
+
+
+_NULL_STAGE_PROFILE = _NullStageProfile()
+
+# The pipeline profiler that profile_stage reports to. It is set by the core runner, and stays active after it
+# returns, so stages that run after it (e.g. GPTQ) are profiled as well.
+_active_profiler = None
+
+
+def set_pipeline_profiler(profiler: PipelineProfiler = None):
+    """
+    Set the active pipeline profiler.
+
+    Args:
+        profiler: PipelineProfiler to set, or None to disable profiling.
+    """
+    global _active_profiler
+    _active_profiler = profiler
+
+
+def get_pipeline_profiler() -> PipelineProfiler:
+    """
+    Returns: The active pipeline profiler (None if profiling is disabled).
+    """
+    return _active_profiler
+
+
+@contextmanager
+def profile_stage(name: str):
+    """
+    Profile a stage of the pipeline with the active pipeline profiler. If no profiler is active, nothing is recorded.
+
+    Args:
+        name: Name of the stage.
+
+    Returns:
+        A context manager that yields the StageProfile of the stage.
+    """
+    if _active_profiler is None:
+        yield _NULL_STAGE_PROFILE
+    else:
+        with _active_profiler.stage(name) as stage_profile:
+            yield stage_profile
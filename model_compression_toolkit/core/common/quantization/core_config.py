@@ -27,7 +27,10 @@ class CoreConfig:
                  n_iter: int = 500,
                  quantization_config: QuantizationConfig = QuantizationConfig(),
                  mixed_precision_config: MixedPrecisionQuantizationConfigV2 = None,
-                 debug_config: DebugConfig = DebugConfig()
+                 debug_config: DebugConfig = DebugConfig(),
+                 compiled_inference: bool = False,
+                 jit_compile_inference: bool = False,
+                 snapshot_dir: str = None
                  ):
         """
 
@@ -36,11 +39,17 @@ class CoreConfig:
             quantization_config (QuantizationConfig): Config for quantization.
             mixed_precision_config (MixedPrecisionQuantizationConfigV2): Config for mixed precision quantization (optional, default=None).
             debug_config (DebugConfig): Config for debugging and editing the network quantization process.
+            compiled_inference (bool): Whether to run the models that are used for statistics collection and mixed precision evaluation using a compiled inference function (supported in Keras), instead of eagerly.
+            jit_compile_inference (bool): Whether to jit-compile (XLA) the compiled inference function (used only if compiled_inference is enabled).
+            snapshot_dir (str): Directory to save the collected statistics to, keyed by the model graph, the representative dataset and n_iter. Later runs with the same key restore the statistics instead of collecting them again (optional, default=None).
         """
         self.n_iter = n_iter
         self.quantization_config = quantization_config
         self.mixed_precision_config = mixed_precision_config
         self.debug_config = debug_config
+        self.compiled_inference = compiled_inference
+        self.jit_compile_inference = jit_compile_inference
+        self.snapshot_dir = snapshot_dir
 
     @property
     def mixed_precision_enable(self):
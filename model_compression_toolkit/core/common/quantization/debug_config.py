@@ -25,7 +25,9 @@ class DebugConfig:
     """
     def __init__(self,
                  analyze_similarity: bool = False,
-                 network_editor: List[EditRule] = []):
+                 network_editor: List[EditRule] = [],
+                 profile_pipeline: bool = False,
+                 profile_report_path: str = None):
         """
 
         Args:
@@ -33,6 +35,12 @@ class DebugConfig:
             analyze_similarity (bool): Whether to plot similarity figures within TensorBoard (when logger is
              enabled) or not. Can be used to pinpoint problematic layers in the quantization process.
             network_editor (List[EditRule]): A list of rules and actions to edit the network for quantization.
+            profile_pipeline (bool): Whether to profile the stages of the quantization process (time, memory and
+             per-node breakdowns). The profile is logged, and added to TensorBoard (when logger is enabled).
+            profile_report_path (str): Path of a JSON file to write the profile to. If None and the logger is
+             enabled, the profile is written to the logger folder.
         """
         self.analyze_similarity = analyze_similarity
         self.network_editor = network_editor
+        self.profile_pipeline = profile_pipeline
+        self.profile_report_path = profile_report_path
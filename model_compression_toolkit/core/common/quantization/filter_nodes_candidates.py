@@ -35,6 +35,7 @@ def filter_nodes_candidates(graph_to_filter: Graph):
     nodes = list(graph.nodes)
     for n in nodes:
         n.candidates_quantization_cfg = filter_node_candidates(node=n)
+    graph.increase_version()
 
     return graph
 
@@ -15,27 +15,29 @@
 
 from typing import Callable
 
-from networkx.algorithms.dag import topological_sort
-
 from model_compression_toolkit.core import common
 
 
 def create_tensor2node(graph: common.Graph,
                        node: common.BaseNode,
-                       fw_info: common.FrameworkInfo):
+                       fw_info: common.FrameworkInfo,
+                       qc: common.QuantizationConfig = common.DEFAULTCONFIG):
     """
     Force tensor creation and assignment for a node.
     Args:
         graph: Graph of the node (for retrieving the current tensor).
         node: Node to create a tensor for.
         fw_info: Specific framework information (for example, output channels index).
+        qc: Quantization configuration (determines how histograms are collected).
 
     """
     current_tensor = graph.get_out_stats_collector(node)
     is_list_nostat_collectors = isinstance(current_tensor, list) and len([sc for sc in current_tensor if not isinstance(sc, common.NoStatsCollector)]) == 0
     if isinstance(current_tensor, common.NoStatsCollector) or current_tensor is None or is_list_nostat_collectors:
         out_channel_axis = fw_info.out_channel_axis_mapping.get(node.type)
-        graph.set_out_stats_collector_to_node(node, common.StatsCollector(out_channel_axis))
+        graph.set_out_stats_collector_to_node(node, common.StatsCollector(out_channel_axis,
+                                                                          histogram_sample_size=qc.histogram_sample_size,
+                                                                          histogram_sampling_method=qc.histogram_sampling_method))
 
 
 def analyzer_graph(node_analyze_func: Callable,
@@ -55,9 +57,9 @@ def analyzer_graph(node_analyze_func: Callable,
         qc: Quantization configuration containing parameters for how the graph should be quantized.
 
     """
-    nodes_sorted = topological_sort(graph)
+    nodes_sorted = graph.get_topo_sorted_nodes()
     for n in nodes_sorted:
-        sc = node_analyze_func(n, fw_info=fw_info)  # Get tensor for the node
+        sc = node_analyze_func(n, fw_info=fw_info, quant_config=qc)  # Get tensor for the node
         # If we use bias correction, and the node has coefficients to quantize, we need to make sure
         # its previous nodes' tensors are consistent with this node.
         # TODO: factor tensor marking in case of bias correction.
@@ -66,6 +68,7 @@ def analyzer_graph(node_analyze_func: Callable,
                 input_node = ie.source_node
                 create_tensor2node(graph,
                                    input_node,
-                                   fw_info)
+                                   fw_info,
+                                   qc)
         if sc is not None:
             graph.set_out_stats_collector_to_node(n, sc)
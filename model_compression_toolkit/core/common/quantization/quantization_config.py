@@ -43,6 +43,20 @@ class QuantizationErrorMethod(Enum):
     LP = 5
 
 
+class HistogramSamplingMethod(Enum):
+    """
+    Method for sampling the elements of large tensors, when collecting their histograms:
+
+    STRIDED - Take every k-th element of the tensor (with a stride that does not align with the tensor's last axis).
+
+    RANDOM - Take uniformly random elements of the tensor.
+
+    """
+
+    STRIDED = 0
+    RANDOM = 1
+
+
 class QuantizationConfig:
 
     def __init__(self,
@@ -63,7 +77,10 @@ class QuantizationConfig:
                  linear_collapsing: bool = True,
                  residual_collapsing: bool = True,
                  shift_negative_ratio: float = 0.05,
-                 shift_negative_threshold_recalculation: bool = False):
+                 shift_negative_threshold_recalculation: bool = False,
+                 batched_attention_heads: bool = False,
+                 histogram_sample_size: int = None,
+                 histogram_sampling_method: HistogramSamplingMethod = HistogramSamplingMethod.STRIDED):
         """
         Class to wrap all different parameters the library quantize the input model according to.
 
@@ -85,6 +102,9 @@ class QuantizationConfig:
             block_collapsing (bool): Whether to collapse block one to another in the input network
             shift_negative_ratio (float): Value for the ratio between the minimal negative value of a non-linearity output to its activation threshold, which above it - shifting negative activation should occur if enabled.
             shift_negative_threshold_recalculation (bool): Whether or not to recompute the threshold after shifting negative activation.
+            batched_attention_heads (bool): Whether to decompose multi-head attention layers with the heads dimension batched (a single attention computation for all heads), instead of a separate attention computation per head.
+            histogram_sample_size (int): Maximal number of elements of a tensor to collect its histogram from, in each inference iteration. Larger tensors are sampled (their min/max are still collected from all elements). If None, histograms are collected from all elements.
+            histogram_sampling_method (HistogramSamplingMethod): Which method to use from HistogramSamplingMethod for sampling tensors that are larger than histogram_sample_size.
 
         Examples:
             One may create a quantization configuration to quantize a model according to.
@@ -120,6 +140,9 @@ class QuantizationConfig:
         self.residual_collapsing = residual_collapsing
         self.shift_negative_ratio = shift_negative_ratio
         self.shift_negative_threshold_recalculation = shift_negative_threshold_recalculation
+        self.batched_attention_heads = batched_attention_heads
+        self.histogram_sample_size = histogram_sample_size
+        self.histogram_sampling_method = histogram_sampling_method
 
     def __repr__(self):
         return str(self.__dict__)
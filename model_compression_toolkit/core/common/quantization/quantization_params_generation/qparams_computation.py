@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import time
 from typing import List
 
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common import Graph, BaseNode, Logger
+from model_compression_toolkit.core.common.pipeline_profiler import get_pipeline_profiler
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_activations_computation \
     import get_activations_qparams
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_weights_computation import \
@@ -49,7 +51,11 @@ def calculate_quantization_params(graph: Graph,
     # Create a list of nodes to compute their thresholds
     nodes_list: List[BaseNode] = nodes if specific_nodes else graph.nodes()
 
+    # Time spent on each node is reported to the pipeline profiler (if profiling is enabled)
+    profiler = get_pipeline_profiler()
+
     for n in nodes_list:  # iterate only nodes that we should compute their thresholds
+        node_start_time = time.perf_counter()
         for candidate_qc in n.candidates_quantization_cfg:
             if n.is_weights_quantization_enabled():
                 # If node's weights should be quantized, we compute its weights' quantization parameters
@@ -67,3 +73,5 @@ def calculate_quantization_params(graph: Graph,
                     out_stats_container=graph.get_out_stats_collector(n))
                 # Create a NodeQuantizationConfig containing all quantization params and attach it to the node
                 candidate_qc.activation_quantization_cfg.set_activation_quantization_param(activation_params)
+        if profiler is not None:
+            profiler.add_node_time(n.name, time.perf_counter() - node_start_time)
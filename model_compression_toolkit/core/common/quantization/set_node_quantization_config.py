@@ -53,6 +53,7 @@ def set_quantization_configuration_to_graph(graph: Graph,
                                          fw_info=graph.fw_info,
                                          tpc=graph.tpc,
                                          mixed_precision_enable=mixed_precision_enable)
+    graph_with_qcs.increase_version()
     return graph_with_qcs
 
 
@@ -55,8 +55,10 @@ class BaseVirtualActivationWeightsComposition(BaseSubstitution):
         # Virtual composed activation-weights node
         # we pass a dummy initialization dict to initialize the super BaseNode class,
         # the actual arguments values are irrelevant because they are being overridden or not used
+        # (the node's weights are held behind a property, thus, they are not included in its __dict__)
         v_node = VirtualActivationWeightsNode(act_node,
                                               weights_node,
+                                              weights=weights_node.weights,
                                               **weights_node.__dict__)
 
         # Update graph
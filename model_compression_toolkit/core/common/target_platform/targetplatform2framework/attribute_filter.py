@@ -14,7 +14,7 @@
 # ==============================================================================
 
 import operator
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, List
 
 
 class Filter:
@@ -33,6 +33,15 @@ class Filter:
         """
         raise Exception('Filter did not implement match')
 
+    def get_attributes(self) -> List[str]:
+        """
+
+        Returns: List of the attributes that the filter checks in a layer's configuration, or None if they are
+        unknown (in which case, the filter's result can not be cached by the attributes' values).
+
+        """
+        return None
+
 
 class AttributeFilter(Filter):
     """
@@ -117,6 +126,14 @@ class AttributeFilter(Filter):
             return self.op(layer_config.get(self.attr), self.value)
         return False
 
+    def get_attributes(self) -> List[str]:
+        """
+
+        Returns: List of the attributes that the filter checks in a layer's configuration.
+
+        """
+        return [self.attr]
+
     def op_as_str(self):
         """
 
@@ -166,6 +183,14 @@ class OrAttributeFilter(Filter):
         """
         return ' | '.join([str(f) for f in self.filters])
 
+    def get_attributes(self) -> List[str]:
+        """
+
+        Returns: List of the attributes that the filters check in a layer's configuration.
+
+        """
+        return get_filters_attributes(self.filters)
+
 
 class AndAttributeFilter(Filter):
     """
@@ -198,6 +223,14 @@ class AndAttributeFilter(Filter):
         """
         return ' & '.join([str(f) for f in self.filters])
 
+    def get_attributes(self) -> List[str]:
+        """
+
+        Returns: List of the attributes that the filters check in a layer's configuration.
+
+        """
+        return get_filters_attributes(self.filters)
+
 
 class Greater(AttributeFilter):
     """
@@ -267,3 +300,22 @@ class Eq(AttributeFilter):
         super().__init__(attr=attr, value=value, op=operator.eq)
 
     def op_as_str(self): return "="
+
+
+def get_filters_attributes(filters: List[Filter]) -> List[str]:
+    """
+    Get the attributes that filters check in a layer's configuration.
+
+    Args:
+        filters: List of filters.
+
+    Returns:
+        List of the attributes that the filters check, or None if the attributes of one of the filters are unknown.
+    """
+    attributes = []
+    for f in filters:
+        filter_attributes = f.get_attributes()
+        if filter_attributes is None:
+            return None
+        attributes.extend([a for a in filter_attributes if a not in attributes])
+    return attributes
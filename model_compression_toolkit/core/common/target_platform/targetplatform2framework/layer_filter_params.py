@@ -13,10 +13,11 @@
 # limitations under the License.
 # ==============================================================================
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from model_compression_toolkit.core.common.graph.base_node import BaseNode
-from model_compression_toolkit.core.common.target_platform.targetplatform2framework.attribute_filter import AttributeFilter
+from model_compression_toolkit.core.common.target_platform.targetplatform2framework.attribute_filter import AttributeFilter, \
+    get_filters_attributes
 
 
 class LayerFilterParams:
@@ -88,6 +89,18 @@ class LayerFilterParams:
         params_str = ', '.join(params)
         return f'{self.layer.__name__}({params_str})'
 
+    def get_attributes(self) -> List[str]:
+        """
+
+        Returns: List of the attributes that the LayerFilterParams checks in a layer's configuration, or None if
+        the attributes of one of its conditions are unknown.
+
+        """
+        conditions_attributes = get_filters_attributes(self.conditions)
+        if conditions_attributes is None:
+            return None
+        return list(self.kwargs.keys()) + [a for a in conditions_attributes if a not in self.kwargs]
+
     def match(self,
               node: BaseNode) -> bool:
         """
@@ -104,11 +117,7 @@ class LayerFilterParams:
         if self.layer != node.type:
             return False
 
-        # Get attributes from node to filter
-        layer_config = node.framework_attr
-        if hasattr(node, "op_call_kwargs"):
-            layer_config.update(node.op_call_kwargs)
-
+        layer_config = get_layer_config(node)
         for attr, value in self.kwargs.items():
             if layer_config.get(attr) != value:
                 return False
@@ -118,3 +127,19 @@ class LayerFilterParams:
                 return False
 
         return True
+
+
+def get_layer_config(node: BaseNode) -> Dict[str, Any]:
+    """
+    Get the configuration of a node to filter by its attributes: the node's framework attributes, and the
+    keyword arguments of its call (if it has such).
+
+    Args:
+        node: Node to get its configuration.
+
+    Returns:
+        The node's configuration.
+    """
+    if getattr(node, "op_call_kwargs", None):
+        return {**node.framework_attr, **node.op_call_kwargs}
+    return node.framework_attr
@@ -22,7 +22,8 @@ from model_compression_toolkit.core.common.logger import Logger
 from model_compression_toolkit.core.common.target_platform.targetplatform2framework.operations_to_layers import \
     OperationsToLayers, OperationsSetToLayers
 from model_compression_toolkit.core.common.target_platform.targetplatform2framework.target_platform_capabilities_component import TargetPlatformCapabilitiesComponent
-from model_compression_toolkit.core.common.target_platform.targetplatform2framework.layer_filter_params import LayerFilterParams
+from model_compression_toolkit.core.common.target_platform.targetplatform2framework.layer_filter_params import LayerFilterParams, \
+    get_layer_config
 from model_compression_toolkit.core.common.immutable import ImmutableClass
 from model_compression_toolkit.core.common.graph.base_node import BaseNode
 from model_compression_toolkit.core.common.target_platform.op_quantization_config import QuantizationConfigOptions, \
@@ -31,6 +32,9 @@ from model_compression_toolkit.core.common.target_platform.operators import Oper
 from model_compression_toolkit.core.common.target_platform.target_platform_model import TargetPlatformModel
 from model_compression_toolkit.core.common.target_platform.targetplatform2framework.current_tpc import _current_tpc
 
+# Marks an attribute that is missing from a node's configuration (to distinguish it from an attribute with a None value).
+_MISSING_ATTRIBUTE = object()
+
 
 class TargetPlatformCapabilities(ImmutableClass):
     """
@@ -54,6 +58,11 @@ class TargetPlatformCapabilities(ImmutableClass):
         self.tp_model = tp_model
         self.op_sets_to_layers = OperationsToLayers() # Init an empty OperationsToLayers
         self.layer2qco, self.filterlayer2qco = {}, {} # Init empty mappings from layers/LayerFilterParams to QC options
+        # Init empty mappings from layers to their LayerFilterParams (and their QC options), and to the attributes
+        # the filters check.
+        self.layer2filters, self.layer2filters_attributes = {}, {}
+        # Cache of nodes' QC options by the node's type and the values of the attributes its filters check.
+        self._qco_cache = {}
         # Track the unused opsets for warning purposes.
         self.__tp_model_opsets_not_used = [s.name for s in tp_model.operator_set]
         self.remove_fusing_names_from_not_used_list()
@@ -149,6 +158,7 @@ class TargetPlatformCapabilities(ImmutableClass):
             raise exc_value
         self.raise_warnings()
         self.layer2qco, self.filterlayer2qco = self._get_config_options_mapping()
+        self.layer2filters, self.layer2filters_attributes = self._get_filters_dispatch_table()
         _current_tpc.reset()
         self.initialized_done()
         return self
@@ -176,12 +186,65 @@ class TargetPlatformCapabilities(ImmutableClass):
         """
         if node is None:
             raise Exception(f'Can not retrieve QC options for None node')
-        for fl, qco in self.filterlayer2qco.items():
+        if node.type not in self.layer2filters:
+            return self.layer2qco.get(node.type, self.tp_model.default_qco)
+
+        filters_attributes = self.layer2filters_attributes.get(node.type)
+        if filters_attributes is None:
+            return self._match_filters(node)
+
+        # The filters of the node's type depend only on the values of their attributes, so the node's QC options
+        # are cached by them.
+        layer_config = get_layer_config(node)
+        cache_key = (node.type, tuple([layer_config.get(a, _MISSING_ATTRIBUTE) for a in filters_attributes]))
+        try:
+            qco = self._qco_cache.get(cache_key)
+        except TypeError:  # Unhashable attribute value
+            return self._match_filters(node)
+        if qco is None:
+            qco = self._match_filters(node)
+            self._qco_cache[cache_key] = qco
+        return qco
+
+    def _match_filters(self,
+                       node: BaseNode) -> QuantizationConfigOptions:
+        """
+        Get the QuantizationConfigOptions of a node by matching it with the LayerFilterParams of its type
+        (by their order in the TargetPlatformCapabilities).
+
+        Args:
+            node: Node to get its QuantizationConfigOptions.
+
+        Returns:
+            QuantizationConfigOptions of the node.
+        """
+        for fl, qco in self.layer2filters.get(node.type):
             if fl.match(node):
                 return qco
-        if node.type in self.layer2qco:
-            return self.layer2qco.get(node.type)
-        return self.tp_model.default_qco
+        return self.layer2qco.get(node.type, self.tp_model.default_qco)
+
+    def _get_filters_dispatch_table(self) -> Tuple[Dict[Any, List[Tuple[LayerFilterParams, QuantizationConfigOptions]]],
+                                                   Dict[Any, List[str]]]:
+        """
+        Build mappings from layers to their LayerFilterParams (with their QuantizationConfigOptions, by their
+        order in the TargetPlatformCapabilities), and from layers to the attributes their filters check
+        (None if the attributes of one of the filters are unknown).
+
+        Returns: Two mappings from layers to their LayerFilterParams and to their filters' attributes.
+
+        """
+        layer2filters = {}
+        layer2filters_attributes = {}
+        for fl, qco in self.filterlayer2qco.items():
+            layer2filters.setdefault(fl.layer, []).append((fl, qco))
+            filter_attributes = fl.get_attributes()
+            layer_attributes = layer2filters_attributes.get(fl.layer, [])
+            if filter_attributes is None or layer_attributes is None:
+                layer2filters_attributes[fl.layer] = None
+            else:
+                layer2filters_attributes[fl.layer] = layer_attributes + [a for a in filter_attributes
+                                                                         if a not in layer_attributes]
+        return layer2filters, layer2filters_attributes
 
     def _get_config_options_mapping(self) -> Tuple[Dict[Any, QuantizationConfigOptions],
                                                    Dict[LayerFilterParams, QuantizationConfigOptions]]:
@@ -30,6 +30,8 @@ class UserInformation:
         self.gptq_info_dict = dict()
         self.mixed_precision_cfg = None
         self.final_kpi = None
+        self.memory_schedule = None
+        self.memory_schedule_live_tensors = None
 
     def set_input_scale(self, scale_value: float):
         """
@@ -43,3 +45,16 @@ class UserInformation:
 
     def set_mixed_precision_cfg(self, mp_cfg:List[int]):
         self.mixed_precision_cfg = mp_cfg
+
+    def set_memory_schedule(self, schedule: List[str], live_tensors: List[List[str]]):
+        """
+        Set the UserInformation a memory-optimal execution schedule of the model.
+
+        Args:
+            schedule: Names of the model's nodes, ordered by their execution order in the schedule.
+            live_tensors: For each step in the schedule, the names of the nodes that their output tensors are
+                alive (allocated) while the step's node is executed.
+
+        """
+        self.memory_schedule = schedule
+        self.memory_schedule_live_tensors = live_tensors
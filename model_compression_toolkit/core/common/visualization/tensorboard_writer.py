@@ -13,9 +13,10 @@
 # limitations under the License.
 # ==============================================================================
 
-from copy import deepcopy
-
 import io
+import queue
+import threading
+
 import numpy as np
 from PIL import Image
 from matplotlib.figure import Figure
@@ -29,14 +30,19 @@ from tensorboard.compat.proto.summary_pb2 import HistogramProto
 from tensorboard.compat.proto.summary_pb2 import Summary
 from tensorboard.compat.proto.tensor_shape_pb2 import TensorShapeProto
 from tensorboard.summary.writer.event_file_writer import EventFileWriter
-from typing import List, Any, Dict
-from networkx import topological_sort
+from typing import List, Any, Dict, Callable
 from model_compression_toolkit import FrameworkInfo
-from model_compression_toolkit.core.common import Graph, BaseNode
+from model_compression_toolkit.core.common import Graph, BaseNode, Logger
 from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector
 
 DEVICE_STEP_STATS = "/device:CPU:0"
 
+# Maximal number of pending writing tasks of a TensorboardWriter (adding events blocks when it is reached).
+TB_MAX_QUEUE_SIZE = 64
+
+# Time (in seconds) without new writing tasks after which the writing thread of a TensorboardWriter exits.
+TB_WORKER_IDLE_TIMEOUT = 1.0
+
 
 def get_node_properties(node_dict_to_log: dict,
                         output_shapes: List[tuple] = None) -> Dict[str, Any]:
@@ -78,18 +84,35 @@ def get_node_properties(node_dict_to_log: dict,
     return node_properties
 
 
+def get_loggable_attr(attr: Dict[Any, Any]) -> Dict[str, Any]:
+    """
+    Snapshot a dictionary of attributes to display, by converting its values that are not int, float or bool
+    to strings (as they are displayed), so it can be logged later even if the attributes' objects change.
+
+    Args:
+        attr: Attributes to snapshot.
+
+    Returns:
+        Dictionary from attributes names to their int, float, bool or string values.
+    """
+    return {str(k): v if type(v) in (int, float, bool) else str(v) for k, v in attr.items()}
+
+
 class TensorboardWriter(object):
     """
     Class to log events to display using Tensorboard such as graphs, histograms, images, etc.
+    The values to log are read from the graph when an event is added, while the events are created and written
+    by a background thread, so logging does not block the quantization process.
     """
 
-    def __init__(self, dir_path: str, fw_info: FrameworkInfo):
+    def __init__(self, dir_path: str, fw_info: FrameworkInfo, max_queue_size: int = TB_MAX_QUEUE_SIZE):
         """
         Initialize a TensorboardWriter object.
         
         Args:
             dir_path: Path to save all events to display on Tensorboard.
             fw_info: FrameworkInfo object (needed for computing nodes' weights memory).
+            max_queue_size: Maximal number of pending writing tasks. Adding events blocks when it is reached.
 
         """
         self.dir_path = dir_path
@@ -98,13 +121,72 @@ class TensorboardWriter(object):
         self.tag_name_to_event_writer = {}
         self.fw_info = fw_info
 
+        # Writing tasks are executed by a worker thread, that is started when a task is submitted and exits when
+        # it is idle, so pending events are written even if the writer is not closed.
+        self._tasks = queue.Queue(maxsize=max_queue_size)
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+    def _submit(self, task: Callable):
+        """
+        Submit a task that creates and writes events to the worker thread.
+
+        Args:
+            task: Function to execute in the worker thread.
+
+        """
+        self._tasks.put(task)
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run_worker, name='TensorboardWriter')
+                self._worker.start()
+
+    def _run_worker(self):
+        """
+        Execute the submitted writing tasks, until no task is submitted for TB_WORKER_IDLE_TIMEOUT seconds.
+        """
+        while True:
+            try:
+                task = self._tasks.get(timeout=TB_WORKER_IDLE_TIMEOUT)
+            except queue.Empty:
+                with self._worker_lock:
+                    if self._tasks.empty():
+                        self._worker = None
+                        return
+                continue
+            try:
+                task()
+            except Exception as e:
+                Logger.warning(f'Failed to write Tensorboard events: {e}')
+            finally:
+                self._tasks.task_done()
+
+    def flush(self):
+        """
+        Wait until all events that were added are written.
+        """
+        self._tasks.join()
+
+    def stop_worker(self):
+        """
+        Wait until all events that were added are written and the writing thread exits (it's started again when
+        events are added). Should be called before forking processes, since a lock that is held by the writing
+        thread while forking is never released in the forked process.
+        """
+        self.flush()
+        with self._worker_lock:
+            worker = self._worker
+        if worker is not None:
+            worker.join()
+
     def close(self):
         """
 
-        Close all event-writers the TensorboardWriter holds.
+        Close all event-writers the TensorboardWriter holds, after all events that were added are written.
         Should be called at the end of logging process.
 
         """
+        self.flush()
         for writer in self.tag_name_to_event_writer.values():
             writer.close()
 
@@ -141,13 +223,13 @@ class TensorboardWriter(object):
                                   bucket_limit=bins.tolist(),
                                   bucket=counts.tolist())
 
-        def __create_histo_event(statistics_collector: BaseStatsCollector):
+        def __get_histogram(statistics_collector: BaseStatsCollector):
             """
-            Create an event of histogram, and attach it to a list of events outside
-            the scope called 'events'.
+            Copy the histogram of a statistics collector (if it has a valid one), and attach it to a list of
+            histograms outside the scope called 'histograms'.
 
             Args:
-                statistics_collector: Statistics collector to create an event from its histogram.
+                statistics_collector: Statistics collector to copy its histogram.
 
             """
             if statistics_collector.require_collection():
@@ -155,27 +237,29 @@ class TensorboardWriter(object):
                     if statistics_collector.hc.is_legal:
                         bins, counts = statistics_collector.hc.get_histogram()
                         if bins is not None and counts is not None:
-                            hist = __create_hist_proto(bins[:-1], counts)
-                            summary = Summary(value=[Summary.Value(tag=n.name, histo=hist)])
-                            events.append(Event(summary=summary))
+                            histograms.append((n.name, np.array(bins[:-1]), np.array(counts)))
 
-        events = []
+        histograms = []
         for n in graph.nodes:
             collector = graph.get_out_stats_collector(n)
             if collector is not None:
                 statistics = graph.get_out_stats_collector(n)
                 if isinstance(statistics, list):
                     for s in statistics:
-                        __create_histo_event(s)
+                        __get_histogram(s)
                 else:
-                    __create_histo_event(statistics)
+                    __get_histogram(statistics)
 
-        # Get the event writer for this tag name
-        er = self.__get_event_writer_by_tag_name(main_tag_name)
+        def __write_histograms():
+            # Get the event writer for this tag name
+            er = self.__get_event_writer_by_tag_name(main_tag_name)
 
-        for event in events:
-            er.add_event(event)
-        er.flush()
+            for name, bins, counts in histograms:
+                summary = Summary(value=[Summary.Value(tag=name, histo=__create_hist_proto(bins, counts))])
+                er.add_event(Event(summary=summary))
+            er.flush()
+
+        self._submit(__write_histograms)
 
     def add_graph(self,
                   graph: Graph,
@@ -205,7 +289,7 @@ class TensorboardWriter(object):
                 attr.update(n.final_activation_quantization_cfg.__dict__)
             elif n.candidates_quantization_cfg is not None:
                 attr.update(n.get_unified_activation_candidates_dict())
-            return attr
+            return get_loggable_attr(attr)
 
         def __get_node_weights_attr(n: BaseNode) -> Dict[str, Any]:
             """
@@ -227,7 +311,7 @@ class TensorboardWriter(object):
                 attr.update(n.final_weights_quantization_cfg.__dict__)
             elif n.candidates_quantization_cfg is not None:
                 attr.update(n.get_unified_weights_candidates_dict())
-            return attr
+            return get_loggable_attr(attr)
 
         def __get_node_attr(n: BaseNode) -> Dict[str, Any]:
             """
@@ -240,10 +324,10 @@ class TensorboardWriter(object):
             Returns:
                 Dictionary containing attributes to display.
             """
-            attr = deepcopy(n.framework_attr)
+            attr = dict(n.framework_attr)
             if n.quantization_attr is not None:
                 attr.update(n.quantization_attr)
-            return attr
+            return get_loggable_attr(attr)
 
         def __get_node_output_dims(n: BaseNode) -> List[tuple]:
             """
@@ -269,84 +353,82 @@ class TensorboardWriter(object):
                 dims = [(-1,) + output_shape[1:] if output_shape[0] is None else output_shape]
             return dims
 
-        def __create_node_stats(n: BaseNode):
-            """
-            Create a NodeExecStats for a node in the graph. A NodeExecStats contains the
-            memory and compute time a node requires.
-
-            Args:
-                n: Node to create its NodeExecStats.
+        # Snapshot the nodes' values to display, since the graph may change before the events are created
+        graph_name = graph.name
+        nodes_info = []
+        for n in graph.get_topo_sorted_nodes():
+            nodes_info.append({'name': n.name,
+                               'op': n.type.__name__,
+                               'attr': __get_node_attr(n),
+                               'weights_attr': __get_node_weights_attr(n),
+                               'act_attr': __get_node_act_attr(n),
+                               'output_dims': __get_node_output_dims(n),
+                               'memory_bytes': int(n.get_memory_bytes(self.fw_info)),
+                               'inputs': [(e.source_node.name, e.source_index) for e in graph.incoming_edges(n)],
+                               'num_outputs': len(graph.out_edges(n))})
+
+        def __write_graph():
+            graph_def = GraphDef()  # GraphDef to add to Tensorboard
+
+            node_stats = []
+            types_dict = dict()
+            tb_node_defs = dict()  # Name of the NodeDef that outputs the node's output, by the node's name
+            for info in nodes_info:  # For each node in the graph, we create NodeDefs and connect them to existing NodeDefs
+                # ----------------------------
+                # Main NodeDef: framework attributes
+                # ----------------------------
+                main_node_def = NodeDef(attr=get_node_properties(info['attr'], info['output_dims']))
+                main_node_def.device = info['op']  # For coloring different ops differently
+                main_node_def.op = info['op']
+                op_id = types_dict.get(main_node_def.op, 0)
+                if len(info['inputs']) == 0:  # Input layer
+                    main_node_def.name = 'Input/' + info['name']
+                elif info['num_outputs'] == 0:  # Output layer
+                    main_node_def.name = 'Output/' + info['name']
+                else:
+                    main_node_def.name = graph_name + '/' + main_node_def.op + '_' + str(op_id) + '/' + info['name']
+                tb_node_defs[info['name']] = main_node_def.name
+                for source_name, source_index in info['inputs']:  # Connect node to its incoming nodes
+                    main_node_def.input.append(f'{tb_node_defs[source_name]}:{source_index}')
+                # ----------------------------
+                # Weights NodeDef
+                # ----------------------------
+                if bool(info['weights_attr']):
+                    weights_node_def = NodeDef(attr=get_node_properties(info['weights_attr']))
+                    weights_node_def.name = main_node_def.name + ".weights"
+                    main_node_def.input.append(f'{weights_node_def.name}:{1}')
+                    graph_def.node.extend([weights_node_def])  # Add the node to the graph
+                # ----------------------------
+                # Activation NodeDef
+                # ----------------------------
+                if bool(info['act_attr']):
+                    act_node_def = NodeDef(attr=get_node_properties(info['act_attr'], info['output_dims']))
+                    act_node_def.name = main_node_def.name + ".activation"
+                    tb_node_defs[info['name']] = act_node_def.name
+                    act_node_def.input.append(f'{main_node_def.name}:{0}')
+                    graph_def.node.extend([act_node_def])  # Add the node to the graph
+
+                graph_def.node.extend([main_node_def])  # Add the node to the graph
+                # NodeExecStats contains the memory and compute time a node requires.
+                node_stats.append(NodeExecStats(node_name=info['name'],
+                                                memory=[AllocatorMemoryUsed(total_bytes=info['memory_bytes'])]))
+                types_dict.update({main_node_def.op: op_id + 1})
+
+            er = self.__get_event_writer_by_tag_name(main_tag_name)
+            event = Event(graph_def=graph_def.SerializeToString())
+            er.add_event(event)
 
-            Returns:
-                A NodeExecStats for a node containing its memory and compute time.
+            # Logging nodes memory and computation time statistics
+            stepstats = RunMetadata(step_stats=StepStats(
+                dev_stats=[DeviceStepStats(device=DEVICE_STEP_STATS, node_stats=node_stats)])
+            )
 
-            """
+            trm = TaggedRunMetadata(tag='Resources', run_metadata=stepstats.SerializeToString())
+            event = Event(tagged_run_metadata=trm)
+            er.add_event(event)
+            er.flush()
 
-            return NodeExecStats(node_name=n.name,
-                                 memory=[AllocatorMemoryUsed(
-                                     total_bytes=int(n.get_memory_bytes(self.fw_info))
-                                 )])
-
-        graph_def = GraphDef()  # GraphDef to add to Tensorboard
-
-        node_stats = []
-        types_dict = dict()
-        node_sort = list(topological_sort(graph))
-        for n in node_sort:  # For each node in the graph, we create NodeDefs and connect them to existing NodeDefs
-            # ----------------------------
-            # Main NodeDef: framework attributes
-            # ----------------------------
-            main_node_def = NodeDef(attr=get_node_properties(__get_node_attr(n), __get_node_output_dims(n)))
-            main_node_def.device = n.type.__name__  # For coloring different ops differently
-            main_node_def.op = n.type.__name__
-            op_id = types_dict.get(main_node_def.op, 0)
-            if len(graph.incoming_edges(n)) == 0:  # Input layer
-                n.tb_node_def = 'Input/' + n.name
-            elif len(graph.out_edges(n)) == 0:  # Output layer
-                n.tb_node_def = 'Output/' + n.name
-            else:
-                n.tb_node_def = graph.name + '/' + main_node_def.op + '_' + str(op_id) + '/' + n.name
-            main_node_def.name = n.tb_node_def
-            for e in graph.incoming_edges(n):  # Connect node to its incoming nodes
-                i_tensor = f'{e.source_node.tb_node_def}:{e.source_index}'
-                main_node_def.input.append(i_tensor)
-            # ----------------------------
-            # Weights NodeDef
-            # ----------------------------
-            attr = __get_node_weights_attr(n)
-            if bool(attr):
-                weights_node_def = NodeDef(attr=get_node_properties(attr))
-                weights_node_def.name = main_node_def.name + ".weights"
-                main_node_def.input.append(f'{weights_node_def.name}:{1}')
-                graph_def.node.extend([weights_node_def])  # Add the node to the graph
-            # ----------------------------
-            # Activation NodeDef
-            # ----------------------------
-            attr = __get_node_act_attr(n)
-            if bool(attr):
-                act_node_def = NodeDef(attr=get_node_properties(attr, __get_node_output_dims(n)))
-                n.tb_node_def = main_node_def.name + ".activation"
-                act_node_def.name = n.tb_node_def
-                act_node_def.input.append(f'{main_node_def.name}:{0}')
-                graph_def.node.extend([act_node_def])  # Add the node to the graph
-
-            graph_def.node.extend([main_node_def])  # Add the node to the graph
-            node_stats.append(__create_node_stats(n))
-            types_dict.update({main_node_def.op: op_id + 1})
-
-        er = self.__get_event_writer_by_tag_name(main_tag_name)
-        event = Event(graph_def=graph_def.SerializeToString())
-        er.add_event(event)
-
-        # Logging nodes memory and computation time statistics
-        stepstats = RunMetadata(step_stats=StepStats(
-            dev_stats=[DeviceStepStats(device=DEVICE_STEP_STATS, node_stats=node_stats)])
-        )
-
-        trm = TaggedRunMetadata(tag='Resources', run_metadata=stepstats.SerializeToString())
-        event = Event(tagged_run_metadata=trm)
-        er.add_event(event)
-        er.flush()
+        self._submit(__write_graph)
 
     def __get_event_writer_by_tag_name(self,
                                        main_tag_name: str) -> EventFileWriter:
@@ -377,37 +459,41 @@ class TensorboardWriter(object):
             main_tag_name: Tag to attach to all MinMaxPerChannelCollectors.
 
         """
-        min_events = []
-        max_events = []
+        min_max_per_channel = []
         for n in graph.nodes:
             collector = graph.get_out_stats_collector(n)
             if collector is not None:
                 if hasattr(collector, 'mpcc'):
                     if collector.mpcc.is_legal:
-                        mpcc = deepcopy(collector.mpcc)
-                        min_pc = mpcc.min_per_channel
-                        max_pc = mpcc.max_per_channel
-                        for i in range(len(min_pc)):
-                            min_i = min_pc[i]
-                            max_i = max_pc[i]
-                            # use step for channel index as we log the min/max per channel
-                            min_events.append(Event(step=i, summary=Summary(
-                                value=[Summary.Value(tag=n.name, simple_value=min_i)])))
-                            max_events.append(Event(step=i, summary=Summary(
-                                value=[Summary.Value(tag=n.name, simple_value=max_i)])))
-
-        # Use a new tag to include both main tag and a 'min_per_channel' tag.
-        er = self.__get_event_writer_by_tag_name(main_tag_name + '/min_per_channel')
-
-        for e in min_events:
-            er.add_event(e)
-
-        # Use a new tag to include both main tag and a 'max_per_channel' tag.
-        er = self.__get_event_writer_by_tag_name(main_tag_name + '/max_per_channel')
-        for e in max_events:
-            er.add_event(e)
-
-        er.flush()
+                        min_max_per_channel.append((n.name,
+                                                    np.array(collector.mpcc.min_per_channel),
+                                                    np.array(collector.mpcc.max_per_channel)))
+
+        def __write_min_max():
+            min_events = []
+            max_events = []
+            for name, min_pc, max_pc in min_max_per_channel:
+                for i in range(len(min_pc)):
+                    # use step for channel index as we log the min/max per channel
+                    min_events.append(Event(step=i, summary=Summary(
+                        value=[Summary.Value(tag=name, simple_value=min_pc[i])])))
+                    max_events.append(Event(step=i, summary=Summary(
+                        value=[Summary.Value(tag=name, simple_value=max_pc[i])])))
+
+            # Use a new tag to include both main tag and a 'min_per_channel' tag.
+            er = self.__get_event_writer_by_tag_name(main_tag_name + '/min_per_channel')
+
+            for e in min_events:
+                er.add_event(e)
+
+            # Use a new tag to include both main tag and a 'max_per_channel' tag.
+            er = self.__get_event_writer_by_tag_name(main_tag_name + '/max_per_channel')
+            for e in max_events:
+                er.add_event(e)
+
+            er.flush()
+
+        self._submit(__write_min_max)
 
     def add_mean(self, graph: Graph, main_tag_name: str):
         """
@@ -419,27 +505,31 @@ class TensorboardWriter(object):
             main_tag_name: Tag to attach to all MeanCollectors.
 
         """
-        mean_events = []
+        mean_per_channel = []
         for n in graph.nodes:
             collector = graph.get_out_stats_collector(n)
             if collector is not None:
                 if hasattr(collector, 'mc'):
                     if collector.mc.is_legal:
-                        mc = deepcopy(collector.mc)
-                        mean_pc = mc.state
-                        for i in range(len(mean_pc)):
-                            mean_i = mean_pc[i]
-                            # use step for channel index as we log the mean per channel
-                            mean_events.append(Event(step=i, summary=Summary(
-                                value=[Summary.Value(tag=n.name, simple_value=mean_i)])))
+                        mean_per_channel.append((n.name, np.array(collector.mc.state)))
+
+        def __write_mean():
+            mean_events = []
+            for name, mean_pc in mean_per_channel:
+                for i in range(len(mean_pc)):
+                    # use step for channel index as we log the mean per channel
+                    mean_events.append(Event(step=i, summary=Summary(
+                        value=[Summary.Value(tag=name, simple_value=mean_pc[i])])))
 
-        # Get the event writer for this tag name
-        er = self.__get_event_writer_by_tag_name(main_tag_name + '/mean_per_channel')
+            # Get the event writer for this tag name
+            er = self.__get_event_writer_by_tag_name(main_tag_name + '/mean_per_channel')
 
-        for e in mean_events:
-            er.add_event(e)
+            for e in mean_events:
+                er.add_event(e)
 
-        er.flush()
+            er.flush()
+
+        self._submit(__write_mean)
 
     def add_all_statistics(self, graph: Graph, main_tag_name: str):
         """
@@ -469,20 +559,54 @@ class TensorboardWriter(object):
             main_tag_name: Main tag which the figure is tagged under.
 
         """
+        # The figure is drawn in the calling thread, as matplotlib figures should not be shared between threads
         figure.canvas.draw()
         data = np.frombuffer(figure.canvas.tostring_rgb(), dtype=np.uint8)
         data = data.reshape(figure.canvas.get_width_height()[::-1] + (3,))
 
-        h, w, c = data.shape
-        output = io.BytesIO()
-        Image.fromarray(data).save(output, format='PNG')
+        def __write_figure():
+            h, w, c = data.shape
+            output = io.BytesIO()
+            Image.fromarray(data).save(output, format='PNG')
+
+            img_summary = Summary.Image(height=h, width=w, colorspace=c, encoded_image_string=output.getvalue())
+            output.close()
 
-        img_summary = Summary.Image(height=h, width=w, colorspace=c, encoded_image_string=output.getvalue())
-        output.close()
+            event = Event(summary=Summary(value=[Summary.Value(tag=figure_tag, image=img_summary)]))
 
-        event = Event(summary=Summary(value=[Summary.Value(tag=figure_tag, image=img_summary)]))
+            # Get the event writer for this tag name
+            er = self.__get_event_writer_by_tag_name(main_tag_name)
+            er.add_event(event)
+            er.flush()
 
-        # Get the event writer for this tag name
-        er = self.__get_event_writer_by_tag_name(main_tag_name)
-        er.add_event(event)
-        er.flush()
+        self._submit(__write_figure)
+
+    def add_stage_profile(self,
+                          stage_profile: Any,
+                          step: int,
+                          main_tag_name: str = 'pipeline_profile'):
+        """
+        Add the measurements of a profiled stage of the pipeline to display on Tensorboard.
+        The stage measurements are tagged by the stage name, and the step is the index of the stage in the pipeline.
+
+        Args:
+            stage_profile: StageProfile of the stage.
+            step: Index of the stage in the pipeline.
+            main_tag_name: Main tag which the measurements are tagged under.
+
+        """
+        values = [Summary.Value(tag=f'{stage_profile.name}/wall_time', simple_value=stage_profile.wall_time),
+                  Summary.Value(tag=f'{stage_profile.name}/cpu_time', simple_value=stage_profile.cpu_time),
+                  Summary.Value(tag=f'{stage_profile.name}/peak_rss_mb', simple_value=stage_profile.peak_rss_mb)]
+        if stage_profile.num_nodes is not None:
+            values.append(Summary.Value(tag=f'{stage_profile.name}/num_nodes', simple_value=stage_profile.num_nodes))
+        for node_name, node_time in stage_profile.nodes_time.items():
+            values.append(Summary.Value(tag=f'{stage_profile.name}/nodes_time/{node_name}', simple_value=node_time))
+
+        def __write_stage_profile():
+            # Get the event writer for this tag name
+            er = self.__get_event_writer_by_tag_name(main_tag_name)
+            er.add_event(Event(step=step, summary=Summary(value=values)))
+            er.flush()
+
+        self._submit(__write_stage_profile)
@@ -0,0 +1,41 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Callable, List
+
+import tensorflow as tf
+from keras.models import Model
+
+
+def get_compiled_inference_fn(model: Model, jit_compile: bool = False) -> Callable:
+    """
+    Get a compiled (tf.function) inference function of a Keras model, so the model's layers
+    (including their quantizers) run as a single graph instead of op-by-op.
+    The inputs shapes are relaxed after the first retrace, so batches of different sizes do not keep
+    triggering retracing. The mixed-precision quantizers select their active candidates using variables,
+    so configuring a mixed-precision model to a different bit-width does not require retracing as well.
+
+    Args:
+        model: Keras model to compile.
+        jit_compile: Whether to compile the inference function using XLA.
+
+    Returns:
+        A callable that gets the model's inputs (Numpy arrays or tensors) and returns the model's outputs.
+    """
+
+    @tf.function(experimental_relax_shapes=True, jit_compile=jit_compile)
+    def _compiled_inference(inputs: List[tf.Tensor]) -> Any:
+        return model(inputs)
+
+    return _compiled_inference
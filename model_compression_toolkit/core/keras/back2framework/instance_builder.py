@@ -17,7 +17,6 @@
 import copy
 from typing import List, Dict
 
-from networkx.algorithms.dag import topological_sort
 
 import tensorflow as tf
 from tensorflow.keras.layers import Layer
@@ -33,7 +32,7 @@ class OperationHandler:
 
     def __init__(self, graph: Graph):
         # hold nodes after sorting them
-        self.node_sort = list(topological_sort(graph))
+        self.node_sort = graph.get_topo_sorted_nodes()
 
         self.layer_to_node_dict = {}
 
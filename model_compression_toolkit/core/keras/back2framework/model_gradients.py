@@ -162,6 +162,71 @@ def keras_iterative_approx_jacobian_trace(graph_float: common.Graph,
             return mean_per_point
 
 
+def keras_batched_approx_jacobian_trace(graph_float: common.Graph,
+                                        model_input_tensors: Dict[BaseNode, np.ndarray],
+                                        interest_points: List[BaseNode],
+                                        output_list: List[BaseNode],
+                                        all_outputs_indices: List[int],
+                                        alpha: float = 0.3,
+                                        n_iter: int = 50,
+                                        norm_weights: bool = True) -> np.ndarray:
+    """
+    Computes the same approximation as keras_iterative_approx_jacobian_trace for each sample of a batch, using
+    a single forward pass over the batch. Since the samples of the batch are independent, the gradient of
+    a random projection of the batch's outputs holds the projected Jacobian of each sample, so each
+    approximation iteration takes a single backward pass for the whole batch and all the interest points
+    (instead of a backward pass per sample and interest point).
+
+    Args:
+        graph_float: Graph to build its corresponding Keras model.
+        model_input_tensors: A mapping between model input nodes to an input batch.
+        interest_points: List of nodes which we want to get their feature map as output, to calculate distance metric.
+        output_list: List of nodes that considered as model's output for the purpose of gradients computation.
+        all_outputs_indices: Indices of the model outputs and outputs replacements (if exists),
+            in a topological sorted interest points list.
+        alpha: A tuning parameter to allow calibration between the contribution of the output feature maps returned
+            weights and the other feature maps weights (since the gradient of the output layers does not provide a
+            compatible weight for the distance metric computation).
+        n_iter: The number of random iterations to calculate the approximated power of the Jacobian trace for each interest point.
+        norm_weights: Whether to normalize the returned weights (to get values between 0 and 1).
+
+    Returns: An array of (possibly normalized) jacobian-based weights of each sample, with shape
+    (batch size, number of interest points).
+    """
+
+    with tf.GradientTape(persistent=True, watch_accessed_variables=False) as g:
+        outputs, interest_points_tensors = _model_outputs_computation(graph_float,
+                                                                      model_input_tensors,
+                                                                      interest_points,
+                                                                      output_list,
+                                                                      gradient_tape=g)
+        outputs_jacobians_approx = []
+        for output in outputs:  # Per model's output tensor
+            output = tf.reshape(output, shape=[output.shape[0], -1])
+
+            trace_jv = []
+            for j in range(n_iter):  # Approximation iterations
+                # Getting a random vector with normal distribution
+                v = tf.random.normal(shape=output.shape)
+                f_v = tf.reduce_sum(v * output)
+
+                with g.stop_recording():
+                    # Computing the jacobian approximation of all interest points by getting the gradient of (output * v)
+                    jac_vs = g.gradient(f_v, interest_points_tensors,
+                                        unconnected_gradients=tf.UnconnectedGradients.ZERO)
+                    trace_jv.append(tf.stack([tf.reduce_sum(tf.pow(tf.reshape(jac_v, [jac_v.shape[0], -1]), 2.0),
+                                                            axis=1) for jac_v in jac_vs]))
+            # Get averaged squared jacobian trace approximation of each interest point and sample
+            outputs_jacobians_approx.append(2 * tf.reduce_mean(trace_jv, axis=0) / output.shape[-1])
+
+        mean_per_sample = tf.transpose(tf.reduce_mean(outputs_jacobians_approx, axis=0))  # Get mean of jacobian approx of all model outputs
+        if norm_weights:
+            return np.asarray([_normalize_weights(mean_per_point, all_outputs_indices, alpha)
+                               for mean_per_point in mean_per_sample])
+        else:
+            return mean_per_sample.numpy()
+
+
 def _model_outputs_computation(graph_float: common.Graph,
                                model_input_tensors: Dict[BaseNode, np.ndarray],
                                interest_points:  List[BaseNode],
@@ -84,6 +84,19 @@ class MHAParams:
         self.stack_shape = self.att_output_shape[:1] + (self.iter_axes_prod,) + self.att_output_shape[1:]
         self.concat_shape = self.stack_shape[:-1] + (self.value_dim*self.num_heads,)
         self.output_shape = self.concat_shape[:-1] + (self.d_model,)
+        # shapes of the attention computation with the heads dimension batched: [B, Iters, Heads, Sequence, Channels]
+        self.q_heads_shape = self.query_proj_shape[:-1] + (self.num_heads, self.query_key_dim)
+        self.k_heads_shape = self.key_proj_shape[:-1] + (self.num_heads, self.query_key_dim)
+        self.v_heads_shape = self.value_proj_shape[:-1] + (self.num_heads, self.value_dim)
+        self.q_heads_perm_shape = self.q_heads_shape[:2] + (self.num_heads,) + self.q_heads_shape[2:3] + \
+                                  (self.query_key_dim,)
+        self.k_heads_perm_shape = self.k_heads_shape[:2] + (self.num_heads, self.query_key_dim) + \
+                                  self.k_heads_shape[2:3]
+        self.v_heads_perm_shape = self.v_heads_shape[:2] + (self.num_heads,) + self.v_heads_shape[2:3] + \
+                                  (self.value_dim,)
+        self.heads_att_matrix_shape = self.q_heads_perm_shape[:-1] + self.k_heads_perm_shape[-1:]
+        self.heads_att_output_shape = self.heads_att_matrix_shape[:-1] + (self.value_dim,)
+        self.heads_att_output_perm_shape = self.concat_shape[:-1] + (self.num_heads, self.value_dim)
         # self.stacked_output_shape = (self.output_shape[0], self.iter_axes_prod) + self.output_shape[1:]
         self.reuse_params = {REUSE: mha_node.reuse, REUSE_GROUP: mha_node.reuse_group}
 
@@ -95,11 +108,16 @@ class MultiHeadAttentionDecomposition(common.BaseSubstitution):
     tf.matmul, Softmax and Concatenate layers
     """
 
-    def __init__(self):
+    def __init__(self, batched_heads: bool = False):
         """
         Matches MultiHeadAttention node.
+
+        Args:
+            batched_heads: Whether to compute the attention of all heads together (with the heads dimension batched),
+                instead of computing the attention of each head (and iteration) separately.
         """
         super().__init__(matcher_instance=NodeOperationMatcher(MultiHeadAttention))
+        self.batched_heads = batched_heads
 
     @staticmethod
     def _get_weight_by_name(mha_node, w_str):
@@ -254,6 +272,129 @@ class MultiHeadAttentionDecomposition(common.BaseSubstitution):
         graph.add_node_with_in_edges(v_node, [v_reshape_node])
         return q_node, k_node, v_node
 
+    def _project_batched_inputs(self, graph, mha_node, q_reshape_node, k_reshape_node, v_reshape_node, params):
+        """
+        Create projection nodes (as Conv2D 1x1) of all heads together
+
+        Args:
+            graph: input graph
+            mha_node: MHA node name
+            q_reshape_node: query input after standardization
+            k_reshape_node: key input after standardization
+            v_reshape_node: value input after standardization
+            params: MHA params object
+
+         Returns:
+            Projection nodes
+
+        """
+        # add norm factor to query kernel and bias
+        factor = (params.query_key_dim ** -0.5)
+        qk = mha_node.weights[self._get_weight_by_name(mha_node, Q_KERNEL)].copy() * factor
+        kk = mha_node.weights[self._get_weight_by_name(mha_node, K_KERNEL)].copy()
+        vk = mha_node.weights[self._get_weight_by_name(mha_node, V_KERNEL)].copy()
+        qb = mha_node.weights[self._get_weight_by_name(mha_node, Q_BIAS)].copy().flatten() * factor
+        kb = mha_node.weights[self._get_weight_by_name(mha_node, K_BIAS)].copy().flatten()
+        vb = mha_node.weights[self._get_weight_by_name(mha_node, V_BIAS)].copy().flatten()
+        # [Channels, Heads, Dim] --> [1, 1, Channels, Heads * Dim]
+        qk = qk.reshape((1, 1, qk.shape[0], -1))
+        kk = kk.reshape((1, 1, kk.shape[0], -1))
+        vk = vk.reshape((1, 1, vk.shape[0], -1))
+
+        # project query, key & value inputs to query_key_dim, query_key_dim & value_dim of each head respectively
+        query_name = f'{mha_node.name}_query'
+        q_node = BaseNode(query_name, {FILTERS: params.num_heads * params.query_key_dim, KERNEL_SIZE: 1,
+                                       USE_BIAS: params.use_bias, ACTIVATION: LINEAR},
+                          params.q_reshape_shape, params.q_heads_shape[:-2] + (qk.shape[-1],),
+                          {KERNEL: qk, BIAS: qb}, Conv2D, **params.reuse_params)
+        graph.add_node_with_in_edges(q_node, [q_reshape_node])
+        key_name = f'{mha_node.name}_key'
+        k_node = BaseNode(key_name, {FILTERS: params.num_heads * params.query_key_dim, KERNEL_SIZE: 1,
+                                     USE_BIAS: params.use_bias, ACTIVATION: LINEAR},
+                          params.k_reshape_shape, params.k_heads_shape[:-2] + (kk.shape[-1],),
+                          {KERNEL: kk, BIAS: kb}, Conv2D, **params.reuse_params)
+        graph.add_node_with_in_edges(k_node, [k_reshape_node])
+        value_name = f'{mha_node.name}_value'
+        v_node = BaseNode(value_name, {FILTERS: params.num_heads * params.value_dim, KERNEL_SIZE: 1,
+                                       USE_BIAS: params.use_bias, ACTIVATION: LINEAR},
+                          params.v_reshape_shape, params.v_heads_shape[:-2] + (vk.shape[-1],),
+                          {KERNEL: vk, BIAS: vb}, Conv2D, **params.reuse_params)
+        graph.add_node_with_in_edges(v_node, [v_reshape_node])
+        return q_node, k_node, v_node
+
+    @staticmethod
+    def _calc_batched_attention(graph, q_node, k_node, v_node, mha_node, params):
+        """
+        Generate the attention subgraph of all heads together (the heads dimension is batched):
+        matmul(softmax(matmul(projected_Q, projected_K)), projected_V)
+         [B, Iters, Sequence, Heads * Channels] --> [B, Iters, Heads, Sequence, Channels] -->
+         [B, Iters, Sequence, Heads * Channels]
+
+        Args:
+            graph: input graph
+            q_node: query input after projection
+            k_node: key input after projection
+            v_node: value input after projection
+            mha_node: MHA node
+            params: MHA params object
+
+        Returns:
+            output of attention, with the heads concatenated
+
+        """
+        name = mha_node.name
+        # split heads: [B, Iters, Sequence, Heads * Channels] --> [B, Iters, Heads, Sequence, Channels]
+        # (key is transposed to [B, Iters, Heads, Channels, Sequence] for the attention matrix multiplication)
+        q_heads_reshape_node = BaseNode(f'{name}_q_heads_reshape', {TARGET_SHAPE: params.q_heads_shape[1:]},
+                                        q_node.output_shape, params.q_heads_shape, {}, Reshape, **params.reuse_params)
+        graph.add_node_with_in_edges(q_heads_reshape_node, [q_node])
+        q_heads_node = BaseNode(f'{name}_q_heads_permute', {DIMS: [1, 3, 2, 4]},
+                                params.q_heads_shape, params.q_heads_perm_shape, {}, Permute, **params.reuse_params)
+        graph.add_node_with_in_edges(q_heads_node, [q_heads_reshape_node])
+        k_heads_reshape_node = BaseNode(f'{name}_k_heads_reshape', {TARGET_SHAPE: params.k_heads_shape[1:]},
+                                        k_node.output_shape, params.k_heads_shape, {}, Reshape, **params.reuse_params)
+        graph.add_node_with_in_edges(k_heads_reshape_node, [k_node])
+        k_heads_node = BaseNode(f'{name}_k_heads_permute', {DIMS: [1, 3, 4, 2]},
+                                params.k_heads_shape, params.k_heads_perm_shape, {}, Permute, **params.reuse_params)
+        graph.add_node_with_in_edges(k_heads_node, [k_heads_reshape_node])
+        v_heads_reshape_node = BaseNode(f'{name}_v_heads_reshape', {TARGET_SHAPE: params.v_heads_shape[1:]},
+                                        v_node.output_shape, params.v_heads_shape, {}, Reshape, **params.reuse_params)
+        graph.add_node_with_in_edges(v_heads_reshape_node, [v_node])
+        v_heads_node = BaseNode(f'{name}_v_heads_permute', {DIMS: [1, 3, 2, 4]},
+                                params.v_heads_shape, params.v_heads_perm_shape, {}, Permute, **params.reuse_params)
+        graph.add_node_with_in_edges(v_heads_node, [v_heads_reshape_node])
+
+        # calculate attention matrix:
+        matmul_node = FunctionalNode(f'{name}_qk_matmul', {FUNCTION: F_MATMUL},
+                                     (params.q_heads_perm_shape, params.k_heads_perm_shape),
+                                     params.heads_att_matrix_shape, {}, TFOpLambda, op_call_args=[],
+                                     op_call_kwargs={}, functional_op=tf.matmul, **params.reuse_params)
+        graph.add_node_with_in_edges(matmul_node, [q_heads_node, k_heads_node])
+
+        # apply softmax on attention matrix
+        softmax_node = BaseNode(f'{name}_softmax', {},
+                                params.heads_att_matrix_shape, params.heads_att_matrix_shape,
+                                {}, Softmax, **params.reuse_params)
+        graph.add_node_with_in_edges(softmax_node, [matmul_node])
+
+        # multiply attention matrix with projected values
+        matmulv_node = FunctionalNode(f'{name}_v_matmul', {FUNCTION: F_MATMUL},
+                                      (params.heads_att_matrix_shape, params.v_heads_perm_shape),
+                                      params.heads_att_output_shape, {}, TFOpLambda, op_call_args=[],
+                                      op_call_kwargs={}, functional_op=tf.matmul, **params.reuse_params)
+        graph.add_node_with_in_edges(matmulv_node, [softmax_node, v_heads_node])
+
+        # concatenate heads: [B, Iters, Heads, Sequence, Channels] --> [B, Iters, Sequence, Heads * Channels]
+        output_permute_node = BaseNode(f'{name}_heads_output_permute', {DIMS: [1, 3, 2, 4]},
+                                       params.heads_att_output_shape, params.heads_att_output_perm_shape, {},
+                                       Permute, **params.reuse_params)
+        graph.add_node_with_in_edges(output_permute_node, [matmulv_node])
+        output_reshape_node = BaseNode(f'{name}_heads_output_reshape', {TARGET_SHAPE: params.concat_shape[1:]},
+                                       params.heads_att_output_perm_shape, params.concat_shape, {},
+                                       Reshape, **params.reuse_params)
+        graph.add_node_with_in_edges(output_reshape_node, [output_permute_node])
+        return output_reshape_node
+
     @staticmethod
     def _calc_attention_head(graph, q_slice_node, k_slice_node, v_slice_node, mha_node,
                              iter_index, head_index, params):
@@ -458,26 +599,32 @@ class MultiHeadAttentionDecomposition(common.BaseSubstitution):
         q_reshape_node, k_reshape_node, v_reshape_node = \
             self._standarize_input_shapes(graph, mha_node.name, len(mha_in_edges), params)
 
-        head_outputs = []
-        for head_index in range(params.num_heads):
-            q_node, k_node, v_node = self._project_inputs(graph, mha_node, head_index,
-                                                          q_reshape_node, k_reshape_node, v_reshape_node, params)
+        if self.batched_heads:
+            q_node, k_node, v_node = self._project_batched_inputs(graph, mha_node, q_reshape_node, k_reshape_node,
+                                                                  v_reshape_node, params)
+            concat_node = self._calc_batched_attention(graph, q_node, k_node, v_node, mha_node, params)
+        else:
+            head_outputs = []
+            for head_index in range(params.num_heads):
+                q_node, k_node, v_node = self._project_inputs(graph, mha_node, head_index,
+                                                              q_reshape_node, k_reshape_node, v_reshape_node, params)
 
-            att_outputs = []
-            for i_iter in range(params.iter_axes_prod):
-                q_slice_node, k_slice_node, v_slice_node = self._slice_per_iteration(graph, mha_node.name, head_index, i_iter,
-                                                                                     q_node, k_node, v_node,
-                                                                                     params)
+                att_outputs = []
+                for i_iter in range(params.iter_axes_prod):
+                    q_slice_node, k_slice_node, v_slice_node = self._slice_per_iteration(graph, mha_node.name,
+                                                                                         head_index, i_iter,
+                                                                                         q_node, k_node, v_node,
+                                                                                         params)
 
-                matmulv_node = self._calc_attention_head(graph, q_slice_node, k_slice_node, v_slice_node, mha_node,
-                                                         i_iter, head_index, params)
+                    matmulv_node = self._calc_attention_head(graph, q_slice_node, k_slice_node, v_slice_node,
+                                                             mha_node, i_iter, head_index, params)
 
-                att_outputs.append(matmulv_node)
+                    att_outputs.append(matmulv_node)
 
-            output_stacked = self._stack_iters(graph, mha_node.name, att_outputs, head_index, params)
-            head_outputs.append(output_stacked)
+                output_stacked = self._stack_iters(graph, mha_node.name, att_outputs, head_index, params)
+                head_outputs.append(output_stacked)
 
-        concat_node = self._concat_heads(graph, mha_node.name, head_outputs, params)
+            concat_node = self._concat_heads(graph, mha_node.name, head_outputs, params)
 
         output = self._project_output(graph, mha_node, concat_node, params)
 
@@ -43,7 +43,8 @@ if importlib.util.find_spec("tensorflow") is not None\
                        representative_data_gen: Callable,
                        quant_config: MixedPrecisionQuantizationConfig = DEFAULT_MIXEDPRECISION_CONFIG,
                        fw_info: FrameworkInfo = DEFAULT_KERAS_INFO,
-                       target_platform_capabilities: TargetPlatformCapabilities = KERAS_DEFAULT_TPC) -> KPI:
+                       target_platform_capabilities: TargetPlatformCapabilities = KERAS_DEFAULT_TPC,
+                       compute_activation_max_cut: bool = False) -> KPI:
         """
         Computes KPI data that can be used to calculate the desired target KPI for mixed-precision quantization.
         Builds the computation graph from the given model and target platform modeling, and uses it to compute the KPI data.
@@ -54,6 +55,7 @@ if importlib.util.find_spec("tensorflow") is not None\
             quant_config (MixedPrecisionQuantizationConfig): MixedPrecisionQuantizationConfig containing parameters of how the model should be quantized.
             fw_info (FrameworkInfo): Information needed for quantization about the specific framework (e.g., kernel channels indices, groups of layers by how they should be quantized, etc.). `Default Keras info <https://github.com/sony/model_optimization/blob/main/model_compression_toolkit/core/keras/default_framework_info.py>`_
             target_platform_capabilities (TargetPlatformCapabilities): TargetPlatformCapabilities to optimize the Keras model according to. `Default Keras TPC <https://github.com/sony/model_optimization/blob/main/model_compression_toolkit/core/tpc_models/keras_tp_models/keras_default.py>`_
+            compute_activation_max_cut (bool): Whether to compute the activation max-cut KPI (the maximal activation memory of a memory-optimal schedule), which requires a schedule search over the graph. If False, activation_max_cut_memory is set to infinity.
 
         Returns:
             A KPI object with total weights parameters sum, max activation tensor and total kpi.
@@ -93,14 +95,16 @@ if importlib.util.find_spec("tensorflow") is not None\
                                 core_config,
                                 target_platform_capabilities,
                                 fw_info,
-                                fw_impl)
+                                fw_impl,
+                                compute_activation_max_cut=compute_activation_max_cut)
 
 
     def keras_kpi_data_experimental(in_model: Model,
                                     representative_data_gen: Callable,
                                     core_config: CoreConfig,
                                     fw_info: FrameworkInfo = DEFAULT_KERAS_INFO,
-                                    target_platform_capabilities: TargetPlatformCapabilities = KERAS_DEFAULT_TPC) -> KPI:
+                                    target_platform_capabilities: TargetPlatformCapabilities = KERAS_DEFAULT_TPC,
+                                    compute_activation_max_cut: bool = False) -> KPI:
         """
         Computes KPI data that can be used to calculate the desired target KPI for mixed-precision quantization.
         Builds the computation graph from the given model and hw modeling, and uses it to compute the KPI data.
@@ -111,6 +115,7 @@ if importlib.util.find_spec("tensorflow") is not None\
             core_config (CoreConfig): CoreConfig containing parameters for quantization and mixed precision of how the model should be quantized.
             fw_info (FrameworkInfo): Information needed for quantization about the specific framework (e.g., kernel channels indices, groups of layers by how they should be quantized, etc.). `Default Keras info <https://github.com/sony/model_optimization/blob/main/model_compression_toolkit/core/keras/default_framework_info.py>`_
             target_platform_capabilities (TargetPlatformCapabilities): TargetPlatformCapabilities to optimize the Keras model according to. `Default Keras TPC <https://github.com/sony/model_optimization/blob/main/model_compression_toolkit/core/tpc_models/keras_tp_models/keras_default.py>`_
+            compute_activation_max_cut (bool): Whether to compute the activation max-cut KPI (the maximal activation memory of a memory-optimal schedule), which requires a schedule search over the graph. If False, activation_max_cut_memory is set to infinity.
 
         Returns:
 
@@ -146,7 +151,8 @@ if importlib.util.find_spec("tensorflow") is not None\
                                 core_config,
                                 target_platform_capabilities,
                                 fw_info,
-                                fw_impl)
+                                fw_impl,
+                                compute_activation_max_cut=compute_activation_max_cut)
 
 else:
     # If tensorflow or tensorflow_model_optimization are not installed,
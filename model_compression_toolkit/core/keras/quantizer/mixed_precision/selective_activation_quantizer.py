@@ -50,6 +50,11 @@ class SelectiveActivationQuantizer(Quantizer):
         """
         self.node_q_cfg = node_q_cfg
         self.active_quantization_config_index = max_candidate_idx  # initialize with first config as default
+        # The active index is also held in a variable, so a compiled model (tf.function) that uses the quantizer
+        # selects the active quantizer at runtime, and does not need to be retraced when the index changes.
+        self.active_quantization_config_index_var = tf.Variable(max_candidate_idx,
+                                                                trainable=False,
+                                                                dtype=tf.int32)
         self.activation_quantizers = []
         self._store_activation_quantizers()
 
@@ -104,7 +109,10 @@ class SelectiveActivationQuantizer(Quantizer):
             specific quantization configuration candidate (the candidate's index is the
             index that is in active_quantization_config_index the quantizer holds).
         """
-        return self.activation_quantizers[self.active_quantization_config_index](inputs)
+        if len(self.activation_quantizers) == 1:
+            return self.activation_quantizers[0](inputs)
+        return tf.switch_case(self.active_quantization_config_index_var.read_value(),
+                              [lambda q=q: q(inputs) for q in self.activation_quantizers])
 
     def set_active_quantization_config_index(self, index: int):
         """
@@ -120,6 +128,7 @@ class SelectiveActivationQuantizer(Quantizer):
                                       f'possible nbits. Can not set ' \
                                       f'index {index}'
         self.active_quantization_config_index = index
+        self.active_quantization_config_index_var.assign(index)
 
     def get_active_quantization_config_index(self) -> int:
         """
@@ -20,6 +20,7 @@ from tensorflow_model_optimization.python.core.quantization.keras.quantize_wrapp
 from tensorflow_model_optimization.python.core.quantization.keras.quantizers import Quantizer
 from typing import Dict, Any, List
 
+from model_compression_toolkit.core.common.mixed_precision.packed_quantized_weights import PackedQuantizedWeights
 from model_compression_toolkit.core.common.quantization.candidate_node_quantization_config import \
     CandidateNodeQuantizationConfig
 
@@ -34,6 +35,8 @@ class SelectiveWeightsQuantizer(Quantizer):
     to the SelectiveWeightsQuantizer when it was initialized.
     The "active" index can be configured as part of the SelectiveWeightsQuantizer's API, so a different quantized
     weight can be returned in another time.
+    The quantized weights are stored packed (and without duplicates), and the active quantized weight is
+    dequantized into a single variable when the "active" index changes.
     """
 
     def __init__(self,
@@ -53,40 +56,11 @@ class SelectiveWeightsQuantizer(Quantizer):
         self.node_q_cfg = node_q_cfg
         self.quantizer_fn_list = [qc.weights_quantization_cfg.weights_quantization_fn for qc in self.node_q_cfg]
         self.float_weight = float_weight
-        self.quantized_weights = []
+        self.quantized_weights = PackedQuantizedWeights(self.node_q_cfg, self.float_weight)
         self.active_quantization_config_index = max_candidate_idx
-        self._store_quantized_weights()
-
-    def _quantize_by_qc(self, index: int) -> np.ndarray:
-        """
-        Quantize the quantizer float weight using a candidate quantization configuration.
-
-        Args:
-            index: Index of the candidate to use for the quantization.
-
-        Returns:
-            Quantized weight.
-        """
-        qc = self.node_q_cfg[index].weights_quantization_cfg
-        return self.quantizer_fn_list[index](self.float_weight,
-                                             qc.weights_n_bits,
-                                             True,
-                                             qc.weights_quantization_params,
-                                             qc.weights_per_channel_threshold,
-                                             qc.weights_channels_axis)
-
-    def _store_quantized_weights(self):
-        """
-
-        Go over all candidates configurations, quantize the quantizer float weight according to each one
-        of them, and store the quantized weights in a list quantized_weights the quantizer holds.
-
-        """
-        for i in range(len(self.node_q_cfg)):
-            q_weight = self._quantize_by_qc(i)
-            self.quantized_weights.append(tf.Variable(q_weight,
-                                                      trainable=False,
-                                                      dtype=tf.float32))
+        self.active_quantized_weight = tf.Variable(self.quantized_weights.get_quantized_weight(max_candidate_idx),
+                                                   trainable=False,
+                                                   dtype=tf.float32)
 
     def build(self,
               tensor_shape: TensorShape,
@@ -118,7 +92,7 @@ class SelectiveWeightsQuantizer(Quantizer):
             index that is in active_quantization_config_index the quantizer holds).
         """
 
-        return self.quantized_weights[self.active_quantization_config_index]
+        return self.active_quantized_weight
 
     def set_active_quantization_config_index(self, index: int):
         """
@@ -134,6 +108,10 @@ class SelectiveWeightsQuantizer(Quantizer):
             self.node_q_cfg), f'Quantizer has {len(self.node_q_cfg)} ' \
                                       f'possible nbits. Can not set ' \
                                       f'index {index}'
+        # candidates that share the same quantized weight don't require a change of the active weight
+        if self.quantized_weights.get_weight_index(index) != \
+                self.quantized_weights.get_weight_index(self.active_quantization_config_index):
+            self.active_quantized_weight.assign(self.quantized_weights.get_quantized_weight(index))
         self.active_quantization_config_index = index
 
     def get_active_quantization_config_index(self) -> int:
@@ -151,7 +129,7 @@ class SelectiveWeightsQuantizer(Quantizer):
         Returns: The current active quantized weight the quantizer holds.
 
         """
-        return self.quantized_weights[self.active_quantization_config_index]
+        return self.active_quantized_weight
 
     def get_config(self) -> Dict[str, Any]:
         """
@@ -50,7 +50,7 @@ class MixedPrecisionPyTorchModel(PytorchModel):
 
 
     def _add_modules(self):
-        configurable_nodes = self.graph.get_configurable_sorted_nodes()
+        configurable_nodes = set(self.graph.get_configurable_sorted_nodes())
         for n in self.node_sort:
             if n in configurable_nodes:
                 self.add_module(n.name, PytorchMixedPrecisionWrapper(n, self.fw_info))
@@ -14,9 +14,9 @@
 # ==============================================================================
 from typing import Any, Dict, List
 
+import numpy as np
 import torch
 import torch.autograd as autograd
-from networkx import topological_sort
 
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common import BaseNode, Graph
@@ -120,7 +120,7 @@ class PytorchModelGradients(torch.nn.Module):
 
         super(PytorchModelGradients, self).__init__()
         self.graph_float = graph_float
-        self.node_sort = list(topological_sort(graph_float))
+        self.node_sort = graph_float.get_topo_sorted_nodes()
         self.interest_points = interest_points
         self.output_list = output_list
         self.interest_points_tensors = []
@@ -270,6 +270,86 @@ def pytorch_iterative_approx_jacobian_trace(graph_float: common.Graph,
         return mean_per_point
 
 
+def pytorch_batched_approx_jacobian_trace(graph_float: common.Graph,
+                                          model_input_tensors: Dict[BaseNode, torch.Tensor],
+                                          interest_points: List[BaseNode],
+                                          output_list: List[BaseNode],
+                                          all_outputs_indices: List[int],
+                                          alpha: float = 0.3,
+                                          n_iter: int = 50,
+                                          norm_weights: bool = True) -> np.ndarray:
+    """
+    Computes the same approximation as pytorch_iterative_approx_jacobian_trace for each sample of a batch, using
+    a single forward pass over the batch. Since the samples of the batch are independent (the model runs in
+    evaluation mode), the gradient of a random projection of the batch's outputs holds the projected Jacobian
+    of each sample, so each approximation iteration takes a single backward pass for the whole batch and all
+    the interest points (instead of a backward pass per sample and interest point).
+
+    Args:
+        graph_float: Graph to build its corresponding Pytorch model.
+        model_input_tensors: A mapping between model input nodes to an input batch torch Tensor.
+        interest_points: List of nodes which we want to get their feature map as output, to calculate distance metric.
+        output_list: List of nodes that considered as model's output for the purpose of gradients computation.
+        all_outputs_indices: Indices of the model outputs and outputs replacements (if exists),
+            in a topological sorted interest points list.
+        alpha: A tuning parameter to allow calibration between the contribution of the output feature maps returned
+            weights and the other feature maps weights (since the gradient of the output layers does not provide a
+            compatible weight for the distance metric computation).
+        n_iter: The number of random iterations to calculate the approximated power of the Jacobian trace for each interest point.
+        norm_weights: Whether to normalize the returned weights (to get values between 0 and 1).
+
+    Returns: An array of (possibly normalized) jacobian-based weights of each sample, with shape
+    (batch size, number of interest points).
+    """
+
+    # Set inputs to require_grad
+    for n, input_tensor in model_input_tensors.items():
+        input_tensor.requires_grad_()
+
+    model_grads_net = PytorchModelGradients(graph_float=graph_float,
+                                            interest_points=interest_points,
+                                            output_list=output_list)
+    model_grads_net.eval()
+
+    # Run model inference
+    output_tensors = model_grads_net(model_input_tensors)
+    device = output_tensors[0].device
+    batch_size = output_tensors[0].shape[0]
+    ipts = model_grads_net.interest_points_tensors
+
+    outputs_jacobians_approx = []
+    for output in output_tensors:  # Per model's output tensor
+        output = torch.reshape(output, shape=[output.shape[0], -1])
+
+        trace_jv = []
+        for j in range(n_iter):  # Approximation iterations
+            # Getting a random vector with normal distribution
+            v = torch.randn(output.shape, device=device)
+            f_v = torch.sum(v * output)
+
+            # Computing the jacobian approximation of all interest points by getting the gradient of (output * v)
+            jac_vs = autograd.grad(outputs=f_v,
+                                   inputs=ipts,
+                                   retain_graph=True,
+                                   allow_unused=True)
+            # In case we have an output node, which is an interest point, but it is not differentiable,
+            # we still want to set some weight for it, so its jacobian trace is set to zero.
+            trace_jv.append(torch.stack([torch.zeros(batch_size, device=device) if jac_v is None else
+                                         torch.sum(torch.pow(torch.reshape(jac_v, [jac_v.shape[0], -1]), 2.0), dim=1)
+                                         for jac_v in jac_vs]))
+        # Get averaged jacobian trace approximation of each interest point and sample
+        outputs_jacobians_approx.append(torch.sqrt(torch.mean(torch.stack(trace_jv), dim=0)))
+
+    # Get mean of jacobians of all model's outputs
+    mean_per_sample = torch_tensor_to_numpy(torch.transpose(torch.mean(torch.stack(outputs_jacobians_approx), dim=0),
+                                                            0, 1))
+    if norm_weights:
+        return np.asarray([_normalize_weights(torch.Tensor(mean_per_point), all_outputs_indices, alpha)
+                           for mean_per_point in mean_per_sample])
+    else:
+        return mean_per_sample
+
+
 def _normalize_weights(jacobians_traces: torch.Tensor,
                        all_outputs_indices: List[int],
                        alpha: float) -> List[float]:
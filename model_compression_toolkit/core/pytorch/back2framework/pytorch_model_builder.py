@@ -16,7 +16,6 @@ from abc import abstractmethod
 from typing import Tuple, Any, Dict, List, Union
 
 import torch
-from networkx import topological_sort
 
 from model_compression_toolkit import FrameworkInfo
 from model_compression_toolkit.core import common
@@ -24,6 +23,7 @@ from model_compression_toolkit.core.common import BaseNode, Graph
 from model_compression_toolkit.core.common.back2framework.base_model_builder import BaseModelBuilder
 from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX
 from model_compression_toolkit.core.common.graph.functional_node import FunctionalNode
+from model_compression_toolkit.core.common.graph.memory_graph.memory_schedule import get_nodes_to_release
 from model_compression_toolkit.core.common.user_info import UserInformation
 from model_compression_toolkit.core.pytorch.back2framework.instance_builder import node_builder
 from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
@@ -142,7 +142,8 @@ class PytorchModel(torch.nn.Module):
                  graph: Graph,
                  append2output: List[Any] = None,
                  fw_info: FrameworkInfo = DEFAULT_PYTORCH_INFO,
-                 return_float_outputs: bool = False):
+                 return_float_outputs: bool = False,
+                 schedule: List[BaseNode] = None):
         """
         Construct a Pytorch model.
 
@@ -151,10 +152,17 @@ class PytorchModel(torch.nn.Module):
             append2output: List of nodes or OutTensor objects.
             fw_info: Framework information (e.g., mapping from layers to their attributes to quantize).
             return_float_outputs: Whether the model returns float tensors or not.
+            schedule: Execution order of the graph's nodes (optional). If given, the nodes are executed by this
+                order, and each node's output tensors are released once all the nodes that use them were executed.
         """
         super(PytorchModel, self).__init__()
         self.graph = graph
-        self.node_sort = list(topological_sort(graph))
+        self.node_sort = graph.get_topo_sorted_nodes() if schedule is None else schedule
+        self.nodes_to_release = {}
+        if schedule is not None:
+            nodes_to_keep = [ot.node for ot in graph.get_outputs()] + \
+                            ([] if append2output is None else list(append2output))
+            self.nodes_to_release = get_nodes_to_release(schedule, graph, nodes_to_keep)
         self.nodes_dict = {}
         self.append2output = append2output
         self.return_float_outputs = return_float_outputs
@@ -220,6 +228,10 @@ class PytorchModel(torch.nn.Module):
                 node_to_output_tensors_dict.update({n: [out_tensors_of_n]})
                 node_to_output_tensors_dict_float.update({n: [out_tensors_of_n_float]})
 
+            # Release output tensors that are not used by the remaining nodes
+            for released_node in self.nodes_to_release.get(n, []):
+                node_to_output_tensors_dict.pop(released_node)
+                node_to_output_tensors_dict_float.pop(released_node)
 
         if self.append2output:
             outputs = _generate_outputs(self.append2output,
@@ -109,6 +109,7 @@ class MHAParams:
         self.v_head_shape = tuple([self.v_input[0], self.kv_seq, self.qdim])
 
         self.attn_mat_shape = tuple([self.q_input[0], 1, self.q_seq, self.kv_seq])
+        self.batched_attn_mat_shape = tuple([self.q_input[0], self.num_heads, self.q_seq, self.kv_seq])
         self.attn_shape = self.q_split_shape
 
         self.attn_cat_shape = tuple([self.q_input[0], self.num_heads, self.q_seq, self.qdim])
@@ -125,11 +126,16 @@ class MultiHeadAttentionDecomposition(common.BaseSubstitution):
     and replaces it with a compatible graph that consists of Conv, MatMul, Softmax and stacked layers.
     """
 
-    def __init__(self):
+    def __init__(self, batched_heads: bool = False):
         """
         Matches MultiHeadAttention node.
+
+        Args:
+            batched_heads: Whether to compute the attention of all heads together (with the heads dimension batched),
+                instead of computing the attention of each head separately.
         """
         super().__init__(matcher_instance=NodeOperationMatcher(nn.MultiheadAttention))
+        self.batched_heads = batched_heads
 
     def _project_input(self,
                        graph: Graph,
@@ -542,12 +548,75 @@ class MultiHeadAttentionDecomposition(common.BaseSubstitution):
         return matmulv_node
 
     @staticmethod
-    def _cat_heads_reshape(graph: Graph,
-                           name: str,
-                           att_head_output_nodes: List[BaseNode],
-                           params: MHAParams) -> BaseNode:
+    def _calc_batched_attention(graph: Graph,
+                                q_node: BaseNode,
+                                k_node: BaseNode,
+                                v_node: BaseNode,
+                                mha_node: BaseNode,
+                                params: MHAParams) -> BaseNode:
         """
-        This method creates the nodes required for concatenating all heads after attention
+        This method creates the nodes required for attention calc of all heads together (the heads
+        dimension is batched).
+
+        Args:
+            graph: Graph to apply the substitution on.
+            q_node: query node after shape arranging.
+            k_node: key node after shape arranging.
+            v_node: value node after shape arranging.
+            mha_node: MHA node.
+            params: MHAnode params.
+
+        Returns:
+            Node after attention calc.
+        """
+        # Q X K = attn
+        # (B, n_h, q_seq, q_dim) X (B, n_h, q_dim, kv_seq) = (B, n_h, q_seq, kv_seq)
+
+        # attn X V = attn_out
+        # (B, n_h, q_seq, kv_seq) X (B, n_h, kv_seq, q_dim) = (B, n_h, q_seq, q_dim)
+
+        # (B, n_h, q_seq, q_dim) X (B, n_h, q_dim, kv_seq) = (B, n_h, q_seq, kv_seq)
+        matmul_node = FunctionalNode(name=f'{mha_node.name}_matmul',
+                                     framework_attr={},
+                                     input_shape=(params.q_transpose_shape, params.k_reshape_in_shape),
+                                     output_shape=params.batched_attn_mat_shape,
+                                     weights={},
+                                     layer_class=torch.matmul,
+                                     op_call_args=[],
+                                     op_call_kwargs={},
+                                     functional_op=torch.matmul)
+        graph.add_node_with_in_edges(matmul_node, [q_node, k_node])
+
+        # apply softmax on attention matrix
+        softmax_node = BaseNode(name=f'{mha_node.name}_softmax',
+                                framework_attr={DIM: -1},
+                                input_shape=params.batched_attn_mat_shape,
+                                output_shape=params.batched_attn_mat_shape,
+                                weights={},
+                                layer_class=nn.Softmax)
+        graph.add_node_with_in_edges(softmax_node, [matmul_node])
+
+        # (B, n_h, q_seq, kv_seq) X (B, n_h, kv_seq, q_dim) = (B, n_h, q_seq, q_dim)
+        matmulv_node = FunctionalNode(name=f'{mha_node.name}_dotv',
+                                      framework_attr={},
+                                      input_shape=(params.batched_attn_mat_shape, params.v_transpose_shape),
+                                      output_shape=params.attn_cat_shape,
+                                      weights={},
+                                      layer_class=torch.matmul,
+                                      op_call_args=[],
+                                      op_call_kwargs={},
+                                      functional_op=torch.matmul)
+        graph.add_node_with_in_edges(matmulv_node, [softmax_node, v_node])
+
+        return matmulv_node
+
+    @staticmethod
+    def _cat_heads(graph: Graph,
+                   name: str,
+                   att_head_output_nodes: List[BaseNode],
+                   params: MHAParams) -> BaseNode:
+        """
+        This method creates the node required for concatenating all heads after attention
 
         Args:
             graph: Graph to apply the substitution on.
@@ -556,11 +625,8 @@ class MultiHeadAttentionDecomposition(common.BaseSubstitution):
             params: MHAnode params.
 
         Returns:
-            Node after cat and reshape.
+            Node after cat.
         """
-        # [(B, 1, q_seq, q_dim)]  * n_h --> (B, n_h, q_seq, q_dim)
-        # -->  (B, q_seq, n_h, q_dim)  -->  (B, q_seq, q_dim*n_h)
-
         # [(B, 1, q_seq, q_dim)]  * n_h --> (B, n_h, q_seq, q_dim)
         cat_node = FunctionalNode(name=f'{name}_cat',
                                   framework_attr={DIM: 1},
@@ -572,6 +638,26 @@ class MultiHeadAttentionDecomposition(common.BaseSubstitution):
                                   op_call_kwargs={DIM: 1},
                                   functional_op=torch.cat, inputs_as_list=True)
         graph.add_node_with_in_edges(cat_node, att_head_output_nodes)
+        return cat_node
+
+    @staticmethod
+    def _reshape_heads(graph: Graph,
+                       name: str,
+                       cat_node: BaseNode,
+                       params: MHAParams) -> BaseNode:
+        """
+        This method creates the nodes required for reshaping the attention output of all heads
+
+        Args:
+            graph: Graph to apply the substitution on.
+            name: MHA node name.
+            cat_node: node of all heads attention output.
+            params: MHAnode params.
+
+        Returns:
+            Node after reshape.
+        """
+        # (B, n_h, q_seq, q_dim) -->  (B, q_seq, n_h, q_dim)  -->  (B, q_seq, q_dim*n_h)
 
         # (B, n_h, q_seq, q_dim) -->  (B, q_seq, n_h, q_dim)
         transpose_node = FunctionalNode(name=f'{name}_transpose',
@@ -723,24 +809,34 @@ class MultiHeadAttentionDecomposition(common.BaseSubstitution):
         # (B, q_dim*n_h, kv_seq) --> (B, n_h, kv_seq, q_dim)
         q_fixed_node, k_fixed_node, v_fixed_node = self._arrange_before_split(graph, mha_node, q_node, k_node, v_node,
                                                                               params)
-        # (B, n_h, q_seq, q_dim) --> (B, 1, q_seq, q_dim) * 3
-        # (B, n_h, q_dim, kv_seq) --> (B, 1, q_dim, kv_seq) * 3
-        # (B, n_h, kv_seq, q_dim) --> (B, 1, kv_seq, q_dim) * 3
-        q_split_node, k_split_node, v_split_node = self._split_projected(graph, mha_node.name, q_fixed_node,
-                                                                         k_fixed_node, v_fixed_node, params)
-
-        att_head_output_nodes = []
-        for h in range(params.num_heads):
-            # (B, 1, q_seq, q_dim) X (B, 1, q_dim, kv_seq) = (B, 1, q_seq, kv_seq)
+        if self.batched_heads:
+            # (B, n_h, q_seq, q_dim) X (B, n_h, q_dim, kv_seq) = (B, n_h, q_seq, kv_seq)
             # Apply Softmax
-            # (B, 1, q_seq, kv_seq) X (B, 1, kv_seq, q_dim) = (B, 1, q_seq, q_dim)
-            dotv_node = self._calc_attention_head(graph, q_split_node, k_split_node, v_split_node,
-                                                  mha_node, h, params)
-            # [(B, 1, q_seq, q_dim)] * n_h
-            att_head_output_nodes.append(dotv_node)
-
-        # [(B, 1, q_seq, q_dim)]  * n_h -->  (B, q_seq, q_dim*n_h)
-        attn_reshape_node = self._cat_heads_reshape(graph, mha_node.name, att_head_output_nodes, params)
+            # (B, n_h, q_seq, kv_seq) X (B, n_h, kv_seq, q_dim) = (B, n_h, q_seq, q_dim)
+            attn_node = self._calc_batched_attention(graph, q_fixed_node, k_fixed_node, v_fixed_node,
+                                                     mha_node, params)
+        else:
+            # (B, n_h, q_seq, q_dim) --> (B, 1, q_seq, q_dim) * 3
+            # (B, n_h, q_dim, kv_seq) --> (B, 1, q_dim, kv_seq) * 3
+            # (B, n_h, kv_seq, q_dim) --> (B, 1, kv_seq, q_dim) * 3
+            q_split_node, k_split_node, v_split_node = self._split_projected(graph, mha_node.name, q_fixed_node,
+                                                                             k_fixed_node, v_fixed_node, params)
+
+            att_head_output_nodes = []
+            for h in range(params.num_heads):
+                # (B, 1, q_seq, q_dim) X (B, 1, q_dim, kv_seq) = (B, 1, q_seq, kv_seq)
+                # Apply Softmax
+                # (B, 1, q_seq, kv_seq) X (B, 1, kv_seq, q_dim) = (B, 1, q_seq, q_dim)
+                dotv_node = self._calc_attention_head(graph, q_split_node, k_split_node, v_split_node,
+                                                      mha_node, h, params)
+                # [(B, 1, q_seq, q_dim)] * n_h
+                att_head_output_nodes.append(dotv_node)
+
+            # [(B, 1, q_seq, q_dim)]  * n_h -->  (B, n_h, q_seq, q_dim)
+            attn_node = self._cat_heads(graph, mha_node.name, att_head_output_nodes, params)
+
+        # (B, n_h, q_seq, q_dim) -->  (B, q_seq, q_dim*n_h)
+        attn_reshape_node = self._reshape_heads(graph, mha_node.name, attn_node, params)
 
         # (B, q_seq, q_dim*n_h) --> (B, q_seq, q_dim*n_h)
         proj_output = self._project_output(graph, mha_node, attn_reshape_node, params)
@@ -0,0 +1,169 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import List, Callable, Dict
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core.common import similarity_analyzer
+from model_compression_toolkit.core.common.constants import EPS
+from model_compression_toolkit.core.pytorch.utils import torch_tensor_to_numpy
+
+##################################################################
+# Pytorch implementations of the similarity_analyzer distance functions.
+# The distance is computed per sample, so they can be used to compute
+# the mixed-precision distance matrix without converting the models'
+# outputs to Numpy.
+##################################################################
+
+
+def _flatten_samples(t: torch.Tensor) -> torch.Tensor:
+    """
+    Flatten a batch of samples to a [samples, features] tensor.
+
+    Args:
+        t: A tensor to be flattened.
+
+    Returns: A flattened tensor which has the number of samples as its first dimension.
+    """
+    return t.reshape([t.shape[0], -1])
+
+
+def compute_mse(float_tensor: torch.Tensor,
+                fxp_tensor: torch.Tensor,
+                norm: bool = False,
+                norm_eps: float = 1e-8) -> torch.Tensor:
+    """
+    Compute the mean square error between two tensors per sample in the batch.
+
+    Args:
+        float_tensor: First tensor to compare.
+        fxp_tensor: Second tensor to compare.
+        norm: whether to normalize the error function result.
+        norm_eps: epsilon value for error normalization stability.
+
+    Returns:
+        The MSE distance between the two tensors per sample.
+    """
+    float_flat = _flatten_samples(float_tensor)
+    fxp_flat = _flatten_samples(fxp_tensor)
+
+    error = torch.mean(torch.square(float_flat - fxp_flat), dim=-1)
+    if norm:
+        error = error / (torch.mean(torch.square(float_flat), dim=-1) + norm_eps)
+    return error
+
+
+def compute_mae(float_tensor: torch.Tensor,
+                fxp_tensor: torch.Tensor,
+                norm: bool = False,
+                norm_eps: float = 1e-8) -> torch.Tensor:
+    """
+    Compute the mean average error between two tensors per sample in the batch.
+
+    Args:
+        float_tensor: First tensor to compare.
+        fxp_tensor: Second tensor to compare.
+        norm: whether to normalize the error function result.
+        norm_eps: epsilon value for error normalization stability.
+
+    Returns:
+        The mean average distance between the two tensors per sample.
+    """
+    float_flat = _flatten_samples(float_tensor)
+    fxp_flat = _flatten_samples(fxp_tensor)
+
+    error = torch.mean(torch.abs(float_flat - fxp_flat), dim=-1)
+    if norm:
+        error = error / (torch.mean(torch.abs(float_flat), dim=-1) + norm_eps)
+    return error
+
+
+def compute_cs(float_tensor: torch.Tensor, fxp_tensor: torch.Tensor, eps: float = 1e-8) -> torch.Tensor:
+    """
+    Compute the similarity between two tensors per sample in the batch using cosine similarity.
+    The returned values are between 0 to 1: the smaller returned value,
+    the greater similarity there is between the two tensors.
+
+    Args:
+        float_tensor: First tensor to compare.
+        fxp_tensor: Second tensor to compare.
+        eps: Small value to avoid zero division.
+
+    Returns:
+        The cosine similarity between two tensors per sample.
+    """
+    float_flat = _flatten_samples(float_tensor)
+    fxp_flat = _flatten_samples(fxp_tensor)
+
+    float_norm = torch.linalg.norm(float_flat, dim=-1)
+    fxp_norm = torch.linalg.norm(fxp_flat, dim=-1)
+
+    # -1 <= cs <= 1
+    cs = torch.sum(float_flat * fxp_flat, dim=-1) / ((float_norm * fxp_norm) + eps)
+    distance = (1.0 - cs) / 2.0
+
+    # Same as the Numpy implementation, two all-zeros tensors get a distance of 1
+    all_zeros = torch.logical_and(torch.all(float_tensor == 0), torch.all(fxp_tensor == 0))
+    return torch.where(all_zeros, torch.ones_like(distance), distance)
+
+
+def compute_kl_divergence(float_tensor: torch.Tensor, fxp_tensor: torch.Tensor) -> torch.Tensor:
+    """
+    Compute the similarity between two tensors per sample in the batch using KL-divergence.
+
+    Args:
+        float_tensor: First tensor to compare.
+        fxp_tensor: Second tensor to compare.
+
+    Returns:
+        The KL-divergence between two tensors per sample.
+    """
+    float_flat = _flatten_samples(float_tensor)
+    fxp_flat = _flatten_samples(fxp_tensor)
+
+    non_zero_fxp_tensor = torch.where(fxp_flat == 0, torch.full_like(fxp_flat, EPS), fxp_flat)
+    return torch.sum(torch.where(float_flat != 0,
+                                 float_flat * torch.log(float_flat / non_zero_fxp_tensor),
+                                 torch.zeros_like(float_flat)),
+                     dim=-1)
+
+
+# Mapping between the Numpy distance functions and their Pytorch implementations
+TORCH_DISTANCE_FUNCTIONS: Dict[Callable, Callable] = {similarity_analyzer.compute_mse: compute_mse,
+                                                      similarity_analyzer.compute_mae: compute_mae,
+                                                      similarity_analyzer.compute_cs: compute_cs,
+                                                      similarity_analyzer.compute_kl_divergence: compute_kl_divergence}
+
+
+def compute_distance_matrix(baseline_tensors: List[torch.Tensor],
+                            mp_tensors: List[torch.Tensor],
+                            distance_fns: List[Callable]) -> np.ndarray:
+    """
+    Compute the distances between the baseline model's outputs and the MP model's outputs
+    of all interest points, and convert only the resulting distance matrix to Numpy.
+
+    Args:
+        baseline_tensors: Baseline model's output tensors.
+        mp_tensors: MP model's output tensors.
+        distance_fns: Pytorch distance function of each interest point.
+
+    Returns:
+        A distance matrix of shape [interest points, samples].
+    """
+    with torch.no_grad():
+        distance_matrix = torch.stack([distance_fn(baseline_tensor, mp_tensor) for distance_fn, baseline_tensor, mp_tensor
+                                       in zip(distance_fns, baseline_tensors, mp_tensors)])
+    return torch_tensor_to_numpy(distance_matrix)
@@ -15,12 +15,14 @@
 
 from typing import Any, List
 
+import numpy as np
 import torch
 import copy
 
 from model_compression_toolkit import FrameworkInfo
 from model_compression_toolkit.core.common import BaseNode
 from model_compression_toolkit.core.common.graph.functional_node import FunctionalNode
+from model_compression_toolkit.core.common.mixed_precision.packed_quantized_weights import PackedQuantizedWeights
 from model_compression_toolkit.core.pytorch.utils import set_model, to_torch_tensor
 
 
@@ -80,13 +82,12 @@ class PytorchMixedPrecisionWrapper(torch.nn.Module):
         if self.enable_weights_quantization:
             self.weight_attrs = fw_info.get_kernel_op_attributes(n.type)
             # float_weights is a list of weights for each attribute that we want to quantize.
-            self.float_weights = [n.get_weights_by_keys(attr) for attr in
-                                  self.weight_attrs]
+            float_weights = [n.get_weights_by_keys(attr) for attr in self.weight_attrs]
 
-            assert len(self.weight_attrs) == len(self.float_weights)
-            self.weights_quantizer_fn_list = [qc.weights_quantization_cfg.weights_quantization_fn
-                                              for qc in self.node_q_cfg]
-            self.quantized_weights = self._get_quantized_weights()
+            assert len(self.weight_attrs) == len(float_weights)
+            self.quantized_weights = self._get_quantized_weights(float_weights)
+            # Index of the stored quantized weight that is currently loaded to the layer, for each attribute
+            self.active_weights_idx = [None] * len(self.weight_attrs)
             # Setting the model with the initial quantized weights (the highest precision)
             self.set_active_weights(bitwidth_idx=max_candidate_idx)
 
@@ -115,28 +116,17 @@ class PytorchMixedPrecisionWrapper(torch.nn.Module):
 
         return outputs
 
-    def _get_quantized_weights(self):
+    def _get_quantized_weights(self, float_weights: List[np.ndarray]) -> List[PackedQuantizedWeights]:
         """
         Calculates the quantized weights' tensors for each of the bitwidth candidates for quantization,
-        to be stored and used during MP search.
-        Returns: a list of quantized weights - for each bitwidth and layer's attribute to be quantized.
+        to be stored (packed and without duplicates) and used during MP search.
+
+        Args:
+            float_weights: A list of float weights - for each of the layer's attribute to be quantized.
+
+        Returns: a list of quantized weights storage - for each layer's attribute to be quantized.
         """
-        quantized_weights = []
-        for index, qc in enumerate(self.node_q_cfg):
-            # for each quantization configuration in mixed precision
-            # get quantized weights for each attribute and for each filter
-            quantized_per_attr = []
-            for float_weight in self.float_weights:
-                # for each attribute
-                quantized_per_attr.append(self.weights_quantizer_fn_list[index](tensor_data=float_weight,
-                                                                                n_bits=qc.weights_quantization_cfg.weights_n_bits,
-                                                                                signed=True,
-                                                                                quantization_params=qc.weights_quantization_cfg.weights_quantization_params,
-                                                                                per_channel=qc.weights_quantization_cfg.weights_per_channel_threshold,
-                                                                                output_channels_axis=qc.weights_quantization_cfg.weights_channels_axis))
-            quantized_weights.append(quantized_per_attr)
-
-        return quantized_weights
+        return [PackedQuantizedWeights(self.node_q_cfg, float_weight) for float_weight in float_weights]
 
     def _get_activation_quantizers(self) -> List[Any]:
         """
@@ -164,7 +154,7 @@ class PytorchMixedPrecisionWrapper(torch.nn.Module):
         """
         if self.enable_weights_quantization:
             if attr is None:  # set bit width to all weights of the layer
-                attr_idxs = [attr_idx for attr_idx in range(len(self.quantized_weights[bitwidth_idx]))]
+                attr_idxs = [attr_idx for attr_idx in range(len(self.weight_attrs))]
                 self._set_weights_bit_width_index(bitwidth_idx, attr_idxs)
             else:  # set bit width to a specific attribute
                 attr_idx = self.weight_attrs.index(attr)
@@ -187,22 +177,25 @@ class PytorchMixedPrecisionWrapper(torch.nn.Module):
                                      attr_idxs: List[int]):
         """
         Sets the wrapped layer's weights state with quantized weights, according to the given configuration.
+        The quantized weights are dequantized and copied in-place into the layer's existing weights tensors.
         Args:
             bitwidth_idx: Index of a candidate quantization configuration to use its quantized
             version of the float weight.
             attr_idxs: Indices list of attributes of the layer's weights to quantize
         Returns: None (sets the new state of the layer inplace).
         """
-        assert bitwidth_idx < len(self.quantized_weights), \
+        assert bitwidth_idx < len(self.node_q_cfg), \
             f"Index {bitwidth_idx} does not exist in current quantization candidates list"
 
-        loaded_weights = {k: torch.as_tensor(v) for k, v in self.layer.state_dict().items()}
+        layer_state = self.layer.state_dict()
         with torch.no_grad():
             for attr_idx in attr_idxs:
-                # need to prepare the weights' tensor - extract it from the maintained quantized_weights list
-                # and move it to the relevant device as the wrapped layer's weights.
-                weights_tensor = self.quantized_weights[bitwidth_idx][attr_idx]
-                weights_device = loaded_weights[self.weight_attrs[attr_idx]].device
-                active_weights = torch.nn.Parameter(torch.from_numpy(weights_tensor).to(weights_device))
-                loaded_weights[self.weight_attrs[attr_idx]] = active_weights
-            self.layer.load_state_dict(loaded_weights, strict=True)
+                # candidates that share the same quantized weight don't require a change of the layer's weights
+                weights_idx = self.quantized_weights[attr_idx].get_weight_index(bitwidth_idx)
+                if weights_idx == self.active_weights_idx[attr_idx]:
+                    continue
+                # dequantize the weights' tensor from the maintained quantized_weights storage
+                # and copy it in-place to the wrapped layer's weights.
+                weights_tensor = self.quantized_weights[attr_idx].get_quantized_weight(bitwidth_idx)
+                layer_state[self.weight_attrs[attr_idx]].copy_(torch.from_numpy(weights_tensor))
+                self.active_weights_idx[attr_idx] = weights_idx
@@ -22,7 +22,8 @@ from torch.nn import Conv2d, ConvTranspose2d, Linear
 from torch.nn import Module, Sigmoid, Softmax
 
 import model_compression_toolkit.core.pytorch.constants as pytorch_constants
-from model_compression_toolkit import QuantizationConfig, FrameworkInfo, CoreConfig, MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit import QuantizationConfig, FrameworkInfo, CoreConfig, MixedPrecisionQuantizationConfigV2, \
+    DEFAULTCONFIG
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector
@@ -36,7 +37,7 @@ from model_compression_toolkit.core.common.similarity_analyzer import compute_ms
 from model_compression_toolkit.core.common.user_info import UserInformation
 from model_compression_toolkit.core.pytorch.back2framework import get_pytorch_model_builder
 from model_compression_toolkit.core.pytorch.back2framework.model_gradients import \
-    pytorch_iterative_approx_jacobian_trace
+    pytorch_iterative_approx_jacobian_trace, pytorch_batched_approx_jacobian_trace
 from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
 from model_compression_toolkit.core.pytorch.graph_substitutions.substitutions.batchnorm_folding import \
     pytorch_batchnorm_folding
@@ -67,6 +68,8 @@ from model_compression_toolkit.core.pytorch.graph_substitutions.substitutions.vi
     VirtualActivationWeightsComposition
 from model_compression_toolkit.core.pytorch.graph_substitutions.substitutions.weights_activation_split import \
     WeightsActivationSplit
+from model_compression_toolkit.core.pytorch.mixed_precision.distance_functions import TORCH_DISTANCE_FUNCTIONS, \
+    compute_distance_matrix
 from model_compression_toolkit.core.pytorch.mixed_precision.set_layer_to_bitwidth import set_layer_to_bitwidth
 from model_compression_toolkit.core.pytorch.pytorch_node_prior_info import create_node_prior_info
 from model_compression_toolkit.core.pytorch.reader.reader import model_reader
@@ -190,17 +193,19 @@ class PytorchImplementation(FrameworkImplementation):
 
     def attach_sc_to_node(self,
                           node: BaseNode,
-                          fw_info: FrameworkInfo) -> BaseStatsCollector:
+                          fw_info: FrameworkInfo,
+                          quant_config: QuantizationConfig = DEFAULTCONFIG) -> BaseStatsCollector:
         """
         Return a statistics collector that should be attached to a node's output
         during statistics collection.
         Args:
             node: Node to return its collector.
             fw_info: Information relevant to a specific framework about what is out channel axis (for statistics per-channel)
+            quant_config: Quantization configuration (determines how histograms are collected).
         Returns:
             Statistics collector for the node.
         """
-        return create_stats_collector_for_node(node, fw_info)
+        return create_stats_collector_for_node(node, fw_info, quant_config)
 
     def get_substitutions_channel_equalization(self,
                                                quant_config: QuantizationConfig,
@@ -221,14 +226,18 @@ class PytorchImplementation(FrameworkImplementation):
                                        ScaleEqualizationWithPad(quant_config, fw_info)])
         return substitutions_list
 
-    def get_substitutions_prepare_graph(self) -> List[common.BaseSubstitution]:
+    def get_substitutions_prepare_graph(self, quant_config: QuantizationConfig = DEFAULTCONFIG) -> \
+            List[common.BaseSubstitution]:
         """
 
+        Args:
+            quant_config: Quantization configuration.
+
         Returns: A list of the framework substitutions used before we collect the prior information.
 
         """
         return [ReshapeWithStaticShapes(),
-                MultiHeadAttentionDecomposition(),
+                MultiHeadAttentionDecomposition(batched_heads=quant_config.batched_attention_heads),
                 PermuteCallMethod()]
 
     def get_substitutions_pre_statistics_collection(self,
@@ -331,7 +340,9 @@ class PytorchImplementation(FrameworkImplementation):
                                   quant_config: MixedPrecisionQuantizationConfigV2,
                                   representative_data_gen: Callable,
                                   fw_info: FrameworkInfo,
-                                  disable_activation_for_metric: bool = False) -> SensitivityEvaluation:
+                                  disable_activation_for_metric: bool = False,
+                                  compiled_inference: bool = False,
+                                  jit_compile_inference: bool = False) -> SensitivityEvaluation:
         """
         Creates and returns an object which handles the computation of a sensitivity metric for a mixed-precision
         configuration (comparing to the float model).
@@ -342,6 +353,8 @@ class PytorchImplementation(FrameworkImplementation):
             representative_data_gen: Dataset to use for retrieving images for the models inputs.
             fw_info: FrameworkInfo object with information about the specific framework's model.
             disable_activation_for_metric: Whether to disable activation quantization when computing the MP metric.
+            compiled_inference: Whether to evaluate the models using a compiled inference function.
+            jit_compile_inference: Whether to jit-compile the compiled inference function.
 
         Returns:
             A SensitivityEvaluation object.
@@ -354,7 +367,9 @@ class PytorchImplementation(FrameworkImplementation):
                                      fw_impl=self,
                                      set_layer_to_bitwidth=set_layer_to_bitwidth,
                                      get_quant_node_name=lambda node_name: f'{node_name}',
-                                     disable_activation_for_metric=disable_activation_for_metric)
+                                     disable_activation_for_metric=disable_activation_for_metric,
+                                     compiled_inference=compiled_inference,
+                                     jit_compile_inference=jit_compile_inference)
 
     def get_node_prior_info(self,
                             node: BaseNode,
@@ -411,6 +426,38 @@ class PytorchImplementation(FrameworkImplementation):
             return compute_cs
         return compute_mse
 
+    def get_framework_distance_fn(self, distance_fn: Callable) -> Callable:
+        """
+        Returns the framework's implementation of a Numpy distance function (that get_node_distance_fn returns),
+        for computing the distances between the models' output tensors without converting them to Numpy.
+
+        Args:
+            distance_fn: A Numpy distance function.
+
+        Returns: The framework's implementation of the distance function, or None if the framework does not
+        implement the given function (e.g., a user-defined distance function).
+        """
+
+        return TORCH_DISTANCE_FUNCTIONS.get(distance_fn)
+
+    def compute_distance_matrix(self,
+                                baseline_tensors: List[torch.Tensor],
+                                mp_tensors: List[torch.Tensor],
+                                distance_fns: List[Callable]) -> np.ndarray:
+        """
+        Compute the distance matrix between the baseline model's outputs and the MP model's outputs
+        using the framework's distance functions (that get_framework_distance_fn returns).
+
+        Args:
+            baseline_tensors: Baseline model's output tensors.
+            mp_tensors: MP model's output tensors.
+            distance_fns: Framework's distance function of each output tensor.
+
+        Returns: A distance matrix of shape [outputs, samples].
+        """
+
+        return compute_distance_matrix(baseline_tensors, mp_tensors, distance_fns)
+
     def get_model_layers_names(self,
                                model: Module) -> List[str]:
         """
@@ -474,6 +521,39 @@ class PytorchImplementation(FrameworkImplementation):
         return pytorch_iterative_approx_jacobian_trace(graph_float, model_input_tensors, interest_points, output_list,
                                                        all_outputs_indices, alpha, n_iter, norm_weights=norm_weights)
 
+    def batched_model_grad(self,
+                           graph_float: common.Graph,
+                           model_input_tensors: Dict[BaseNode, torch.Tensor],
+                           interest_points: List[BaseNode],
+                           output_list: List[BaseNode],
+                           all_outputs_indices: List[int],
+                           alpha: float = 0.3,
+                           n_iter: int = 50,
+                           norm_weights: bool = True) -> np.ndarray:
+        """
+        Calls a PyTorch model gradient calculation function, which computes the jacobian-based weights of the model's
+        outputs with respect to the feature maps of the set of given interest points, for each sample of a batch.
+
+        Args:
+            graph_float: Graph to build its corresponding PyTorch model.
+            model_input_tensors: A mapping between model input nodes to an input batch.
+            interest_points: List of nodes which we want to get their feature map as output, to calculate distance metric.
+            output_list: List of nodes that considered as model's output for the purpose of gradients computation.
+            all_outputs_indices: Indices of the model outputs and outputs replacements (if exists),
+                in a topological sorted interest points list.
+            alpha: A tuning parameter to allow calibration between the contribution of the output feature maps returned
+                weights and the other feature maps weights (since the gradient of the output layers does not provide a
+                compatible weight for the distance metric computation).
+            n_iter: The number of random iterations to calculate the approximated jacobian-based weights for each interest point.
+            norm_weights: Whether to normalize the returned weights (to get values between 0 and 1).
+
+        Returns: An array of (possibly normalized) jacobian-based weights of each sample, with shape
+        (batch size, number of interest points).
+        """
+
+        return pytorch_batched_approx_jacobian_trace(graph_float, model_input_tensors, interest_points, output_list,
+                                                     all_outputs_indices, alpha, n_iter, norm_weights=norm_weights)
+
     def is_node_compatible_for_metric_outputs(self,
                                               node: BaseNode) -> bool:
         """
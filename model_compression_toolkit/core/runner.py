@@ -26,6 +26,9 @@ from model_compression_toolkit.core.common import Logger
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.fusion.layer_fusing import fusion
 from model_compression_toolkit.core.common.graph.base_graph import Graph
+from model_compression_toolkit.core.common.graph_snapshot import get_snapshot_path, load_statistics_snapshot, \
+    save_statistics_snapshot
+from model_compression_toolkit.core.common.graph.memory_graph.memory_schedule import set_memory_schedule
 from model_compression_toolkit.core.common.mixed_precision.bit_width_setter import set_bit_widths
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPI, KPITarget
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_aggregation_methods import MpKpiAggregation
@@ -34,6 +37,8 @@ from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi_methods
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_facade import search_bit_width
 from model_compression_toolkit.core.common.model_collector import ModelCollector
 from model_compression_toolkit.core.common.network_editors.edit_network import edit_network_graph
+from model_compression_toolkit.core.common.pipeline_profiler import PipelineProfiler, profile_stage, \
+    get_pipeline_profiler, set_pipeline_profiler
 from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
 from model_compression_toolkit.core.common.quantization.filter_nodes_candidates import filter_nodes_candidates
 from model_compression_toolkit.core.common.quantization.quantization_analyzer import analyzer_graph
@@ -89,11 +94,15 @@ def core_runner(in_model: Any,
 
     """
 
-    graph = read_model_to_graph(in_model,
-                                representative_data_gen,
-                                tpc,
-                                fw_info,
-                                fw_impl)
+    _init_pipeline_profiler(core_config, tb_w)
+
+    with profile_stage('read_model') as stage:
+        graph = read_model_to_graph(in_model,
+                                    representative_data_gen,
+                                    tpc,
+                                    fw_info,
+                                    fw_impl)
+        stage.set_graph(graph)
 
     tg = _prepare_model_for_quantization(graph,
                                          representative_data_gen,
@@ -110,12 +119,15 @@ def core_runner(in_model: Any,
         assert core_config.mixed_precision_enable
         if core_config.mixed_precision_config.configuration_overwrite is None:
 
-            bit_widths_config = search_bit_width(tg,
-                                                 fw_info,
-                                                 fw_impl,
-                                                 target_kpi,
-                                                 core_config.mixed_precision_config,
-                                                 representative_data_gen)
+            with profile_stage('mixed_precision_search'):
+                bit_widths_config = search_bit_width(tg,
+                                                     fw_info,
+                                                     fw_impl,
+                                                     target_kpi,
+                                                     core_config.mixed_precision_config,
+                                                     representative_data_gen,
+                                                     compiled_inference=core_config.compiled_inference,
+                                                     jit_compile_inference=core_config.jit_compile_inference)
         else:
             Logger.warning(
                 f'Mixed Precision has overwrite bit-width configuration{core_config.mixed_precision_config.configuration_overwrite}')
@@ -124,19 +136,28 @@ def core_runner(in_model: Any,
     else:
         bit_widths_config = []
 
-    tg = set_bit_widths(core_config.mixed_precision_enable,
-                        tg,
-                        bit_widths_config)
-
-    # Edit the graph again after finalizing the configurations.
-    # This is since some actions regard the final configuration and should be edited.
-    edit_network_graph(tg, fw_info, core_config.debug_config.network_editor)
-
-    _set_final_kpi(graph=tg,
-                   final_bit_widths_config=bit_widths_config,
-                   kpi_functions_dict=kpi_functions_mapping,
-                   fw_info=fw_info,
-                   fw_impl=fw_impl)
+    with profile_stage('set_bit_widths') as stage:
+        tg = set_bit_widths(core_config.mixed_precision_enable,
+                            tg,
+                            bit_widths_config)
+
+        # Edit the graph again after finalizing the configurations.
+        # This is since some actions regard the final configuration and should be edited.
+        edit_network_graph(tg, fw_info, core_config.debug_config.network_editor)
+        stage.set_graph(tg)
+
+    with profile_stage('final_kpi'):
+        _set_final_kpi(graph=tg,
+                       final_bit_widths_config=bit_widths_config,
+                       kpi_functions_dict=kpi_functions_mapping,
+                       fw_info=fw_info,
+                       fw_impl=fw_impl,
+                       target_kpi=target_kpi)
+
+    if target_kpi is not None and target_kpi.activation_max_cut_memory < np.inf:
+        # Attach the memory schedule that the activation max-cut KPI was computed for,
+        # so the exported model can be executed by it.
+        set_memory_schedule(tg)
 
     if target_kpi is not None:
         # Retrieve lists of tuples (node, node's final weights/activation bitwidth)
@@ -158,6 +179,10 @@ def core_runner(in_model: Any,
                 figure = visual.plot_config_bitwidth()
                 tb_w.add_figure(figure, f'Activation final bit-width config')
 
+    profiler = get_pipeline_profiler()
+    if profiler is not None:
+        profiler.log_summary()
+
     return tg, bit_widths_config
 
 
@@ -190,7 +215,9 @@ def get_finalized_graph(initial_graph: Graph,
     ######################################
     # Graph substitution (prepare graph)
     ######################################
-    graph = substitute(initial_graph, fw_impl.get_substitutions_prepare_graph())
+    with profile_stage('prepare_graph_substitutions') as stage:
+        graph = substitute(initial_graph, fw_impl.get_substitutions_prepare_graph(quant_config))
+        stage.set_graph(graph)
 
     if tb_w is not None:
         tb_w.add_graph(graph, 'after_graph_preparation')
@@ -205,11 +232,18 @@ def get_finalized_graph(initial_graph: Graph,
     ##################################################
     # Graph substitution (pre statistics collection)
     ##################################################
-    transformed_graph = substitute(graph, fw_impl.get_substitutions_pre_statistics_collection(quant_config))
+    with profile_stage('pre_statistics_collection_substitutions') as stage:
+        transformed_graph = substitute(graph, fw_impl.get_substitutions_pre_statistics_collection(quant_config))
+        stage.set_graph(transformed_graph)
     if quant_config.linear_collapsing:
-        transformed_graph = linear_collapsing_substitute(transformed_graph, fw_impl.get_linear_collapsing_substitution())
+        with profile_stage('linear_collapsing') as stage:
+            transformed_graph = linear_collapsing_substitute(transformed_graph,
+                                                             fw_impl.get_linear_collapsing_substitution())
+            stage.set_graph(transformed_graph)
     if quant_config.residual_collapsing:
-        transformed_graph = substitute(transformed_graph, fw_impl.get_residual_collapsing_substitution())
+        with profile_stage('residual_collapsing') as stage:
+            transformed_graph = substitute(transformed_graph, fw_impl.get_residual_collapsing_substitution())
+            stage.set_graph(transformed_graph)
 
     if tb_w is not None:
         tb_w.add_graph(transformed_graph, 'pre_statistics_collection_substitutions')
@@ -217,21 +251,27 @@ def get_finalized_graph(initial_graph: Graph,
     ######################################
     # Add quantization configurations
     ######################################
-    transformed_graph = set_quantization_configuration_to_graph(graph=transformed_graph,
-                                                                quant_config=quant_config,
-                                                                mixed_precision_enable=mixed_precision_enable)
+    with profile_stage('set_quantization_configuration') as stage:
+        transformed_graph = set_quantization_configuration_to_graph(graph=transformed_graph,
+                                                                    quant_config=quant_config,
+                                                                    mixed_precision_enable=mixed_precision_enable)
+        stage.set_graph(transformed_graph)
 
     ######################################
     # Layer fusing
     ######################################
-    transformed_graph = fusion(transformed_graph, tpc)
+    with profile_stage('layer_fusing') as stage:
+        transformed_graph = fusion(transformed_graph, tpc)
+        stage.set_graph(transformed_graph)
 
     ######################################
     # Channel equalization
     ######################################
-    transformed_graph = substitute(transformed_graph,
-                                   fw_impl.get_substitutions_channel_equalization(quant_config,
-                                                                                  fw_info))
+    with profile_stage('channel_equalization') as stage:
+        transformed_graph = substitute(transformed_graph,
+                                       fw_impl.get_substitutions_channel_equalization(quant_config,
+                                                                                      fw_info))
+        stage.set_graph(transformed_graph)
 
     if tb_w is not None:
         tb_w.add_graph(transformed_graph, 'after_graph_marking')
@@ -239,7 +279,9 @@ def get_finalized_graph(initial_graph: Graph,
     ######################################
     # Filter nodes' candidates
     ######################################
-    transformed_graph = filter_nodes_candidates(transformed_graph)
+    with profile_stage('filter_nodes_candidates') as stage:
+        transformed_graph = filter_nodes_candidates(transformed_graph)
+        stage.set_graph(transformed_graph)
 
     if tb_w is not None:
         tb_w.add_graph(transformed_graph, 'after_candidates_filtering')
@@ -266,6 +308,27 @@ def _init_tensorboard_writer(fw_info: FrameworkInfo) -> TensorboardWriter:
     return tb_w
 
 
+def _init_pipeline_profiler(core_config: CoreConfig, tb_w: TensorboardWriter = None):
+    """
+    Set the active pipeline profiler according to the debug configuration: a PipelineProfiler that reports
+    to the TensorBoardWriter and to a JSON file (in the logger dir path if no report path was set),
+    if pipeline profiling is enabled, or None otherwise.
+
+    Args:
+        core_config: CoreConfig containing the debug configuration.
+        tb_w: TensorboardWriter object to report the profiled stages to.
+    """
+    profiler = None
+    if core_config.debug_config.profile_pipeline:
+        report_path = core_config.debug_config.profile_report_path
+        if report_path is None and common.Logger.LOG_PATH is not None:
+            report_path = os.path.join(common.Logger.LOG_PATH, 'pipeline_profile.json')
+        if report_path is not None:
+            common.Logger.info(f'Writing pipeline profile to {report_path}')
+        profiler = PipelineProfiler(report_path=report_path, tb_w=tb_w)
+    set_pipeline_profiler(profiler)
+
+
 def read_model_to_graph(in_model: Any,
                         representative_data_gen: Callable,
                         tpc: TargetPlatformCapabilities,
@@ -333,10 +396,11 @@ def _prepare_model_for_quantization(graph: Graph,
     ######################################
     # Graph analyzing (attaching statistics collectors)
     ######################################
-    analyzer_graph(fw_impl.attach_sc_to_node,
-                   transformed_graph,
-                   fw_info,
-                   core_config.quantization_config)  # Mark points for statistics collection
+    with profile_stage('analyzer_graph'):
+        analyzer_graph(fw_impl.attach_sc_to_node,
+                       transformed_graph,
+                       fw_info,
+                       core_config.quantization_config)  # Mark points for statistics collection
 
     if tb_w is not None:
         tb_w.add_graph(transformed_graph, 'after_analyzer_graph')
@@ -344,12 +408,12 @@ def _prepare_model_for_quantization(graph: Graph,
     ######################################
     # Statistic collection
     ######################################
-    mi = ModelCollector(transformed_graph,
-                        fw_impl,
-                        fw_info)
-
-    for _ in tqdm(range(core_config.n_iter)):
-        mi.infer(representative_data_gen())
+    with profile_stage('statistics_collection'):
+        _collect_statistics(transformed_graph,
+                            representative_data_gen,
+                            core_config,
+                            fw_info,
+                            fw_impl)
 
     ######################################
     # Edit network according to user
@@ -363,9 +427,10 @@ def _prepare_model_for_quantization(graph: Graph,
     ######################################
     # Calculate quantization params
     ######################################
-    calculate_quantization_params(transformed_graph,
-                                  fw_info,
-                                  fw_impl=fw_impl)
+    with profile_stage('calculate_quantization_params'):
+        calculate_quantization_params(transformed_graph,
+                                      fw_info,
+                                      fw_impl=fw_impl)
 
     if tb_w is not None:
         tb_w.add_graph(transformed_graph, 'thresholds_selection')
@@ -374,16 +439,21 @@ def _prepare_model_for_quantization(graph: Graph,
     ######################################
     # Graph substitution (post statistics collection)
     ######################################
-    transformed_graph = substitute(transformed_graph,
-                                   fw_impl.get_substitutions_post_statistics_collection(core_config.quantization_config))
+    with profile_stage('post_statistics_collection_substitutions') as stage:
+        transformed_graph = substitute(transformed_graph,
+                                       fw_impl.get_substitutions_post_statistics_collection(
+                                           core_config.quantization_config))
+        stage.set_graph(transformed_graph)
 
     ######################################
     # Shift Negative Activations
     ######################################
     if core_config.quantization_config.shift_negative_activation_correction:
-        transformed_graph = fw_impl.shift_negative_correction(transformed_graph,
-                                                              core_config,
-                                                              fw_info)
+        with profile_stage('shift_negative_correction') as stage:
+            transformed_graph = fw_impl.shift_negative_correction(transformed_graph,
+                                                                  core_config,
+                                                                  fw_info)
+            stage.set_graph(transformed_graph)
         if tb_w is not None:
             tb_w.add_graph(transformed_graph, 'after_shift_negative_correction')
             tb_w.add_all_statistics(transformed_graph, 'after_shift_negative_correction')
@@ -395,7 +465,9 @@ def _prepare_model_for_quantization(graph: Graph,
     ######################################
     # Statistics Correction
     ######################################
-    tg_with_bias = statistics_correction_runner(transformed_graph, core_config, fw_info, fw_impl, tb_w)
+    with profile_stage('statistics_correction') as stage:
+        tg_with_bias = statistics_correction_runner(transformed_graph, core_config, fw_info, fw_impl, tb_w)
+        stage.set_graph(tg_with_bias)
 
     for n in tg_with_bias.nodes:
         assert n.final_weights_quantization_cfg is None
@@ -403,14 +475,56 @@ def _prepare_model_for_quantization(graph: Graph,
     return tg_with_bias
 
 
+def _collect_statistics(graph: Graph,
+                        representative_data_gen: Callable,
+                        core_config: CoreConfig,
+                        fw_info: FrameworkInfo,
+                        fw_impl: FrameworkImplementation):
+    """
+    Collect statistics of the graph nodes by inferring the representative dataset.
+    If a snapshot directory is set in the core config, the statistics are restored from a matching snapshot
+    (if one exists) instead of being collected, and are saved to a snapshot after they are collected.
+
+    Args:
+        graph: Graph with statistics collectors attached.
+        representative_data_gen: Dataset used for calibration.
+        core_config: CoreConfig containing parameters of how the model should be quantized.
+        fw_info: Information needed for quantization about the specific framework.
+        fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+    """
+    first_inputs, snapshot_path = None, None
+    if core_config.snapshot_dir is not None:
+        # The first batch is part of the snapshot key, and is reused as the first calibration batch
+        first_inputs = representative_data_gen()
+        snapshot_path = get_snapshot_path(core_config.snapshot_dir, graph, first_inputs, core_config.n_iter,
+                                          core_config.quantization_config)
+        if os.path.isfile(snapshot_path) and load_statistics_snapshot(graph, snapshot_path):
+            return
+
+    mi = ModelCollector(graph,
+                        fw_impl,
+                        fw_info,
+                        compiled_inference=core_config.compiled_inference,
+                        jit_compile_inference=core_config.jit_compile_inference)
+
+    for i in tqdm(range(core_config.n_iter)):
+        mi.infer(first_inputs if i == 0 and first_inputs is not None else representative_data_gen())
+
+    if snapshot_path is not None:
+        save_statistics_snapshot(graph, snapshot_path)
+
+
 def _set_final_kpi(graph: Graph,
                    final_bit_widths_config: List[int],
                    kpi_functions_dict: Dict[KPITarget, Tuple[MpKpiMetric, MpKpiAggregation]],
                    fw_info: FrameworkInfo,
-                   fw_impl: FrameworkImplementation):
+                   fw_impl: FrameworkImplementation,
+                   target_kpi: KPI = None):
     """
     Computing the KPIs of the model according to the final bit-width configuration,
     and setting it (inplace) in the graph's UserInfo field.
+    The activation max-cut KPI is computed only if it was set in the target KPI, since it requires a schedule
+    search over the graph.
 
     Args:
         graph: Graph to compute the KPI for.
@@ -418,12 +532,16 @@ def _set_final_kpi(graph: Graph,
         kpi_functions_dict: A mapping between a KPITarget and a pair of kpi method and kpi aggregation functions.
         fw_info: A FrameworkInfo object.
         fw_impl: FrameworkImplementation object with specific framework methods implementation.
+        target_kpi: KPI that was used to constraint the search of the mixed-precision configuration (if any).
 
     """
 
     final_kpis_dict = {}
     for kpi_target, kpi_funcs in kpi_functions_dict.items():
         kpi_method, kpi_aggr = kpi_funcs
+        if kpi_target == KPITarget.ACTIVATION_MAX_CUT and \
+                (target_kpi is None or target_kpi.activation_max_cut_memory == np.inf):
+            continue
         if kpi_target == KPITarget.BOPS:
             final_kpis_dict[kpi_target] = kpi_aggr(kpi_method(final_bit_widths_config, graph, fw_info, fw_impl, False), False)[0]
         else:
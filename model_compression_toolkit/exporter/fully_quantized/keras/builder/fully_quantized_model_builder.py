@@ -24,6 +24,7 @@ from typing import List, Tuple, Dict, Any
 
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common import BaseNode, Graph
+from model_compression_toolkit.core.common.graph.memory_graph.memory_schedule import get_memory_schedule
 from model_compression_toolkit.core.common.user_info import UserInformation
 from model_compression_toolkit.core.keras.back2framework.keras_model_builder import KerasModelBuilder, \
     is_layer_fake_quant, get_node_name_from_layer
@@ -42,17 +43,21 @@ from model_compression_toolkit.exporter.fully_quantized.keras.quantizers.weights
     WeightsUniformQuantizer
 
 
-def get_fully_quantized_keras_model(graph: Graph) -> tf.keras.models.Model:
+def get_fully_quantized_keras_model(graph: Graph, use_memory_schedule: bool = False) -> tf.keras.models.Model:
     """
     Convert graph to fully quantized Keras model.
+    If the graph's UserInformation has a memory schedule (or use_memory_schedule is set), the model's layers
+    are built by the memory schedule order.
 
     Args:
         graph: Graph to convert to a Keras model.
+        use_memory_schedule: Whether to compute a memory schedule for the model if the graph's UserInformation
+            doesn't have one.
 
     Returns:
         Fully quantized Keras model.
     """
-    return FullyQuantizedKerasModelBuilder(graph=graph).build_model()
+    return FullyQuantizedKerasModelBuilder(graph=graph, use_memory_schedule=use_memory_schedule).build_model()
 
 
 class FullyQuantizedKerasModelBuilder(KerasModelBuilder):
@@ -61,15 +66,25 @@ class FullyQuantizedKerasModelBuilder(KerasModelBuilder):
     """
 
     def __init__(self,
-                 graph: common.Graph):
+                 graph: common.Graph,
+                 use_memory_schedule: bool = False):
         """
 
         Args:
             graph: Graph to build the model from.
+            use_memory_schedule: Whether to compute a memory schedule for the model if the graph's
+                UserInformation doesn't have one.
         """
 
         super().__init__(graph)
 
+        if use_memory_schedule or self.graph.user_info.memory_schedule is not None:
+            schedule = get_memory_schedule(self.graph)
+            if schedule is not None:
+                # Apply the layers by the schedule order. Note that a Keras functional model releases
+                # intermediate tensors once all the layers that use them were applied.
+                self.oh.node_sort = schedule
+
     def _quantize_node_activations(self,
                                    node: BaseNode,
                                    input_tensors: List[TFReference]) -> List[TFReference]:
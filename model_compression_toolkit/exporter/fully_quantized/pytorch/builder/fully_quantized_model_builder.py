@@ -19,6 +19,7 @@ import torch
 
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common import BaseNode, Graph
+from model_compression_toolkit.core.common.graph.memory_graph.memory_schedule import get_memory_schedule
 from model_compression_toolkit.core.common.user_info import UserInformation
 from model_compression_toolkit.core.pytorch.back2framework.instance_builder import node_builder
 from model_compression_toolkit.core.pytorch.back2framework.pytorch_model_builder import PyTorchModelBuilder, \
@@ -33,17 +34,21 @@ from model_compression_toolkit.core.pytorch.utils import get_working_device
 from model_compression_toolkit.exporter.fully_quantized.pytorch.builder.node_to_quantize_config import get_quantization_config
 
 
-def get_fully_quantized_pytorch_model(graph: Graph):
+def get_fully_quantized_pytorch_model(graph: Graph, use_memory_schedule: bool = False):
     """
     Convert graph to fully quantized PyTorch model.
+    If the graph's UserInformation has a memory schedule (or use_memory_schedule is set), the model executes
+    its layers by the memory schedule and releases activation tensors once they are not needed anymore.
 
     Args:
         graph: Graph to convert to a PyTorch model.
+        use_memory_schedule: Whether to compute a memory schedule for the model if the graph's UserInformation
+            doesn't have one.
 
     Returns:
         Fully quantized PyTorch model.
     """
-    return FullyQuantizedPyTorchModelBuilder(graph=graph).build_model()
+    return FullyQuantizedPyTorchModelBuilder(graph=graph, use_memory_schedule=use_memory_schedule).build_model()
 
 
 
@@ -53,14 +58,16 @@ class FullyQuantizedPyTorchModel(PytorchModel):
     """
 
     def __init__(self,
-                 graph: common.Graph):
+                 graph: common.Graph,
+                 schedule: List[BaseNode] = None):
         """
 
         Args:
             graph: Graph to build its corresponding Pytorch model.
+            schedule: Execution order of the graph's nodes (optional).
         """
 
-        super().__init__(graph)
+        super().__init__(graph, schedule=schedule)
 
 
     def _add_modules(self):
@@ -126,14 +133,18 @@ class FullyQuantizedPyTorchModelBuilder(PyTorchModelBuilder):
     """
 
     def __init__(self,
-                 graph: common.Graph):
+                 graph: common.Graph,
+                 use_memory_schedule: bool = False):
         """
 
         Args:
             graph: Graph to build the model from.
+            use_memory_schedule: Whether to compute a memory schedule for the model if the graph's
+                UserInformation doesn't have one.
         """
 
         super().__init__(graph)
+        self.use_memory_schedule = use_memory_schedule
 
     def build_model(self) -> Tuple[PytorchModel, UserInformation]:
         """
@@ -141,4 +152,8 @@ class FullyQuantizedPyTorchModelBuilder(PyTorchModelBuilder):
         Returns: Fully quantized PyTorch model and user information.
 
         """
-        return FullyQuantizedPyTorchModel(self.graph), self.graph.user_info
+        schedule = None
+        if self.use_memory_schedule or self.graph.user_info.memory_schedule is not None:
+            schedule = get_memory_schedule(self.graph)
+
+        return FullyQuantizedPyTorchModel(self.graph, schedule=schedule), self.graph.user_info
@@ -0,0 +1,118 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import os
+import pickle
+import shutil
+from typing import Any, Callable, Dict, Tuple
+
+from model_compression_toolkit.core.common import Logger
+from model_compression_toolkit.gptq.common.gptq_config import CheckpointConfig, GradientPTQConfig
+
+CHECKPOINT_DIR_PREFIX = 'checkpoint_'
+LATEST_CHECKPOINT_FILE = 'latest'
+TRAINER_STATE_FILE = 'trainer_state.pkl'
+
+
+class GPTQCheckpointManager:
+    """
+    Save GPTQ training checkpoints to a directory and load the last one.
+    Each checkpoint is saved in its own sub-directory, and a pointer file to the last complete checkpoint
+    is replaced only after the checkpoint was fully written, so a training that is stopped while saving a
+    checkpoint can still be resumed from the previous one.
+    """
+
+    def __init__(self, checkpoint_config: CheckpointConfig):
+        """
+        Args:
+            checkpoint_config: CheckpointConfig with the checkpoints directory and saving interval.
+        """
+        self.checkpoint_dir = checkpoint_config.checkpoint_dir
+        self.save_interval = checkpoint_config.save_interval
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+
+    def should_save(self, iteration: int, n_iteration: int) -> bool:
+        """
+        Args:
+            iteration: Number of training iterations done so far.
+            n_iteration: Total number of training iterations.
+
+        Returns: Whether a checkpoint should be saved after the given iteration.
+        """
+        return iteration % self.save_interval == 0 or iteration == n_iteration
+
+    def save(self,
+             iteration: int,
+             trainer_state: Dict[str, Any],
+             save_framework_state: Callable[[str], None]):
+        """
+        Save a checkpoint and remove the previous ones.
+
+        Args:
+            iteration: Number of training iterations done so far.
+            trainer_state: A dictionary of the framework-independent training state (picklable).
+            save_framework_state: A callable that gets a checkpoint directory and saves the framework's
+                training state (models variables, optimizers state, etc.) into it.
+        """
+        checkpoint_name = f'{CHECKPOINT_DIR_PREFIX}{iteration}'
+        checkpoint_path = os.path.join(self.checkpoint_dir, checkpoint_name)
+        shutil.rmtree(checkpoint_path, ignore_errors=True)
+        os.makedirs(checkpoint_path)
+
+        save_framework_state(checkpoint_path)
+        with open(os.path.join(checkpoint_path, TRAINER_STATE_FILE), 'wb') as f:
+            pickle.dump(trainer_state, f)
+
+        latest_file = os.path.join(self.checkpoint_dir, LATEST_CHECKPOINT_FILE)
+        with open(f'{latest_file}.tmp', 'w') as f:
+            f.write(checkpoint_name)
+        os.replace(f'{latest_file}.tmp', latest_file)
+
+        for name in os.listdir(self.checkpoint_dir):
+            if name.startswith(CHECKPOINT_DIR_PREFIX) and name != checkpoint_name:
+                shutil.rmtree(os.path.join(self.checkpoint_dir, name), ignore_errors=True)
+
+    def load(self) -> Tuple[str, Dict[str, Any]]:
+        """
+        Load the last checkpoint.
+
+        Returns: The directory of the last checkpoint and its framework-independent training state,
+        or (None, None) if there is no checkpoint.
+        """
+        latest_file = os.path.join(self.checkpoint_dir, LATEST_CHECKPOINT_FILE)
+        if not os.path.isfile(latest_file):
+            return None, None
+        with open(latest_file, 'r') as f:
+            checkpoint_path = os.path.join(self.checkpoint_dir, f.read().strip())
+        with open(os.path.join(checkpoint_path, TRAINER_STATE_FILE), 'rb') as f:
+            trainer_state = pickle.load(f)
+        return checkpoint_path, trainer_state
+
+
+def get_resume_gptq_config(gptq_config: GradientPTQConfig) -> GradientPTQConfig:
+    """
+    Get a copy of a GPTQ configuration that resumes the training from its last checkpoint.
+
+    Args:
+        gptq_config: GradientPTQConfig of the training to resume (must have a checkpoint configuration).
+
+    Returns: A GradientPTQConfig with resuming enabled.
+    """
+    if gptq_config is None or gptq_config.checkpoint_config is None:
+        Logger.error('Resuming GPTQ training requires a GPTQ configuration with a checkpoint_config')
+    resume_config = copy.copy(gptq_config)
+    resume_config.checkpoint_config = copy.copy(gptq_config.checkpoint_config)
+    resume_config.checkpoint_config.resume = True
+    return resume_config
@@ -38,6 +38,18 @@ class RoundingType(Enum):
     GumbelRounding = 1
 
 
+class AuxVarPrecision(Enum):
+    """
+    An enum for choosing the storage precision of the Gumbel Rounding auxiliary variables
+    0. FLOAT32
+    1. FLOAT16
+    2. BFLOAT16
+    """
+    FLOAT32 = 0
+    FLOAT16 = 1
+    BFLOAT16 = 2
+
+
 class GumbelConfig(object):
     """
     Configuration to use for quantization with Gumbel Rounding.
@@ -48,7 +60,8 @@ class GumbelConfig(object):
                  n_cycles: int = N_CYCLES,
                  minimal_temp: float = MIM_TEMP,
                  maximal_temp: float = MAX_TEMP,
-                 gumbel_entropy_regularization: float = GAMMA_TEMPERATURE):
+                 gumbel_entropy_regularization: float = GAMMA_TEMPERATURE,
+                 aux_var_precision: AuxVarPrecision = AuxVarPrecision.FLOAT32):
         """
         Initialize a GumbelConfig.
 
@@ -59,14 +72,62 @@ class GumbelConfig(object):
             n_cycles (int): A floating point number that defines the gumbel entropy regularization factor.
             minimal_temp (float): A floating point number that defines the gumbel entropy regularization factor.
             maximal_temp (float): A floating point number that defines the gumbel entropy regularization factor.
+            aux_var_precision (AuxVarPrecision): Storage precision of the auxiliary variables (and their optimizer state). The rounding itself is always computed in float32.
         """
         self.gumbel_entropy_regularization = gumbel_entropy_regularization
+        self.aux_var_precision = aux_var_precision
         self.temperature_learning = temperature_learning
         self.n_cycles = n_cycles
         self.minimal_temp = minimal_temp
         self.maximal_temp = maximal_temp
 
 
+class TeacherCacheConfig(object):
+    """
+    Configuration to use for caching the float (teacher) model's outputs during GPTQ training.
+    """
+
+    def __init__(self,
+                 num_samples: int,
+                 cache_dir: str = None,
+                 use_float16: bool = False):
+        """
+        Initialize a TeacherCacheConfig.
+
+        Args:
+            num_samples (int): Number of samples in the pool the teacher model is run on once before the training.
+            cache_dir (str): Directory to store the memory-mapped cache files in. If None, a temporary directory is used.
+            use_float16 (bool): Whether to store the teacher's outputs as float16 to halve the cache size.
+        """
+        self.num_samples = num_samples
+        self.cache_dir = cache_dir
+        self.use_float16 = use_float16
+
+
+class CheckpointConfig(object):
+    """
+    Configuration to use for saving checkpoints of the GPTQ training, and for resuming it from the last checkpoint.
+    """
+
+    def __init__(self,
+                 checkpoint_dir: str,
+                 save_interval: int = 100,
+                 resume: bool = False):
+        """
+        Initialize a CheckpointConfig.
+
+        Args:
+            checkpoint_dir (str): Directory to save the checkpoints in.
+            save_interval (int): Number of training iterations between checkpoints (a checkpoint is also saved at the end of the training). Must be a positive integer.
+            resume (bool): Whether to resume the training from the last checkpoint in checkpoint_dir (if there is one).
+        """
+        if not isinstance(save_interval, int) or isinstance(save_interval, bool) or save_interval <= 0:
+            common.Logger.error(f'GPTQ checkpoint save_interval must be a positive integer, but got: {save_interval}')
+        self.checkpoint_dir = checkpoint_dir
+        self.save_interval = save_interval
+        self.resume = resume
+
+
 class GradientPTQConfig:
     """
     Configuration to use for quantization with GradientPTQ (experimental).
@@ -91,7 +152,12 @@ class GradientPTQConfig:
                  quantizer_config: GumbelConfig = GumbelConfig(),
                  optimizer_quantization_parameter: Any = None,
                  optimizer_bias: Any = None,
-                 gumbel_scale: float = GUMBEL_SCALE):
+                 gumbel_scale: float = GUMBEL_SCALE,
+                 compiled_training_step: bool = False,
+                 teacher_cache_config: TeacherCacheConfig = None,
+                 block_wise: bool = False,
+                 checkpoint_config: CheckpointConfig = None,
+                 num_workers: int = 1):
         """
         Initialize a GradientPTQConfig.
 
@@ -117,6 +183,11 @@ class GradientPTQConfig:
             optimizer_quantization_parameter (Any): Optimizer to override the rest optimizer  for quantizer parameters.
             optimizer_bias (Any): Optimizer to override the rest optimizerfor bias.
             gumbel_scale (float): A normalization factor for the gumbel tensor values.
+            compiled_training_step (bool): Whether to trace each GPTQ training step (float and quantized models forward, loss, gradients and optimizers updates) into a single compiled graph (currently supported for Keras only).
+            teacher_cache_config (TeacherCacheConfig): If given, the float model is run once over a fixed pool of samples and its outputs are cached and streamed during the training, instead of running it on every iteration.
+            block_wise (bool): Whether to train each compare point separately (layer-wise reconstruction), using the float model's cached inputs and outputs of the layer, instead of training the entire model at once. Each block is trained for n_iter iterations, and the pool size of the cache is set by teacher_cache_config (or num_samples_for_loss, if not given).
+            checkpoint_config (CheckpointConfig): If given, the training state (trainable variables, optimizers state, iteration and loss history) is periodically saved, and the training can be resumed from the last checkpoint (not supported with block_wise).
+            num_workers (int): Number of parallel training processes. Each process trains a replica of the quantized model on an equal shard of each batch, and the gradients are averaged between the processes, so the training is equivalent to a single-process training. The loss must average over the batch samples, such as multiple_tensors_sample_mse_loss, which is the default of get_pytorch_gptq_config with num_workers > 1 (losses that are normalized per batch, such as multiple_tensors_mse_loss, are rejected). With block_wise, the blocks don't depend on each other, so they are distributed between the processes instead, and each block is trained on full batches. The processes are forked, so it is supported for Pytorch models on CPU only. The log function is called in the calling process.
 
         """
         self.n_iter = n_iter
@@ -140,6 +211,13 @@ class GradientPTQConfig:
         self.optimizer_quantization_parameter = optimizer_quantization_parameter
         self.optimizer_bias = optimizer_bias
         self.gumbel_scale = gumbel_scale
+        self.compiled_training_step = compiled_training_step
+        self.teacher_cache_config = teacher_cache_config
+        self.block_wise = block_wise
+        if checkpoint_config is not None and block_wise:
+            common.Logger.error("GPTQ checkpointing is not supported in block-wise training")
+        self.checkpoint_config = checkpoint_config
+        self.num_workers = num_workers
 
     @property
     def is_gumbel(self) -> bool:
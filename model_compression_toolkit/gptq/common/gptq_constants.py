@@ -7,3 +7,11 @@ TEMP = '_temp'
 WEIGHTS_QUANTIZATION_PARAMS = 'weights_quantization_params'
 PTQ_MIN_RANGE = "_min_range"
 PTQ_MAX_RANGE = "_max_range"
+
+# GPTQ checkpoint state
+ITERATION = 'iteration'
+LOSS_LIST = 'loss_list'
+WEIGHTS_FOR_AVERAGE_LOSS = 'weights_for_average_loss'
+NUMPY_RANDOM_STATE = 'numpy_random_state'
+QUANTIZERS_SEEDS = 'quantizers_seeds'
+QUANTIZERS_ITERATIONS = 'quantizers_iterations'
@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Tuple, List
-from model_compression_toolkit.core.common.graph.base_graph import Graph
+import copy
+from typing import Tuple, List, Callable
+
+from model_compression_toolkit.core.common.graph.base_graph import Graph, OutTensor
 from model_compression_toolkit.core.common.graph.base_node import BaseNode
+from model_compression_toolkit.core.common.graph.edge import Edge, EDGE_SINK_INDEX
 
 
 def get_compare_points(input_graph: Graph) -> Tuple[List[BaseNode], List[str], List, List]:
@@ -42,3 +45,57 @@ def get_compare_points(input_graph: Graph) -> Tuple[List[BaseNode], List[str], L
             compare_points_std.append(n.prior_info.std_output)
             compare_points_mean.append(n.prior_info.mean_output)
     return compare_points, compare_points_name, compare_points_mean, compare_points_std
+
+
+def get_block_input_tensors(input_graph: Graph, compare_point: BaseNode) -> List[Tuple[BaseNode, int]]:
+    """
+    Get the tensors a GPTQ block (a compare point node) gets as inputs.
+
+    Args:
+        input_graph: Graph the compare point belongs to.
+        compare_point: Compare point node of the block.
+
+    Returns:
+        A list of the block's input tensors, each as a tuple of the node that outputs it and its output index,
+        ordered by the inputs order of the compare point.
+    """
+    return [(ie.source_node, ie.source_index)
+            for ie in input_graph.incoming_edges(compare_point, sort_by_attr=EDGE_SINK_INDEX)]
+
+
+def build_block_graph(input_graph: Graph,
+                      compare_point: BaseNode,
+                      create_input_node: Callable) -> Graph:
+    """
+    Build a graph of a single GPTQ block, for layer-wise reconstruction of a compare point.
+    The block graph holds the compare point node, and an input node instead of each of its input tensors.
+    An input node uses the activation quantization configuration of the node that outputs the tensor in the
+    original graph, so the block's inputs are quantized the same way they are quantized in the original graph.
+
+    Args:
+        input_graph: Graph the compare point belongs to.
+        compare_point: Compare point node of the block.
+        create_input_node: A framework-specific function that gets a name and an output shape and creates
+            an input node.
+
+    Returns:
+        A graph of the block.
+    """
+    input_nodes, edges = [], []
+    for i, (source_node, source_index) in enumerate(get_block_input_tensors(input_graph, compare_point)):
+        output_shape = source_node.output_shape[source_index] if isinstance(source_node.output_shape, list) \
+            else source_node.output_shape
+        input_node = create_input_node(f'{compare_point.name}_block_input_{i}', output_shape)
+        input_node.candidates_quantization_cfg = copy.deepcopy(source_node.candidates_quantization_cfg)
+        input_node.final_activation_quantization_cfg = copy.deepcopy(source_node.final_activation_quantization_cfg)
+        input_nodes.append(input_node)
+        edges.append(Edge(input_node, compare_point, 0, i))
+
+    block_graph = Graph(f'{compare_point.name}_block',
+                        nodes=input_nodes + [compare_point],
+                        input_nodes=input_nodes,
+                        output_nodes=[OutTensor(compare_point, 0)],
+                        edge_list=edges,
+                        fw_info=input_graph.fw_info)
+    block_graph.user_info = copy.copy(input_graph.user_info)
+    return block_graph
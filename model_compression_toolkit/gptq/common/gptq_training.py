@@ -15,12 +15,17 @@
 import copy
 from abc import ABC, abstractmethod
 import numpy as np
-from typing import Callable, List, Any
-from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig
+from typing import Callable, List, Any, Tuple
+from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig, TeacherCacheConfig
+from model_compression_toolkit.gptq.common.gptq_constants import ITERATION, LOSS_LIST, WEIGHTS_FOR_AVERAGE_LOSS, \
+    NUMPY_RANDOM_STATE
 from model_compression_toolkit.core.common import Graph, Logger, BaseNode
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
-from model_compression_toolkit.gptq.common.gptq_graph import get_compare_points
+from model_compression_toolkit.gptq.common.gptq_graph import get_compare_points, get_block_input_tensors, \
+    build_block_graph
+from model_compression_toolkit.gptq.common.teacher_activation_cache import TeacherActivationCache
+from model_compression_toolkit.gptq.common.gptq_checkpoint import GPTQCheckpointManager
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
 
 
@@ -59,12 +64,27 @@ class GPTQTrainer(ABC):
         # ----------------------------------------------
         self.compare_points, _, self.compare_points_mean, self.compare_points_std = get_compare_points(self.graph_float)
 
+        if self.gptq_config.block_wise:
+            # In block-wise training, the float model is the teacher of all the blocks, so it outputs their
+            # inputs as well. A quantized model is built for each block separately, so no full quantized model.
+            _, _, float_model_outputs = self._get_block_wise_teacher_tensors()
+        else:
+            float_model_outputs = self.compare_points
+
         self.float_model, self.float_user_info = fw_impl.model_builder(self.graph_float,
                                                                        mode=ModelBuilderMode.FLOAT,
-                                                                       append2output=self.compare_points,
+                                                                       append2output=float_model_outputs,
                                                                        fw_info=self.fw_info)
 
-        self.fxp_model, self.gptq_user_info = self.build_gptq_model()
+        if self.gptq_config.block_wise:
+            self.fxp_model, self.gptq_user_info = None, None
+        else:
+            self.fxp_model, self.gptq_user_info = self.build_gptq_model()
+
+        self.input_scale = 1
+        self.teacher_activation_cache = None
+        self.checkpoint_manager = None if gptq_config.checkpoint_config is None else \
+            GPTQCheckpointManager(gptq_config.checkpoint_config)
 
     def get_optimizer_with_param(self,
                                  flattened_trainable_weights: List[Any],
@@ -123,25 +143,25 @@ class GPTQTrainer(ABC):
         Returns: A vector of weights, one for each compare point,
         to be used for the loss metric weighted average computation when running GPTQ training.
         """
-        if self.gptq_config.use_jac_based_weights:
+        # In block-wise training each compare point is trained separately, so its loss is not weighted
+        if self.gptq_config.use_jac_based_weights and not self.gptq_config.block_wise:
             images = self._generate_images_batch(representative_data_gen, self.gptq_config.num_samples_for_loss)
 
             model_output_replacement = self._get_model_output_replacement()
 
-            points_apprx_jacobians_weights = []
-            for i in range(1, images.shape[0] + 1):
-                # Note that in GPTQ loss weights computation we assume that there aren't replacement output nodes,
-                # therefore, output_list is just the graph outputs, and we don't need the tuning factor for
-                # defining the output weights (since the output layer is not a compare point).
-                image_ip_gradients = self.fw_impl.model_grad(self.graph_float,
-                                                             {inode: self.fw_impl.to_tensor(images[i - 1:i]) for inode in
-                                                              self.graph_float.get_inputs()},
-                                                             self.compare_points,
-                                                             output_list=model_output_replacement,
-                                                             all_outputs_indices=[],
-                                                             alpha=0,
-                                                             norm_weights=self.gptq_config.norm_weights)
-                points_apprx_jacobians_weights.append(image_ip_gradients)
+            # Note that in GPTQ loss weights computation we assume that there aren't replacement output nodes,
+            # therefore, output_list is just the graph outputs, and we don't need the tuning factor for
+            # defining the output weights (since the output layer is not a compare point).
+            # The weights of all the images are computed in a single batch.
+            points_apprx_jacobians_weights = self.fw_impl.batched_model_grad(self.graph_float,
+                                                                             {inode: self.fw_impl.to_tensor(images)
+                                                                              for inode in
+                                                                              self.graph_float.get_inputs()},
+                                                                             self.compare_points,
+                                                                             output_list=model_output_replacement,
+                                                                             all_outputs_indices=[],
+                                                                             alpha=0,
+                                                                             norm_weights=self.gptq_config.norm_weights)
             return np.mean(points_apprx_jacobians_weights, axis=0)
         else:
             num_nodes = len(self.compare_points)
@@ -178,6 +198,245 @@ class GPTQTrainer(ABC):
         return np.concatenate(images, axis=0)
 
 
+    def _build_teacher_activation_cache(self, representative_data_gen: Callable):
+        """
+        If a teacher cache is configured, run the float model once over a pool of samples from the
+        representative dataset and cache its outputs, to be streamed during the training.
+
+        Args:
+            representative_data_gen: Dataset to draw the cached pool from.
+
+        """
+        cache_config = self.gptq_config.teacher_cache_config
+        if cache_config is not None:
+            self.teacher_activation_cache = TeacherActivationCache(num_samples=cache_config.num_samples,
+                                                                   cache_dir=cache_config.cache_dir,
+                                                                   use_float16=cache_config.use_float16)
+            self.teacher_activation_cache.build(representative_data_gen,
+                                                lambda input_data: [self.fw_impl.to_numpy(y) for y in
+                                                                    self.run_float_model(self.float_model,
+                                                                                         input_data)],
+                                                input_scale=self.input_scale)
+
+    def _release_teacher_activation_cache(self):
+        """
+        Release the teacher cache (if it was built) at the end of the training.
+        """
+        if self.teacher_activation_cache is not None:
+            self.teacher_activation_cache.close()
+            self.teacher_activation_cache = None
+
+    def _get_training_batch(self, data_function: Callable) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """
+        Get the inputs of the next training iteration, and the float model's outputs on them if they are cached.
+
+        Args:
+            data_function: A callable function that give a batch of samples.
+
+        Returns: A list of (scaled) inputs, and a list of the float model's outputs (None if they are not cached).
+
+        """
+        if self.teacher_activation_cache is not None:
+            return self.teacher_activation_cache.get_batch()
+        return [d * self.input_scale for d in data_function()], None
+
+    def _restore_checkpoint(self) -> int:
+        """
+        If resuming is configured and a checkpoint exists, restore the training state from the last checkpoint.
+
+        Returns: Number of training iterations that were already done (0 if the training starts from scratch).
+
+        """
+        if self.checkpoint_manager is None or not self.gptq_config.checkpoint_config.resume:
+            return 0
+        checkpoint_path, trainer_state = self.checkpoint_manager.load()
+        if checkpoint_path is None:
+            Logger.warning(f'No GPTQ checkpoint found in {self.checkpoint_manager.checkpoint_dir}, '
+                           f'training from scratch')
+            return 0
+
+        self.load_training_state(checkpoint_path)
+        self.loss_list = trainer_state[LOSS_LIST]
+        self.weights_for_average_loss = self.fw_impl.to_tensor(trainer_state[WEIGHTS_FOR_AVERAGE_LOSS])
+        np.random.set_state(trainer_state[NUMPY_RANDOM_STATE])
+        Logger.info(f'Resuming GPTQ training from iteration {trainer_state[ITERATION]}')
+        return trainer_state[ITERATION]
+
+    def _save_checkpoint(self, iteration: int, n_iteration: int):
+        """
+        Save a checkpoint of the training state, if checkpointing is configured and the iteration is a
+        checkpoint iteration (or the last one).
+
+        Args:
+            iteration: Number of training iterations done so far.
+            n_iteration: Total number of training iterations.
+
+        """
+        if self.checkpoint_manager is None or not self.checkpoint_manager.should_save(iteration, n_iteration):
+            return
+        trainer_state = {ITERATION: iteration,
+                         LOSS_LIST: self.loss_list,
+                         WEIGHTS_FOR_AVERAGE_LOSS: np.asarray(self.fw_impl.to_numpy(self.weights_for_average_loss),
+                                                              dtype=np.float32),
+                         NUMPY_RANDOM_STATE: np.random.get_state()}
+        self.checkpoint_manager.save(iteration, trainer_state, self.save_training_state)
+
+    def train_block_wise(self, representative_data_gen: Callable):
+        """
+        Train each compare point of the quantized graph separately (layer-wise reconstruction).
+        The float model is run once over a pool of samples, and the inputs and outputs of all compare points
+        are cached on disk. Then, each block (a compare point with its quantized inputs) is built as a separate
+        model and trained to reconstruct the float outputs from the float inputs, so the training memory is
+        bounded by the largest block. Since the blocks are trained on float inputs, they don't depend on each other.
+
+        Args:
+            representative_data_gen: Dataset to draw the cached pool from.
+
+        """
+        quant_compare_points = [self.graph_quant.find_node_by_name(n.name)[0] for n in self.compare_points]
+        teacher_tensors, blocks_tensors_indices, teacher_nodes = self._get_block_wise_teacher_tensors()
+
+        def _teacher_fn(input_data: List[np.ndarray]) -> List[np.ndarray]:
+            outputs = self.run_float_model(self.float_model, input_data)
+            teacher_outputs = []
+            for node_name, output_index in teacher_tensors:
+                node_outputs = outputs[[n.name for n in teacher_nodes].index(node_name)]
+                teacher_outputs.append(self.fw_impl.to_numpy(node_outputs[output_index] if
+                                                             isinstance(node_outputs, list) else node_outputs))
+            return teacher_outputs
+
+        cache_config = self.gptq_config.teacher_cache_config
+        if cache_config is None:
+            cache_config = TeacherCacheConfig(num_samples=self.gptq_config.num_samples_for_loss)
+        cache = TeacherActivationCache(num_samples=cache_config.num_samples,
+                                       cache_dir=cache_config.cache_dir,
+                                       use_float16=cache_config.use_float16,
+                                       store_inputs=False)
+        cache.build(representative_data_gen, _teacher_fn, input_scale=self.input_scale)
+
+        def _get_block(block_index: int) -> Tuple[Graph, Callable]:
+            block_graph = build_block_graph(self.graph_quant,
+                                            quant_compare_points[block_index],
+                                            self.create_block_input_node)
+
+            def _block_data_function(indices=blocks_tensors_indices[block_index]):
+                _, block_tensors = cache.get_batch(indices)
+                return block_tensors[:-1], block_tensors[-1:]
+
+            return block_graph, _block_data_function
+
+        try:
+            self.train_blocks(_get_block, len(quant_compare_points))
+        finally:
+            cache.close()
+
+    def train_blocks(self, get_block: Callable, n_blocks: int):
+        """
+        Train the GPTQ blocks one after another. Since the blocks are trained on the cached float inputs and
+        outputs, they don't depend on each other, so a framework can override it to train them in parallel.
+
+        Args:
+            get_block: A callable that gets a block index, and returns the block's graph and its data function.
+            n_blocks: Number of blocks (compare points) to train.
+
+        """
+        for block_index in range(n_blocks):
+            block_graph, data_function = get_block(block_index)
+            Logger.info(f'GPTQ: training block {block_index + 1}/{n_blocks} '
+                        f'of {block_graph.get_outputs()[0].node.name}')
+            self.train_block(block_graph, block_index, data_function)
+
+    def _get_block_wise_teacher_tensors(self) -> Tuple[List[Tuple[str, int]], List[List[int]], List[BaseNode]]:
+        """
+        Collect the float tensors to cache for block-wise training: the inputs of each block and its
+        compare point output.
+
+        Returns: A list of the cached tensors (as node name and output index pairs), a list of the indices of
+        each block's tensors in it (the block's inputs and then its output), and a list of the float graph's
+        nodes that output the cached tensors.
+        """
+        teacher_tensors, blocks_tensors_indices = [], []
+        for compare_point in self.compare_points:
+            compare_point = self.graph_quant.find_node_by_name(compare_point.name)[0]
+            block_tensors = [(n.name, i) for n, i in get_block_input_tensors(self.graph_quant, compare_point)] + \
+                            [(compare_point.name, 0)]
+            for t in block_tensors:
+                if t not in teacher_tensors:
+                    teacher_tensors.append(t)
+            blocks_tensors_indices.append([teacher_tensors.index(t) for t in block_tensors])
+
+        teacher_nodes = []
+        for node_name, _ in teacher_tensors:
+            node = self.graph_float.find_node_by_name(node_name)[0]
+            if node not in teacher_nodes:
+                teacher_nodes.append(node)
+        return teacher_tensors, blocks_tensors_indices, teacher_nodes
+
+    @abstractmethod
+    def train_block(self, block_graph: Graph, compare_point_index: int, data_function: Callable):
+        """
+        Train a single GPTQ block, and update the quantized graph with the block's trained parameters.
+
+        Args:
+            block_graph: Graph of the block (a compare point and its input nodes).
+            compare_point_index: Index of the block's compare point in the compare points list.
+            data_function: A callable that returns a list of the block's float inputs and a list of its
+                float outputs.
+        """
+        raise NotImplemented(f'{self.__class__.__name__} have to implement the '
+                             f'framework\'s train_block method.')
+
+    @abstractmethod
+    def create_block_input_node(self, name: str, output_shape: Tuple[Any]) -> BaseNode:
+        """
+        Create an input node for a GPTQ block graph.
+
+        Args:
+            name: Name of the node.
+            output_shape: Shape of the node's output tensor.
+
+        Returns: An input node.
+        """
+        raise NotImplemented(f'{self.__class__.__name__} have to implement the '
+                             f'framework\'s create_block_input_node method.')
+
+    @abstractmethod
+    def run_float_model(self, float_model: Any, input_data: List[np.ndarray]) -> List[Any]:
+        """
+        Run a float (teacher) model.
+
+        Args:
+            float_model: Float model to run.
+            input_data: A list of input arrays.
+
+        Returns: A list of the float model's outputs (for each of its output nodes).
+        """
+        raise NotImplemented(f'{self.__class__.__name__} have to implement the '
+                             f'framework\'s run_float_model method.')
+
+    @abstractmethod
+    def save_training_state(self, checkpoint_path: str):
+        """
+        Save the framework's training state (the quantized model's variables, the optimizers' state and the
+        random generators' state) to a checkpoint directory.
+
+        Args:
+            checkpoint_path: Directory of the checkpoint.
+        """
+        raise NotImplemented(f'{self.__class__.__name__} have to implement the '
+                             f'framework\'s save_training_state method.')
+
+    @abstractmethod
+    def load_training_state(self, checkpoint_path: str):
+        """
+        Load the framework's training state from a checkpoint directory.
+
+        Args:
+            checkpoint_path: Directory of the checkpoint.
+        """
+        raise NotImplemented(f'{self.__class__.__name__} have to implement the '
+                             f'framework\'s load_training_state method.')
+
     @abstractmethod
     def build_gptq_model(self):
         """
@@ -0,0 +1,161 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import shutil
+import tempfile
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from model_compression_toolkit.core.common import Logger
+
+INPUT_FILE_PREFIX = 'input'
+TEACHER_OUTPUT_FILE_PREFIX = 'teacher_output'
+
+
+class TeacherActivationCache:
+    """
+    A disk-backed cache of a pool of input batches and the float (teacher) model's outputs on them.
+    The teacher model is run once over the pool, and its outputs are stored in memory-mapped files,
+    so GPTQ training can stream the inputs and the teacher outputs instead of running the teacher
+    model on every iteration.
+    """
+
+    def __init__(self,
+                 num_samples: int,
+                 cache_dir: str = None,
+                 use_float16: bool = False,
+                 store_inputs: bool = True):
+        """
+        Args:
+            num_samples: Number of samples in the cached pool (rounded up to whole batches).
+            cache_dir: Directory to store the cache files in. If None, a temporary directory is used
+                (and deleted when the cache is closed).
+            use_float16: Whether to store the teacher outputs as float16 (inputs are always stored as float32).
+            store_inputs: Whether to store the inputs of the teacher (if only its outputs are needed for
+                the training, they are not stored).
+        """
+        self.num_samples = num_samples
+        self.use_float16 = use_float16
+        self.store_inputs = store_inputs
+        self.is_temp_dir = cache_dir is None
+        self.cache_dir = tempfile.mkdtemp() if self.is_temp_dir else cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self.inputs = None
+        self.teacher_outputs = None
+        self.batch_size = None
+        self.num_batches = 0
+        self.batches_order = []
+
+    def build(self,
+              representative_data_gen: Callable,
+              teacher_fn: Callable,
+              input_scale: float = 1):
+        """
+        Draw batches from the representative dataset until the pool is full, run the teacher on each
+        batch and write the (scaled) inputs and the teacher outputs into the cache files.
+
+        Args:
+            representative_data_gen: Dataset to draw the pool's batches from.
+            teacher_fn: A callable that gets a list of input arrays and returns a list of the teacher's
+                output arrays.
+            input_scale: Scale factor to apply on the inputs.
+
+        """
+        data = [d * input_scale for d in representative_data_gen()]
+        self.batch_size = data[0].shape[0]
+        self.num_batches = int(np.ceil(self.num_samples / self.batch_size))
+
+        for batch_index in range(self.num_batches):
+            if batch_index > 0:
+                data = [d * input_scale for d in representative_data_gen()]
+            if data[0].shape[0] != self.batch_size:
+                Logger.critical(f'Caching teacher activations requires a constant batch size, '
+                                f'expected {self.batch_size} but got {data[0].shape[0]}')  # pragma: no cover
+            outputs = teacher_fn(data)
+
+            if not self.store_inputs:
+                data = []
+            if self.inputs is None:
+                self.inputs = self._open_cache_files(INPUT_FILE_PREFIX, data, np.float32)
+                self.teacher_outputs = self._open_cache_files(TEACHER_OUTPUT_FILE_PREFIX, outputs,
+                                                              np.float16 if self.use_float16 else np.float32)
+
+            batch_slice = self._batch_slice(batch_index)
+            for cached, d in zip(self.inputs + self.teacher_outputs, data + outputs):
+                cached[batch_slice] = d
+
+        for cached in self.inputs + self.teacher_outputs:
+            cached.flush()
+
+    def _open_cache_files(self,
+                          prefix: str,
+                          batch_arrays: List[np.ndarray],
+                          dtype: type) -> List[np.memmap]:
+        """
+        Create a memory-mapped file for each array in a batch, with room for the entire pool.
+
+        Args:
+            prefix: Prefix of the files names.
+            batch_arrays: A batch of arrays to create their files.
+            dtype: Data type of the files.
+
+        Returns: A list of memory-mapped arrays.
+
+        """
+        return [np.lib.format.open_memmap(os.path.join(self.cache_dir, f'{prefix}_{i}.npy'),
+                                          mode='w+',
+                                          dtype=dtype,
+                                          shape=(self.num_batches * self.batch_size, *a.shape[1:]))
+                for i, a in enumerate(batch_arrays)]
+
+    def _batch_slice(self, batch_index: int) -> slice:
+        """
+        Args:
+            batch_index: Index of a batch in the pool.
+
+        Returns: The slice of the batch in the cache files.
+
+        """
+        return slice(batch_index * self.batch_size, (batch_index + 1) * self.batch_size)
+
+    def get_batch(self, outputs_indices: List[int] = None) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """
+        Stream the next batch from the pool. The pool's batches are read in a random order,
+        which is reshuffled after each pass over the pool.
+
+        Args:
+            outputs_indices: Indices of the teacher outputs to read (if None, all outputs are read).
+
+        Returns: A list of input arrays and a list of the teacher's float32 output arrays of the batch.
+
+        """
+        if len(self.batches_order) == 0:
+            self.batches_order = list(np.random.permutation(self.num_batches))
+        batch_slice = self._batch_slice(self.batches_order.pop())
+
+        teacher_outputs = self.teacher_outputs if outputs_indices is None else \
+            [self.teacher_outputs[i] for i in outputs_indices]
+        return [np.asarray(cached[batch_slice]) for cached in self.inputs], \
+               [np.asarray(cached[batch_slice], dtype=np.float32) for cached in teacher_outputs]
+
+    def close(self):
+        """
+        Release the cache files (and delete them, if they are stored in a temporary directory).
+        """
+        self.inputs, self.teacher_outputs = None, None
+        if self.is_temp_dir:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
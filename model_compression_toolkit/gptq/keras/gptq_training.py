@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Callable, List, Tuple
+import os
+from typing import Any, Callable, List, Tuple
 
 import tensorflow as tf
 from tensorflow_model_optimization.python.core.quantization.keras.quantize_wrapper import QuantizeWrapper
@@ -30,18 +31,24 @@ else:
 from model_compression_toolkit.core import common
 from model_compression_toolkit.gptq.common.gptq_training import GPTQTrainer
 from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig
-from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.gptq.keras.graph_info import get_trainable_parameters, get_weights_for_loss, \
     get_gumbel_probability
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 import numpy as np
 import copy
-from model_compression_toolkit.core.keras.constants import BIAS, USE_BIAS
+from model_compression_toolkit.core.keras.constants import BIAS, USE_BIAS, LAYER_NAME
+from model_compression_toolkit.core.keras.back2framework.keras_model_builder import BATCH_INPUT_SHAPE
 from model_compression_toolkit.gptq.keras.quantizer import WeightQuantizeConfig
+from model_compression_toolkit.gptq.keras.quantizer.gumbel_rounding.base_gumbel_rounding import GumbelRoundingBase
+from model_compression_toolkit.gptq.common.gptq_constants import QUANTIZERS_SEEDS
 from model_compression_toolkit.gptq.keras.optimizers.sam_optimizer import SAM
 
 
+TF_CHECKPOINT_PREFIX = 'tf_state'
+
+
 class KerasGPTQTrainer(GPTQTrainer):
     """
     Keras GPTQ training class for fine-tuning a quantized model
@@ -75,35 +82,40 @@ class KerasGPTQTrainer(GPTQTrainer):
                          fw_info)
 
         self.loss_list = []
-        self.input_scale = 1
+        # Compiled training steps, by the gradients function, optimizers and training mode they were built with
+        self.compiled_training_steps = {}
 
-        trainable_weights, bias_weights, trainable_threshold, temperature_weights = get_trainable_parameters(
-            self.fxp_model,
-            fw_info,
-            add_bias=True,
-            is_gumbel=gptq_config.is_gumbel)
-
-        self.flp_weights_list, self.fxp_weights_list = get_weights_for_loss(self.fxp_model)
-
-        if not (len(self.compare_points) == len(trainable_weights) == len(self.flp_weights_list) == len(
-                self.fxp_weights_list)):
-            raise Exception(
-                "GPTQ: Mismatch between number of compare points, number of layers with trainable weights " +
-                "and number of float and quantized weights for loss")
-
-        flattened_trainable_weights = [w for layer_weights in trainable_weights for w in layer_weights]
-        flattened_bias_weights = [w for layer_weights in bias_weights for w in layer_weights]
-        trainable_quantization_parameters = trainable_threshold
-        self.optimizer_with_param = self.get_optimizer_with_param(flattened_trainable_weights,
-                                                                  flattened_bias_weights,
-                                                                  trainable_quantization_parameters,
-                                                                  temperature_weights)
-        self.has_params_to_train = np.sum([len(optimizer_params_tuple[1]) for optimizer_params_tuple in self.optimizer_with_param])>0
-
-        if self.float_user_info.input_scale != self.gptq_user_info.input_scale:
-            common.Logger.error("Input scale mismatch between float and GPTQ networks")  # pragma: no cover
+        if self.gptq_config.block_wise:
+            # The trainable parameters and optimizers are created for each block in train_block
+            self.input_scale = self.float_user_info.input_scale
         else:
-            self.input_scale = self.gptq_user_info.input_scale
+            trainable_weights, bias_weights, trainable_threshold, temperature_weights = get_trainable_parameters(
+                self.fxp_model,
+                fw_info,
+                add_bias=True,
+                is_gumbel=gptq_config.is_gumbel)
+
+            self.flp_weights_list, self.fxp_weights_list = get_weights_for_loss(self.fxp_model)
+
+            if not (len(self.compare_points) == len(trainable_weights) == len(self.flp_weights_list) == len(
+                    self.fxp_weights_list)):
+                raise Exception(
+                    "GPTQ: Mismatch between number of compare points, number of layers with trainable weights " +
+                    "and number of float and quantized weights for loss")
+
+            flattened_trainable_weights = [w for layer_weights in trainable_weights for w in layer_weights]
+            flattened_bias_weights = [w for layer_weights in bias_weights for w in layer_weights]
+            trainable_quantization_parameters = trainable_threshold
+            self.optimizer_with_param = self.get_optimizer_with_param(flattened_trainable_weights,
+                                                                      flattened_bias_weights,
+                                                                      trainable_quantization_parameters,
+                                                                      temperature_weights)
+            self.has_params_to_train = np.sum([len(optimizer_params_tuple[1]) for optimizer_params_tuple in self.optimizer_with_param])>0
+
+            if self.float_user_info.input_scale != self.gptq_user_info.input_scale:
+                common.Logger.error("Input scale mismatch between float and GPTQ networks")  # pragma: no cover
+            else:
+                self.input_scale = self.gptq_user_info.input_scale
 
         self.weights_for_average_loss = self.compute_jacobian_based_weights(representative_data_gen)
 
@@ -141,26 +153,14 @@ class KerasGPTQTrainer(GPTQTrainer):
 
         with tf.GradientTape(persistent=True) as tape:
             y_fxp = self.fxp_model(input_data, training=training)  # running fxp model
-            loss_value = self.gptq_config.loss(y_fxp,
-                                               in_y_float,
-                                               self.fxp_weights_list,
-                                               self.flp_weights_list,
-                                               self.compare_points_mean,
-                                               self.compare_points_std,
-                                               self.weights_for_average_loss)
-
-            if self.gptq_config.is_gumbel and self.gptq_config.quantizer_config.temperature_learning:
-                gumbel_prob = get_gumbel_probability(self.fxp_model)
-                gumbel_reg = 0
-                for p in gumbel_prob:
-                    entropy = -tf.reduce_mean(
-                        tf.reduce_sum(p * tf.math.log(tf.maximum(p,
-                                                                 self.gptq_config.eps)),
-                                      axis=0))
-
-                    gumbel_reg += entropy
-                gumbel_reg /= len(gumbel_prob)
-                loss_value += self.gptq_config.quantizer_config.gumbel_entropy_regularization * gumbel_reg
+            loss_value = self._compute_loss(self.fxp_model,
+                                            y_fxp,
+                                            in_y_float,
+                                            self.fxp_weights_list,
+                                            self.flp_weights_list,
+                                            self.compare_points_mean,
+                                            self.compare_points_std,
+                                            self.weights_for_average_loss)
 
         # Use the gradient tape to automatically retrieve
         # the gradients of the trainable variables with respect to the loss.
@@ -172,12 +172,69 @@ class KerasGPTQTrainer(GPTQTrainer):
             i += len(p)
         return loss_value, res
 
+    def _compute_loss(self,
+                      model: tf.keras.Model,
+                      y_fxp: List[tf.Tensor],
+                      y_float: List[tf.Tensor],
+                      fxp_weights_list: List[List[tf.Tensor]],
+                      flp_weights_list: List[List[tf.Tensor]],
+                      compare_points_mean: List,
+                      compare_points_std: List,
+                      weights_for_average_loss: np.ndarray) -> tf.Tensor:
+        """
+        Compute the GPTQ loss of a quantized model's outputs, including the Gumbel entropy regularization
+        (if temperature learning is enabled).
+
+        Args:
+            model: Quantized model the outputs were computed by.
+            y_fxp: A list of the quantized model's outputs.
+            y_float: A list of reference tensors from the floating point network.
+            fxp_weights_list: A list of the quantized model's weights for the loss.
+            flp_weights_list: A list of the float model's weights for the loss.
+            compare_points_mean: A list of the compare points' mean values.
+            compare_points_std: A list of the compare points' std values.
+            weights_for_average_loss: A vector of weights to compute weighted average loss.
+
+        Returns:
+            Loss value.
+        """
+        loss_value = self.gptq_config.loss(y_fxp,
+                                           y_float,
+                                           fxp_weights_list,
+                                           flp_weights_list,
+                                           compare_points_mean,
+                                           compare_points_std,
+                                           weights_for_average_loss)
+
+        if self.gptq_config.is_gumbel and self.gptq_config.quantizer_config.temperature_learning:
+            gumbel_prob = get_gumbel_probability(model)
+            gumbel_reg = 0
+            for p in gumbel_prob:
+                entropy = -tf.reduce_mean(
+                    tf.reduce_sum(p * tf.math.log(tf.maximum(p,
+                                                             self.gptq_config.eps)),
+                                  axis=0))
+
+                gumbel_reg += entropy
+            gumbel_reg /= len(gumbel_prob)
+            loss_value += self.gptq_config.quantizer_config.gumbel_entropy_regularization * gumbel_reg
+        return loss_value
+
     def train(self, representative_data_gen: Callable):
         """
         Train the quantized model using GPTQ training process in Keras framework
         Args:
             representative_data_gen: Dataset to use for inputs of the models.
         """
+        if self.gptq_config.num_workers > 1:
+            # The Tensorflow runtime can't be used in forked processes
+            common.Logger.warning('Parallel GPTQ training is currently supported for Pytorch only, '
+                                  'training in a single process')
+
+        if self.gptq_config.block_wise:
+            self.train_block_wise(representative_data_gen)
+            return
+
         compute_gradients = self.compute_gradients
         if self.gptq_config.sam_optimization:
             sam = SAM(self.fxp_model, self.compute_gradients, self.optimizer_with_param, self.gptq_config.rho)
@@ -187,11 +244,104 @@ class KerasGPTQTrainer(GPTQTrainer):
         # Training loop
         # ----------------------------------------------
         if self.has_params_to_train:
-            self.micro_training_loop(representative_data_gen,
-                                     compute_gradients,
-                                     self.optimizer_with_param,
-                                     self.gptq_config.n_iter,
-                                     True)
+            self._build_teacher_activation_cache(representative_data_gen)
+            try:
+                self.micro_training_loop(representative_data_gen,
+                                         compute_gradients,
+                                         self.optimizer_with_param,
+                                         self.gptq_config.n_iter,
+                                         True)
+            finally:
+                self._release_teacher_activation_cache()
+
+    def train_block(self, block_graph: Graph, compare_point_index: int, data_function: Callable):
+        """
+        Train a single GPTQ block, and update the quantized graph with the block's trained parameters.
+
+        Args:
+            block_graph: Graph of the block (a compare point and its input nodes).
+            compare_point_index: Index of the block's compare point in the compare points list.
+            data_function: A callable that returns a list of the block's float inputs and a list of its
+                float outputs.
+        """
+        block_model, _ = GPTQKerasModelBuilder(graph=block_graph,
+                                               gptq_config=self.gptq_config,
+                                               append2output=[block_graph.get_outputs()[0].node],
+                                               fw_info=self.fw_info,
+                                               return_float_outputs=True).build_model()
+
+        trainable_weights, bias_weights, trainable_threshold, temperature_weights = get_trainable_parameters(
+            block_model,
+            self.fw_info,
+            add_bias=True,
+            is_gumbel=self.gptq_config.is_gumbel)
+        flp_weights_list, fxp_weights_list = get_weights_for_loss(block_model)
+        optimizer_with_param = self.get_optimizer_with_param([w for ws in trainable_weights for w in ws],
+                                                             [w for ws in bias_weights for w in ws],
+                                                             trainable_threshold,
+                                                             temperature_weights)
+        # Each block is trained with fresh copies of the configured optimizers, so their state (slots and
+        # iterations) doesn't carry over from the previous blocks
+        optimizer_with_param = [(optimizer.__class__.from_config(optimizer.get_config()), params)
+                                for optimizer, params in optimizer_with_param]
+        param2grad = [p for _, params in optimizer_with_param for p in params]
+        if len(param2grad) == 0:
+            return  # pragma: no cover
+
+        for _ in tqdm(range(int(self.gptq_config.n_iter))):
+            input_data, y_float = data_function()
+            with tf.GradientTape() as tape:
+                y_fxp = block_model(input_data, training=True)
+                if not isinstance(y_fxp, list):
+                    y_fxp = [y_fxp]
+                loss_value = self._compute_loss(block_model,
+                                                y_fxp,
+                                                y_float,
+                                                fxp_weights_list,
+                                                flp_weights_list,
+                                                [self.compare_points_mean[compare_point_index]],
+                                                [self.compare_points_std[compare_point_index]],
+                                                np.ones(1))
+            grads = tape.gradient(loss_value, param2grad)
+            i = 0
+            for o, p in optimizer_with_param:
+                o.apply_gradients(zip(grads[i:(i + len(p))], p))
+                i += len(p)
+            self.loss_list.append(loss_value.numpy())
+            common.Logger.debug(f'last loss value: {self.loss_list[-1]}')
+
+        self._update_graph_from_model(self.graph_quant, block_model)
+
+    def create_block_input_node(self, name: str, output_shape: Tuple[Any]) -> BaseNode:
+        """
+        Create an input node for a GPTQ block graph.
+
+        Args:
+            name: Name of the node.
+            output_shape: Shape of the node's output tensor.
+
+        Returns: An input node.
+        """
+        input_node = copy.deepcopy(self.graph_quant.get_inputs()[0])
+        input_node.name = name
+        input_node.input_shape = output_shape
+        input_node.output_shape = output_shape
+        input_node.framework_attr[BATCH_INPUT_SHAPE] = (None, *output_shape[1:])
+        input_node.framework_attr[LAYER_NAME] = name
+        return input_node
+
+    def run_float_model(self, float_model: tf.keras.Model, input_data: List[np.ndarray]) -> List[tf.Tensor]:
+        """
+        Run a float (teacher) model.
+
+        Args:
+            float_model: Float model to run.
+            input_data: A list of input arrays.
+
+        Returns: A list of the float model's outputs (for each of its output nodes).
+        """
+        y_float = float_model(input_data)
+        return y_float if isinstance(y_float, list) else [y_float]
 
     def micro_training_loop(self,
                             data_function: Callable,
@@ -211,21 +361,120 @@ class KerasGPTQTrainer(GPTQTrainer):
         Returns: None
 
         """
-        for _ in tqdm(range(int(n_iteration))):
-            data = data_function()
-            input_data = [d * self.input_scale for d in data]
-            y_float = self.float_model(input_data)  # running float model
+        training_step = self._get_training_step(in_compute_gradients, in_optimizer_with_param, is_training)
+        n_iteration = int(n_iteration)
+        start_iteration = self._restore_checkpoint()
+        for iteration in tqdm(range(start_iteration, n_iteration), initial=start_iteration, total=n_iteration):
+            input_data, y_float = self._get_training_batch(data_function)
+            loss_value_step, grads = training_step(input_data, y_float)
+            if self.gptq_config.log_function is not None:
+                self.gptq_config.log_function(loss_value_step, grads[0], in_optimizer_with_param[0][-1],
+                                              self.compare_points)
+            self.loss_list.append(loss_value_step.numpy())
+            common.Logger.debug(f'last loss value: {self.loss_list[-1]}')
+            self._save_checkpoint(iteration + 1, n_iteration)
+
+    def _get_tf_checkpoint(self) -> tf.train.Checkpoint:
+        """
+        Returns: A TF checkpoint object that tracks the quantized model's variables (including the quantizers'
+        auxiliary variables and iteration counters) and the optimizers' variables. The optimizers' slots are
+        created on their first update, so when restoring before the training they are restored on creation.
+        """
+        return tf.train.Checkpoint(model=self.fxp_model,
+                                   optimizers=[o for o, _ in self.optimizer_with_param])
+
+    def _get_gumbel_quantizers(self) -> List[GumbelRoundingBase]:
+        """
+        Returns: A list of the quantized model's Gumbel Rounding quantizers.
+        """
+        return [layer.quantize_config.weight_quantizer for layer in self.fxp_model.layers
+                if isinstance(layer, QuantizeWrapper) and isinstance(layer.quantize_config, WeightQuantizeConfig)
+                and isinstance(layer.quantize_config.weight_quantizer, GumbelRoundingBase)]
+
+    def save_training_state(self, checkpoint_path: str):
+        """
+        Save the quantized model's variables, the optimizers' state and the Gumbel noise seeds to a
+        checkpoint directory.
+
+        Args:
+            checkpoint_path: Directory of the checkpoint.
+        """
+        self._get_tf_checkpoint().write(os.path.join(checkpoint_path, TF_CHECKPOINT_PREFIX))
+        np.save(os.path.join(checkpoint_path, f'{QUANTIZERS_SEEDS}.npy'),
+                np.array([q.seed for q in self._get_gumbel_quantizers()], dtype=np.int64))
+
+    def load_training_state(self, checkpoint_path: str):
+        """
+        Load the quantized model's variables, the optimizers' state and the Gumbel noise seeds from a
+        checkpoint directory.
+
+        Args:
+            checkpoint_path: Directory of the checkpoint.
+        """
+        status = self._get_tf_checkpoint().read(os.path.join(checkpoint_path, TF_CHECKPOINT_PREFIX))
+        status.assert_existing_objects_matched()
+        seeds = np.load(os.path.join(checkpoint_path, f'{QUANTIZERS_SEEDS}.npy'))
+        quantizers = self._get_gumbel_quantizers()
+        if len(seeds) != len(quantizers):
+            common.Logger.error(f'GPTQ checkpoint mismatch: expected {len(quantizers)} Gumbel quantizers '
+                                f'but the checkpoint has {len(seeds)}')  # pragma: no cover
+        for q, seed in zip(quantizers, seeds):
+            q.seed = int(seed)
+
+    def _get_training_step(self,
+                           in_compute_gradients: Callable,
+                           in_optimizer_with_param: List[Tuple[tf.keras.optimizers.Optimizer, List[tf.Tensor]]],
+                           is_training: bool) -> Callable:
+        """
+        Build a function that runs a single training step: running the float model (unless its outputs are
+        given), computing the loss and the gradients of the quantized model and updating its parameters using
+        the optimizers.
+        If compiled_training_step is set in the GPTQ config, the training step is traced into a single graph
+        using tf.function, otherwise it runs eagerly. The compiled step is built once per optimizers grouping and
+        cached in the trainer, so it's not traced again in later training loops. The values that change between
+        iterations (the Gumbel quantizers' iteration counters and temperatures) are TF variables and tensors,
+        so they are not fixed in the trace.
+
+        Args:
+            in_compute_gradients: A callable function that compute the gradients.
+            in_optimizer_with_param: A list of optimizer classes to update with the corresponding parameters.
+            is_training: A boolean flag stating if the network is running in training mode.
+
+        Returns: A callable that gets a list of input tensors and a list of the float model's outputs (or None),
+        and returns the step's loss and gradients.
+
+        """
+
+        def training_step(input_data: List[tf.Tensor],
+                          y_float: List[tf.Tensor] = None) -> Tuple[tf.Tensor, List[List[tf.Tensor]]]:
+            if y_float is None:
+                y_float = self.float_model(input_data)  # running float model
+            elif len(y_float) == 1:
+                # A single-output Keras model returns a tensor rather than a list
+                y_float = y_float[0]
             loss_value_step, grads = in_compute_gradients(y_float, input_data, in_optimizer_with_param,
                                                           training=is_training)
             # Run one step of gradient descent by updating
             # the value of the variables to minimize the loss.
             for i, (o, p) in enumerate(in_optimizer_with_param):
                 o.apply_gradients(zip(grads[i], p))
-            if self.gptq_config.log_function is not None:
-                self.gptq_config.log_function(loss_value_step, grads[0], in_optimizer_with_param[0][-1],
-                                              self.compare_points)
-            self.loss_list.append(loss_value_step.numpy())
-            common.Logger.debug(f'last loss value: {self.loss_list[-1]}')
+            return loss_value_step, grads
+
+        if not self.gptq_config.compiled_training_step:
+            return training_step
+
+        training_step_key = (in_compute_gradients, tuple(id(o) for o, _ in in_optimizer_with_param), is_training)
+        if training_step_key not in self.compiled_training_steps:
+            self.compiled_training_steps[training_step_key] = tf.function(training_step)
+        compiled_training_step = self.compiled_training_steps[training_step_key]
+
+        def run_compiled_training_step(input_data: List[np.ndarray],
+                                       y_float: List[np.ndarray] = None) -> Tuple[tf.Tensor, List[List[tf.Tensor]]]:
+            if y_float is not None:
+                y_float = [tf.convert_to_tensor(y, dtype=tf.float32) for y in y_float]
+            return compiled_training_step([tf.convert_to_tensor(d, dtype=tf.float32) for d in input_data], y_float)
+
+        return run_compiled_training_step
 
     def update_graph(self):
         """
@@ -235,8 +484,20 @@ class KerasGPTQTrainer(GPTQTrainer):
             Updated graph after GPTQ.
         """
         graph = copy.copy(self.graph_quant)
+        if not self.gptq_config.block_wise:
+            # In block-wise training, the graph is updated after the training of each block
+            self._update_graph_from_model(graph, self.fxp_model)
+        return graph
+
+    def _update_graph_from_model(self, graph: Graph, fxp_model: tf.keras.Model):
+        """
+        Update the nodes of a graph with the trained parameters of a GPTQ model.
 
-        for layer in self.fxp_model.layers:
+        Args:
+            graph: Graph to update.
+            fxp_model: Trained GPTQ model.
+        """
+        for layer in fxp_model.layers:
             if isinstance(layer, QuantizeWrapper) and isinstance(
                     layer.quantize_config, WeightQuantizeConfig):
                 node = graph.find_node_by_name(layer.layer.name)
@@ -258,6 +519,3 @@ class KerasGPTQTrainer(GPTQTrainer):
                     if use_bias is not None and use_bias:
                         new_bias = layer.layer.bias.numpy()
                         node.set_weights_by_keys(BIAS, new_bias)
-
-        return graph
-
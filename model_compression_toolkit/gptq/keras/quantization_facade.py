@@ -21,6 +21,7 @@ from model_compression_toolkit.core.common import Logger
 from model_compression_toolkit.core.common.constants import TENSORFLOW
 from model_compression_toolkit.core.common.user_info import UserInformation
 from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig
+from model_compression_toolkit.gptq.common.gptq_checkpoint import get_resume_gptq_config
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPI
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config import \
@@ -230,6 +231,59 @@ if common.constants.FOUND_TF:
                             tb_w,
                             bit_widths_config)
 
+
+    def keras_resume_gradient_post_training_quantization_experimental(in_model: Model,
+                                                                      representative_data_gen: Callable,
+                                                                      gptq_config: GradientPTQConfig,
+                                                                      target_kpi: KPI = None,
+                                                                      core_config: CoreConfig = CoreConfig(),
+                                                                      fw_info: FrameworkInfo = DEFAULT_KERAS_INFO,
+                                                                      target_platform_capabilities: TargetPlatformCapabilities = DEFAULT_KERAS_TPC,
+                                                                      new_experimental_exporter: bool = False) -> \
+    Tuple[Model, UserInformation]:
+        """
+        Resume a GPTQ run of :func:`~model_compression_toolkit.keras_gradient_post_training_quantization_experimental`
+        from the last checkpoint in the checkpoint directory of gptq_config.checkpoint_config.
+        The quantized model is rebuilt from in_model, its trained variables and the optimizers' state are restored
+        from the checkpoint, and the training continues from the checkpoint's iteration.
+        The arguments should be the same as the ones of the stopped run (and the representative dataset should
+        give the same samples), so the rebuilt quantized model matches the checkpoint.
+
+        Args:
+            in_model (Model): Keras model to quantize.
+            representative_data_gen (Callable): Dataset used for calibration.
+            gptq_config (GradientPTQConfig): Configuration for using gptq, with a checkpoint_config.
+            target_kpi (KPI): KPI object to limit the search of the mixed-precision configuration as desired.
+            core_config (CoreConfig): Configuration object containing parameters of how the model should be quantized, including mixed precision parameters.
+            fw_info (FrameworkInfo): Information needed for quantization about the specific framework.
+            target_platform_capabilities (TargetPlatformCapabilities): TargetPlatformCapabilities to optimize the Keras model according to.
+            new_experimental_exporter (bool): Whether exporting the quantized model using new exporter or not.
+
+        Returns:
+
+            A quantized model and information the user may need to handle the quantized model.
+
+        Examples:
+
+            Create a GPTQ config that saves a checkpoint every 100 iterations:
+
+            >>> gptq_config = mct.get_keras_gptq_config(n_iter=1000)
+            >>> gptq_config.checkpoint_config = mct.CheckpointConfig(checkpoint_dir='/tmp/gptq_checkpoints', save_interval=100)
+
+            If the run of :func:`~model_compression_toolkit.keras_gradient_post_training_quantization_experimental` was stopped, resume it:
+
+            >>> quantized_model, quantization_info = mct.keras_resume_gradient_post_training_quantization_experimental(model, repr_datagen, gptq_config)
+
+        """
+        return keras_gradient_post_training_quantization_experimental(in_model,
+                                                                      representative_data_gen,
+                                                                      get_resume_gptq_config(gptq_config),
+                                                                      target_kpi=target_kpi,
+                                                                      core_config=core_config,
+                                                                      fw_info=fw_info,
+                                                                      target_platform_capabilities=target_platform_capabilities,
+                                                                      new_experimental_exporter=new_experimental_exporter)
+
 else:
     # If tensorflow or tensorflow_model_optimization are not installed,
     # we raise an exception when trying to use these functions.
@@ -243,3 +297,9 @@ else:
         Logger.critical('Installing tensorflow and tensorflow_model_optimization is mandatory '
                         'when using keras_gradient_post_training_quantization_experimental. '
                         'Could not find Tensorflow package.')
+
+
+    def keras_resume_gradient_post_training_quantization_experimental(*args, **kwargs):
+        Logger.critical('Installing tensorflow and tensorflow_model_optimization is mandatory '
+                        'when using keras_resume_gradient_post_training_quantization_experimental. '
+                        'Could not find Tensorflow package.')
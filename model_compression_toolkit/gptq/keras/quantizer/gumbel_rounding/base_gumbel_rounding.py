@@ -18,6 +18,7 @@ import numpy as np
 import tensorflow as tf
 
 from model_compression_toolkit import GumbelConfig
+from model_compression_toolkit.gptq.common.gptq_config import AuxVarPrecision
 from model_compression_toolkit.core.keras.quantizer.base_quantizer import BaseTrainableQuantizer
 from model_compression_toolkit.core.common.defaultdict import DefaultDict
 from model_compression_toolkit.core import common
@@ -30,6 +31,10 @@ from model_compression_toolkit.gptq.keras.quantizer import quant_utils as qutils
 
 P_INIT = 0.01
 
+AUX_VAR_DTYPES = {AuxVarPrecision.FLOAT32: tf.float32,
+                  AuxVarPrecision.FLOAT16: tf.float16,
+                  AuxVarPrecision.BFLOAT16: tf.bfloat16}
+
 
 def _init_aux_var(w_shape: List[int], m: int, p: float = P_INIT) -> np.ndarray:
     """
@@ -111,36 +116,40 @@ class GumbelRoundingBase(BaseTrainableQuantizer):
         self.maximal_temp = gumbel_config.maximal_temp
         self.cycle_iterations = int(self.max_iteration / self.n_cycles)
         self.tau = None
-        self.g_t = None
         self.p_t = None
+        self.aux_var_dtype = AUX_VAR_DTYPES[gumbel_config.aux_var_precision]
+        # Seed of the counter-based generator of the gumbel noise (the iteration number is the counter)
+        self.seed = np.random.randint(np.iinfo(np.int32).max)
         scale = self.cycle_iterations / (-2 * np.log(0.001))
 
         def tau_function(i):
             """
-            A function the generate the gumbel temperature.
+            A function the generate the gumbel temperature. The iteration is selected with tensor operations
+            (rather than a Python branch), so the temperature follows the iteration in a compiled training step.
             Args:
-                i: An int the represent the current iteration number
+                i: A tensor (or int) the represent the current iteration number
 
             Returns: A temperature value.
 
             """
-            if i < (self.cycle_iterations - 1):
-                index = ((i + 1) % self.cycle_iterations) / scale
-            else:
-                index = (i % self.cycle_iterations) / scale
+            i = tf.cast(i, tf.float32)
+            index = tf.where(i < (self.cycle_iterations - 1),
+                             ((i + 1) % self.cycle_iterations) / scale,
+                             (i % self.cycle_iterations) / scale)
 
             x = tf.exp(-index)
             return self.minimal_temp + (self.maximal_temp - self.minimal_temp) * x
 
         self.tau_function = tau_function
         self.w_shape = None
-        self.update_gumbel_param = True
+        # A variable (rather than a Python flag), so toggling it is not fixed when the training step is compiled
+        self.update_gumbel_param = tf.Variable(True, trainable=False)
 
     def enable_update(self):
-        self.update_gumbel_param = True
+        self.update_gumbel_param.assign(True)
 
     def disable_update(self):
-        self.update_gumbel_param = False
+        self.update_gumbel_param.assign(False)
 
     def build(self, tensor_shape: TensorShape,
               name: str,
@@ -169,8 +178,9 @@ class GumbelRoundingBase(BaseTrainableQuantizer):
             name + gptq_constants.AUXVAR,
             shape=[self.m, *self.w_shape],
             initializer=tf.keras.initializers.Constant(0.0),
+            dtype=self.aux_var_dtype,
             trainable=True)
-        auxvar_tensor.assign(_init_aux_var(self.w_shape, self.m))
+        auxvar_tensor.assign(tf.cast(_init_aux_var(self.w_shape, self.m), self.aux_var_dtype))
 
         temp_tensor = layer.add_weight(
             name + gptq_constants.TEMP,
@@ -248,13 +258,29 @@ class GumbelRoundingBase(BaseTrainableQuantizer):
                                        self.minimal_temp)
         else:
             self.tau = self.tau_function(ar_iter)
-        if self.update_gumbel_param and training:
+        if training:
+            ar_iter.assign_add(tf.cast(self.update_gumbel_param, ar_iter.dtype))
+
+    def get_gumbel_noise(self, ar_iter: tf.Variable) -> tf.Tensor:
+        """
+        Sample the gumbel noise of the current iteration. The noise is generated by a counter-based
+        generator from the quantizer's seed and the iteration number, so it is not kept between
+        iterations, and it is the same for all calls in an iteration (e.g., when the update is disabled).
+
+        Args:
+            ar_iter: Iteration number variable.
 
-            ar_iter.assign_add(1.0)
-            self.g_t = sample_gumbel([self.m, *self.w_shape])
+        Returns: A tensor of i.i.d gumbel random variable in the shape of the auxiliary variable.
+
+        """
+        return sample_gumbel([self.m, *self.w_shape], seed=tf.stack([self.seed, tf.cast(ar_iter, tf.int32)]))
 
     def get_temperature_variable(self):
         return self.quantizer_parameters[gptq_constants.TEMP]
 
     def get_gumbel_probability(self):
+        """
+        Returns: The gumbel softmax probability computed in the last call of the quantizer. It is only valid in
+        the training step that called the quantizer (in a compiled training step, it's a tensor of the step's graph).
+        """
         return self.p_t
@@ -12,20 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+from typing import Tuple
+
 import tensorflow as tf
 
 
-def sample_gumbel(shape, eps=1e-6) -> tf.Tensor:
+def sample_gumbel(shape, eps=1e-6, seed=None) -> tf.Tensor:
     """
     A function that sample a tensor of i.i.d gumbel random variable.
     Args:
         shape: The tensor output shape
         eps: A small number for numeric stability.
+        seed: A seed of shape [2] for a counter-based (stateless) random generator. If None, the global
+            random generator is used.
 
     Returns: A tensor of i.i.d gumbel random variable.
 
     """
-    u = tf.random.uniform(shape)
+    u = tf.random.uniform(shape) if seed is None else tf.random.stateless_uniform(shape, seed=seed)
     return -tf.math.log(-tf.math.log(u + eps) + eps)
 
 
@@ -44,7 +48,35 @@ def gumbel_softmax(in_pi: tf.Tensor, in_tau: tf.Tensor, in_gumbel: tf.Tensor, ep
     Returns: A gumbel softmax probability tensor.
 
     """
-    return tf.nn.softmax((tf.nn.log_softmax(in_pi, axis=axis) + gumbel_scale * in_gumbel) / (in_tau + eps), axis=axis)
+    # The log-softmax normalization of in_pi is constant along the softmax axis (and so is the temperature),
+    # thus it cancels out in the softmax and is not computed.
+    return tf.nn.softmax((tf.cast(in_pi, tf.float32) + gumbel_scale * in_gumbel) / (in_tau + eps), axis=axis)
+
+
+def gumbel_softmax_rounding(in_pi: tf.Tensor,
+                            in_tau: tf.Tensor,
+                            in_gumbel: tf.Tensor,
+                            aux_shift: tf.Tensor,
+                            gumbel_scale: float = 1.0,
+                            hard: bool = False) -> Tuple[tf.Tensor, tf.Tensor]:
+    """
+    Compute the gumbel softmax probability of the rounding shifts, and the expected rounding shift
+    of each element (contracting the shifts axis without materializing the weighted shifts tensor).
+    Args:
+        in_pi: A tensor of log probability of the shifts (with the shifts on the first axis).
+        in_tau: A temperature tensor.
+        in_gumbel: A tensor of gumbel random variable.
+        aux_shift: A vector of the shifts values.
+        gumbel_scale: A normalization factor for the gumbel tensor values
+        hard: Whether to select the most probable shift (with STE) instead of the soft probability.
+
+    Returns: A gumbel softmax probability tensor, and the tensor of expected shifts.
+
+    """
+    p_t = gumbel_softmax(in_pi, in_tau, in_gumbel, gumbel_scale=gumbel_scale)
+    if hard:
+        p_t = ste_gumbel(p_t)
+    return p_t, tf.tensordot(tf.cast(aux_shift, p_t.dtype), p_t, axes=[[0], [0]])
 
 
 def ste_gumbel(in_prob: tf.Tensor) -> tf.Tensor:
@@ -22,7 +22,7 @@ from tensorflow_model_optimization.python.core.quantization.keras.quantize_wrapp
 from tensorflow.python.framework.tensor_shape import TensorShape
 from model_compression_toolkit.core.common.defaultdict import DefaultDict
 from typing import Dict, Any, List
-from model_compression_toolkit.gptq.keras.quantizer.gumbel_rounding.gumbel_softmax import gumbel_softmax, ste_gumbel
+from model_compression_toolkit.gptq.keras.quantizer.gumbel_rounding.gumbel_softmax import gumbel_softmax_rounding
 from model_compression_toolkit.core.common.constants import THRESHOLD, GUMBEL_MAX_ITER, MIN_THRESHOLD
 from model_compression_toolkit.gptq.common import gptq_constants
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import max_power_of_two
@@ -176,21 +176,19 @@ class SymmetricGumbelRounding(GumbelRoundingBase):
                 self.quantization_axis
             reshape_shape = [-1 if i == quantization_axis else 1 for i in range(n_axis)]
 
-            reshape_shape_aux_ind = [-1, *[1 for _ in range(n_axis)]]
             #####################################################
             # Gumbel Softmax
             #####################################################
             if training:
-                p_t = gumbel_softmax(auxvar, self.tau, self.g_t, gumbel_scale=self.gumbel_scale)
+                p_t, auxvar_hat = gumbel_softmax_rounding(auxvar, self.tau, self.get_gumbel_noise(ar_iter),
+                                                          aux_index_shift, gumbel_scale=self.gumbel_scale)
             else:
-                p_t = gumbel_softmax(auxvar, self.minimal_temp, 0)
-                p_t = ste_gumbel(p_t)
+                p_t, auxvar_hat = gumbel_softmax_rounding(auxvar, self.minimal_temp, 0, aux_index_shift, hard=True)
             self.p_t = p_t
             #####################################################
             # Calculate v hat and threshold hat
             #####################################################
             ptq_threshold_tensor_hat = tf.reshape(ptq_threshold_tensor, reshape_shape)
-            auxvar_hat = tf.reduce_sum(p_t * tf.reshape(aux_index_shift, reshape_shape_aux_ind), axis=0)
             #####################################################
             # Quantized Input
             #####################################################
@@ -205,7 +203,7 @@ class SymmetricGumbelRounding(GumbelRoundingBase):
 
             return q_tensor
         else:
-            return gumbel_rounding_symmetric_quantizer(inputs, auxvar,
+            return gumbel_rounding_symmetric_quantizer(inputs, tf.cast(auxvar, tf.float32),
                                                        ptq_threshold_tensor,
                                                        self.num_bits,
                                                        self.signed,
@@ -22,7 +22,7 @@ from tensorflow_model_optimization.python.core.quantization.keras.quantize_wrapp
 from tensorflow.python.framework.tensor_shape import TensorShape
 from model_compression_toolkit.core.common.defaultdict import DefaultDict
 from typing import Dict, Any, List
-from model_compression_toolkit.gptq.keras.quantizer.gumbel_rounding.gumbel_softmax import gumbel_softmax, ste_gumbel
+from model_compression_toolkit.gptq.keras.quantizer.gumbel_rounding.gumbel_softmax import gumbel_softmax_rounding
 from model_compression_toolkit.core.common.constants import RANGE_MIN, RANGE_MAX
 from model_compression_toolkit.gptq.common import gptq_constants
 
@@ -164,15 +164,14 @@ class UniformGumbelRounding(GumbelRoundingBase):
                 self.quantization_axis
             reshape_shape = [-1 if i == quantization_axis else 1 for i in range(n_axis)]
 
-            reshape_shape_aux_ind = [-1, *[1 for _ in range(n_axis)]]
             #####################################################
             # Gumbel Softmax
             #####################################################
             if training:
-                p_t = gumbel_softmax(auxvar, self.tau, self.g_t)
+                p_t, auxvar_hat = gumbel_softmax_rounding(auxvar, self.tau, self.get_gumbel_noise(ar_iter),
+                                                          aux_index_shift)
             else:
-                p_t = gumbel_softmax(auxvar, self.minimal_temp, 0)
-                p_t = ste_gumbel(p_t)
+                p_t, auxvar_hat = gumbel_softmax_rounding(auxvar, self.minimal_temp, 0, aux_index_shift, hard=True)
             self.p_t = p_t
             #####################################################
             # Calculate v hat and threshold hat
@@ -180,7 +179,6 @@ class UniformGumbelRounding(GumbelRoundingBase):
             ptq_min_range = tf.reshape(ptq_min_range, reshape_shape)
             ptq_max_range = tf.reshape(ptq_max_range, reshape_shape)
 
-            auxvar_hat = tf.reduce_sum(p_t * tf.reshape(aux_index_shift, reshape_shape_aux_ind), axis=0)
             #####################################################
             # Quantized Input
             #####################################################
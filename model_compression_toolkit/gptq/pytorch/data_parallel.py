@@ -0,0 +1,305 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import multiprocessing
+import os
+import tempfile
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, List, Tuple
+
+import numpy as np
+import torch
+import torch.distributed as dist
+
+from model_compression_toolkit.core.common.logger import Logger
+from model_compression_toolkit.core.pytorch.constants import CPU
+from model_compression_toolkit.core.pytorch.utils import get_working_device
+from model_compression_toolkit.gptq.common.gptq_checkpoint import GPTQCheckpointManager
+from model_compression_toolkit.gptq.common.gptq_config import CheckpointConfig
+from model_compression_toolkit.gptq.common.gptq_constants import LOSS_LIST
+
+GLOO_BACKEND = 'gloo'
+INIT_FILE = 'dist_init'
+RESULT_DIR = 'result'
+
+# Number of samples in each worker's shard of the batch that the loss sample-separability is checked on
+SEPARABILITY_CHECK_SHARD_SIZE = 2
+# Relative tolerance between the loss of a batch and the mean loss of its shards, for a sample-separable loss
+SEPARABILITY_CHECK_RTOL = 1e-4
+
+
+def check_data_parallel_support():
+    """
+    Check that data-parallel GPTQ training can run in the environment: the workers are forked from the
+    current process, and CUDA cannot be used in forked processes, so the models must be on the CPU.
+
+    """
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        Logger.error('Data-parallel GPTQ requires the fork start method of multiprocessing')  # pragma: no cover
+    if get_working_device().type != CPU:
+        Logger.error('Data-parallel GPTQ forks the training processes, and CUDA cannot be used in forked '
+                     'processes, so it is supported only when training on CPU')  # pragma: no cover
+
+
+def is_loss_sample_separable(loss_fn: Callable,
+                             y_fxp: List[torch.Tensor],
+                             y_float: List[torch.Tensor],
+                             world_size: int) -> bool:
+    """
+    Check whether a loss is separable over the batch samples, i.e. the loss of a batch equals the mean loss of its
+    equal shards. Only for such losses, the average of the workers' gradients is the gradient of the batch, so
+    data-parallel training is equivalent to single-process training.
+
+    Args:
+        loss_fn: A function that computes the loss from lists of quantized and float outputs.
+        y_fxp: A list of quantized outputs of a batch.
+        y_float: A list of float outputs of the batch.
+        world_size: Number of workers.
+
+    Returns: Whether the loss is separable over the batch samples.
+
+    """
+    batch_loss = loss_fn(y_fxp, y_float).item()
+    shards_loss = np.mean([loss_fn(shard_batch(y_fxp, rank, world_size),
+                                   shard_batch(y_float, rank, world_size)).item() for rank in range(world_size)])
+    return np.isclose(batch_loss, shards_loss, rtol=SEPARABILITY_CHECK_RTOL, atol=0)
+
+
+def shard_batch(batch: List[np.ndarray], rank: int, world_size: int) -> List[np.ndarray]:
+    """
+    Get the shard of a data-parallel worker from a batch.
+
+    Args:
+        batch: A list of arrays of the batch.
+        rank: Index of the worker.
+        world_size: Number of workers.
+
+    Returns: A list of the worker's (contiguous) shards of the arrays.
+
+    """
+    batch_size = batch[0].shape[0]
+    if batch_size % world_size != 0:
+        Logger.error(f'Data-parallel GPTQ requires a batch size that is divisible by the number of workers, '
+                     f'but got a batch of {batch_size} samples for {world_size} workers')  # pragma: no cover
+    shard_size = batch_size // world_size
+    return [b[rank * shard_size:(rank + 1) * shard_size] for b in batch]
+
+
+def all_reduce_gradients(params: List[torch.Tensor], loss_value: torch.Tensor, world_size: int) -> torch.Tensor:
+    """
+    Average the gradients of the parameters and the loss value between the data-parallel workers.
+    All gradients are coalesced into a single float32 buffer, so a single all-reduce is done per step.
+
+    Args:
+        params: A list of parameters (of the same structure in all workers).
+        loss_value: The worker's loss value.
+        world_size: Number of workers.
+
+    Returns: The averaged loss value.
+
+    """
+    params = [p for p in params if p.grad is not None]
+    buffer = torch.cat([p.grad.detach().flatten().float() for p in params] + [loss_value.detach().reshape(1).float()])
+    dist.all_reduce(buffer)
+    buffer /= world_size
+
+    offset = 0
+    for p in params:
+        p.grad.copy_(buffer[offset:offset + p.grad.numel()].reshape(p.grad.shape))
+        offset += p.grad.numel()
+    return buffer[offset]
+
+
+def _data_parallel_worker(trainer: Any,
+                          rank: int,
+                          world_size: int,
+                          work_dir: str,
+                          data_function: Callable,
+                          n_iteration: int,
+                          log_connection: Connection = None):
+    """
+    Run the GPTQ training loop in a data-parallel worker process. The first worker saves the trained state
+    to the work directory at the end of the training.
+
+    Args:
+        trainer: The (forked) PytorchGPTQTrainer to train.
+        rank: Index of the worker.
+        world_size: Number of workers.
+        work_dir: Directory of the process group initialization file and the training result.
+        data_function: A callable function that give a batch of samples.
+        n_iteration: Number of update iterations.
+        log_connection: A connection to send the first worker's training logs through to the parent process
+            (if the GPTQ config has a log function).
+
+    """
+    dist.init_process_group(GLOO_BACKEND,
+                            init_method=f'file://{os.path.join(work_dir, INIT_FILE)}',
+                            rank=rank,
+                            world_size=world_size)
+    try:
+        trainer.rank, trainer.world_size = rank, world_size
+        trainer.log_connection = log_connection if rank == 0 else None
+        trainer.micro_training_loop(data_function, n_iteration)
+        if rank == 0:
+            GPTQCheckpointManager(CheckpointConfig(os.path.join(work_dir, RESULT_DIR))).save(
+                n_iteration, {LOSS_LIST: trainer.loss_list}, trainer.save_training_state)
+    finally:
+        dist.destroy_process_group()
+
+
+def run_forked_workers(worker_function: Callable,
+                       workers_args: List[Tuple],
+                       message_function: Callable = None):
+    """
+    Run a function in forked worker processes, and wait until all of them finish.
+    The host's intra-op threads are split between the workers. The number of threads is set before forking (and
+    restored afterwards), so the workers don't start with the current thread pool's size. Other threads of the
+    current process should be stopped before calling this function, since a lock that is held by another thread
+    while forking is never released in the workers.
+    Each worker gets a connection (as its last argument) to send messages through to the current process, where
+    message_function is called with each message (so its side effects and exceptions are in the current process).
+    If a worker fails, the other workers are terminated and an error is logged.
+
+    Args:
+        worker_function: Function to run in the workers.
+        workers_args: A list of the arguments of each worker (without the connection).
+        message_function: A function to call with each message from the workers (if None, the workers get no
+            connection, and None is passed instead).
+
+    """
+    check_data_parallel_support()
+
+    context = multiprocessing.get_context('fork')
+    reader, writer = context.Pipe(duplex=False) if message_function is not None else (None, None)
+    workers = []
+    try:
+        num_threads = torch.get_num_threads()
+        torch.set_num_threads(max(1, num_threads // len(workers_args)))
+        try:
+            for args in workers_args:
+                workers.append(context.Process(target=worker_function, args=(*args, writer)))
+                workers[-1].start()
+        finally:
+            torch.set_num_threads(num_threads)
+
+        running = {w.sentinel: w for w in workers}
+        if reader is not None:
+            # Only the workers hold the writing end of the pipe, so the reader gets an EOF once they exit
+            writer.close()
+            running[reader] = None
+        while len(running) > 0:
+            for ready in wait(list(running.keys())):
+                if ready is reader:
+                    try:
+                        message_function(reader.recv())
+                    except EOFError:
+                        running.pop(reader)
+                    continue
+                worker = running.pop(ready)
+                worker.join()
+                if worker.exitcode != 0:
+                    Logger.error(f'GPTQ worker process failed with exit code {worker.exitcode}')
+    finally:
+        # If a worker failed, the other workers may be blocked on it (e.g., on its gradients)
+        for w in workers:
+            if w.is_alive():
+                w.terminate()
+                w.join()
+        if reader is not None:
+            reader.close()
+
+
+def data_parallel_training(trainer: Any, data_function: Callable, n_iteration: int):
+    """
+    Train a GPTQ model using data-parallel worker processes.
+    The workers are forked from the current process, so each of them starts with an identical replica of the
+    trainer (models, optimizers, quantizers seeds and random generators state), and draws the same batches.
+    Each worker runs the training step on its shard of the batch, and the gradients are averaged between the
+    workers before the optimizers' update, so the replicas stay identical.
+    The first worker sends the arguments of the log function of each iteration to the current process, where the
+    log function is called.
+    At the end of the training, the trained state of the first worker is loaded into the trainer.
+
+    Args:
+        trainer: PytorchGPTQTrainer to train.
+        data_function: A callable function that give a batch of samples.
+        n_iteration: Number of update iterations.
+
+    """
+    world_size = trainer.gptq_config.num_workers
+    log_function = trainer.gptq_config.log_function
+    with tempfile.TemporaryDirectory() as work_dir:
+        run_forked_workers(_data_parallel_worker,
+                           [(trainer, rank, world_size, work_dir, data_function, n_iteration)
+                            for rank in range(world_size)],
+                           message_function=None if log_function is None else lambda args: log_function(*args))
+
+        checkpoint_path, trainer_state = GPTQCheckpointManager(
+            CheckpointConfig(os.path.join(work_dir, RESULT_DIR))).load()
+        trainer.load_training_state(checkpoint_path)
+        trainer.loss_list = trainer_state[LOSS_LIST]
+
+
+def _blocks_worker(trainer: Any,
+                   get_block: Callable,
+                   blocks_indices: List[int],
+                   connection: Connection):
+    """
+    Train GPTQ blocks in a worker process, and send the trained parameters and the losses of each block
+    to the parent process.
+
+    Args:
+        trainer: The (forked) PytorchGPTQTrainer to train the blocks with.
+        get_block: A callable that gets a block index, and returns the block's graph and its data function.
+        blocks_indices: Indices of the blocks to train in the worker.
+        connection: A connection to send the blocks' results through to the parent process.
+
+    """
+    for block_index in blocks_indices:
+        block_graph, data_function = get_block(block_index)
+        Logger.info(f'GPTQ: training block {block_index + 1} of {block_graph.get_outputs()[0].node.name}')
+        losses_start = len(trainer.loss_list)
+        trained_parameters = trainer.train_block_parameters(block_graph, block_index, data_function)
+        connection.send((block_index, trained_parameters, trainer.loss_list[losses_start:]))
+
+
+def blocks_parallel_training(trainer: Any, get_block: Callable, n_blocks: int):
+    """
+    Train the GPTQ blocks in parallel worker processes. The blocks are trained on the cached float inputs and
+    outputs, so they don't depend on each other, and are distributed between the workers in a round-robin order.
+    The workers are forked from the current process, so each of them has the teacher cache and the quantized graph.
+    After all the blocks are trained, the quantized graph is updated with their trained parameters, and their
+    losses are appended to the trainer's loss list, in the order of the blocks.
+
+    Args:
+        trainer: PytorchGPTQTrainer to train the blocks with.
+        get_block: A callable that gets a block index, and returns the block's graph and its data function.
+        n_blocks: Number of blocks to train.
+
+    """
+    world_size = min(trainer.gptq_config.num_workers, n_blocks)
+    blocks_results = {}
+
+    def _collect_block_result(message: Tuple):
+        block_index, trained_parameters, losses = message
+        blocks_results[block_index] = (trained_parameters, losses)
+
+    run_forked_workers(_blocks_worker,
+                       [(trainer, get_block, list(range(rank, n_blocks, world_size))) for rank in range(world_size)],
+                       message_function=_collect_block_result)
+
+    for block_index in range(n_blocks):
+        trained_parameters, losses = blocks_results[block_index]
+        trainer.set_trained_parameters(trainer.graph_quant, trained_parameters)
+        trainer.loss_list.extend(losses)
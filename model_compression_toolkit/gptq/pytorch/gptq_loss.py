@@ -62,3 +62,53 @@ def multiple_tensors_mse_loss(y_list: List[torch.Tensor],
     else:
         return torch.mean(torch.stack(loss_values_list))
 
+
+def sample_mse_loss(y: torch.Tensor, x: torch.Tensor, normalized: bool = True) -> torch.Tensor:
+    """
+    Compute the MSE of two batches of tensors, averaged over the batch samples. Unlike mse_loss, a normalized MSE is
+    normalized by each sample's mean square, so the loss of a batch is the mean loss of any equal split of it
+    (as required by data-parallel training).
+    Args:
+        y: First tensor.
+        x: Second tensor.
+        normalized: either return normalized MSE or MSE
+    Returns:
+        The mean MSE of the batch samples.
+    """
+    y, x = torch.flatten(y, start_dim=1), torch.flatten(x, start_dim=1)
+    loss = torch.mean(torch.square(x - y), dim=1)
+    return torch.mean(loss / torch.mean(torch.square(x), dim=1) if normalized else loss)
+
+
+def multiple_tensors_sample_mse_loss(y_list: List[torch.Tensor],
+                                     x_list: List[torch.Tensor],
+                                     fxp_w_list: List[List[torch.Tensor]],
+                                     flp_w_list: List[List[torch.Tensor]],
+                                     act_bn_mean: List,
+                                     act_bn_std: List,
+                                     loss_weights: torch.Tensor = None) -> torch.Tensor:
+    """
+    Compute MSE similarity between two lists of tensors, averaged over the batch samples (see sample_mse_loss).
+    This is the default loss of data-parallel GPTQ training.
+
+    Args:
+        y_list: First list of tensors.
+        x_list: Second list of tensors.
+        fxp_w_list: list of lists each containing a quantized model layer's trainable weights - quantized
+        flp_w_list: list of lists each containing a float model layer's weights - not quantized
+        act_bn_mean: list of prior activations mean collected from batch normalization. None is there's no info
+        act_bn_std: list of prior activations std collected from batch normalization. None is there's no info
+        loss_weights: A vector of weights to compute weighted average loss.
+    Returns:
+        A single loss value which is the average of all MSE loss of all tensor pairs
+    """
+
+    loss_values_list = []
+    for i, (y, x) in enumerate(zip(y_list, x_list)):
+        point_loss = sample_mse_loss(y, x)
+        loss_values_list.append(point_loss)
+
+    if loss_weights is not None:
+        return torch.mean(loss_weights * torch.stack(loss_values_list))
+    else:
+        return torch.mean(torch.stack(loss_values_list))
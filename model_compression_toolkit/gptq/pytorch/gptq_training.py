@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Callable, List, Tuple
+import os
+from typing import Any, Callable, Dict, List, Tuple
 
 import numpy as np
 from tqdm import tqdm
@@ -21,15 +22,30 @@ import torch
 from model_compression_toolkit.core.common.logger import Logger
 from model_compression_toolkit.gptq.common.gptq_training import GPTQTrainer
 from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig
-from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.pytorch.constants import BIAS, KERNEL
 from model_compression_toolkit.gptq.pytorch.gptq_model_builder import GPTQPytorchModelBuilder
-from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, set_model, torch_tensor_to_numpy
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, set_model, torch_tensor_to_numpy, \
+    get_working_device
 from model_compression_toolkit.gptq.pytorch.gptq_graph_info import get_trainable_parameters, get_weights_for_loss
 from model_compression_toolkit.gptq.pytorch.quantizer.quantizer_wrapper import WeightQuantizerWrapper
 from model_compression_toolkit.gptq.pytorch.gptq_graph_info import get_gumbel_probability
+from model_compression_toolkit.gptq.pytorch.quantizer.gumbel_rounding.base_gumbel_weights_quantizer import \
+    BaseGumbelWeightQuantizer
+from model_compression_toolkit.gptq.common.gptq_constants import QUANTIZERS_SEEDS, QUANTIZERS_ITERATIONS
+from model_compression_toolkit.gptq.pytorch.data_parallel import data_parallel_training, shard_batch, \
+    all_reduce_gradients, check_data_parallel_support, is_loss_sample_separable, SEPARABILITY_CHECK_SHARD_SIZE, \
+    blocks_parallel_training
+
+TORCH_CHECKPOINT_FILE = 'torch_state.pt'
+MODEL_STATE = 'model'
+OPTIMIZERS_STATE = 'optimizers'
+TORCH_RANDOM_STATE = 'torch_random_state'
+CUDA_RANDOM_STATE = 'cuda_random_state'
+WEIGHTS_QUANTIZATION_PARAMS = 'weights_quantization_params'
+
 
 class PytorchGPTQTrainer(GPTQTrainer):
     """
@@ -57,31 +73,41 @@ class PytorchGPTQTrainer(GPTQTrainer):
             fw_info: Framework information
             representative_data_gen: Dataset to use for inputs of the models.
         """
+        if gptq_config.num_workers > 1:
+            check_data_parallel_support()
         super().__init__(graph_float, graph_quant, gptq_config, fw_impl, fw_info)
         self.loss_list = []
-        self.input_scale = 1
-        if self.float_user_info.input_scale != self.gptq_user_info.input_scale:
-            Logger.error("Input scale mismatch between float and GPTQ networks")  # pragma: no cover
+        # Index of the data-parallel worker process and number of workers (set in the workers), and a connection
+        # to send the training logs through from the first worker to the parent process
+        self.rank = 0
+        self.world_size = 1
+        self.log_connection = None
+        if self.gptq_config.block_wise:
+            # The trainable parameters and optimizers are set for each block in train_block
+            self.input_scale = self.float_user_info.input_scale
         else:
-            self.input_scale = self.gptq_user_info.input_scale
+            if self.float_user_info.input_scale != self.gptq_user_info.input_scale:
+                Logger.error("Input scale mismatch between float and GPTQ networks")  # pragma: no cover
+            else:
+                self.input_scale = self.gptq_user_info.input_scale
 
-        trainable_weights, trainable_bias, trainable_threshold, trainable_temperature = get_trainable_parameters(
-            self.fxp_model,
-            add_bias=self.gptq_config.train_bias,
-            quantization_parameters_learning=self.gptq_config.quantization_parameters_learning,
-            is_gumbel=self.gptq_config.is_gumbel)
+            trainable_weights, trainable_bias, trainable_threshold, trainable_temperature = get_trainable_parameters(
+                self.fxp_model,
+                add_bias=self.gptq_config.train_bias,
+                quantization_parameters_learning=self.gptq_config.quantization_parameters_learning,
+                is_gumbel=self.gptq_config.is_gumbel)
 
-        self.flp_weights_list, self.fxp_weights_list = get_weights_for_loss(self.fxp_model)
-        if not (len(self.compare_points) == len(trainable_weights) == len(self.flp_weights_list) == len(
-                self.fxp_weights_list)):
-            Logger.error(
-                "GPTQ: Mismatch between number of compare points, number of layers with trainable weights " +
-                "and number of float and quantized weights for loss")
+            self.flp_weights_list, self.fxp_weights_list = get_weights_for_loss(self.fxp_model)
+            if not (len(self.compare_points) == len(trainable_weights) == len(self.flp_weights_list) == len(
+                    self.fxp_weights_list)):
+                Logger.error(
+                    "GPTQ: Mismatch between number of compare points, number of layers with trainable weights " +
+                    "and number of float and quantized weights for loss")
 
-        self.optimizer_with_param = self.get_optimizer_with_param(trainable_weights,
-                                                                  trainable_bias,
-                                                                  trainable_threshold,
-                                                                  trainable_temperature)
+            self.optimizer_with_param = self.get_optimizer_with_param(trainable_weights,
+                                                                      trainable_bias,
+                                                                      trainable_threshold,
+                                                                      trainable_temperature)
 
         self.weights_for_average_loss = to_torch_tensor(self.compute_jacobian_based_weights(representative_data_gen))
 
@@ -104,6 +130,11 @@ class PytorchGPTQTrainer(GPTQTrainer):
           Returns:
               Graph after GPTQ training
           """
+        if self.gptq_config.block_wise:
+            set_model(self.float_model, False)
+            self.train_block_wise(representative_data_gen)
+            return
+
         # Set Optimizers
         for (optimizer, params) in self.optimizer_with_param:
             optimizer.param_groups.clear()
@@ -112,12 +143,170 @@ class PytorchGPTQTrainer(GPTQTrainer):
         # Set models mode
         set_model(self.float_model, False)
         set_model(self.fxp_model, True)
-        self._set_requires_grad()
+        for param in self.float_model.parameters():
+            param.requires_grad = False
+        self._set_requires_grad(self.fxp_model)
 
         # ----------------------------------------------
         # Training loop
         # ----------------------------------------------
-        self.micro_training_loop(representative_data_gen, self.gptq_config.n_iter)
+        self._build_teacher_activation_cache(representative_data_gen)
+        try:
+            if self.gptq_config.num_workers > 1:
+                self._check_data_parallel_loss()
+                data_parallel_training(self, representative_data_gen, self.gptq_config.n_iter)
+            else:
+                self.micro_training_loop(representative_data_gen, self.gptq_config.n_iter)
+        finally:
+            self._release_teacher_activation_cache()
+
+    def _check_data_parallel_loss(self):
+        """
+        Check that the GPTQ loss is separable over the batch samples, so data-parallel training is equivalent to
+        single-process training. The check runs on random inputs, and on a random perturbation of the float model's
+        outputs as the quantized outputs (so the training state, e.g. the quantizers' iterations, is not changed).
+
+        """
+        world_size = self.gptq_config.num_workers
+        generator = torch.Generator().manual_seed(0)
+        input_tensors = [torch.randn([world_size * SEPARABILITY_CHECK_SHARD_SIZE] + list(n.output_shape[0][1:]),
+                                     generator=generator).to(get_working_device())
+                         for n in self.graph_float.get_inputs()]
+        with torch.no_grad():
+            y_float = self.float_model(input_tensors)
+            y_fxp = [y + 0.1 * torch.randn(y.shape, generator=generator).to(y.device) * torch.std(y) for y in y_float]
+
+            def _loss_fn(_y_fxp, _y_float):
+                return self.gptq_config.loss(_y_fxp,
+                                             _y_float,
+                                             self.fxp_weights_list,
+                                             self.flp_weights_list,
+                                             self.compare_points_mean,
+                                             self.compare_points_std,
+                                             self.weights_for_average_loss)
+
+            if not is_loss_sample_separable(_loss_fn, y_fxp, y_float, world_size):
+                Logger.error('Data-parallel GPTQ requires a loss that averages over the batch samples (the loss of '
+                             'a batch should be the mean loss of its shards), otherwise the averaged gradients of '
+                             'the workers are not the gradients of the batch. Use a sample-averaged loss (such as '
+                             'multiple_tensors_sample_mse_loss), or num_workers=1')
+
+    def train_blocks(self, get_block: Callable, n_blocks: int):
+        """
+        Train the GPTQ blocks. If the GPTQ config has more than one worker, the blocks are trained in
+        parallel worker processes.
+
+        Args:
+            get_block: A callable that gets a block index, and returns the block's graph and its data function.
+            n_blocks: Number of blocks (compare points) to train.
+
+        """
+        if self.gptq_config.num_workers > 1:
+            blocks_parallel_training(self, get_block, n_blocks)
+        else:
+            super().train_blocks(get_block, n_blocks)
+
+    def train_block(self, block_graph: Graph, compare_point_index: int, data_function: Callable):
+        """
+        Train a single GPTQ block, and update the quantized graph with the block's trained parameters.
+
+        Args:
+            block_graph: Graph of the block (a compare point and its input nodes).
+            compare_point_index: Index of the block's compare point in the compare points list.
+            data_function: A callable that returns a list of the block's float inputs and a list of its
+                float outputs.
+        """
+        self.set_trained_parameters(self.graph_quant,
+                                    self.train_block_parameters(block_graph, compare_point_index, data_function))
+
+    def train_block_parameters(self,
+                               block_graph: Graph,
+                               compare_point_index: int,
+                               data_function: Callable) -> Dict[str, Dict[str, Any]]:
+        """
+        Train a single GPTQ block.
+
+        Args:
+            block_graph: Graph of the block (a compare point and its input nodes).
+            compare_point_index: Index of the block's compare point in the compare points list.
+            data_function: A callable that returns a list of the block's float inputs and a list of its
+                float outputs.
+
+        Returns: The trained parameters of the block's nodes (see get_trained_parameters).
+        """
+        block_model, _ = GPTQPytorchModelBuilder(block_graph,
+                                                 self.gptq_config,
+                                                 append2output=[block_graph.get_outputs()[0].node],
+                                                 return_float_outputs=True).build_model()
+        trainable_weights, trainable_bias, trainable_threshold, trainable_temperature = get_trainable_parameters(
+            block_model,
+            add_bias=self.gptq_config.train_bias,
+            quantization_parameters_learning=self.gptq_config.quantization_parameters_learning,
+            is_gumbel=self.gptq_config.is_gumbel)
+        flp_weights_list, fxp_weights_list = get_weights_for_loss(block_model)
+
+        # The configured optimizers are reused for all blocks, with the block's parameters
+        optimizer_with_param = self.get_optimizer_with_param(trainable_weights,
+                                                             trainable_bias,
+                                                             trainable_threshold,
+                                                             trainable_temperature)
+        for (optimizer, params) in optimizer_with_param:
+            optimizer.param_groups.clear()
+            optimizer.state.clear()
+            optimizer.add_param_group({'params': params})
+
+        set_model(block_model, True)
+        self._set_requires_grad(block_model)
+
+        for _ in tqdm(range(int(self.gptq_config.n_iter))):
+            input_data, y_float = data_function()
+            y_fxp = block_model(*to_torch_tensor(input_data))
+            loss_value = self._compute_loss(block_model,
+                                            y_fxp,
+                                            to_torch_tensor(y_float),
+                                            fxp_weights_list,
+                                            flp_weights_list,
+                                            [self.compare_points_mean[compare_point_index]],
+                                            [self.compare_points_std[compare_point_index]],
+                                            to_torch_tensor(np.ones(1)))
+            loss_value.backward()
+            for (optimizer, _) in optimizer_with_param:
+                optimizer.step()
+                optimizer.zero_grad()
+            self.loss_list.append(loss_value.item())
+            Logger.debug(f'last loss value: {self.loss_list[-1]}')
+
+        return self.get_trained_parameters(block_model)
+
+    def create_block_input_node(self, name: str, output_shape: Tuple[Any]) -> BaseNode:
+        """
+        Create an input node for a GPTQ block graph.
+
+        Args:
+            name: Name of the node.
+            output_shape: Shape of the node's output tensor.
+
+        Returns: An input node.
+        """
+        input_node = copy.deepcopy(self.graph_quant.get_inputs()[0])
+        input_node.name = name
+        input_node.input_shape = output_shape
+        input_node.output_shape = output_shape
+        return input_node
+
+    def run_float_model(self, float_model: torch.nn.Module, input_data: List[np.ndarray]) -> List[torch.Tensor]:
+        """
+        Run a float (teacher) model.
+
+        Args:
+            float_model: Float model to run.
+            input_data: A list of input arrays.
+
+        Returns: A list of the float model's outputs (for each of its output nodes).
+        """
+        with torch.no_grad():
+            y_float = float_model(*to_torch_tensor(input_data))
+        return y_float if isinstance(y_float, list) else [y_float]
 
     def compute_gradients(self,
                           y_float: List[torch.Tensor],
@@ -136,34 +325,74 @@ class PytorchGPTQTrainer(GPTQTrainer):
         y_fxp = self.fxp_model(input_tensors)
 
         # Loss
-        loss_value = self.gptq_config.loss(y_fxp,
-                                           y_float,
-                                           self.fxp_weights_list,
-                                           self.flp_weights_list,
-                                           self.compare_points_mean,
-                                           self.compare_points_std,
-                                           self.weights_for_average_loss)
-
-        if self.gptq_config.is_gumbel and self.gptq_config.quantizer_config.temperature_learning:
-            gumbel_prob = get_gumbel_probability(self.fxp_model)
-            gumbel_reg = 0
-            for p in gumbel_prob:
-                entropy = -torch.mean(torch.sum(p * torch.log(torch.maximum(p, self.gptq_config.eps*torch.ones_like(p))),dim=0))
-                gumbel_reg += entropy
-            gumbel_reg = 0 if gumbel_reg == 0 else gumbel_reg/len(gumbel_prob)
-            loss_value += self.gptq_config.quantizer_config.gumbel_entropy_regularization * gumbel_reg
+        loss_value = self._compute_loss(self.fxp_model,
+                                        y_fxp,
+                                        y_float,
+                                        self.fxp_weights_list,
+                                        self.flp_weights_list,
+                                        self.compare_points_mean,
+                                        self.compare_points_std,
+                                        self.weights_for_average_loss)
 
         # Back-pass
         loss_value.backward()
+        if self.world_size > 1:
+            loss_value = all_reduce_gradients([p for _, params in self.optimizer_with_param for p in params],
+                                              loss_value,
+                                              self.world_size)
 
         # Get gradients
         grads = []
         for param in self.fxp_model.parameters():
             if param.requires_grad and param.grad is not None:
-                grads.append(torch_tensor_to_numpy(param.grad))
+                grads.append(torch_tensor_to_numpy(param.grad.float()))
 
         return loss_value, grads
 
+    def _compute_loss(self,
+                      model: torch.nn.Module,
+                      y_fxp: List[torch.Tensor],
+                      y_float: List[torch.Tensor],
+                      fxp_weights_list: List[List[torch.Tensor]],
+                      flp_weights_list: List[List[torch.Tensor]],
+                      compare_points_mean: List,
+                      compare_points_std: List,
+                      weights_for_average_loss: torch.Tensor) -> torch.Tensor:
+        """
+        Compute the GPTQ loss of a quantized model's outputs, including the Gumbel entropy regularization
+        (if temperature learning is enabled).
+
+        Args:
+            model: Quantized model the outputs were computed by.
+            y_fxp: A list of the quantized model's outputs.
+            y_float: A list of reference tensors from the floating point network.
+            fxp_weights_list: A list of the quantized model's weights for the loss.
+            flp_weights_list: A list of the float model's weights for the loss.
+            compare_points_mean: A list of the compare points' mean values.
+            compare_points_std: A list of the compare points' std values.
+            weights_for_average_loss: A vector of weights to compute weighted average loss.
+
+        Returns:
+            Loss value.
+        """
+        loss_value = self.gptq_config.loss(y_fxp,
+                                           y_float,
+                                           fxp_weights_list,
+                                           flp_weights_list,
+                                           compare_points_mean,
+                                           compare_points_std,
+                                           weights_for_average_loss)
+
+        if self.gptq_config.is_gumbel and self.gptq_config.quantizer_config.temperature_learning:
+            gumbel_prob = get_gumbel_probability(model)
+            gumbel_reg = 0
+            for p in gumbel_prob:
+                entropy = -torch.mean(torch.sum(p * torch.log(torch.maximum(p, self.gptq_config.eps*torch.ones_like(p))),dim=0))
+                gumbel_reg += entropy
+            gumbel_reg = 0 if gumbel_reg == 0 else gumbel_reg/len(gumbel_prob)
+            loss_value += self.gptq_config.quantizer_config.gumbel_entropy_regularization * gumbel_reg
+        return loss_value
+
     def micro_training_loop(self,
                             data_function: Callable,
                             n_iteration: int):
@@ -173,22 +402,86 @@ class PytorchGPTQTrainer(GPTQTrainer):
             data_function: A callable function that give a batch of samples.
             n_iteration: Number of update iterations.
         """
-        for _ in tqdm(range(int(n_iteration))):
-            data = data_function()
-            input_data = [d * self.input_scale for d in data]
+        n_iteration = int(n_iteration)
+        start_iteration = self._restore_checkpoint()
+        for iteration in tqdm(range(start_iteration, n_iteration), initial=start_iteration, total=n_iteration):
+            input_data, y_float = self._get_training_batch(data_function)
+            if self.world_size > 1:
+                input_data = shard_batch(input_data, self.rank, self.world_size)
+                y_float = None if y_float is None else shard_batch(y_float, self.rank, self.world_size)
             input_tensor = to_torch_tensor(input_data)
-            y_float = self.float_model(input_tensor)  # running float model
+            if y_float is None:
+                y_float = self.float_model(input_tensor)  # running float model
+            else:
+                y_float = to_torch_tensor(y_float)
             loss_value, grads = self.compute_gradients(y_float, input_tensor)
             # Run one step of gradient descent by updating the value of the variables to minimize the loss.
             for (optimizer, _) in self.optimizer_with_param:
                 optimizer.step()
                 optimizer.zero_grad()
-            if self.gptq_config.log_function is not None:
-                self.gptq_config.log_function(loss_value.item(),
-                                              torch_tensor_to_numpy(grads),
-                                              torch_tensor_to_numpy(self.optimizer_with_param[0][-1]))
             self.loss_list.append(loss_value.item())
-            Logger.debug(f'last loss value: {self.loss_list[-1]}')
+            # In data-parallel training, the replicas are identical so only the first worker logs and saves them.
+            # The logs are sent to the parent process, so the log function is called there.
+            if self.rank == 0:
+                if self.gptq_config.log_function is not None:
+                    log_args = (loss_value.item(),
+                                torch_tensor_to_numpy(grads),
+                                torch_tensor_to_numpy(self.optimizer_with_param[0][-1]))
+                    if self.log_connection is None:
+                        self.gptq_config.log_function(*log_args)
+                    else:
+                        self.log_connection.send(log_args)
+                Logger.debug(f'last loss value: {self.loss_list[-1]}')
+                self._save_checkpoint(iteration + 1, n_iteration)
+
+    def _get_gumbel_quantizers(self) -> List[BaseGumbelWeightQuantizer]:
+        """
+        Returns: A list of the quantized model's Gumbel Rounding quantizers.
+        """
+        return [layer.weight_quantizer for layer in self.fxp_model.modules()
+                if isinstance(layer, WeightQuantizerWrapper) and
+                isinstance(layer.weight_quantizer, BaseGumbelWeightQuantizer)]
+
+    def save_training_state(self, checkpoint_path: str):
+        """
+        Save the quantized model's parameters, the optimizers' state, the random generators' state and the
+        Gumbel quantizers' seeds and iteration counters to a checkpoint directory.
+
+        Args:
+            checkpoint_path: Directory of the checkpoint.
+        """
+        gumbel_quantizers = self._get_gumbel_quantizers()
+        torch.save({MODEL_STATE: self.fxp_model.state_dict(),
+                    OPTIMIZERS_STATE: [o.state_dict() for o, _ in self.optimizer_with_param],
+                    TORCH_RANDOM_STATE: torch.get_rng_state(),
+                    CUDA_RANDOM_STATE: torch.cuda.get_rng_state_all() if torch.cuda.is_available() else None,
+                    QUANTIZERS_SEEDS: [q.seed for q in gumbel_quantizers],
+                    QUANTIZERS_ITERATIONS: [q.n_iter for q in gumbel_quantizers]},
+                   os.path.join(checkpoint_path, TORCH_CHECKPOINT_FILE))
+
+    def load_training_state(self, checkpoint_path: str):
+        """
+        Load the quantized model's parameters, the optimizers' state, the random generators' state and the
+        Gumbel quantizers' seeds and iteration counters from a checkpoint directory.
+
+        Args:
+            checkpoint_path: Directory of the checkpoint.
+        """
+        state = torch.load(os.path.join(checkpoint_path, TORCH_CHECKPOINT_FILE), map_location=get_working_device())
+        self.fxp_model.load_state_dict(state[MODEL_STATE])
+        for (optimizer, _), optimizer_state in zip(self.optimizer_with_param, state[OPTIMIZERS_STATE]):
+            optimizer.load_state_dict(optimizer_state)
+        torch.set_rng_state(state[TORCH_RANDOM_STATE].cpu())
+        if state[CUDA_RANDOM_STATE] is not None and torch.cuda.is_available():
+            torch.cuda.set_rng_state_all(state[CUDA_RANDOM_STATE])  # pragma: no cover
+
+        gumbel_quantizers = self._get_gumbel_quantizers()
+        if len(state[QUANTIZERS_SEEDS]) != len(gumbel_quantizers):
+            Logger.error(f'GPTQ checkpoint mismatch: expected {len(gumbel_quantizers)} Gumbel quantizers '
+                         f'but the checkpoint has {len(state[QUANTIZERS_SEEDS])}')  # pragma: no cover
+        for q, seed, n_iter in zip(gumbel_quantizers, state[QUANTIZERS_SEEDS], state[QUANTIZERS_ITERATIONS]):
+            q.seed = seed
+            q.n_iter = n_iter
 
     def update_graph(self) -> Graph:
         """
@@ -198,37 +491,78 @@ class PytorchGPTQTrainer(GPTQTrainer):
             Updated graph after GPTQ.
         """
         graph_quant = copy.copy(self.graph_quant)
+        if not self.gptq_config.block_wise:
+            # In block-wise training, the graph is updated after the training of each block
+            self._update_graph_from_model(self.graph_quant, self.fxp_model)
+        return graph_quant
+
+    def _update_graph_from_model(self, graph: Graph, fxp_model: torch.nn.Module):
+        """
+        Update the nodes of a graph with the trained parameters of a GPTQ model.
+
+        Args:
+            graph: Graph to update.
+            fxp_model: Trained GPTQ model.
+        """
+        self.set_trained_parameters(graph, self.get_trained_parameters(fxp_model))
 
-        # Update graph after training
-        for name, layer in self.fxp_model.named_modules():
+    def get_trained_parameters(self, fxp_model: torch.nn.Module) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the trained parameters of a GPTQ model as numpy arrays (so they can be sent between processes).
+
+        Args:
+            fxp_model: Trained GPTQ model.
+
+        Returns: A dictionary from the name of each trained layer to its quantized kernel, and its weights
+        quantization params and bias (if they are trained).
+        """
+        trained_parameters = {}
+        for name, layer in fxp_model.named_modules():
             if isinstance(layer, WeightQuantizerWrapper):
-                node = self.graph_quant.find_node_by_name(name)
-                if len(node) != 1:
-                    Logger.error(f"Can't update GPTQ graph due to missing layer named: {name}")
-                node = node[0]
                 # Weight
-                node.set_weights_by_keys(KERNEL, self.fw_impl.to_numpy(layer.weight_quantizer(layer.float_weight, training=False)))
+                layer_parameters = {KERNEL: self.fw_impl.to_numpy(layer.weight_quantizer(layer.float_weight, training=False))}
                 # Weight quantization params
                 if self.gptq_config.quantization_parameters_learning:
-                    node.final_weights_quantization_cfg.set_weights_quantization_param(layer.weight_quantizer.get_weight_quant_params())
+                    layer_parameters[WEIGHTS_QUANTIZATION_PARAMS] = layer.weight_quantizer.get_weight_quant_params()
                 # Bias
                 if self.gptq_config.train_bias:
-                    node.set_weights_by_keys(BIAS, self.fw_impl.to_numpy(getattr(layer.op, BIAS)))
+                    layer_parameters[BIAS] = self.fw_impl.to_numpy(getattr(layer.op, BIAS))
+                trained_parameters[name] = layer_parameters
+        return trained_parameters
 
-        return graph_quant
+    def set_trained_parameters(self, graph: Graph, trained_parameters: Dict[str, Dict[str, Any]]):
+        """
+        Update the nodes of a graph with trained GPTQ parameters.
 
-    def _set_requires_grad(self):
+        Args:
+            graph: Graph to update.
+            trained_parameters: The trained parameters of the nodes (see get_trained_parameters).
+        """
+        for name, layer_parameters in trained_parameters.items():
+            node = graph.find_node_by_name(name)
+            if len(node) != 1:
+                Logger.error(f"Can't update GPTQ graph due to missing layer named: {name}")
+            node = node[0]
+            node.set_weights_by_keys(KERNEL, layer_parameters[KERNEL])
+            if WEIGHTS_QUANTIZATION_PARAMS in layer_parameters:
+                node.final_weights_quantization_cfg.set_weights_quantization_param(
+                    layer_parameters[WEIGHTS_QUANTIZATION_PARAMS])
+            if BIAS in layer_parameters:
+                node.set_weights_by_keys(BIAS, layer_parameters[BIAS])
+
+    def _set_requires_grad(self, fxp_model: torch.nn.Module):
         """
         Set require_grad flag for trainable parameters for GPTQ training
+
+        Args:
+            fxp_model: GPTQ model to set its trainable parameters.
         """
-        # Float and Fxp models: freeze all the parameters in the network
-        for param in self.float_model.parameters():
-            param.requires_grad = False
-        for param in self.fxp_model.parameters():
+        # Fxp model: freeze all the parameters in the network
+        for param in fxp_model.parameters():
             param.requires_grad = False
 
         # Fxp model: unfreeze only trainable parameters
-        for layer in self.fxp_model.modules():
+        for layer in fxp_model.modules():
             if isinstance(layer, WeightQuantizerWrapper):
                 for param in layer.weight_quantizer.get_trainable_params():
                     param.requires_grad = True
@@ -18,6 +18,7 @@ from model_compression_toolkit.core.common.constants import FOUND_TORCH
 from model_compression_toolkit.core.common import Logger
 from model_compression_toolkit.core.common.constants import PYTORCH
 from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig
+from model_compression_toolkit.gptq.common.gptq_checkpoint import get_resume_gptq_config
 from model_compression_toolkit.core.common.target_platform import TargetPlatformCapabilities
 from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPI
 from model_compression_toolkit.core.runner import core_runner, _init_tensorboard_writer
@@ -37,7 +38,8 @@ if FOUND_TORCH:
     from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
     from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
     from model_compression_toolkit.core.pytorch.constants import DEFAULT_TP_MODEL
-    from model_compression_toolkit.gptq.pytorch.gptq_loss import multiple_tensors_mse_loss
+    from model_compression_toolkit.gptq.pytorch.gptq_loss import multiple_tensors_mse_loss, \
+        multiple_tensors_sample_mse_loss
     from model_compression_toolkit.exporter.fully_quantized.pytorch.builder.fully_quantized_model_builder import get_fully_quantized_pytorch_model
     import torch
     from torch.nn import Module
@@ -51,8 +53,9 @@ if FOUND_TORCH:
     def get_pytorch_gptq_config(n_iter: int,
                                 optimizer: Optimizer = Adam([torch.Tensor([])], lr=LR_DEFAULT),
                                 optimizer_rest: Optimizer = Adam([torch.Tensor([])], lr=LR_REST_DEFAULT),
-                                loss: Callable = multiple_tensors_mse_loss,
-                                log_function: Callable = None) -> GradientPTQConfig:
+                                loss: Callable = None,
+                                log_function: Callable = None,
+                                num_workers: int = 1) -> GradientPTQConfig:
         """
         Create a GradientPTQConfig instance for Pytorch models.
 
@@ -60,8 +63,9 @@ if FOUND_TORCH:
             n_iter (int): Number of iterations to fine-tune.
             optimizer (Optimizer): Pytorch optimizer to use for fine-tuning for auxiliry variable.
             optimizer_rest (Optimizer): Pytorch optimizer to use for fine-tuning of the bias variable.
-            loss (Callable): loss to use during fine-tuning. should accept 4 lists of tensors. 1st list of quantized tensors, the 2nd list is the float tensors, the 3rd is a list of quantized weights and the 4th is a list of float weights.
+            loss (Callable): loss to use during fine-tuning. should accept 4 lists of tensors. 1st list of quantized tensors, the 2nd list is the float tensors, the 3rd is a list of quantized weights and the 4th is a list of float weights. If None, multiple_tensors_mse_loss is used, or multiple_tensors_sample_mse_loss (which averages over the batch samples) if num_workers > 1.
             log_function (Callable): Function to log information about the gptq process.
+            num_workers (int): Number of data-parallel training processes (see GradientPTQConfig).
 
         returns:
             a GradientPTQConfig object to use when fine-tuning the quantized model using gptq.
@@ -83,6 +87,8 @@ if FOUND_TORCH:
         """
         bias_optimizer = Adam([torch.Tensor([])], lr=LR_BIAS_DEFAULT)
         optimizer_quantization_parameter = Adam([torch.Tensor([])], lr=LR_QUANTIZATION_PARAM_DEFAULT)
+        if loss is None:
+            loss = multiple_tensors_sample_mse_loss if num_workers > 1 else multiple_tensors_mse_loss
         return GradientPTQConfig(n_iter,
                                  optimizer,
                                  optimizer_rest=optimizer_rest,
@@ -90,7 +96,8 @@ if FOUND_TORCH:
                                  log_function=log_function,
                                  train_bias=True,
                                  optimizer_quantization_parameter=optimizer_quantization_parameter,
-                                 optimizer_bias=bias_optimizer)
+                                 optimizer_bias=bias_optimizer,
+                                 num_workers=num_workers)
 
 
     def pytorch_gradient_post_training_quantization_experimental(model: Module,
@@ -197,6 +204,55 @@ if FOUND_TORCH:
                             tb_w,
                             bit_widths_config)
 
+
+    def pytorch_resume_gradient_post_training_quantization_experimental(model: Module,
+                                                                        representative_data_gen: Callable,
+                                                                        target_kpi: KPI = None,
+                                                                        core_config: CoreConfig = CoreConfig(),
+                                                                        gptq_config: GradientPTQConfig = None,
+                                                                        target_platform_capabilities: TargetPlatformCapabilities = DEFAULT_PYTORCH_TPC,
+                                                                        new_experimental_exporter: bool = False):
+        """
+        Resume a GPTQ run of :func:`~model_compression_toolkit.pytorch_gradient_post_training_quantization_experimental`
+        from the last checkpoint in the checkpoint directory of gptq_config.checkpoint_config.
+        The quantized module is rebuilt from the given module, its trained parameters, the optimizers' state and
+        the random generators' state are restored from the checkpoint, and the training continues from the
+        checkpoint's iteration.
+        The arguments should be the same as the ones of the stopped run (and the representative dataset should
+        give the same samples), so the rebuilt quantized module matches the checkpoint.
+
+        Args:
+            model (Module): Pytorch model to quantize.
+            representative_data_gen (Callable): Dataset used for calibration.
+            target_kpi (KPI): KPI object to limit the search of the mixed-precision configuration as desired.
+            core_config (CoreConfig): Configuration object containing parameters of how the model should be quantized, including mixed precision parameters.
+            gptq_config (GradientPTQConfig): Configuration for using gptq, with a checkpoint_config.
+            target_platform_capabilities (TargetPlatformCapabilities): TargetPlatformCapabilities to optimize the PyTorch model according to.
+            new_experimental_exporter (bool): Whether exporting the quantized model using new exporter or not.
+
+        Returns:
+            A quantized module and information the user may need to handle the quantized module.
+
+        Examples:
+
+            Create a GPTQ config that saves a checkpoint every 100 iterations:
+
+            >>> gptq_conf = mct.get_pytorch_gptq_config(n_iter=1000)
+            >>> gptq_conf.checkpoint_config = mct.CheckpointConfig(checkpoint_dir='/tmp/gptq_checkpoints', save_interval=100)
+
+            If the run of :func:`~model_compression_toolkit.pytorch_gradient_post_training_quantization_experimental` was stopped, resume it:
+
+            >>> quantized_module, quantization_info = mct.pytorch_resume_gradient_post_training_quantization_experimental(module, repr_datagen, gptq_config=gptq_conf)
+
+        """
+        return pytorch_gradient_post_training_quantization_experimental(model,
+                                                                        representative_data_gen,
+                                                                        target_kpi=target_kpi,
+                                                                        core_config=core_config,
+                                                                        gptq_config=get_resume_gptq_config(gptq_config),
+                                                                        target_platform_capabilities=target_platform_capabilities,
+                                                                        new_experimental_exporter=new_experimental_exporter)
+
 else:
     # If torch is not installed,
     # we raise an exception when trying to use these functions.
@@ -210,3 +266,9 @@ else:
         Logger.critical('Installing Pytorch is mandatory '
                         'when using pytorch_gradient_post_training_quantization_experimental. '
                         'Could not find the torch package.')
+
+
+    def pytorch_resume_gradient_post_training_quantization_experimental(*args, **kwargs):
+        Logger.critical('Installing Pytorch is mandatory '
+                        'when using pytorch_resume_gradient_post_training_quantization_experimental. '
+                        'Could not find the torch package.')
@@ -17,15 +17,19 @@ from abc import abstractmethod
 import torch
 import numpy as np
 from model_compression_toolkit.core.common import Logger
-from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig
+from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig, AuxVarPrecision
 from model_compression_toolkit.gptq.pytorch.quantizer.gptq_quantizer import BaseWeightQuantizer
 from model_compression_toolkit.core.common.quantization.node_quantization_config import NodeWeightsQuantizationConfig
 from model_compression_toolkit.gptq.pytorch.quantizer.quant_utils import sample_gumbel
-from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, get_working_device
 from model_compression_toolkit.core.common.target_platform.op_quantization_config import QuantizationMethod
 
 P_INIT = 0.01
 
+AUX_VAR_DTYPES = {AuxVarPrecision.FLOAT32: torch.float32,
+                  AuxVarPrecision.FLOAT16: torch.float16,
+                  AuxVarPrecision.BFLOAT16: torch.bfloat16}
+
 def init_aux_var(w_shape: torch.Size, m: int, p: float = P_INIT) -> torch.Tensor:
     """
     This function generate a random pi matrix for Gumbel Rounding
@@ -77,7 +81,6 @@ class BaseGumbelWeightQuantizer(BaseWeightQuantizer):
         super().__init__()
 
         self.power_of_two = QuantizationMethod.POWER_OF_TWO == weights_quantization_cfg.weights_quantization_method
-        self.reshape_aux_shift = [-1, *[1 for _ in range(len(weight_shape))]]
         self.num_bits = weights_quantization_cfg.weights_n_bits
         self.weight_shape = weight_shape
         self.max_delta_change = gptq_config.lsb_change_per_bit_width.get(self.num_bits)
@@ -88,10 +91,13 @@ class BaseGumbelWeightQuantizer(BaseWeightQuantizer):
         self.temperature_learning = gptq_config.quantizer_config.temperature_learning
         self.cycle_iterations = int(gptq_config.n_iter / gptq_config.quantizer_config.n_cycles)
         self.shift_tensor = to_torch_tensor(init_shift_var(self.m))
+        self.aux_var_dtype = AUX_VAR_DTYPES[gptq_config.quantizer_config.aux_var_precision]
         self.tau = None
-        self.g_t = 0
         self.p_t = None
         self.n_iter = 0
+        # Seed of the counter-based generator of the gumbel noise (the iteration number is the counter)
+        self.seed = np.random.randint(np.iinfo(np.int32).max)
+        self.generator = torch.Generator(device=get_working_device())
         self.update_gumbel_param = True
         scale = self.cycle_iterations / (-2 * np.log(0.001))
 
@@ -135,7 +141,18 @@ class BaseGumbelWeightQuantizer(BaseWeightQuantizer):
             if self.cycle_iterations > 0 and self.n_iter % self.cycle_iterations == 0:
                 self.temp_tensor.data = self.maximal_temp * to_torch_tensor(torch.ones(self.temp_tensor.shape))
             self.n_iter += 1
-            self.g_t = sample_gumbel([self.m, *self.weight_shape])
+
+    def get_gumbel_noise(self) -> torch.Tensor:
+        """
+        Sample the gumbel noise of the current iteration. The noise is generated from the quantizer's seed
+        and the iteration number, so it is not kept between iterations, and it is the same for all calls
+        in an iteration (e.g., when the update is disabled).
+
+        Returns: A tensor of i.i.d gumbel random variable in the shape of the auxiliary variable.
+
+        """
+        self.generator.manual_seed(self.seed + self.n_iter)
+        return sample_gumbel([self.m, *self.weight_shape], generator=self.generator)
 
     @abstractmethod
     def get_temperature_variable(self) -> Union[torch.Tensor, List]:
@@ -18,7 +18,7 @@ from typing import List, Union
 from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig
 from model_compression_toolkit.gptq.pytorch.quantizer.gumbel_rounding.base_gumbel_weights_quantizer import BaseGumbelWeightQuantizer, init_aux_var
 from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy
-from model_compression_toolkit.gptq.pytorch.quantizer.quant_utils import ste_clip, ste_gumbel, gumbel_softmax, power_of_two_max
+from model_compression_toolkit.gptq.pytorch.quantizer.quant_utils import ste_clip, gumbel_softmax_rounding, power_of_two_max
 from model_compression_toolkit.gptq.common.gptq_constants import AUXVAR, THRESHOLD_TENSOR, TEMP
 from model_compression_toolkit.core.common.quantization.node_quantization_config import NodeWeightsQuantizationConfig
 from model_compression_toolkit.core.common.constants import THRESHOLD
@@ -54,7 +54,8 @@ class SymmetricGumbelWeightQuantizer(BaseGumbelWeightQuantizer):
         """
         A function to set a list of trainable parameters of the quantizer for GPTQ retraining
         """
-        self.aux_tensor = nn.Parameter(to_torch_tensor(init_aux_var(self.weight_shape, self.m)), requires_grad=True)
+        self.aux_tensor = nn.Parameter(to_torch_tensor(init_aux_var(self.weight_shape, self.m)).to(self.aux_var_dtype),
+                                       requires_grad=True)
         self.trainable_params.update({AUXVAR: self.aux_tensor})
         self.temp_tensor = nn.Parameter(to_torch_tensor(self.maximal_temp*torch.ones([1,*self.weight_shape])), requires_grad=True)
         self.trainable_params.update({TEMP: self.temp_tensor})
@@ -103,11 +104,11 @@ class SymmetricGumbelWeightQuantizer(BaseGumbelWeightQuantizer):
         # Gumbel Softmax
         #####################################################
         if training:
-            self.p_t = gumbel_softmax(self.aux_tensor, self.tau, self.g_t)
+            self.p_t, auxhat_tensor = gumbel_softmax_rounding(self.aux_tensor, self.tau, self.get_gumbel_noise(),
+                                                              self.shift_tensor)
         else:
-            self.p_t = ste_gumbel(gumbel_softmax(self.aux_tensor, self.minimal_temp, 0))
-
-        auxhat_tensor = torch.sum(self.p_t * self.shift_tensor.reshape(self.reshape_aux_shift), dim=0)
+            self.p_t, auxhat_tensor = gumbel_softmax_rounding(self.aux_tensor, self.minimal_temp, 0,
+                                                              self.shift_tensor, hard=True)
 
         #####################################################
         # Quantizer
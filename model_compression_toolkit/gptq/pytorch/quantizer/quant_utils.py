@@ -12,11 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Union
+from typing import Union, Tuple
 import torch
-from torch.nn.functional import softmax, log_softmax, one_hot
+from torch.nn.functional import softmax, one_hot
 from model_compression_toolkit.core.common.constants import MIN_THRESHOLD
-from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+from model_compression_toolkit.core.pytorch.utils import get_working_device
 
 
 def power_of_two_max(max_tensor: torch.Tensor) -> torch.Tensor:
@@ -70,7 +70,33 @@ def gumbel_softmax(x: torch.Tensor, tau: Union[torch.Tensor,float], gumbel_tenso
     Returns: A gumbel softmax probability tensor.
 
     """
-    return softmax((log_softmax(x, dim=axis) + gumbel_tensor) / (tau + eps), dim=axis)
+    # The log-softmax normalization of x is constant along the softmax axis (and so is the temperature),
+    # thus it cancels out in the softmax and is not computed.
+    return softmax((x.float() + gumbel_tensor) / (tau + eps), dim=axis)
+
+
+def gumbel_softmax_rounding(x: torch.Tensor,
+                            tau: Union[torch.Tensor, float],
+                            gumbel_tensor: Union[torch.Tensor, float],
+                            shift_tensor: torch.Tensor,
+                            hard: bool = False) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Compute the gumbel softmax probability of the rounding shifts, and the expected rounding shift
+    of each element (contracting the shifts axis without materializing the weighted shifts tensor).
+    Args:
+        x: A tensor of log probability of the shifts (with the shifts on the first axis).
+        tau: A temperature tensor.
+        gumbel_tensor: A tensor of gumbel random variable.
+        shift_tensor: A vector of the shifts values.
+        hard: Whether to select the most probable shift (with STE) instead of the soft probability.
+
+    Returns: A gumbel softmax probability tensor, and the tensor of expected shifts.
+
+    """
+    p_t = gumbel_softmax(x, tau, gumbel_tensor)
+    if hard:
+        p_t = ste_gumbel(p_t)
+    return p_t, torch.tensordot(shift_tensor, p_t, dims=([0], [0]))
 
 
 def select_gumbel(prob: torch.Tensor) -> torch.Tensor:
@@ -102,15 +128,18 @@ def ste_gumbel(prob: torch.Tensor) -> torch.Tensor:
     return prob + delta
 
 
-def sample_gumbel(shape, eps=1e-6) -> torch.Tensor:
+def sample_gumbel(shape, eps=1e-6, generator: torch.Generator = None) -> torch.Tensor:
     """
     A function that sample a tensor of i.i.d gumbel random variable.
     Args:
         shape: The tensor output shape
         eps: A small number for numeric stability.
+        generator: A random generator to sample with (if None, the global random generator is used).
 
     Returns: A tensor of i.i.d gumbel random variable.
 
     """
-    u = to_torch_tensor(torch.rand(shape))
-    return -torch.log(-torch.log(u + eps) + eps)
\ No newline at end of file
+    # The noise is computed in-place, so a single tensor is allocated
+    u = torch.empty(shape, device=get_working_device() if generator is None else generator.device)
+    u.uniform_(generator=generator)
+    return u.add_(eps).log_().neg_().add_(eps).log_().neg_()
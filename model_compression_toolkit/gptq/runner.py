@@ -23,6 +23,7 @@ from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common import FrameworkInfo
 from model_compression_toolkit.core.common.graph.base_graph import Graph
+from model_compression_toolkit.core.common.pipeline_profiler import profile_stage
 from model_compression_toolkit.gptq.common.gptq_training import gptq_training
 
 from model_compression_toolkit.core.common.visualization.tensorboard_writer import TensorboardWriter
@@ -58,6 +59,10 @@ def _apply_gptq(gptq_config: GradientPTQConfig,
         common.Logger.info("Using experimental Gradient Based PTQ: If you encounter an issue "
                            "please file a bug. To disable it, do not pass a gptq configuration.")
 
+        if tb_w is not None and gptq_config.num_workers > 1:
+            # GPTQ forks worker processes, so the Tensorboard writing thread should not run while forking
+            tb_w.stop_worker()
+
         tg_bias = gptq_training(tg,
                                 tg_bias,
                                 gptq_config,
@@ -98,19 +103,23 @@ def gptq_runner(tg: Graph,
     #############################################
     # Apply Statistics Correction
     #############################################
-    tg_bias = apply_statistics_correction(tg, representative_data_gen, core_config, fw_info, fw_impl, tb_w)
+    with profile_stage('gptq_statistics_correction') as stage:
+        tg_bias = apply_statistics_correction(tg, representative_data_gen, core_config, fw_info, fw_impl, tb_w)
+        stage.set_graph(tg_bias)
 
     if tb_w is not None:
         tb_w.add_graph(tg_bias, 'after_bias_correction')
     #############################################
     # Gradient Based Post Training Quantization
     #############################################
-    tg_gptq = _apply_gptq(gptq_config,
-                          representative_data_gen,
-                          tb_w,
-                          tg,
-                          tg_bias,
-                          fw_info,
-                          fw_impl)
+    with profile_stage('gptq') as stage:
+        tg_gptq = _apply_gptq(gptq_config,
+                              representative_data_gen,
+                              tb_w,
+                              tg,
+                              tg_bias,
+                              fw_info,
+                              fw_impl)
+        stage.set_graph(tg_gptq)
 
     return tg_gptq
@@ -45,7 +45,8 @@ setup_obj = setup(name='model_compression_toolkit',
                   packages=find_packages(
                       exclude=["tests", "tests.*",
                                "requirements", "requirements.*",
-                               "tutorials", "tutorials.*"]),
+                               "tutorials", "tutorials.*",
+                               "benchmarks", "benchmarks.*"]),
                   classifiers=[
                       "Programming Language :: Python :: 3",
                       "License :: OSI Approved :: Apache Software License",
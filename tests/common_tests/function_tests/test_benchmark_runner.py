@@ -0,0 +1,50 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+from benchmarks.benchmark_runner import compare_to_baseline
+
+
+def get_results(wall_time, peak_rss_mb, stages_wall_time):
+    return {'benchmarks': {'keras/resnet_like/ptq': {
+        'wall_time': wall_time,
+        'peak_rss_mb': peak_rss_mb,
+        'stages': {name: {'wall_time': t} for name, t in stages_wall_time.items()}}}}
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+
+    def test_compare_to_baseline(self):
+        baseline = get_results(10., 1000., {'statistics_collection': 2., 'calculate_quantization_params': 5.,
+                                            'layer_fusing': 0.01})
+        results = get_results(10.5, 1500., {'statistics_collection': 1., 'calculate_quantization_params': 7.,
+                                            'layer_fusing': 0.05})
+        regressions, improvements = compare_to_baseline(results, baseline, tolerance=0.25)
+
+        # The total wall time changed within the tolerance, and the layer fusing time is too short to compare
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(any(['peak RSS' in r for r in regressions]))
+        self.assertTrue(any(['calculate_quantization_params' in r for r in regressions]))
+        self.assertEqual(len(improvements), 1)
+        self.assertTrue('statistics_collection' in improvements[0])
+
+    def test_compare_to_baseline_without_benchmark(self):
+        results = get_results(10., 1000., {})
+        regressions, improvements = compare_to_baseline(results, {'benchmarks': {}}, tolerance=0.25)
+        self.assertEqual(len(regressions) + len(improvements), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,6 +17,11 @@
 import unittest
 import numpy as np
 from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector, interpolate_histogram
+from model_compression_toolkit.core.common.collectors.statistics_collector import StatsCollector
+from model_compression_toolkit.core.common.quantization.quantization_config import HistogramSamplingMethod, \
+    QuantizationErrorMethod
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.power_of_two_selection import \
+    power_of_two_selection_histogram
 
 
 class TestHistogramCollector(unittest.TestCase):
@@ -47,6 +52,53 @@ class TestHistogramCollector(unittest.TestCase):
         self.assertTrue(hc.max() == 1.0)
         self.assertTrue(hc.min() == 1.0)
 
+    def test_sampled_histogram(self):
+        x = np.random.randn(8, 16, 16, 32)
+        for sampling_method in HistogramSamplingMethod:
+            hc = HistogramCollector(sample_size=1000, sampling_method=sampling_method)
+            hc.update(x)
+            bins, counts = hc.get_histogram()
+            # The range is the exact range of the tensor, and the counts are scaled to its size
+            bin_width = (np.max(x) - np.min(x)) / 2048
+            self.assertTrue(np.isclose(np.min(x), hc.min()))
+            self.assertTrue(np.isclose(np.max(x), hc.max(), atol=bin_width))
+            self.assertTrue(np.isclose(np.sum(counts), x.size))
+
+            # The sampled distribution is close to the tensor's distribution
+            cdf = np.cumsum(counts) / x.size
+            exact_cdf = np.searchsorted(np.sort(x.flatten()), bins[1:], side='right') / x.size
+            self.assertTrue(np.max(np.abs(cdf - exact_cdf)) < 0.1)
+
+    def test_sampled_histogram_outlier(self):
+        x = 0.1 * np.random.randn(100000)
+        x[12345] = 7.9
+        for sampling_method in HistogramSamplingMethod:
+            hc = HistogramCollector(sample_size=1000, sampling_method=sampling_method)
+            hc.update(x)
+            bins, counts = hc.get_histogram()
+            # The outlier is counted even if the sample misses it, so it still sets the threshold
+            self.assertTrue(np.isclose(np.sum(counts[bins[:-1] > 7.]), 1.))
+            threshold = power_of_two_selection_histogram(bins, counts, p=2, n_bits=8, min_value=hc.min(),
+                                                         max_value=hc.max(),
+                                                         quant_error_method=QuantizationErrorMethod.NOCLIPPING)
+            self.assertEqual(threshold['threshold'], 8.)
+
+    def test_sampled_histogram_small_tensor(self):
+        x = np.random.randn(10, 10)
+        hc, sampled_hc = HistogramCollector(), HistogramCollector(sample_size=1000)
+        hc.update(x)
+        sampled_hc.update(x)
+        self.assertTrue(np.array_equal(hc.get_histogram()[1], sampled_hc.get_histogram()[1]))
+
+    def test_sampled_stats_exact_min_max(self):
+        x = np.random.randn(4, 8, 8, 16)
+        x[1, 2, 3, 4] = 100.
+        x[2, 3, 4, 5] = -100.
+        sc = StatsCollector(out_channel_axis=-1, histogram_sample_size=100)
+        sc.update_statistics(x)
+        self.assertTrue(sc.get_min_max_values() == (-100., 100.))
+        self.assertTrue(np.array_equal(sc.mpcc.max_per_channel, np.max(x, axis=(0, 1, 2))))
+
     def test_inter_histogram(self):
         x = np.random.rand(1, 2, 3, 4)
         bins = np.linspace(-2, 2, num=100)
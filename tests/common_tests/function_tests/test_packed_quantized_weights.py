@@ -0,0 +1,54 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core.common.mixed_precision.packed_quantized_weights import pack_quantized_tensor
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import quantize_tensor
+
+
+class TestPackedQuantizedWeights(unittest.TestCase):
+
+    def test_pack_per_channel(self):
+        w = np.random.randn(3, 3, 64, 16).astype(np.float32)
+        threshold = 2.0 ** np.random.randint(-2, 2, size=(1, 1, 1, 16))
+        for n_bits in [2, 3, 4, 8]:
+            q_w = quantize_tensor(w, threshold, n_bits, True)
+            packed = pack_quantized_tensor(q_w, n_bits, channels_axis=-1)
+            self.assertIsNotNone(packed)
+            self.assertTrue(np.array_equal(packed.unpack(), q_w.astype(np.float32)))
+            # Codes take n_bits per element
+            self.assertEqual(packed.codes.nbytes, int(np.ceil(w.size * n_bits / 8)))
+            self.assertTrue(packed.nbytes < q_w.astype(np.float32).nbytes)
+
+    def test_pack_per_tensor(self):
+        w = np.random.randn(16, 8, 3, 3).astype(np.float32)
+        q_w = quantize_tensor(w, 1.0, 4, True)
+        packed = pack_quantized_tensor(q_w, 4)
+        self.assertEqual(packed.codebook.shape, (1, 16))
+        self.assertTrue(np.array_equal(packed.unpack(), q_w.astype(np.float32)))
+
+    def test_pack_unrepresentable_tensor(self):
+        # A float tensor has more distinct values than the codes can represent
+        self.assertIsNone(pack_quantized_tensor(np.random.randn(16, 16), 4))
+        self.assertIsNone(pack_quantized_tensor(np.random.randn(16, 16), 16))
+        # Packing a small tensor doesn't reduce its memory
+        self.assertIsNone(pack_quantized_tensor(quantize_tensor(np.linspace(-0.9, 0.9, 16).reshape((4, 4)),
+                                                                1.0, 8, True), 8))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+from benchmarks.primitive_benchmarks import run_primitive_benchmarks, compare_to_baseline, get_sweep_points, \
+    PRIMITIVES
+
+
+class TestPrimitiveBenchmarks(unittest.TestCase):
+
+    def test_sweep_points(self):
+        sweep = {'size': [10, 100], 'channels': [1, 2], 'n_bits': [4, 8], 'candidates': [4]}
+        points = get_sweep_points(('size', 'n_bits'), sweep)
+        self.assertEqual(len(points), 4)
+        self.assertTrue({'size': 100, 'n_bits': 4} in points)
+
+    def test_run_primitive_benchmarks(self):
+        sweep = {'size': [256], 'channels': [1, 4], 'n_bits': [4], 'candidates': [2], 'sample_size': [64]}
+        results = run_primitive_benchmarks(list(PRIMITIVES.keys()), sweep, min_time=0.)
+        self.assertEqual(set(results.keys()), set(PRIMITIVES.keys()))
+        for name, curve in results.items():
+            self.assertTrue(len(curve) > 0)
+            for point in curve:
+                self.assertTrue(point['throughput'] > 0, f'Non-positive throughput of {name}')
+                self.assertTrue(point['peak_memory_mb'] >= 0)
+        self.assertEqual(len(results['quantize_tensor']), 2)
+        self.assertTrue(results['strided_histogram_collector_update'][0]['threshold_relative_error'] >= 0)
+
+    def test_compare_to_baseline(self):
+        baseline = {'quantize_tensor': [{'key': 'size=10', 'throughput': 100.},
+                                        {'key': 'size=100', 'throughput': 100.}],
+                    'kmeans_assign_clusters': [{'key': 'size=10', 'throughput': 100.}]}
+        results = {'quantize_tensor': [{'key': 'size=10', 'throughput': 50.},
+                                       {'key': 'size=100', 'throughput': 110.},
+                                       {'key': 'size=1000', 'throughput': 10.}],
+                   'kmeans_assign_clusters': [{'key': 'size=10', 'throughput': 200.}]}
+        regressions, improvements = compare_to_baseline(results, baseline, tolerance=0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue('quantize_tensor size=10 ' in regressions[0])
+        self.assertEqual(len(improvements), 1)
+        self.assertTrue('kmeans_assign_clusters' in improvements[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.gptq.common.teacher_activation_cache import TeacherActivationCache
+
+
+def teacher_fn(inputs):
+    return [inputs[0].sum(axis=-1), inputs[0] * 2]
+
+
+class TestTeacherActivationCache(unittest.TestCase):
+
+    def test_teacher_activation_cache(self):
+        teacher_calls = []
+
+        def representative_data_gen():
+            teacher_calls.append(1)
+            return [np.random.randn(2, 4, 3)]
+
+        cache = TeacherActivationCache(num_samples=5, use_float16=True)
+        cache.build(representative_data_gen, teacher_fn, input_scale=0.5)
+
+        # The pool is rounded up to whole batches, and the teacher runs once per batch
+        self.assertEqual(len(teacher_calls), 3)
+        self.assertEqual(cache.inputs[0].shape, (6, 4, 3))
+        self.assertEqual(cache.teacher_outputs[0].dtype, np.float16)
+
+        # A pass over the pool streams each batch once
+        seen_inputs = []
+        for _ in range(3):
+            inputs, outputs = cache.get_batch()
+            self.assertEqual(inputs[0].shape, (2, 4, 3))
+            self.assertEqual(outputs[1].dtype, np.float32)
+            self.assertTrue(np.allclose(outputs[1], teacher_fn(inputs)[1], atol=1e-2))
+            seen_inputs.append(inputs[0])
+        self.assertTrue(np.allclose(np.sort(np.concatenate(seen_inputs).flatten()),
+                                    np.sort(np.asarray(cache.inputs[0]).flatten())))
+
+        cache_dir = cache.cache_dir
+        cache.close()
+        self.assertFalse(os.path.exists(cache_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
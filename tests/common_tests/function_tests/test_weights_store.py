@@ -0,0 +1,83 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core.common import BaseNode
+from model_compression_toolkit.core.common.graph.weights_store import WeightsStore, get_weights_store, \
+    set_weights_store_file
+
+
+def build_node(kernel, bias=None):
+    return BaseNode('node', {}, (1, 8), (1, 4), {'kernel': kernel, 'bias': bias}, object)
+
+
+class TestWeightsStore(unittest.TestCase):
+
+    def test_content_addressed_entries(self):
+        store = WeightsStore()
+        a = np.random.randn(3, 4).astype(np.float32)
+        handle = store.put(a)
+        self.assertIs(store.put(a.copy()).array, handle.array)
+        self.assertIsNot(store.put(a.astype(np.float64)).array, handle.array)
+        self.assertIsNot(store.put(a.reshape(4, 3)).array, handle.array)
+        self.assertFalse(handle.array.flags.writeable)
+        self.assertTrue(np.array_equal(handle.array, a))
+
+    def test_node_copy_shares_weights(self):
+        kernel = np.random.randn(8, 4)
+        node = build_node(kernel)
+        self.assertFalse(node.get_weights_by_keys('kernel').flags.writeable)
+        self.assertIsNone(node.get_weights_by_keys('bias'))
+
+        copied_node = copy.deepcopy(node)
+        self.assertIs(copied_node.get_weights_by_keys('kernel'), node.get_weights_by_keys('kernel'))
+
+        # Setting a weight of the copy adds a new entry, and does not modify the original node
+        copied_node.set_weights_by_keys('kernel', kernel * 2)
+        self.assertTrue(np.array_equal(node.get_weights_by_keys('kernel'), kernel))
+        self.assertTrue(np.array_equal(copied_node.get_weights_by_keys('kernel'), kernel * 2))
+
+        unpickled_node = pickle.loads(pickle.dumps(node))
+        self.assertTrue(np.array_equal(unpickled_node.get_weights_by_keys('kernel'), kernel))
+
+    def test_file_backed_store(self):
+        kernel = np.random.randn(8, 4).astype(np.float32)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'weights')
+            set_weights_store_file(file_path)
+            try:
+                node = build_node(kernel, bias=np.random.randn(3).astype(np.float16))
+                node_kernel = node.get_weights_by_keys('kernel')
+                self.assertIsInstance(node_kernel.base, np.memmap)
+                self.assertTrue(np.array_equal(node_kernel, kernel))
+                self.assertEqual(get_weights_store().file_path, file_path)
+
+                node.set_weights_by_keys('kernel', kernel + 1)
+                self.assertTrue(np.array_equal(node.get_weights_by_keys('kernel'), kernel + 1))
+                self.assertTrue(np.array_equal(node_kernel, kernel))
+            finally:
+                set_weights_store_file(None)
+            self.assertFalse(os.path.exists(file_path))
+            self.assertIsNone(get_weights_store().file_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
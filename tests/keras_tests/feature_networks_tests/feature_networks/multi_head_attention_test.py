@@ -28,7 +28,7 @@ layers = keras.layers
 
 class MultiHeadAttentionTest(BaseKerasFeatureNetworkTest):
     def __init__(self, unit_test, input_shapes, num_heads, query_key_dim, value_dim,
-                 attention_axes=None, separate_key_value=False, output_dim=None):
+                 attention_axes=None, separate_key_value=False, output_dim=None, batched_heads=False):
         super().__init__(unit_test)
         self.num_calibration_iter = 100
 
@@ -42,10 +42,14 @@ class MultiHeadAttentionTest(BaseKerasFeatureNetworkTest):
         self.attention_axes=attention_axes
         self.separate_key_value = separate_key_value
         self.output_dim = output_dim
+        self.batched_heads = batched_heads
 
     def get_tpc(self):
         return get_quantization_disabled_keras_tpc("multi_head_attention_test")
 
+    def get_quantization_config(self):
+        return QuantizationConfig(batched_attention_heads=self.batched_heads)
+
     def get_input_shapes(self):
         if self.separate_key_value:
             return [[self.val_batch_size] + list(self.query_input_shape),
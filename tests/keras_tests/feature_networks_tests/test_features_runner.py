@@ -551,6 +551,14 @@ class FeatureNetworkTest(unittest.TestCase):
             MultiHeadAttentionTest(self, input_shapes,
                                    num_heads, qk_proj_dim, v_proj_dim, None,
                                    separate_key_value=separate_key_value, output_dim=14).run_test()
+            MultiHeadAttentionTest(self, input_shapes,
+                                   num_heads, qk_proj_dim, v_proj_dim, attention_axes,
+                                   separate_key_value=separate_key_value, output_dim=14,
+                                   batched_heads=True).run_test()
+            MultiHeadAttentionTest(self, input_shapes,
+                                   num_heads, qk_proj_dim, v_proj_dim, None,
+                                   separate_key_value=separate_key_value, output_dim=None,
+                                   batched_heads=True).run_test()
 
     def test_layer_norm_substitution(self):
         LayerNormSub(self, scale=True, center=True).run_test()
@@ -0,0 +1,106 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import keras
+import numpy as np
+from tensorflow.keras.layers import Conv2D, ReLU, Input, Add
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.tpc_models.default_tpc.latest import get_op_quantization_configs
+from tests.common_tests.helpers.activation_mp_tp_model import generate_tp_model_with_activation_mp
+from tests.keras_tests.tpc_keras import generate_activation_mp_tpc_keras
+
+
+def random_datagen():
+    return [np.random.random((1, 8, 8, 3))]
+
+
+def residual_model():
+    """
+    A model with a residual connection, in which the residual tensor is alive while computing the
+    residual branch, so the peak activation memory is larger than the largest activation tensor.
+    """
+    inputs = Input(shape=(8, 8, 3))
+    x = Conv2D(8, 3, padding='same')(inputs)
+    y = ReLU()(x)
+    y = Conv2D(8, 3, padding='same')(y)
+    y = ReLU()(y)
+    x = Add()([x, y])
+    outputs = Conv2D(4, 1)(x)
+    return keras.Model(inputs=inputs, outputs=outputs)
+
+
+def get_tpc():
+    mp_bitwidth_candidates_list = [(i, j) for i in [8, 4, 2] for j in [8, 4, 2]]
+    base_config, _ = get_op_quantization_configs()
+    base_config = base_config.clone_and_edit(weights_n_bits=mp_bitwidth_candidates_list[0][0],
+                                             activation_n_bits=mp_bitwidth_candidates_list[0][1])
+    tp_model = generate_tp_model_with_activation_mp(base_cfg=base_config,
+                                                    mp_bitwidth_candidates_list=mp_bitwidth_candidates_list)
+    return generate_activation_mp_tpc_keras(tp_model=tp_model, name="activation_max_cut_kpi_test")
+
+
+class TestActivationMaxCutKPI(unittest.TestCase):
+
+    def test_kpi_data_activation_max_cut(self):
+        kpi_data = mct.keras_kpi_data(in_model=residual_model(),
+                                      representative_data_gen=random_datagen,
+                                      target_platform_capabilities=get_tpc(),
+                                      compute_activation_max_cut=True)
+
+        # While computing the residual branch, the residual tensor, the branch input and the branch output are alive
+        self.assertEqual(kpi_data.activation_max_cut_memory, 3 * 8 * 8 * 8)
+        self.assertTrue(kpi_data.activation_max_cut_memory > kpi_data.activation_memory)
+
+    def test_kpi_data_without_activation_max_cut(self):
+        kpi_data = mct.keras_kpi_data(in_model=residual_model(),
+                                      representative_data_gen=random_datagen,
+                                      target_platform_capabilities=get_tpc())
+
+        # The max-cut search runs only when it's requested
+        self.assertEqual(kpi_data.activation_max_cut_memory, np.inf)
+
+    def test_activation_max_cut_kpi_search(self):
+        model = residual_model()
+        tpc = get_tpc()
+        kpi_data = mct.keras_kpi_data(in_model=model,
+                                      representative_data_gen=random_datagen,
+                                      target_platform_capabilities=tpc,
+                                      compute_activation_max_cut=True)
+
+        # Peak activation memory of about 4 bits activation
+        target_kpi = mct.KPI(activation_max_cut_memory=kpi_data.activation_max_cut_memory * 4 / 8)
+        _, quantization_info = mct.keras_post_training_quantization_mixed_precision(
+            model,
+            random_datagen,
+            target_kpi=target_kpi,
+            n_iter=1,
+            quant_config=mct.MixedPrecisionQuantizationConfig(num_of_images=1),
+            target_platform_capabilities=tpc)
+
+        final_kpi = quantization_info.final_kpi
+        self.assertTrue(final_kpi.activation_max_cut_memory <= target_kpi.activation_max_cut_memory,
+                        f"Expects activation_max_cut_memory to be at most {target_kpi.activation_max_cut_memory} "
+                        f"but result is {final_kpi.activation_max_cut_memory}")
+        self.assertTrue(target_kpi.holds_constraints(final_kpi))
+
+        # The memory schedule of the final graph is attached to the user information
+        self.assertIsNotNone(quantization_info.memory_schedule)
+        self.assertEqual(len(quantization_info.memory_schedule), len(quantization_info.memory_schedule_live_tensors))
+
+
+if __name__ == '__main__':
+    unittest.main()
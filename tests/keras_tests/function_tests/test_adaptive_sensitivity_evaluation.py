@@ -0,0 +1,153 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from model_compression_toolkit import DEFAULTCONFIG
+from model_compression_toolkit.core.common.mixed_precision.kpi_tools.kpi import KPITarget
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config import \
+    MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit.core.common.mixed_precision.search_methods.linear_programming import \
+    _get_dominance_threshold
+from model_compression_toolkit.core.common.model_collector import ModelCollector
+from model_compression_toolkit.core.common.quantization.quantization_analyzer import analyzer_graph
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_computation import \
+    calculate_quantization_params
+from model_compression_toolkit.core.common.quantization.set_node_quantization_config import \
+    set_quantization_configuration_to_graph
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.core.tpc_models.default_tpc.latest import get_op_quantization_configs, generate_keras_tpc
+from tests.common_tests.helpers.generate_test_tp_model import generate_mixed_precision_test_tp_model
+
+layers = tf.keras.layers
+SHAPE = [32, 16, 16, 3]
+ADAPTIVE_BATCH_SIZE = 4
+
+
+def build_model(in_input_shape):
+    inputs = layers.Input(shape=in_input_shape)
+    x = layers.Conv2D(4, 3)(inputs)
+    x = layers.BatchNormalization()(x)
+    x = layers.ReLU()(x)
+    x = layers.Conv2D(8, 3)(x)
+    x = layers.ReLU()(x)
+    x = layers.Flatten()(x)
+    outputs = layers.Dense(10)(x)
+    return tf.keras.Model(inputs=inputs, outputs=outputs)
+
+
+class MockSearchManager:
+    # Weights KPI of the bitwidths of a single node (8, 4 and 4 bits weights with different activation bits)
+    candidates_weights_kpi = {0: [8.], 1: [4.], 2: [4.]}
+
+    def compute_node_kpi_for_candidate(self, conf_node_idx, candidate_idx, target):
+        return self.candidates_weights_kpi[candidate_idx]
+
+
+class TestAdaptiveSensitivityEvaluation(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+        self.data = [np.random.random(SHAPE).astype(np.float32)]
+        self.keras_impl = KerasImplementation()
+
+        base_config, _ = get_op_quantization_configs()
+        tp_model = generate_mixed_precision_test_tp_model(base_cfg=base_config,
+                                                          mp_bitwidth_candidates_list=[(8, 8), (4, 8), (2, 8)])
+        tpc = generate_keras_tpc(name="adaptive_evaluation_test", tp_model=tp_model)
+
+        graph = self.keras_impl.model_reader(build_model(SHAPE[1:]), lambda: self.data)
+        graph.set_fw_info(DEFAULT_KERAS_INFO)
+        graph.set_tpc(tpc)
+        graph = set_quantization_configuration_to_graph(graph=graph,
+                                                        quant_config=DEFAULTCONFIG,
+                                                        mixed_precision_enable=True)
+        for node in graph.nodes:
+            node.prior_info = self.keras_impl.get_node_prior_info(node=node,
+                                                                  fw_info=DEFAULT_KERAS_INFO,
+                                                                  graph=graph)
+        analyzer_graph(self.keras_impl.attach_sc_to_node, graph, DEFAULT_KERAS_INFO)
+        ModelCollector(graph, self.keras_impl, DEFAULT_KERAS_INFO).infer(self.data)
+        calculate_quantization_params(graph, DEFAULT_KERAS_INFO, fw_impl=self.keras_impl)
+        self.graph = graph
+
+    def _get_sensitivity_evaluator(self, adaptive_evaluation, adaptive_evaluation_tolerance=0.05):
+        mp_config = MixedPrecisionQuantizationConfigV2(num_of_images=SHAPE[0],
+                                                       use_grad_based_weights=False,
+                                                       adaptive_evaluation=adaptive_evaluation,
+                                                       adaptive_evaluation_batch_size=ADAPTIVE_BATCH_SIZE,
+                                                       adaptive_evaluation_tolerance=adaptive_evaluation_tolerance)
+        return self.keras_impl.get_sensitivity_evaluator(self.graph,
+                                                         mp_config,
+                                                         representative_data_gen=lambda: self.data,
+                                                         fw_info=DEFAULT_KERAS_INFO)
+
+    def _get_configurations(self, se):
+        num_configurable_nodes = len(se.sorted_configurable_nodes_names)
+        return [[i] * num_configurable_nodes for i in range(1, 3)]
+
+    def test_adaptive_evaluation_without_early_stopping(self):
+        se = self._get_sensitivity_evaluator(adaptive_evaluation=False)
+        adaptive_se = self._get_sensitivity_evaluator(adaptive_evaluation=True, adaptive_evaluation_tolerance=0.0)
+        self.assertEqual(len(adaptive_se.images_batches), SHAPE[0] // ADAPTIVE_BATCH_SIZE)
+
+        for configuration in self._get_configurations(se):
+            metric = se.compute_metric(configuration)
+            adaptive_metric = adaptive_se.compute_metric(configuration)
+            self.assertTrue(np.isclose(metric, adaptive_metric, rtol=1e-4),
+                            msg=f'Adaptive metric {adaptive_metric} differs from full metric {metric}')
+        self.assertEqual(adaptive_se.num_evaluated_images, [SHAPE[0]] * 2)
+
+    def test_adaptive_evaluation_tolerance(self):
+        se = self._get_sensitivity_evaluator(adaptive_evaluation=False)
+        adaptive_se = self._get_sensitivity_evaluator(adaptive_evaluation=True, adaptive_evaluation_tolerance=1.0)
+
+        for configuration in self._get_configurations(se):
+            metric = se.compute_metric(configuration)
+            adaptive_metric = adaptive_se.compute_metric(configuration)
+            self.assertTrue(np.isclose(metric, adaptive_metric, rtol=0.5),
+                            msg=f'Adaptive metric {adaptive_metric} is far from full metric {metric}')
+        self.assertTrue(all([n < SHAPE[0] for n in adaptive_se.num_evaluated_images]))
+
+    def test_adaptive_evaluation_dominance(self):
+        adaptive_se = self._get_sensitivity_evaluator(adaptive_evaluation=True, adaptive_evaluation_tolerance=0.0)
+        configuration = self._get_configurations(adaptive_se)[-1]
+
+        # A configuration that is provably worse than the threshold stops after the first batch
+        adaptive_se.compute_metric(configuration, dominance_threshold=0.0)
+        adaptive_se.compute_metric(configuration, dominance_threshold=np.inf)
+        self.assertEqual(adaptive_se.num_evaluated_images, [ADAPTIVE_BATCH_SIZE, SHAPE[0]])
+
+    def test_dominance_threshold(self):
+        layer_metrics = {0: 0.1, 1: 0.5}
+
+        # The 8 bits bitwidth has a better metric but a greater weights KPI, so only the 4 bits bitwidth dominates
+        threshold = _get_dominance_threshold(MockSearchManager(), 0, 2, layer_metrics, [KPITarget.WEIGHTS], {})
+        self.assertEqual(threshold, 0.5)
+
+        # Without KPI constraints, the bitwidth with the best metric dominates all others
+        threshold = _get_dominance_threshold(MockSearchManager(), 0, 2, layer_metrics, [], {})
+        self.assertEqual(threshold, 0.1)
+
+        # No measured bitwidth has a weights KPI that is not greater than 4 bits
+        threshold = _get_dominance_threshold(MockSearchManager(), 0, 1, {0: 0.1}, [KPITarget.WEIGHTS], {})
+        self.assertIsNone(threshold)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from model_compression_toolkit import DEFAULTCONFIG
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config import \
+    MixedPrecisionQuantizationConfigV2
+from model_compression_toolkit.core.common.model_collector import ModelCollector
+from model_compression_toolkit.core.common.quantization.quantization_analyzer import analyzer_graph
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_computation import \
+    calculate_quantization_params
+from model_compression_toolkit.core.common.quantization.set_node_quantization_config import \
+    set_quantization_configuration_to_graph
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.core.tpc_models.default_tpc.latest import get_op_quantization_configs, generate_keras_tpc
+from tests.common_tests.helpers.generate_test_tp_model import generate_mixed_precision_test_tp_model
+
+layers = tf.keras.layers
+SHAPE = [4, 16, 16, 3]
+
+
+def build_model(in_input_shape):
+    inputs = layers.Input(shape=in_input_shape)
+    x = layers.Conv2D(4, 3)(inputs)
+    x = layers.BatchNormalization()(x)
+    x = layers.ReLU()(x)
+    x = layers.Conv2D(8, 3)(x)
+    x = layers.ReLU()(x)
+    x = layers.Flatten()(x)
+    outputs = layers.Dense(10)(x)
+    return tf.keras.Model(inputs=inputs, outputs=outputs)
+
+
+class TestCompiledInference(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+        self.data = [np.random.random(SHAPE).astype(np.float32)]
+        self.keras_impl = KerasImplementation()
+
+        base_config, _ = get_op_quantization_configs()
+        # Weights and activation mixed-precision candidates
+        tp_model = generate_mixed_precision_test_tp_model(base_cfg=base_config,
+                                                          mp_bitwidth_candidates_list=[(8, 8), (8, 4), (4, 8), (4, 4)])
+        tpc = generate_keras_tpc(name="compiled_inference_test", tp_model=tp_model)
+
+        graph = self.keras_impl.model_reader(build_model(SHAPE[1:]), lambda: self.data)
+        graph.set_fw_info(DEFAULT_KERAS_INFO)
+        graph.set_tpc(tpc)
+        graph = set_quantization_configuration_to_graph(graph=graph,
+                                                        quant_config=DEFAULTCONFIG,
+                                                        mixed_precision_enable=True)
+        for node in graph.nodes:
+            node.prior_info = self.keras_impl.get_node_prior_info(node=node,
+                                                                  fw_info=DEFAULT_KERAS_INFO,
+                                                                  graph=graph)
+        analyzer_graph(self.keras_impl.attach_sc_to_node, graph, DEFAULT_KERAS_INFO)
+        self.graph = graph
+
+    def _get_sensitivity_evaluator(self, compiled_inference, jit_compile_inference=False):
+        return self.keras_impl.get_sensitivity_evaluator(self.graph,
+                                                         MixedPrecisionQuantizationConfigV2(num_of_images=SHAPE[0],
+                                                                                            use_grad_based_weights=False),
+                                                         representative_data_gen=lambda: self.data,
+                                                         fw_info=DEFAULT_KERAS_INFO,
+                                                         compiled_inference=compiled_inference,
+                                                         jit_compile_inference=jit_compile_inference)
+
+    def test_compiled_model_collector(self):
+        mi = ModelCollector(self.graph, self.keras_impl, DEFAULT_KERAS_INFO)
+        compiled_mi = ModelCollector(self.graph, self.keras_impl, DEFAULT_KERAS_INFO, compiled_inference=True)
+        eager_outputs = self.keras_impl.run_model_inference(mi.inference_fn, self.data)
+        compiled_outputs = self.keras_impl.run_model_inference(compiled_mi.inference_fn, self.data)
+
+        self.assertEqual(len(eager_outputs), len(compiled_outputs))
+        for eager_output, compiled_output in zip(eager_outputs, compiled_outputs):
+            self.assertTrue(np.allclose(eager_output.numpy(), compiled_output.numpy(), atol=1e-5))
+
+    def _run_compiled_sensitivity_test(self, jit_compile_inference):
+        for _ in range(3):
+            ModelCollector(self.graph, self.keras_impl, DEFAULT_KERAS_INFO).infer(self.data)
+        calculate_quantization_params(self.graph, DEFAULT_KERAS_INFO, fw_impl=self.keras_impl)
+
+        eager_se = self._get_sensitivity_evaluator(compiled_inference=False)
+        compiled_se = self._get_sensitivity_evaluator(compiled_inference=True,
+                                                      jit_compile_inference=jit_compile_inference)
+
+        num_configurable_nodes = len(eager_se.sorted_configurable_nodes_names)
+        num_candidates = len(self.graph.get_configurable_sorted_nodes()[0].candidates_quantization_cfg)
+        configurations = [[i] * num_configurable_nodes for i in range(num_candidates)] + \
+                         [list(np.random.randint(0, num_candidates, num_configurable_nodes)) for _ in range(3)]
+        metrics = []
+        for configuration in configurations:
+            eager_metric = eager_se.compute_metric(configuration)
+            compiled_metric = compiled_se.compute_metric(configuration)
+            self.assertTrue(np.isclose(eager_metric, compiled_metric, rtol=1e-4),
+                            msg=f'Compiled metric {compiled_metric} differs from eager metric {eager_metric} '
+                                f'for configuration {configuration}')
+            metrics.append(compiled_metric)
+
+        # Different bit-widths are used by the compiled model, without retracing it
+        self.assertTrue(len(set(metrics)) > 1)
+        self.assertEqual(compiled_se.model_mp_inference_fn.experimental_get_tracing_count(), 1)
+
+    def test_compiled_sensitivity_evaluation(self):
+        self._run_compiled_sensitivity_test(jit_compile_inference=False)
+
+    def test_jit_compiled_sensitivity_evaluation(self):
+        self._run_compiled_sensitivity_test(jit_compile_inference=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
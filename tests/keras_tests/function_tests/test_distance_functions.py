@@ -0,0 +1,89 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from model_compression_toolkit.core.common.similarity_analyzer import compute_mse, compute_mae, compute_cs, \
+    compute_kl_divergence
+from model_compression_toolkit.core.keras.mixed_precision.distance_functions import TF_DISTANCE_FUNCTIONS
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+
+SHAPE = [4, 8, 8, 3]
+
+
+def _get_test_tensors():
+    np.random.seed(0)
+    float_tensor = np.random.randn(*SHAPE).astype(np.float32)
+    fxp_tensor = (float_tensor + 0.1 * np.random.randn(*SHAPE)).astype(np.float32)
+    # Zeros in both tensors to check the handling of zero values
+    float_tensor[:, 0, 0, :] = 0
+    fxp_tensor[:, 1, 1, :] = 0
+    return float_tensor, fxp_tensor
+
+
+def _get_test_distributions():
+    float_tensor, fxp_tensor = _get_test_tensors()
+    return np.abs(float_tensor) / np.abs(float_tensor).sum(), np.abs(fxp_tensor) / np.abs(fxp_tensor).sum()
+
+
+class TestTFDistanceFunctions(unittest.TestCase):
+
+    def _check_distance_fn(self, distance_fn, float_tensor, fxp_tensor):
+        expected = distance_fn(float_tensor, fxp_tensor, batch=True)
+        framework_distance_fn = KerasImplementation().get_framework_distance_fn(distance_fn)
+        distance = framework_distance_fn(tf.convert_to_tensor(float_tensor), tf.convert_to_tensor(fxp_tensor)).numpy()
+        self.assertEqual(distance.shape, (SHAPE[0],))
+        self.assertTrue(np.allclose(distance, expected, rtol=1e-4, atol=1e-6),
+                        msg=f'{distance_fn.__name__} distance {distance} differs from {expected}')
+
+    def test_mse(self):
+        self._check_distance_fn(compute_mse, *_get_test_tensors())
+
+    def test_mae(self):
+        self._check_distance_fn(compute_mae, *_get_test_tensors())
+
+    def test_cs(self):
+        self._check_distance_fn(compute_cs, *_get_test_tensors())
+        zeros = np.zeros(SHAPE, dtype=np.float32)
+        self._check_distance_fn(compute_cs, zeros, zeros)
+
+    def test_kl_divergence(self):
+        self._check_distance_fn(compute_kl_divergence, *_get_test_distributions())
+
+    def test_distance_matrix(self):
+        float_tensor, fxp_tensor = _get_test_tensors()
+        float_dist, fxp_dist = _get_test_distributions()
+        distance_fns = [compute_mse, compute_cs, compute_kl_divergence]
+        baseline_tensors = [float_tensor, float_tensor, float_dist]
+        mp_tensors = [fxp_tensor, fxp_tensor, fxp_dist]
+
+        fw_impl = KerasImplementation()
+        distance_matrix = fw_impl.compute_distance_matrix([tf.convert_to_tensor(t) for t in baseline_tensors],
+                                                          [tf.convert_to_tensor(t) for t in mp_tensors],
+                                                          [fw_impl.get_framework_distance_fn(fn) for fn in distance_fns])
+        self.assertIsInstance(distance_matrix, np.ndarray)
+        self.assertEqual(distance_matrix.shape, (len(distance_fns), SHAPE[0]))
+        for i, distance_fn in enumerate(distance_fns):
+            self.assertTrue(np.allclose(distance_matrix[i], distance_fn(baseline_tensors[i], mp_tensors[i], batch=True),
+                                        rtol=1e-4, atol=1e-6))
+
+    def test_user_defined_distance_fn(self):
+        self.assertIsNone(KerasImplementation().get_framework_distance_fn(lambda x, y, batch: compute_mse(x, y, batch=batch)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -73,7 +73,49 @@ class TestGetGPTQConfig(unittest.TestCase):
                                                  optimizer_rest=tf.keras.optimizers.RMSprop(), train_bias=True,
                                                  loss=multiple_tensors_mse_loss,
                                                  rounding_type=RoundingType.GumbelRounding, quantizer_config=gc),
-                               get_keras_gptq_config(n_iter=1, optimizer=tf.keras.optimizers.RMSprop())]
+                               get_keras_gptq_config(n_iter=1, optimizer=tf.keras.optimizers.RMSprop()),
+                               GradientPTQConfig(3, optimizer=tf.keras.optimizers.RMSprop(),
+                                                 optimizer_rest=tf.keras.optimizers.RMSprop(), train_bias=True,
+                                                 loss=multiple_tensors_mse_loss, quantizer_config=gc,
+                                                 compiled_training_step=True),
+                               GradientPTQConfig(3, optimizer=tf.keras.optimizers.RMSprop(),
+                                                 optimizer_rest=tf.keras.optimizers.RMSprop(), train_bias=True,
+                                                 sam_optimization=True, loss=multiple_tensors_mse_loss,
+                                                 compiled_training_step=True),
+                               GradientPTQConfig(3, optimizer=tf.keras.optimizers.RMSprop(),
+                                                 optimizer_rest=tf.keras.optimizers.RMSprop(), train_bias=True,
+                                                 loss=multiple_tensors_mse_loss,
+                                                 teacher_cache_config=mct.TeacherCacheConfig(num_samples=2)),
+                               GradientPTQConfig(3, optimizer=tf.keras.optimizers.RMSprop(),
+                                                 optimizer_rest=tf.keras.optimizers.RMSprop(), train_bias=True,
+                                                 loss=multiple_tensors_mse_loss, compiled_training_step=True,
+                                                 teacher_cache_config=mct.TeacherCacheConfig(num_samples=2,
+                                                                                             use_float16=True)),
+                               GradientPTQConfig(3, optimizer=tf.keras.optimizers.RMSprop(),
+                                                 optimizer_rest=tf.keras.optimizers.RMSprop(), train_bias=True,
+                                                 loss=multiple_tensors_mse_loss, block_wise=True),
+                               GradientPTQConfig(3, optimizer=tf.keras.optimizers.RMSprop(),
+                                                 optimizer_rest=tf.keras.optimizers.RMSprop(), train_bias=True,
+                                                 loss=multiple_tensors_mse_loss,
+                                                 rounding_type=RoundingType.GumbelRounding, quantizer_config=gc,
+                                                 block_wise=True,
+                                                 teacher_cache_config=mct.TeacherCacheConfig(num_samples=2)),
+                               GradientPTQConfig(3, optimizer=tf.keras.optimizers.RMSprop(),
+                                                 optimizer_rest=tf.keras.optimizers.RMSprop(), train_bias=True,
+                                                 loss=multiple_tensors_mse_loss,
+                                                 rounding_type=RoundingType.GumbelRounding,
+                                                 quantizer_config=mct.GumbelConfig(
+                                                     aux_var_precision=mct.AuxVarPrecision.FLOAT16)),
+                               GradientPTQConfig(3, optimizer=tf.keras.optimizers.RMSprop(),
+                                                 optimizer_rest=tf.keras.optimizers.RMSprop(), train_bias=True,
+                                                 loss=multiple_tensors_mse_loss,
+                                                 rounding_type=RoundingType.GumbelRounding,
+                                                 compiled_training_step=True,
+                                                 quantizer_config=mct.GumbelConfig(
+                                                     aux_var_precision=mct.AuxVarPrecision.BFLOAT16)),
+                               GradientPTQConfig(1, optimizer=tf.keras.optimizers.RMSprop(),
+                                                 optimizer_rest=tf.keras.optimizers.RMSprop(), train_bias=True,
+                                                 loss=multiple_tensors_mse_loss, num_workers=2)]
 
         for gptq_config in gptq_configurations:
             keras_post_training_quantization(in_model=build_model(SHAPE[1:]),
@@ -82,6 +124,22 @@ class TestGetGPTQConfig(unittest.TestCase):
                                              quant_config=qc,
                                              gptq_config=gptq_config)
 
+    def test_block_wise_fresh_optimizers(self):
+        qc = QuantizationConfig(QuantizationErrorMethod.MSE,
+                                QuantizationErrorMethod.MSE,
+                                weights_bias_correction=False)
+        gptq_config = GradientPTQConfig(3, optimizer=tf.keras.optimizers.Adam(),
+                                        optimizer_rest=tf.keras.optimizers.Adam(), train_bias=True,
+                                        loss=multiple_tensors_mse_loss, block_wise=True)
+        keras_post_training_quantization(in_model=build_model(SHAPE[1:]),
+                                         representative_data_gen=random_datagen,
+                                         n_iter=1,
+                                         quant_config=qc,
+                                         gptq_config=gptq_config)
+        # Each block is trained with its own copies of the configured optimizers
+        self.assertEqual(gptq_config.optimizer.iterations.numpy(), 0)
+        self.assertEqual(gptq_config.optimizer_rest.iterations.numpy(), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,130 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+import model_compression_toolkit as mct
+from model_compression_toolkit import GradientPTQConfig, RoundingType, CheckpointConfig
+from model_compression_toolkit.gptq.common.gptq_checkpoint import LATEST_CHECKPOINT_FILE
+from model_compression_toolkit.gptq.keras.gptq_loss import multiple_tensors_mse_loss
+
+layers = tf.keras.layers
+SHAPE = [2, 16, 16, 3]
+N_ITER = 6
+STOP_ITER = 4
+SAVE_INTERVAL = 3
+
+
+def build_model(in_input_shape):
+    inputs = layers.Input(shape=in_input_shape)
+    x = layers.Conv2D(3, 4)(inputs)
+    x = layers.BatchNormalization()(x)
+    x = layers.ReLU()(x)
+    x = layers.Conv2D(7, 8)(x)
+    outputs = layers.ReLU()(x)
+    return tf.keras.Model(inputs=inputs, outputs=outputs)
+
+
+class StopTraining(Exception):
+    pass
+
+
+class TestGPTQCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+        self.data = [np.random.random(SHAPE).astype(np.float32)]
+        self.model = build_model(SHAPE[1:])
+        self.core_config = mct.CoreConfig(quantization_config=mct.QuantizationConfig(weights_bias_correction=False))
+
+    def _get_gptq_config(self, checkpoint_dir, log_function=None, compiled_training_step=False):
+        return GradientPTQConfig(N_ITER,
+                                 optimizer=tf.keras.optimizers.Adam(learning_rate=0.1),
+                                 optimizer_rest=tf.keras.optimizers.Adam(learning_rate=0.01),
+                                 loss=multiple_tensors_mse_loss,
+                                 log_function=log_function,
+                                 train_bias=True,
+                                 rounding_type=RoundingType.GumbelRounding,
+                                 compiled_training_step=compiled_training_step,
+                                 checkpoint_config=CheckpointConfig(checkpoint_dir, save_interval=SAVE_INTERVAL))
+
+    def _run_gptq(self, gptq_config, resume=False):
+        np.random.seed(2)
+        tf.random.set_seed(2)
+        facade = mct.keras_resume_gradient_post_training_quantization_experimental if resume else \
+            mct.keras_gradient_post_training_quantization_experimental
+        quantized_model, _ = facade(self.model,
+                                    lambda: self.data,
+                                    gptq_config,
+                                    core_config=self.core_config)
+        return quantized_model
+
+    def _run_resume_test(self, compiled_training_step):
+        with tempfile.TemporaryDirectory() as full_run_dir, tempfile.TemporaryDirectory() as stopped_run_dir:
+            full_run_model = self._run_gptq(self._get_gptq_config(full_run_dir,
+                                                                  compiled_training_step=compiled_training_step))
+
+            def _stop_training(loss, *args):
+                _stop_training.n_calls += 1
+                if _stop_training.n_calls == STOP_ITER:
+                    raise StopTraining()
+            _stop_training.n_calls = 0
+
+            with self.assertRaises(StopTraining):
+                self._run_gptq(self._get_gptq_config(stopped_run_dir, log_function=_stop_training,
+                                                     compiled_training_step=compiled_training_step))
+            with open(os.path.join(stopped_run_dir, LATEST_CHECKPOINT_FILE), 'r') as f:
+                self.assertEqual(f.read(), f'checkpoint_{SAVE_INTERVAL}')
+
+            def _count_iterations(loss, *args):
+                _count_iterations.n_calls += 1
+            _count_iterations.n_calls = 0
+
+            resumed_model = self._run_gptq(self._get_gptq_config(stopped_run_dir, log_function=_count_iterations,
+                                                                 compiled_training_step=compiled_training_step),
+                                           resume=True)
+            # The resumed training continues from the last checkpoint
+            self.assertEqual(_count_iterations.n_calls, N_ITER - SAVE_INTERVAL)
+
+        self.assertEqual(len(full_run_model.weights), len(resumed_model.weights))
+        for w_full, w_resumed in zip(full_run_model.weights, resumed_model.weights):
+            self.assertTrue(np.allclose(w_full.numpy(), w_resumed.numpy(), atol=1e-5),
+                            msg=f'Resumed GPTQ weight {w_resumed.name} differs from the full run')
+
+    def test_resume_gptq_training(self):
+        self._run_resume_test(compiled_training_step=False)
+
+    def test_resume_compiled_gptq_training(self):
+        self._run_resume_test(compiled_training_step=True)
+
+    def test_resume_without_checkpoint_config(self):
+        with self.assertRaises(Exception):
+            mct.keras_resume_gradient_post_training_quantization_experimental(self.model,
+                                                                              lambda: self.data,
+                                                                              mct.get_keras_gptq_config(n_iter=1))
+
+    def test_invalid_save_interval(self):
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            for save_interval in [0, -3, 2.5, True]:
+                with self.assertRaises(Exception):
+                    CheckpointConfig(checkpoint_dir, save_interval=save_interval)
+
+
+if __name__ == '__main__':
+    unittest.main()
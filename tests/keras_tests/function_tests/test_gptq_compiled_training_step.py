@@ -0,0 +1,86 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+import model_compression_toolkit as mct
+from model_compression_toolkit import keras_post_training_quantization, QuantizationConfig, \
+    QuantizationErrorMethod, GradientPTQConfig, RoundingType
+from model_compression_toolkit.gptq.keras.gptq_loss import multiple_tensors_mse_loss
+from tests.keras_tests.function_tests.test_get_gptq_config import build_model, SHAPE
+
+N_ITER = 6
+
+
+def run_gptq(compiled_training_step: bool, gumbel_config: mct.GumbelConfig, sam_optimization: bool = False):
+    """
+    Run GPTQ with Gumbel rounding from a fixed seed, and return the training losses and the quantized
+    model's weights.
+    """
+    np.random.seed(1)
+    tf.random.set_seed(1)
+    model = build_model(SHAPE[1:])
+    random_state = np.random.RandomState(0)
+    losses = []
+    gptq_config = GradientPTQConfig(N_ITER,
+                                    optimizer=tf.keras.optimizers.SGD(0.1),
+                                    optimizer_rest=tf.keras.optimizers.SGD(0.1),
+                                    train_bias=True,
+                                    loss=multiple_tensors_mse_loss,
+                                    rounding_type=RoundingType.GumbelRounding,
+                                    quantizer_config=gumbel_config,
+                                    sam_optimization=sam_optimization,
+                                    compiled_training_step=compiled_training_step,
+                                    log_function=lambda loss, *args: losses.append(float(loss)))
+    quantized_model, _ = keras_post_training_quantization(model,
+                                                          lambda: [random_state.random_sample(SHAPE)],
+                                                          n_iter=1,
+                                                          quant_config=QuantizationConfig(
+                                                              QuantizationErrorMethod.MSE,
+                                                              QuantizationErrorMethod.MSE,
+                                                              weights_bias_correction=False),
+                                                          gptq_config=gptq_config)
+    return losses, quantized_model.get_weights()
+
+
+class TestGPTQCompiledTrainingStep(unittest.TestCase):
+
+    def _compare_eager_and_compiled(self, gumbel_config: mct.GumbelConfig, sam_optimization: bool = False):
+        eager_losses, eager_weights = run_gptq(False, gumbel_config, sam_optimization)
+        compiled_losses, compiled_weights = run_gptq(True, gumbel_config, sam_optimization)
+
+        self.assertEqual(len(eager_losses), N_ITER)
+        self.assertTrue(np.all(np.isfinite(eager_losses)))
+        np.testing.assert_allclose(compiled_losses, eager_losses, rtol=1e-5)
+        self.assertEqual(len(compiled_weights), len(eager_weights))
+        for compiled_w, eager_w in zip(compiled_weights, eager_weights):
+            np.testing.assert_allclose(compiled_w, eager_w, rtol=1e-5, atol=1e-6)
+
+    def test_compiled_step_scheduled_temperature(self):
+        # Two temperature cycles in the training, so the schedule restarts during the training
+        self._compare_eager_and_compiled(mct.GumbelConfig(temperature_learning=False, n_cycles=2))
+
+    def test_compiled_step_learned_temperature(self):
+        self._compare_eager_and_compiled(mct.GumbelConfig(temperature_learning=True))
+
+    def test_compiled_step_sam(self):
+        self._compare_eager_and_compiled(mct.GumbelConfig(temperature_learning=False, n_cycles=2),
+                                         sam_optimization=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import keras
 import unittest
+from unittest.mock import patch
 
 from keras.applications.mobilenet_v2 import MobileNetV2
 from keras.layers import Activation, Add
@@ -57,8 +58,38 @@ def expanding_model(input_shape):
     return keras.Model(inputs=inputs, outputs=concat)
 
 
+def wide_model(input_shape, n_blocks=10, n_branches=4, branch_depth=3):
+    """
+    This is a model with many parallel branches, which results in a large number of possible schedules.
+    """
+    inputs = Input(shape=input_shape)
+    x = Conv2D(4, 3, padding='same')(inputs)
+    for _ in range(n_blocks):
+        branches = []
+        for b in range(n_branches):
+            y = x
+            for _ in range(branch_depth):
+                y = Conv2D(2 + b, 1)(y)
+            branches.append(y)
+        x = Conv2D(4, 1)(keras.layers.Concatenate()(branches))
+    return keras.Model(inputs=inputs, outputs=x)
+
+
 class TestGraphMaxCut(unittest.TestCase):
 
+    def _verify_schedule(self, graph, schedule):
+        self.assertEqual(len(schedule), len(graph.nodes))
+        self.assertEqual(set(schedule), set(graph.nodes))
+        scheduled_index = {n: i for i, n in enumerate(schedule)}
+        for n in schedule:
+            for p in graph.get_prev_nodes(n):
+                self.assertTrue(scheduled_index[p] < scheduled_index[n])
+
+    def _verify_cuts(self, schedule, max_cut_size, cuts):
+        # Cuts are ordered by the schedule, and the largest cut is the max cut
+        self.assertEqual([c.op_order[-1] for c in cuts], schedule)
+        self.assertEqual(max([c.memory_size() for c in cuts]), max_cut_size)
+
     def test_graph_max_cut_plain_graph_simple(self):
         input_shape = (8, 8, 3)
         model = simple_model(input_shape)
@@ -95,6 +126,38 @@ class TestGraphMaxCut(unittest.TestCase):
         self.assertTrue(len(cuts) > 0)
         self.assertTrue(max_cut_size >= memory_graph.memory_lbound_single_op)
 
+    def test_graph_max_cut_plain_graph_wide(self):
+        input_shape = (8, 8, 3)
+        model = wide_model(input_shape)
+        graph = model_reader(model)
+        memory_graph = MemoryGraph(graph)
+
+        schedule, max_cut_size, cuts = compute_graph_max_cut(memory_graph)
+        self.assertIsNotNone(schedule)
+        self.assertIsNotNone(cuts)
+        self.assertTrue(len(cuts) > 0)
+        self.assertTrue(max_cut_size >= memory_graph.memory_lbound_single_op)
+        self._verify_schedule(graph, schedule)
+        self._verify_cuts(schedule, max_cut_size, cuts)
+
+    def test_graph_max_cut_keeps_best_result(self):
+        graph = model_reader(complex_model((8, 8, 3)))
+        memory_graph = MemoryGraph(graph)
+        u_bound = 2 * sum([t.total_size for t in memory_graph.b_nodes]) - memory_graph.memory_lbound_single_op
+
+        # A successful search, a failed search and then a successful search with a larger max cut
+        solve_results = [(['best_schedule'], 0.9 * u_bound, ['best_cuts']),
+                         (None, 0, None),
+                         (['worse_schedule'], 0.95 * u_bound, ['worse_cuts'])]
+        with patch('model_compression_toolkit.core.common.graph.memory_graph.compute_graph_max_cut.MaxCutAstar') \
+                as max_cut_astar:
+            max_cut_astar.return_value.solve.side_effect = solve_results
+            schedule, max_cut_size, cuts = compute_graph_max_cut(memory_graph, n_iter=3)
+
+        self.assertEqual(schedule, ['best_schedule'])
+        self.assertEqual(max_cut_size, 0.9 * u_bound)
+        self.assertEqual(cuts, ['best_cuts'])
+
     def test_graph_max_cut_plain_graph_real_model(self):
         model = MobileNetV2()
         graph = model_reader(model)
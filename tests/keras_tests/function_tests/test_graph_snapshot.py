@@ -0,0 +1,95 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.common.graph_snapshot import get_data_fingerprint
+
+layers = tf.keras.layers
+SHAPE = [2, 16, 16, 3]
+N_ITER = 3
+
+
+def build_model(in_input_shape):
+    inputs = layers.Input(shape=in_input_shape)
+    x = layers.Conv2D(3, 4)(inputs)
+    x = layers.BatchNormalization()(x)
+    x = layers.ReLU()(x)
+    x = layers.Conv2D(7, 8)(x)
+    outputs = layers.ReLU()(x)
+    return tf.keras.Model(inputs=inputs, outputs=outputs)
+
+
+class CountingDataGenerator:
+
+    def __init__(self, seed):
+        self.data = [np.random.RandomState(seed).random(SHAPE).astype(np.float32)]
+        self.n_calls = 0
+
+    def __call__(self):
+        self.n_calls += 1
+        return self.data
+
+
+class TestGraphSnapshot(unittest.TestCase):
+
+    def _quantize(self, model, data_gen, snapshot_dir, quant_config=mct.DEFAULTCONFIG):
+        core_config = mct.CoreConfig(n_iter=N_ITER, quantization_config=quant_config, snapshot_dir=snapshot_dir)
+        q_model, _ = mct.keras_post_training_quantization_experimental(model, data_gen, core_config=core_config)
+        return q_model
+
+    def test_data_fingerprint(self):
+        x = np.ones(SHAPE, dtype=np.float32)
+        self.assertEqual(get_data_fingerprint([x]), get_data_fingerprint([x.copy()]))
+        self.assertNotEqual(get_data_fingerprint([x]), get_data_fingerprint([x.astype(np.float64)]))
+        self.assertNotEqual(get_data_fingerprint([x]), get_data_fingerprint([2 * x]))
+
+    def test_snapshot_reuse(self):
+        model = build_model(SHAPE[1:])
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            data_gen = CountingDataGenerator(seed=0)
+            q_model = self._quantize(model, data_gen, snapshot_dir)
+            self.assertEqual(len(os.listdir(snapshot_dir)), 1)
+            collection_calls = data_gen.n_calls
+
+            # The statistics are restored from the snapshot, so the data is read only to compute its fingerprint
+            data_gen = CountingDataGenerator(seed=0)
+            restored_q_model = self._quantize(model, data_gen, snapshot_dir)
+            self.assertEqual(len(os.listdir(snapshot_dir)), 1)
+            self.assertEqual(collection_calls - data_gen.n_calls, N_ITER - 1)
+            x = data_gen.data[0]
+            self.assertTrue(np.array_equal(q_model(x).numpy(), restored_q_model(x).numpy()))
+
+            # Another representative dataset gets its own snapshot
+            self._quantize(model, CountingDataGenerator(seed=1), snapshot_dir)
+            self.assertEqual(len(os.listdir(snapshot_dir)), 2)
+
+            # Another model gets its own snapshot
+            self._quantize(build_model(SHAPE[1:]), CountingDataGenerator(seed=0), snapshot_dir)
+            self.assertEqual(len(os.listdir(snapshot_dir)), 3)
+
+            # Statistics that are collected with sampled histograms get their own snapshot
+            self._quantize(model, CountingDataGenerator(seed=0), snapshot_dir,
+                           mct.QuantizationConfig(histogram_sample_size=100))
+            self.assertEqual(len(os.listdir(snapshot_dir)), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
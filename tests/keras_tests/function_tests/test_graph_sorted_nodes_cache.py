@@ -0,0 +1,99 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import unittest
+
+import keras
+from networkx.algorithms.dag import topological_sort
+from tensorflow.keras.layers import Conv2D, BatchNormalization, ReLU, Input
+
+from model_compression_toolkit.core.keras.reader.reader import model_reader
+
+
+def simple_model(input_shape):
+    inputs = Input(shape=input_shape)
+    x = Conv2D(2, 3)(inputs)
+    x_bn = BatchNormalization()(x)
+    x_relu = ReLU()(x_bn)
+    outputs = Conv2D(2, 3)(x_relu)
+    return keras.Model(inputs=inputs, outputs=outputs)
+
+
+class TestGraphSortedNodesCache(unittest.TestCase):
+
+    def test_topo_sorted_nodes_cache(self):
+        graph = model_reader(simple_model((8, 8, 3)))
+
+        sorted_nodes = graph.get_topo_sorted_nodes()
+        self.assertEqual(sorted_nodes, list(topological_sort(graph)))
+        for i, n in enumerate(sorted_nodes):
+            self.assertEqual(graph.get_topo_sorted_node_index(n), i)
+
+        # Mutating the returned list should not affect the cached order
+        sorted_nodes.reverse()
+        self.assertEqual(graph.get_topo_sorted_nodes(), list(topological_sort(graph)))
+
+    def test_topo_sorted_nodes_cache_invalidation(self):
+        graph = model_reader(simple_model((8, 8, 3)))
+        sorted_nodes = graph.get_topo_sorted_nodes()
+        version = graph.version
+
+        # Remove the last node and make sure the cached order is updated
+        last_node = sorted_nodes[-1]
+        prev_node = sorted_nodes[-2]
+        graph.remove_edge(prev_node, last_node)
+        graph.remove_node(last_node, new_graph_outputs=[])
+        self.assertTrue(graph.version > version)
+        self.assertEqual(graph.get_topo_sorted_nodes(), sorted_nodes[:-1])
+
+        # Re-add the node and make sure it is sorted again
+        graph.add_node_with_in_edges(last_node, [prev_node])
+        self.assertEqual(graph.get_topo_sorted_nodes(), sorted_nodes)
+        self.assertEqual(graph.get_topo_sorted_node_index(last_node), len(sorted_nodes) - 1)
+
+    def test_topo_sorted_nodes_cache_deepcopy(self):
+        graph = model_reader(simple_model((8, 8, 3)))
+        graph.get_topo_sorted_nodes()
+
+        copied_graph = copy.deepcopy(graph)
+        copied_sorted_nodes = copied_graph.get_topo_sorted_nodes()
+        self.assertEqual(copied_sorted_nodes, list(topological_sort(copied_graph)))
+        self.assertTrue(all([n not in graph.nodes for n in copied_sorted_nodes]))
+
+    def test_topo_sorted_nodes_cache_copy(self):
+        graph = model_reader(simple_model((8, 8, 3)))
+        sorted_nodes = graph.get_topo_sorted_nodes()
+
+        # The copy has its own cache, so changing it doesn't affect the original graph's cache
+        copied_graph = copy.copy(graph)
+        self.assertFalse(copied_graph._cache is graph._cache)
+        copied_graph.set_outputs([])
+        copied_graph.get_topo_sorted_nodes()
+        self.assertTrue(copied_graph.version > graph.version)
+        self.assertTrue('topo_sorted_nodes' in graph._cache)
+        self.assertEqual(graph.get_topo_sorted_nodes(), sorted_nodes)
+
+    def test_sort_nodes_not_in_graph(self):
+        graph = model_reader(simple_model((8, 8, 3)))
+        sorted_nodes = graph.get_topo_sorted_nodes()
+        other_node = model_reader(simple_model((8, 8, 3))).get_topo_sorted_nodes()[0]
+
+        # Nodes that are not in the graph are filtered out
+        self.assertEqual(graph._sort_nodes_in_list([sorted_nodes[2], other_node, sorted_nodes[0]]),
+                         [sorted_nodes[0], sorted_nodes[2]])
+
+
+if __name__ == '__main__':
+    unittest.main()
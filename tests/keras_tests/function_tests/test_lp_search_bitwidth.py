@@ -13,6 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 import numpy as np
+import tensorflow as tf
 import unittest
 from tensorflow.keras.applications.mobilenet_v2 import MobileNetV2
 
@@ -22,9 +23,9 @@ from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quant
     MixedPrecisionQuantizationConfigV2
 from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_facade import search_bit_width, \
-    BitWidthSearchMethod
+    BitWidthSearchMethod, search_bit_width_sweep
 from model_compression_toolkit.core.common.mixed_precision.search_methods.linear_programming import \
-    mp_integer_programming_search
+    mp_integer_programming_search, mp_integer_programming_sweep
 from model_compression_toolkit.core.common.quantization.quantization_analyzer import analyzer_graph
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_computation import \
     calculate_quantization_params
@@ -50,11 +51,17 @@ class MockReconstructionHelper:
         return max_kpi_config
 
 
+class MockSensitivityEvaluation:
+    def __init__(self):
+        self.quant_config = MixedPrecisionQuantizationConfigV2()
+
+
 class MockMixedPrecisionSearchManager:
     def __init__(self, layer_to_kpi_mapping):
         self.layer_to_bitwidth_mapping = {0: [0, 1, 2]}
         self.layer_to_kpi_mapping = layer_to_kpi_mapping
-        self.compute_metric_fn = lambda x, y=None, z=None: 0
+        self.sensitivity_evaluator = MockSensitivityEvaluation()
+        self.compute_metric_fn = lambda x, y=None, z=None, dominance_threshold=None: 0
         self.min_kpi = {KPITarget.WEIGHTS: [[1], [1], [1]],
                         KPITarget.ACTIVATION: [[1], [1], [1]],
                         KPITarget.TOTAL: [[2], [2], [2]],
@@ -65,8 +72,10 @@ class MockMixedPrecisionSearchManager:
                                       KPITarget.BOPS: (None, lambda v: [sum(v)])}
         self.max_kpi_config = [0]
         self.config_reconstruction_helper = MockReconstructionHelper()
+        self.num_kpi_matrix_computations = 0
 
     def compute_kpi_matrix(self, target):
+        self.num_kpi_matrix_computations += 1
         # minus 1 is normalization by the minimal kpi (which is always 1 in this test)
         if target == KPITarget.WEIGHTS:
             kpi_matrix = [np.flip(np.array([kpi.weights_memory - 1 for _, kpi in self.layer_to_kpi_mapping[0].items()]))]
@@ -184,6 +193,21 @@ class TestLpSearchBitwidth(unittest.TestCase):
         self.assertTrue(len(bit_cfg) == 1)
         self.assertTrue(bit_cfg[0] == 1)
 
+    def test_search_weights_sweep(self):
+        layer_to_kpi_mapping = {0: {2: KPI(weights_memory=1),
+                                    1: KPI(weights_memory=2),
+                                    0: KPI(weights_memory=3)}}
+        mock_search_manager = MockMixedPrecisionSearchManager(layer_to_kpi_mapping)
+
+        bit_cfgs = mp_integer_programming_sweep(mock_search_manager,
+                                                target_kpis=[KPI(weights_memory=1),
+                                                             KPI(weights_memory=2),
+                                                             KPI(weights_memory=3)])
+
+        self.assertEqual([list(c) for c in bit_cfgs], [[2], [1], [0]])
+        # The KPI constraints are computed once for the whole sweep
+        self.assertEqual(mock_search_manager.num_kpi_matrix_computations, 1)
+
 
 class TestSearchBitwidthConfiguration(unittest.TestCase):
 
@@ -265,6 +289,76 @@ class TestSearchBitwidthConfiguration(unittest.TestCase):
                                    representative_data_gen=lambda: [np.random.random((1, 224, 224, 3))],
                                    search_method=BitWidthSearchMethod.INTEGER_PROGRAMMING)
 
+    def test_search_sweep(self):
+        np.random.seed(1)
+        data = [np.random.random((4, 16, 16, 3)).astype(np.float32)]
+        mp_config = MixedPrecisionQuantizationConfigV2(num_of_images=4, use_grad_based_weights=False)
+        tp_model = generate_mixed_precision_test_tp_model(base_cfg=get_op_quantization_configs()[0],
+                                                          mp_bitwidth_candidates_list=[(8, 8), (4, 8), (2, 8)])
+        tpc = generate_keras_tpc(name="bitwidth_sweep_test", tp_model=tp_model)
+        keras_impl = KerasImplementation()
+
+        inputs = tf.keras.layers.Input(shape=(16, 16, 3))
+        x = tf.keras.layers.Conv2D(4, 3)(inputs)
+        x = tf.keras.layers.ReLU()(x)
+        x = tf.keras.layers.Conv2D(8, 3)(x)
+        x = tf.keras.layers.Flatten()(x)
+        outputs = tf.keras.layers.Dense(10)(x)
+
+        graph = keras_impl.model_reader(tf.keras.Model(inputs=inputs, outputs=outputs), lambda: data)
+        graph.set_fw_info(DEFAULT_KERAS_INFO)
+        graph.set_tpc(tpc)
+        graph = set_quantization_configuration_to_graph(graph=graph,
+                                                        quant_config=DEFAULTCONFIG,
+                                                        mixed_precision_enable=True)
+        for node in graph.nodes:
+            node.prior_info = keras_impl.get_node_prior_info(node=node, fw_info=DEFAULT_KERAS_INFO, graph=graph)
+        analyzer_graph(keras_impl.attach_sc_to_node, graph, DEFAULT_KERAS_INFO)
+        mi = ModelCollector(graph, fw_info=DEFAULT_KERAS_INFO, fw_impl=keras_impl)
+        mi.infer(data)
+        calculate_quantization_params(graph, DEFAULT_KERAS_INFO, fw_impl=keras_impl)
+
+        # Count the sensitivity evaluators that are built
+        num_sensitivity_evaluators = [0]
+        get_sensitivity_evaluator = keras_impl.get_sensitivity_evaluator
+
+        def _counting_get_sensitivity_evaluator(*args, **kwargs):
+            num_sensitivity_evaluators[0] += 1
+            return get_sensitivity_evaluator(*args, **kwargs)
+        keras_impl.get_sensitivity_evaluator = _counting_get_sensitivity_evaluator
+
+        # The model has 11916 weights to quantize (with 2, 4 or 8 bits)
+        target_kpis = [KPI(weights_memory=3000), KPI(weights_memory=7000), KPI(weights_memory=12000)]
+        cfgs = search_bit_width_sweep(graph_to_search_cfg=graph,
+                                      fw_info=DEFAULT_KERAS_INFO,
+                                      fw_impl=keras_impl,
+                                      target_kpis=target_kpis,
+                                      mp_config=mp_config,
+                                      representative_data_gen=lambda: data)
+        self.assertEqual(num_sensitivity_evaluators[0], 1)
+        self.assertEqual(len(cfgs), len(target_kpis))
+        # A larger target KPI allows a configuration with more bits
+        self.assertEqual(list(cfgs[-1]), [0, 0, 0])
+        self.assertTrue(all([sum(c1) >= sum(c2) for c1, c2 in zip(cfgs[:-1], cfgs[1:])]))
+
+        for cfg, target_kpi in zip(cfgs, target_kpis):
+            single_cfg = search_bit_width(graph_to_search_cfg=graph,
+                                          fw_info=DEFAULT_KERAS_INFO,
+                                          fw_impl=keras_impl,
+                                          target_kpi=target_kpi,
+                                          mp_config=mp_config,
+                                          representative_data_gen=lambda: data)
+            self.assertEqual(list(cfg), list(single_cfg))
+
+        # All target KPIs of a sweep have to constrain the same KPI targets
+        with self.assertRaises(Exception):
+            search_bit_width_sweep(graph_to_search_cfg=graph,
+                                   fw_info=DEFAULT_KERAS_INFO,
+                                   fw_impl=keras_impl,
+                                   target_kpis=[KPI(weights_memory=7000), KPI(activation_memory=1000)],
+                                   mp_config=mp_config,
+                                   representative_data_gen=lambda: data)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -152,6 +152,30 @@ class TestModelGradients(unittest.TestCase):
         self.assertTrue(np.isclose(y[1], np.float32(0.0)))
         self.assertTrue(np.isclose(y[2], np.float32(1.0)))
 
+    def test_batched_jacobian_trace_calculation(self):
+        input_shape = (8, 8, 3)
+        in_model = basic_derivative_model(input_shape)
+        keras_impl = KerasImplementation()
+        graph = prepare_graph(in_model, keras_impl)
+
+        interest_points = [n for n in graph.get_topo_sorted_nodes()]
+
+        input_tensors = {inode: np.random.randn(4, *input_shape).astype(np.float32) for inode in graph.get_inputs()}
+        output_nodes = [o.node for o in graph.output_nodes]
+        x = keras_impl.batched_model_grad(graph_float=graph,
+                                          model_input_tensors=input_tensors,
+                                          interest_points=interest_points,
+                                          output_list=output_nodes,
+                                          all_outputs_indices=[len(interest_points) - 1],
+                                          alpha=0)
+
+        # A row of normalized weights per sample, each with the same expected values as the
+        # non-batched computation
+        self.assertTrue(x.shape == (4, len(interest_points)))
+        for row in x:
+            self.assertTrue(np.isclose(row[0], np.float32(0.8), 1e-1))
+            self.assertTrue(np.isclose(row[1], np.float32(0.2), 1e-1))
+            self.assertTrue(np.isclose(row[2], np.float32(0.0)))
 
     def test_basic_model_grad(self):
         input_shape = (8, 8, 3)
@@ -0,0 +1,90 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.common.pipeline_profiler import PipelineProfiler, get_pipeline_profiler, \
+    profile_stage, set_pipeline_profiler
+
+layers = tf.keras.layers
+SHAPE = [2, 16, 16, 3]
+
+
+def build_model(in_input_shape):
+    inputs = layers.Input(shape=in_input_shape)
+    x = layers.Conv2D(3, 4)(inputs)
+    x = layers.BatchNormalization()(x)
+    x = layers.ReLU()(x)
+    x = layers.Conv2D(7, 8)(x)
+    outputs = layers.ReLU()(x)
+    return tf.keras.Model(inputs=inputs, outputs=outputs)
+
+
+class TestPipelineProfiler(unittest.TestCase):
+
+    def tearDown(self):
+        set_pipeline_profiler(None)
+
+    def test_profile_stage(self):
+        profiler = PipelineProfiler()
+        set_pipeline_profiler(profiler)
+        with profile_stage('stage_a') as stage:
+            get_pipeline_profiler().add_node_time('node_a', 1.)
+            get_pipeline_profiler().add_node_time('node_a', 2.)
+        with profile_stage('stage_b'):
+            pass
+
+        self.assertEqual([s.name for s in profiler.stages], ['stage_a', 'stage_b'])
+        self.assertEqual(stage.nodes_time, {'node_a': 3.})
+        self.assertTrue(all([s.wall_time >= 0 and s.peak_rss_mb > 0 for s in profiler.stages]))
+
+        # Without an active profiler, nothing is recorded
+        set_pipeline_profiler(None)
+        with profile_stage('stage_c') as stage:
+            stage.add_node_time('node_a', 1.)
+        self.assertEqual(len(profiler.stages), 2)
+
+    def test_profile_ptq(self):
+        data = [np.random.random(SHAPE).astype(np.float32)]
+        with tempfile.TemporaryDirectory() as report_dir:
+            report_path = os.path.join(report_dir, 'profile.json')
+            core_config = mct.CoreConfig(debug_config=mct.DebugConfig(profile_pipeline=True,
+                                                                      profile_report_path=report_path))
+            mct.keras_post_training_quantization_experimental(build_model(SHAPE[1:]),
+                                                              lambda: data,
+                                                              core_config=core_config)
+            with open(report_path) as f:
+                report = json.load(f)
+
+        stages = {s['name']: s for s in report['stages']}
+        for stage_name in ['read_model', 'prepare_graph_substitutions', 'statistics_collection',
+                           'calculate_quantization_params', 'statistics_correction', 'final_kpi']:
+            self.assertIn(stage_name, stages)
+        self.assertEqual(stages['read_model']['num_nodes'], 6)
+        # Batch normalization is folded into the preceding convolution
+        self.assertEqual(stages['pre_statistics_collection_substitutions']['num_nodes'], 5)
+        self.assertTrue(len(stages['statistics_collection']['nodes_time']) > 0)
+        self.assertTrue(len(stages['calculate_quantization_params']['nodes_time']) > 0)
+        self.assertTrue(report['total_wall_time'] > 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import glob
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import tensorflow as tf
+from tensorboard.backend.event_processing import event_file_loader
+from tensorboard.compat.proto.graph_pb2 import GraphDef
+
+from model_compression_toolkit import DEFAULTCONFIG
+from model_compression_toolkit.core.common.model_collector import ModelCollector
+from model_compression_toolkit.core.common.quantization.quantization_analyzer import analyzer_graph
+from model_compression_toolkit.core.common.quantization.set_node_quantization_config import \
+    set_quantization_configuration_to_graph
+from model_compression_toolkit.core.common.visualization.tensorboard_writer import TensorboardWriter
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.core.tpc_models.default_tpc.latest import get_keras_tpc_latest
+
+layers = tf.keras.layers
+SHAPE = [2, 16, 16, 3]
+
+
+def build_model(in_input_shape):
+    inputs = layers.Input(shape=in_input_shape)
+    x = layers.Conv2D(4, 3, name='conv2d')(inputs)
+    x = layers.ReLU()(x)
+    outputs = layers.Conv2D(8, 3, name='conv2d_out')(x)
+    return tf.keras.Model(inputs=inputs, outputs=outputs)
+
+
+def load_events(events_dir):
+    events_files = glob.glob(os.path.join(events_dir, '*events*'))
+    return [e for f in events_files for e in event_file_loader.LegacyEventFileLoader(f).Load()]
+
+
+class TestTensorboardWriter(unittest.TestCase):
+
+    def setUp(self):
+        keras_impl = KerasImplementation()
+        graph = keras_impl.model_reader(build_model(SHAPE[1:]), None)
+        graph.set_fw_info(DEFAULT_KERAS_INFO)
+        graph.set_tpc(get_keras_tpc_latest())
+        graph = set_quantization_configuration_to_graph(graph=graph, quant_config=DEFAULTCONFIG)
+        for node in graph.nodes:
+            node.prior_info = keras_impl.get_node_prior_info(node=node, fw_info=DEFAULT_KERAS_INFO, graph=graph)
+        analyzer_graph(keras_impl.attach_sc_to_node, graph, DEFAULT_KERAS_INFO)
+        self.mi = ModelCollector(graph, fw_info=DEFAULT_KERAS_INFO, fw_impl=keras_impl)
+        self.mi.infer([np.random.random(SHAPE).astype(np.float32)])
+        self.graph = graph
+
+    def test_add_graph_and_statistics(self):
+        with tempfile.TemporaryDirectory() as log_dir:
+            tb_w = TensorboardWriter(log_dir, DEFAULT_KERAS_INFO)
+            tb_w.add_graph(self.graph, 'test_graph')
+            tb_w.add_all_statistics(self.graph, 'test_statistics')
+
+            # The statistics are logged as they were when they were added, even if they change before they are written
+            conv = self.graph.find_node_by_name('conv2d')[0]
+            logged_max = np.array(self.graph.get_out_stats_collector(conv).mpcc.max_per_channel)
+            self.mi.infer([10 * np.ones(SHAPE, dtype=np.float32)])
+
+            tb_w.close()
+
+            graph_defs = [GraphDef().FromString(e.graph_def)
+                          for e in load_events(os.path.join(log_dir, 'test_graph')) if len(e.graph_def) > 0]
+            self.assertEqual(len(graph_defs), 1)
+            # Each node has a main NodeDef, and quantized nodes have weights and activation NodeDefs
+            self.assertTrue(len(graph_defs[0].node) >= len(self.graph.nodes))
+
+            histograms = [v.tag for e in load_events(os.path.join(log_dir, 'test_statistics'))
+                          for v in e.summary.value if v.HasField('histo')]
+            self.assertTrue('conv2d' in histograms)
+
+            max_events = [(e.step, v.simple_value)
+                          for e in load_events(os.path.join(log_dir, 'test_statistics', 'max_per_channel'))
+                          for v in e.summary.value if v.tag == 'conv2d']
+            self.assertEqual(len(max_events), len(logged_max))
+            for step, value in max_events:
+                self.assertAlmostEqual(value, logged_max[step], places=5)
+
+    def test_worker_exits_when_idle(self):
+        with tempfile.TemporaryDirectory() as log_dir:
+            tb_w = TensorboardWriter(log_dir, DEFAULT_KERAS_INFO, max_queue_size=1)
+            for i in range(3):
+                tb_w.add_mean(self.graph, f'mean_{i}')
+            tb_w.flush()
+            self.assertEqual(len(glob.glob(os.path.join(log_dir, 'mean_*', 'mean_per_channel', '*events*'))), 3)
+            worker = tb_w._worker
+            if worker is not None:
+                worker.join()
+            self.assertIsNone(tb_w._worker)
+            tb_w.close()
+
+    def test_stop_worker(self):
+        with tempfile.TemporaryDirectory() as log_dir:
+            tb_w = TensorboardWriter(log_dir, DEFAULT_KERAS_INFO)
+            tb_w.add_mean(self.graph, 'mean')
+            worker = tb_w._worker
+            tb_w.stop_worker()
+            self.assertFalse(worker.is_alive())
+            self.assertIsNone(tb_w._worker)
+            self.assertEqual(len(glob.glob(os.path.join(log_dir, 'mean', 'mean_per_channel', '*events*'))), 1)
+
+            # The writing thread is started again when events are added
+            tb_w.add_mean(self.graph, 'mean')
+            tb_w.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -172,6 +172,38 @@ class TestKerasTPModel(unittest.TestCase):
         self.assertEqual(tanh_qco, sevenbit_qco)
         self.assertEqual(relu_qco, default_qco)
 
+    def test_qco_by_keras_layer_filters(self):
+        default_qco = tp.QuantizationConfigOptions([TEST_QC])
+        hm = tp.TargetPlatformModel(default_qco, name='test')
+        with hm:
+            sixbit_qco = TEST_QCO.clone_and_edit(activation_n_bits=6)
+            sevenbit_qco = TEST_QCO.clone_and_edit(activation_n_bits=7)
+            tp.OperatorsSet("relu", sixbit_qco)
+            tp.OperatorsSet("tanh", sevenbit_qco)
+
+        hm_keras = tp.TargetPlatformCapabilities(hm, name='fw_test')
+        with hm_keras:
+            tp.OperationsSetToLayers("relu", [LayerFilterParams(Activation, activation="relu"),
+                                              LayerFilterParams(ReLU, Eq("max_value", 6))])
+            tp.OperationsSetToLayers("tanh", [LayerFilterParams(Activation, activation="tanh")])
+
+        self.assertEqual(len(hm_keras.layer2filters[Activation]), 2)
+        self.assertEqual(hm_keras.layer2filters_attributes[Activation], ['activation'])
+
+        relu_node = get_node(Activation('relu'))
+        framework_attr = copy.deepcopy(relu_node.framework_attr)
+        for _ in range(2):
+            self.assertEqual(hm_keras.get_qco_by_node(relu_node), sixbit_qco)
+        self.assertEqual(hm_keras.get_qco_by_node(get_node(Activation('tanh'))), sevenbit_qco)
+        self.assertEqual(hm_keras.get_qco_by_node(get_node(Activation('sigmoid'))), default_qco)
+        self.assertEqual(hm_keras.get_qco_by_node(get_node(ReLU(max_value=6))), sixbit_qco)
+        self.assertEqual(hm_keras.get_qco_by_node(get_node(ReLU())), default_qco)
+
+        # Matching a node does not modify its attributes, and a modified node is matched by its new attributes
+        self.assertEqual(relu_node.framework_attr, framework_attr)
+        relu_node.framework_attr['activation'] = 'tanh'
+        self.assertEqual(hm_keras.get_qco_by_node(relu_node), sevenbit_qco)
+
     def test_opset_not_in_tp(self):
         default_qco = tp.QuantizationConfigOptions([TEST_QC])
         hm = tp.TargetPlatformModel(default_qco)
@@ -185,6 +185,33 @@ class ModelGradientsCalculationTest(BasePytorchTest):
         self.unit_test.assertTrue(model_grads[2] == 0.0)
 
 
+class ModelGradientsBatchedCalculationTest(ModelGradientsCalculationTest):
+    def __init__(self, unit_test):
+        super().__init__(unit_test)
+        self.val_batch_size = 4
+
+    def run_test(self, seed=0):
+        model_float = basic_derivative_model()
+        pytorch_impl = PytorchImplementation()
+        graph = prepare_graph(model_float, self.representative_data_gen, pytorch_impl)
+        input_tensors = {inode: self.representative_data_gen()[0] for inode in graph.get_inputs()}
+
+        ipts = [n for n in graph.get_topo_sorted_nodes()]
+        output_list = [ipts[-1]]
+        model_grads = pytorch_impl.batched_model_grad(graph_float=graph,
+                                                      model_input_tensors=input_tensors,
+                                                      interest_points=ipts,
+                                                      output_list=output_list,
+                                                      all_outputs_indices=[len(ipts) - 1],
+                                                      alpha=0)
+
+        self.unit_test.assertTrue(model_grads.shape == (self.val_batch_size, len(ipts)))
+        for sample_grads in model_grads:
+            self.unit_test.assertTrue(np.isclose(sample_grads[0], 0.66, 1e-1))
+            self.unit_test.assertTrue(np.isclose(sample_grads[1], 0.33, 1e-1))
+            self.unit_test.assertTrue(sample_grads[2] == 0.0)
+
+
 class ModelGradientsBasicModelTest(BasePytorchTest):
     def __init__(self, unit_test):
         super().__init__(unit_test)
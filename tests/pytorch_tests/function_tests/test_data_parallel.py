@@ -0,0 +1,71 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import unittest
+
+import torch
+
+from model_compression_toolkit.gptq.pytorch.data_parallel import run_forked_workers, is_loss_sample_separable
+from model_compression_toolkit.gptq.pytorch.gptq_loss import multiple_tensors_mse_loss, \
+    multiple_tensors_sample_mse_loss
+
+
+def _send_num_threads(worker_index, connection):
+    connection.send((worker_index, torch.get_num_threads()))
+
+
+def _fail_worker(worker_index, connection):
+    os._exit(worker_index)
+
+
+class TestRunForkedWorkers(unittest.TestCase):
+
+    def test_workers_threads(self):
+        num_threads = torch.get_num_threads()
+        messages = []
+        run_forked_workers(_send_num_threads, [(i,) for i in range(2)], message_function=messages.append)
+
+        # The workers are forked with their share of the threads, and the threads are restored afterwards
+        self.assertEqual(sorted([i for i, _ in messages]), [0, 1])
+        for _, worker_num_threads in messages:
+            self.assertEqual(worker_num_threads, max(1, num_threads // 2))
+        self.assertEqual(torch.get_num_threads(), num_threads)
+
+    def test_failed_worker(self):
+        num_threads = torch.get_num_threads()
+        with self.assertRaises(Exception):
+            run_forked_workers(_fail_worker, [(0,), (1,)])
+        self.assertEqual(torch.get_num_threads(), num_threads)
+
+
+class TestSampleSeparableLoss(unittest.TestCase):
+
+    def _is_separable(self, loss):
+        generator = torch.Generator().manual_seed(0)
+        # Samples of different scales, so a loss that is normalized per batch isn't separable
+        scales = torch.arange(1, 9, dtype=torch.float32).reshape([-1, 1, 1, 1])
+        y_float = [scales * torch.randn([8, 3, 4, 4], generator=generator) for _ in range(2)]
+        y_fxp = [y + 0.1 * torch.randn(y.shape, generator=generator) for y in y_float]
+        return is_loss_sample_separable(lambda _y_fxp, _y_float: loss(_y_fxp, _y_float, [], [], [], [],
+                                                                      torch.ones(2)),
+                                        y_fxp, y_float, 2)
+
+    def test_sample_mse_loss(self):
+        self.assertTrue(self._is_separable(multiple_tensors_sample_mse_loss))
+        self.assertFalse(self._is_separable(multiple_tensors_mse_loss))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,7 +22,8 @@ from tests.pytorch_tests.function_tests.kpi_data_test import TestKPIDataBasicAll
 from tests.pytorch_tests.function_tests.layer_fusing_test import LayerFusingTest1, LayerFusingTest2, LayerFusingTest3, \
     LayerFusingTest4
 from tests.pytorch_tests.function_tests.model_gradients_test import ModelGradientsBasicModelTest, \
-    ModelGradientsCalculationTest, ModelGradientsAdvancedModelTest, ModelGradientsOutputReplacementTest
+    ModelGradientsCalculationTest, ModelGradientsAdvancedModelTest, ModelGradientsOutputReplacementTest, \
+    ModelGradientsBatchedCalculationTest
 
 
 class FunctionTestRunner(unittest.TestCase):
@@ -98,6 +99,7 @@ class FunctionTestRunner(unittest.TestCase):
         ModelGradientsCalculationTest(self).run_test()
         ModelGradientsAdvancedModelTest(self).run_test()
         ModelGradientsOutputReplacementTest(self).run_test()
+        ModelGradientsBatchedCalculationTest(self).run_test()
 
     def test_layer_fusing(self):
         """
@@ -0,0 +1,83 @@
+# Copyright 2022 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+from torch.nn import Conv2d, ReLU
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+from model_compression_toolkit.exporter.fully_quantized.pytorch.builder.fully_quantized_model_builder import \
+    FullyQuantizedPyTorchModel
+
+
+def random_datagen():
+    return [np.random.random((1, 3, 8, 8))]
+
+
+class BranchesModel(torch.nn.Module):
+    def __init__(self):
+        super(BranchesModel, self).__init__()
+        self.conv1 = Conv2d(3, 8, 3, padding='same')
+        self.conv2 = Conv2d(8, 8, 3, padding='same')
+        self.relu = ReLU()
+        self.conv3 = Conv2d(8, 16, 1)
+        self.conv4 = Conv2d(16, 8, 1)
+
+    def forward(self, inp):
+        x = self.conv1(inp)
+        y = self.relu(self.conv2(x))
+        z = self.conv4(self.conv3(x))
+        return torch.add(x, y) + z
+
+
+class TestMemoryScheduleExport(unittest.TestCase):
+
+    def test_fully_quantized_model_memory_schedule(self):
+        core_config = mct.CoreConfig(n_iter=1,
+                                     mixed_precision_config=mct.MixedPrecisionQuantizationConfigV2(num_of_images=1))
+        quantized_model, user_info = mct.pytorch_post_training_quantization_experimental(
+            in_module=BranchesModel(),
+            representative_data_gen=random_datagen,
+            target_kpi=mct.KPI(activation_max_cut_memory=1e9),
+            core_config=core_config,
+            new_experimental_exporter=True)
+
+        # The memory schedule is attached to the user information and the model is executed by it
+        self.assertIsNotNone(user_info.memory_schedule)
+        self.assertEqual(len(user_info.memory_schedule), len(user_info.memory_schedule_live_tensors))
+        self.assertEqual([n.name for n in quantized_model.node_sort], user_info.memory_schedule)
+        self.assertTrue(len(quantized_model.nodes_to_release) > 0)
+
+        # Each released tensor is released after its last use, and model outputs are never released
+        schedule_index = {n: i for i, n in enumerate(quantized_model.node_sort)}
+        output_nodes = [ot.node for ot in quantized_model.graph.get_outputs()]
+        for n, released_nodes in quantized_model.nodes_to_release.items():
+            for r in released_nodes:
+                self.assertNotIn(r, output_nodes)
+                self.assertTrue(all([schedule_index[c] <= schedule_index[n]
+                                     for c in quantized_model.graph.get_next_nodes(r)]))
+
+        # Executing by the schedule doesn't change the model's output
+        topo_sorted_model = FullyQuantizedPyTorchModel(quantized_model.graph)
+        topo_sorted_model.load_state_dict(quantized_model.state_dict())
+        images = to_torch_tensor(random_datagen())
+        diff = quantized_model(images) - topo_sorted_model(images)
+        self.assertTrue(np.sum(np.abs(diff.cpu().detach().numpy())) == 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
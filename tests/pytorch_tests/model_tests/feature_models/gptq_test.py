@@ -12,15 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import os
+import tempfile
+
 import numpy as np
 import torch
 import torch.nn as nn
 from tests.pytorch_tests.model_tests.base_pytorch_feature_test import BasePytorchFeatureNetworkTest
 import model_compression_toolkit as mct
 from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
-from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig, RoundingType
+from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig, RoundingType, TeacherCacheConfig, \
+    GumbelConfig, AuxVarPrecision, CheckpointConfig
+from model_compression_toolkit.gptq.common.gptq_checkpoint import LATEST_CHECKPOINT_FILE
 from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy
-from model_compression_toolkit.gptq.pytorch.gptq_loss import multiple_tensors_mse_loss
+from model_compression_toolkit.gptq.pytorch.gptq_loss import multiple_tensors_mse_loss, multiple_tensors_sample_mse_loss
 from tests.common_tests.helpers.generate_test_tp_model import generate_test_tp_model
 from model_compression_toolkit.core.tpc_models.default_tpc.latest import generate_pytorch_tpc
 
@@ -208,6 +213,216 @@ class SymGumbelWeightsUpdateTest(GPTQBaseTest):
         self.unit_test.assertTrue(all(w_diff), msg="GPTQ: some weights weren't updated")
 
 
+class SymGumbelTeacherCacheWeightsUpdateTest(SymGumbelWeightsUpdateTest):
+
+    def get_gptq_config(self):
+        return GradientPTQConfig(50,
+                                 optimizer=torch.optim.Adam([torch.Tensor([])], lr=0.5),
+                                 loss=multiple_tensors_mse_loss,
+                                 train_bias=True,
+                                 optimizer_rest=torch.optim.Adam([torch.Tensor([])], lr=0.5),
+                                 rounding_type=RoundingType.GumbelRounding,
+                                 teacher_cache_config=TeacherCacheConfig(num_samples=4, use_float16=True))
+
+
+class SymGumbelBlockWiseWeightsUpdateTest(SymGumbelWeightsUpdateTest):
+
+    def get_gptq_config(self):
+        return GradientPTQConfig(50,
+                                 optimizer=torch.optim.Adam([torch.Tensor([])], lr=0.5),
+                                 loss=multiple_tensors_mse_loss,
+                                 train_bias=True,
+                                 optimizer_rest=torch.optim.Adam([torch.Tensor([])], lr=0.5),
+                                 rounding_type=RoundingType.GumbelRounding,
+                                 block_wise=True)
+
+
+class SymGumbelLowPrecisionAuxWeightsUpdateTest(SymGumbelWeightsUpdateTest):
+
+    def get_gptq_config(self):
+        return GradientPTQConfig(50,
+                                 optimizer=torch.optim.Adam([torch.Tensor([])], lr=0.5),
+                                 loss=multiple_tensors_mse_loss,
+                                 train_bias=True,
+                                 optimizer_rest=torch.optim.Adam([torch.Tensor([])], lr=0.5),
+                                 rounding_type=RoundingType.GumbelRounding,
+                                 quantizer_config=GumbelConfig(aux_var_precision=AuxVarPrecision.BFLOAT16))
+
+
+class StopTraining(Exception):
+    pass
+
+
+class SymGumbelCheckpointResumeTest(GPTQBaseTest):
+    """
+    Stop a GPTQ training after its first checkpoint, resume it and compare it to an uninterrupted training.
+    """
+
+    def __init__(self, unit_test):
+        super().__init__(unit_test)
+        self.n_iter = 6
+        self.save_interval = 3
+        self.stop_iter = 4
+        # A fixed dataset, so the stopped and resumed runs build the same quantized model
+        self.data = self.generate_inputs()
+
+    def representative_data_gen(self):
+        return self.data
+
+    def get_gptq_config(self, checkpoint_dir=None, log_function=None):
+        return GradientPTQConfig(self.n_iter,
+                                 optimizer=torch.optim.Adam([torch.Tensor([])], lr=0.5),
+                                 loss=multiple_tensors_mse_loss,
+                                 log_function=log_function,
+                                 train_bias=True,
+                                 optimizer_rest=torch.optim.Adam([torch.Tensor([])], lr=0.5),
+                                 rounding_type=RoundingType.GumbelRounding,
+                                 checkpoint_config=CheckpointConfig(checkpoint_dir, save_interval=self.save_interval))
+
+    def _run_gptq(self, gptq_config, resume=False):
+        np.random.seed(self.seed)
+        torch.manual_seed(self.seed)
+        facade = mct.pytorch_resume_gradient_post_training_quantization_experimental if resume else \
+            mct.pytorch_gradient_post_training_quantization_experimental
+        gptq_model, _ = facade(self.float_model,
+                               self.representative_data_gen,
+                               core_config=self.get_core_config(),
+                               target_platform_capabilities=self.get_tpc(),
+                               gptq_config=gptq_config)
+        return gptq_model
+
+    def run_test(self):
+        self.float_model = self.create_networks()
+
+        with tempfile.TemporaryDirectory() as full_run_dir, tempfile.TemporaryDirectory() as stopped_run_dir:
+            full_run_model = self._run_gptq(self.get_gptq_config(full_run_dir))
+
+            def _stop_training(loss, *args):
+                _stop_training.n_calls += 1
+                if _stop_training.n_calls == self.stop_iter:
+                    raise StopTraining()
+            _stop_training.n_calls = 0
+
+            with self.unit_test.assertRaises(StopTraining):
+                self._run_gptq(self.get_gptq_config(stopped_run_dir, log_function=_stop_training))
+            with open(os.path.join(stopped_run_dir, LATEST_CHECKPOINT_FILE), 'r') as f:
+                self.unit_test.assertEqual(f.read(), f'checkpoint_{self.save_interval}')
+
+            def _count_iterations(loss, *args):
+                _count_iterations.n_calls += 1
+            _count_iterations.n_calls = 0
+
+            resumed_model = self._run_gptq(self.get_gptq_config(stopped_run_dir, log_function=_count_iterations),
+                                           resume=True)
+            # The resumed training continues from the last checkpoint
+            self.unit_test.assertEqual(_count_iterations.n_calls, self.n_iter - self.save_interval)
+
+        full_run_weights = torch_tensor_to_numpy(list(full_run_model.parameters()))
+        resumed_weights = torch_tensor_to_numpy(list(resumed_model.parameters()))
+        self.unit_test.assertTrue(len(full_run_weights) == len(resumed_weights))
+        for w_full, w_resumed in zip(full_run_weights, resumed_weights):
+            self.unit_test.assertTrue(np.allclose(w_full, w_resumed, atol=1e-5),
+                                      msg='Resumed GPTQ weights differ from the uninterrupted training')
+
+
+class SymGumbelDataParallelTest(GPTQBaseTest):
+    """
+    Compare a data-parallel GPTQ training to a single-process training.
+    """
+
+    def __init__(self, unit_test):
+        super().__init__(unit_test)
+        self.input_shape = (4,) + self.input_shape[1:]
+        self.num_workers = 2
+
+    def get_gptq_config(self, num_workers=1, log_function=None):
+        return GradientPTQConfig(5,
+                                 optimizer=torch.optim.Adam([torch.Tensor([])], lr=0.5),
+                                 loss=multiple_tensors_sample_mse_loss,
+                                 log_function=log_function,
+                                 train_bias=True,
+                                 optimizer_rest=torch.optim.Adam([torch.Tensor([])], lr=0.5),
+                                 rounding_type=RoundingType.GumbelRounding,
+                                 num_workers=num_workers)
+
+    def _run_gptq(self, gptq_config):
+        np.random.seed(self.seed)
+        torch.manual_seed(self.seed)
+        gptq_model, _ = mct.pytorch_gradient_post_training_quantization_experimental(
+            self.float_model,
+            self.representative_data_gen,
+            core_config=self.get_core_config(),
+            target_platform_capabilities=self.get_tpc(),
+            gptq_config=gptq_config)
+        return gptq_model
+
+    def run_test(self):
+        self.float_model = self.create_networks()
+        single_process_losses, data_parallel_losses = [], []
+        single_process_model = self._run_gptq(
+            self.get_gptq_config(log_function=lambda loss, *args: single_process_losses.append(loss)))
+        # The log function is called in this process, with the losses of the whole batches
+        data_parallel_model = self._run_gptq(
+            self.get_gptq_config(num_workers=self.num_workers,
+                                 log_function=lambda loss, *args: data_parallel_losses.append(loss)))
+        self.unit_test.assertTrue(np.allclose(single_process_losses, data_parallel_losses, rtol=1e-4))
+
+        # The default data-parallel loss averages over the batch samples
+        default_gptq_config = mct.get_pytorch_gptq_config(n_iter=5, num_workers=self.num_workers)
+        self.unit_test.assertTrue(default_gptq_config.loss is multiple_tensors_sample_mse_loss)
+        self._run_gptq(default_gptq_config)
+
+        # A loss that is normalized per batch is rejected, since the workers' gradients do not average to the
+        # batch gradient
+        with self.unit_test.assertRaises(Exception):
+            self._run_gptq(mct.get_pytorch_gptq_config(n_iter=5, loss=multiple_tensors_mse_loss,
+                                                       num_workers=self.num_workers))
+
+        single_process_weights = torch_tensor_to_numpy(list(single_process_model.parameters()))
+        data_parallel_weights = torch_tensor_to_numpy(list(data_parallel_model.parameters()))
+        self.unit_test.assertTrue(len(single_process_weights) == len(data_parallel_weights))
+        for w_single, w_parallel in zip(single_process_weights, data_parallel_weights):
+            self.unit_test.assertTrue(np.allclose(w_single, w_parallel, atol=1e-5),
+                                      msg='Data-parallel GPTQ weights differ from the single-process training')
+
+
+class SymGumbelBlockWiseParallelTest(SymGumbelDataParallelTest):
+    """
+    Compare a block-wise GPTQ training of the blocks in parallel processes to a sequential training.
+    """
+
+    def get_gptq_config(self, num_workers=1, log_function=None):
+        return GradientPTQConfig(5,
+                                 optimizer=torch.optim.Adam([torch.Tensor([])], lr=0.5),
+                                 loss=multiple_tensors_mse_loss,
+                                 train_bias=True,
+                                 optimizer_rest=torch.optim.Adam([torch.Tensor([])], lr=0.5),
+                                 rounding_type=RoundingType.GumbelRounding,
+                                 block_wise=True,
+                                 num_workers=num_workers)
+
+    def run_test(self):
+        self.float_model = self.create_networks()
+        np.random.seed(self.seed)
+        ptq_model, _ = mct.pytorch_post_training_quantization_experimental(self.float_model,
+                                                                           self.representative_data_gen,
+                                                                           core_config=self.get_core_config(),
+                                                                           target_platform_capabilities=self.get_tpc())
+        sequential_model = self._run_gptq(self.get_gptq_config())
+        parallel_model = self._run_gptq(self.get_gptq_config(num_workers=self.num_workers))
+
+        ptq_weights = torch_tensor_to_numpy(list(ptq_model.parameters()))
+        sequential_weights = torch_tensor_to_numpy(list(sequential_model.parameters()))
+        parallel_weights = torch_tensor_to_numpy(list(parallel_model.parameters()))
+        self.unit_test.assertTrue(len(sequential_weights) == len(parallel_weights))
+        # The first block is trained by the first worker, from the same random state as in the sequential training
+        for w_sequential, w_parallel in zip(sequential_weights[:2], parallel_weights[:2]):
+            self.unit_test.assertTrue(np.allclose(w_sequential, w_parallel, atol=1e-5),
+                                      msg='The first block differs from its sequential training')
+        w_diff = [np.any(w_ptq != w_parallel) for w_ptq, w_parallel in zip(ptq_weights, parallel_weights)]
+        self.unit_test.assertTrue(all(w_diff), msg="GPTQ: some weights weren't updated")
+
+
 class UniformGumbelAccuracyTest(GPTQBaseTest):
 
     def __init__(self, unit_test):
@@ -24,7 +24,8 @@ This test checks the MultiHeadAttentionDecomposition feature.
 
 class MHABaseTest(BasePytorchTest):
     def __init__(self, unit_test, num_heads, q_seq_len, embed_dim, kv_seq_len, kdim, vdim, bias=True,
-                 add_bias_kv=False, add_zero_attn=False, batch_first=True, float_reconstruction_error=1e-6):
+                 add_bias_kv=False, add_zero_attn=False, batch_first=True, float_reconstruction_error=1e-6,
+                 batched_heads=False):
         super().__init__(unit_test, float_reconstruction_error)
 
         self.num_heads = num_heads
@@ -42,6 +43,13 @@ class MHABaseTest(BasePytorchTest):
         self.add_bias_kv = add_bias_kv
         self.add_zero_attn = add_zero_attn
         self.batch_first = batch_first
+        self.batched_heads = batched_heads
+
+    def get_quantization_configs(self):
+        quant_configs = super().get_quantization_configs()
+        for quant_config in quant_configs.values():
+            quant_config.batched_attention_heads = self.batched_heads
+        return quant_configs
 
     def create_inputs_shape(self):
         return [[self.val_batch_size] + list(self.query_input_shape),
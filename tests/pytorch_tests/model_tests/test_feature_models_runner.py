@@ -62,7 +62,9 @@ from tests.pytorch_tests.model_tests.feature_models.split_concat_net_test import
 from tests.pytorch_tests.model_tests.feature_models.torch_tensor_attr_net_test import TorchTensorAttrNetTest
 from tests.pytorch_tests.model_tests.feature_models.bn_function_test import BNFNetTest
 from tests.pytorch_tests.model_tests.feature_models.gptq_test import STEAccuracyTest, STEWeightsUpdateTest, STELearnRateZeroTest
-from tests.pytorch_tests.model_tests.feature_models.gptq_test import SymGumbelAccuracyTest, SymGumbelWeightsUpdateTest
+from tests.pytorch_tests.model_tests.feature_models.gptq_test import SymGumbelAccuracyTest, SymGumbelWeightsUpdateTest, \
+    SymGumbelTeacherCacheWeightsUpdateTest, SymGumbelBlockWiseWeightsUpdateTest, SymGumbelLowPrecisionAuxWeightsUpdateTest, \
+    SymGumbelCheckpointResumeTest, SymGumbelDataParallelTest, SymGumbelBlockWiseParallelTest
 from tests.pytorch_tests.model_tests.feature_models.gptq_test import UniformGumbelAccuracyTest, UniformGumbelWeightsUpdateTest
 
 
@@ -401,6 +403,8 @@ class FeatureModelsTestRunner(unittest.TestCase):
                             kv_seq_len[iter], kdim[iter], vdim[iter], bias=True).run_test()
             MHALayerNetTest(self, num_heads[iter], q_seq_len[iter], qdim[iter] * num_heads[iter],
                             kv_seq_len[iter], kdim[iter], vdim[iter], bias=False).run_test()
+            MHALayerNetTest(self, num_heads[iter], q_seq_len[iter], qdim[iter] * num_heads[iter],
+                            kv_seq_len[iter], kdim[iter], vdim[iter], bias=True, batched_heads=True).run_test()
 
 
     def test_gptq(self):
@@ -412,6 +416,12 @@ class FeatureModelsTestRunner(unittest.TestCase):
         STELearnRateZeroTest(self).run_test()
         SymGumbelAccuracyTest(self).run_test()
         SymGumbelWeightsUpdateTest(self).run_test()
+        SymGumbelTeacherCacheWeightsUpdateTest(self).run_test()
+        SymGumbelBlockWiseWeightsUpdateTest(self).run_test()
+        SymGumbelLowPrecisionAuxWeightsUpdateTest(self).run_test()
+        SymGumbelCheckpointResumeTest(self).run_test()
+        SymGumbelDataParallelTest(self).run_test()
+        SymGumbelBlockWiseParallelTest(self).run_test()
         UniformGumbelAccuracyTest(self).run_test()
         UniformGumbelWeightsUpdateTest(self).run_test()
 
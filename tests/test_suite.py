@@ -21,6 +21,11 @@ from packaging import version
 
 #  ----------------  Individual test suites
 from tests.common_tests.function_tests.test_histogram_collector import TestHistogramCollector
+from tests.common_tests.function_tests.test_packed_quantized_weights import TestPackedQuantizedWeights
+from tests.common_tests.function_tests.test_teacher_activation_cache import TestTeacherActivationCache
+from tests.common_tests.function_tests.test_weights_store import TestWeightsStore
+from tests.common_tests.function_tests.test_benchmark_runner import TestBenchmarkRunner
+from tests.common_tests.function_tests.test_primitive_benchmarks import TestPrimitiveBenchmarks
 from tests.common_tests.function_tests.test_collectors_manipulation import TestCollectorsManipulations
 from tests.common_tests.function_tests.test_threshold_selection import TestThresholdSelection
 from tests.common_tests.function_tests.test_folder_image_loader import TestFolderLoader
@@ -51,6 +56,17 @@ if found_tf:
     from tests.keras_tests.test_keras_tp_model import TestKerasTPModel
     from tests.keras_tests.function_tests.test_sensitivity_metric_interest_points import \
         TestSensitivityMetricInterestPoints
+    from tests.keras_tests.function_tests.test_graph_sorted_nodes_cache import TestGraphSortedNodesCache
+    from tests.keras_tests.function_tests.test_gptq_compiled_training_step import TestGPTQCompiledTrainingStep
+    from tests.keras_tests.function_tests.test_activation_max_cut_kpi import TestActivationMaxCutKPI
+    from tests.keras_tests.function_tests.test_gptq_checkpoint import TestGPTQCheckpoint
+    from tests.keras_tests.function_tests.test_distance_functions import TestTFDistanceFunctions
+    from tests.keras_tests.function_tests.test_compiled_inference import TestCompiledInference
+    from tests.keras_tests.function_tests.test_pipeline_profiler import TestPipelineProfiler
+    from tests.keras_tests.function_tests.test_graph_snapshot import TestGraphSnapshot
+    from tests.keras_tests.function_tests.test_tensorboard_writer_async import TestTensorboardWriter
+    from tests.keras_tests.function_tests.test_adaptive_sensitivity_evaluation import \
+        TestAdaptiveSensitivityEvaluation
 
 if found_pytorch:
     from tests.pytorch_tests.layer_tests.test_layers_runner import LayerTest as TorchLayerTest
@@ -58,12 +74,20 @@ if found_pytorch:
     from tests.pytorch_tests.model_tests.test_models_runner import ModelTest
     from tests.pytorch_tests.function_tests.test_function_runner import FunctionTestRunner
     from tests.pytorch_tests.test_pytorch_tp_model import TestPytorchTPModel
+    from tests.pytorch_tests.function_tests.test_memory_schedule_export import TestMemoryScheduleExport
+    from tests.pytorch_tests.function_tests.test_distance_functions import TestTorchDistanceFunctions
+    from tests.pytorch_tests.function_tests.test_data_parallel import TestRunForkedWorkers, TestSampleSeparableLoss
 
 
 if __name__ == '__main__':
     # -----------------  Load all the test cases
     suiteList = []
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestHistogramCollector))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestPackedQuantizedWeights))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestTeacherActivationCache))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestWeightsStore))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestBenchmarkRunner))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestPrimitiveBenchmarks))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestCollectorsManipulations))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestFolderLoader))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestThresholdSelection))
@@ -89,6 +113,16 @@ if __name__ == '__main__':
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestUniformQuantizeTensor))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestUniformRangeSelectionWeights))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestKerasTPModel))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGraphSortedNodesCache))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGPTQCompiledTrainingStep))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestActivationMaxCutKPI))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGPTQCheckpoint))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestTFDistanceFunctions))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestCompiledInference))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestPipelineProfiler))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestGraphSnapshot))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestTensorboardWriter))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestAdaptiveSensitivityEvaluation))
 
         # Keras test layers are supported in TF2.6 or higher versions
         if version.parse(tf.__version__) >= version.parse("2.6"):
@@ -104,6 +138,10 @@ if __name__ == '__main__':
         suiteList.append(unittest.TestLoader().loadTestsFromName('test_resnet18', ModelTest))
         suiteList.append(unittest.TestLoader().loadTestsFromName('test_shufflenet_v2_x1_0', ModelTest))
         suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestPytorchTPModel))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestMemoryScheduleExport))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestTorchDistanceFunctions))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestRunForkedWorkers))
+        suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestSampleSeparableLoss))
 
     # ----------------   Join them together and run them
     comboSuite = unittest.TestSuite(suiteList)